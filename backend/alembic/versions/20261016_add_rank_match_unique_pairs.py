@@ -0,0 +1,91 @@
+"""Make candidate ranks and match results unique per resume-vacancy pair
+
+Revision ID: 016_unique_rank_match_pairs
+Revises: 015_add_resume_skill_ids
+Create Date: 2026-10-16
+
+Ranking and matching now write these rows with
+INSERT ... ON CONFLICT (resume_id, vacancy_id) DO UPDATE, which needs a
+unique constraint on the pair. Duplicate pairs left by the old
+read-then-insert writers are collapsed first: the most recently updated
+row is kept and rows referencing the others are pointed at it.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '016_unique_rank_match_pairs'
+down_revision: Union[str, None] = '015_add_resume_skill_ids'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, rows referencing it as (table, column))
+PAIR_TABLES = [
+    ('candidate_ranks', [('ranking_feedback', 'rank_id')]),
+    (
+        'match_results',
+        [
+            ('candidate_feedback', 'match_result_id'),
+            ('score_appeals', 'match_result_id'),
+            ('skill_feedback', 'match_result_id'),
+        ],
+    ),
+]
+
+
+def _collapse_duplicates(table: str, references: Sequence[tuple]) -> None:
+    """Keep the latest row per (resume_id, vacancy_id), repointing references to it."""
+    op.execute(
+        f"""
+        CREATE TEMPORARY TABLE {table}_duplicates AS
+        SELECT id, first_value(id) OVER (
+            PARTITION BY resume_id, vacancy_id
+            ORDER BY updated_at DESC, created_at DESC, id
+        ) AS keep_id
+        FROM {table}
+        """
+    )
+    for ref_table, ref_column in references:
+        op.execute(
+            f"""
+            UPDATE {ref_table} SET {ref_column} = d.keep_id
+            FROM {table}_duplicates d
+            WHERE {ref_table}.{ref_column} = d.id AND d.id <> d.keep_id
+            """
+        )
+    op.execute(
+        f"""
+        DELETE FROM {table}
+        USING {table}_duplicates d
+        WHERE {table}.id = d.id AND d.id <> d.keep_id
+        """
+    )
+    op.execute(f"DROP TABLE {table}_duplicates")
+
+
+def upgrade() -> None:
+    """Collapse duplicate pairs and add unique constraints on (resume_id, vacancy_id)."""
+    for table, references in PAIR_TABLES:
+        _collapse_duplicates(table, references)
+
+    # The unique constraint's index replaces the plain composite index
+    op.drop_index('ix_candidate_ranks_resume_vacancy', table_name='candidate_ranks')
+    op.create_unique_constraint(
+        'uq_candidate_ranks_resume_vacancy', 'candidate_ranks', ['resume_id', 'vacancy_id']
+    )
+    op.create_unique_constraint(
+        'uq_match_results_resume_vacancy', 'match_results', ['resume_id', 'vacancy_id']
+    )
+
+
+def downgrade() -> None:
+    """Drop the unique constraints (collapsed duplicates are not restored)."""
+    op.drop_constraint('uq_match_results_resume_vacancy', 'match_results', type_='unique')
+    op.drop_constraint('uq_candidate_ranks_resume_vacancy', 'candidate_ranks', type_='unique')
+    op.create_index(
+        'ix_candidate_ranks_resume_vacancy', 'candidate_ranks', ['resume_id', 'vacancy_id']
+    )
@@ -0,0 +1,65 @@
+"""Add interned skill IDs to resume analyses
+
+Revision ID: 015_add_resume_skill_ids
+Revises: 014_add_matching_weights
+Create Date: 2026-10-16
+
+Adds resume_analyses.skill_ids: sorted, unique integer IDs of the
+normalized skills (see analyzers/skill_ids.py), and fills it for
+existing rows.
+
+"""
+import hashlib
+from typing import Iterable, List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '015_add_resume_skill_ids'
+down_revision: Union[str, None] = '014_add_matching_weights'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _skill_ids(skills: Iterable[object]) -> List[int]:
+    """Skill IDs as analyzers/skill_ids.py computed them at this revision (frozen copy)."""
+    ids = set()
+    for skill in skills:
+        if not isinstance(skill, str) or not skill:
+            continue
+        normalized = " ".join(skill.strip().lower().split())
+        normalized = "".join(c for c in normalized if c.isalnum() or c in " .+#")
+        digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest()
+        ids.add(int.from_bytes(digest, "big") & ((1 << 53) - 1))
+    return sorted(ids)
+
+
+def upgrade() -> None:
+    """Add and backfill resume_analyses.skill_ids."""
+    op.add_column('resume_analyses', sa.Column('skill_ids', postgresql.JSON(), nullable=True))
+
+    analyses = sa.table(
+        'resume_analyses',
+        sa.column('id', sa.UUID()),
+        sa.column('skills', postgresql.JSON()),
+        sa.column('skill_ids', postgresql.JSON()),
+    )
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(analyses.c.id, analyses.c.skills).where(analyses.c.skills.isnot(None))
+    ).fetchall()
+    for row in rows:
+        if isinstance(row.skills, list):
+            connection.execute(
+                analyses.update()
+                .where(analyses.c.id == row.id)
+                .values(skill_ids=_skill_ids(row.skills))
+            )
+
+
+def downgrade() -> None:
+    """Drop resume_analyses.skill_ids."""
+    op.drop_column('resume_analyses', 'skill_ids')
@@ -0,0 +1,65 @@
+"""Add interned skill IDs to job vacancies
+
+Revision ID: 017_add_vacancy_skill_ids
+Revises: 016_unique_rank_match_pairs
+Create Date: 2026-10-16
+
+Adds job_vacancies.required_skill_ids: sorted, unique integer IDs of the
+normalized required skills, matching resume_analyses.skill_ids, and fills
+it for existing rows. Ranking compares the two with set operations.
+
+"""
+import hashlib
+from typing import Iterable, List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '017_add_vacancy_skill_ids'
+down_revision: Union[str, None] = '016_unique_rank_match_pairs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _skill_ids(skills: Iterable[object]) -> List[int]:
+    """Skill IDs as analyzers/skill_ids.py computed them at this revision (frozen copy)."""
+    ids = set()
+    for skill in skills:
+        if not isinstance(skill, str) or not skill:
+            continue
+        normalized = " ".join(skill.strip().lower().split())
+        normalized = "".join(c for c in normalized if c.isalnum() or c in " .+#")
+        digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest()
+        ids.add(int.from_bytes(digest, "big") & ((1 << 53) - 1))
+    return sorted(ids)
+
+
+def upgrade() -> None:
+    """Add and backfill job_vacancies.required_skill_ids."""
+    op.add_column('job_vacancies', sa.Column('required_skill_ids', postgresql.JSON(), nullable=True))
+
+    vacancies = sa.table(
+        'job_vacancies',
+        sa.column('id', sa.UUID()),
+        sa.column('required_skills', postgresql.JSON()),
+        sa.column('required_skill_ids', postgresql.JSON()),
+    )
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(vacancies.c.id, vacancies.c.required_skills).where(vacancies.c.required_skills.isnot(None))
+    ).fetchall()
+    for row in rows:
+        if isinstance(row.required_skills, list):
+            connection.execute(
+                vacancies.update()
+                .where(vacancies.c.id == row.id)
+                .values(required_skill_ids=_skill_ids(row.required_skills))
+            )
+
+
+def downgrade() -> None:
+    """Drop job_vacancies.required_skill_ids."""
+    op.drop_column('job_vacancies', 'required_skill_ids')
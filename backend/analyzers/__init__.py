@@ -51,26 +51,87 @@ from .error_detector import (
     format_errors_for_display,
 )
 from .enhanced_matcher import (
+    CompiledSkill,
     EnhancedSkillMatcher,
 )
+from .keyword_scanner import (
+    KeywordScanner,
+    get_keyword_scanner,
+)
+from .skill_ids import (
+    SkillInterner,
+    get_skill_interner,
+    normalize_skill_name,
+    canonicalize_skill_name,
+    skill_id,
+    skill_ids,
+    count_shared_skills,
+)
+from .fuzzy_index import (
+    FuzzySkillIndex,
+    get_fuzzy_index,
+)
+from .synonym_index import (
+    SynonymIndex,
+    get_synonym_index,
+)
 from .tfidf_matcher import (
     TfidfSkillMatcher,
     TfidfMatchResult,
     get_tfidf_matcher,
+    VacancyProfile,
+    invalidate_vacancy_profile,
+)
+from .model_registry import (
+    ModelRegistry,
+    get_model_registry,
+)
+from .tfidf_corpus import (
+    CorpusTfidfIndex,
+    get_corpus_tfidf,
+)
+from .embedding_store import (
+    EmbeddingStore,
+    get_embedding_store,
 )
 from .vector_matcher import (
     VectorSimilarityMatcher,
     VectorMatchResult,
     get_vector_matcher,
 )
+from .ann_index import (
+    IVFFlatIndex,
+)
+from .resume_retrieval import (
+    ResumeVectorIndex,
+    ResumeRetriever,
+    get_resume_retriever,
+)
 from .unified_matcher import (
     UnifiedSkillMatcher,
     UnifiedMatchResult,
+    CompiledVacancy,
+    RankingSnapshot,
     get_unified_matcher,
 )
+from .top_k import TopK
+from .parallel_ranking import (
+    ParallelRanker,
+    get_parallel_ranker,
+)
+from .encoder_batcher import (
+    EmbeddingBatcher,
+    get_embedding_batcher,
+)
 from .taxonomy_loader import (
     TaxonomyLoader,
 )
+from .taxonomy_snapshot import (
+    TaxonomySnapshot,
+    TaxonomySnapshotStore,
+    get_taxonomy_snapshot,
+    publish_taxonomy_snapshot,
+)
 from .model_versioning import (
     ModelVersionManager,
 )
@@ -115,17 +176,54 @@ __all__ = [
     "detect_resume_errors",
     "get_error_summary",
     "format_errors_for_display",
+    "CompiledSkill",
     "EnhancedSkillMatcher",
+    "KeywordScanner",
+    "get_keyword_scanner",
+    "SkillInterner",
+    "get_skill_interner",
+    "normalize_skill_name",
+    "canonicalize_skill_name",
+    "skill_id",
+    "skill_ids",
+    "count_shared_skills",
+    "FuzzySkillIndex",
+    "get_fuzzy_index",
+    "SynonymIndex",
+    "get_synonym_index",
     "TfidfSkillMatcher",
     "TfidfMatchResult",
     "get_tfidf_matcher",
+    "VacancyProfile",
+    "invalidate_vacancy_profile",
+    "ModelRegistry",
+    "get_model_registry",
+    "CorpusTfidfIndex",
+    "get_corpus_tfidf",
+    "EmbeddingStore",
+    "get_embedding_store",
     "VectorSimilarityMatcher",
     "VectorMatchResult",
     "get_vector_matcher",
+    "IVFFlatIndex",
+    "ResumeVectorIndex",
+    "ResumeRetriever",
+    "get_resume_retriever",
     "UnifiedSkillMatcher",
     "UnifiedMatchResult",
+    "CompiledVacancy",
+    "RankingSnapshot",
     "get_unified_matcher",
+    "TopK",
+    "ParallelRanker",
+    "get_parallel_ranker",
+    "EmbeddingBatcher",
+    "get_embedding_batcher",
     "TaxonomyLoader",
+    "TaxonomySnapshot",
+    "TaxonomySnapshotStore",
+    "get_taxonomy_snapshot",
+    "publish_taxonomy_snapshot",
     "ModelVersionManager",
     "AccuracyBenchmark",
     "SkillGapAnalyzer",
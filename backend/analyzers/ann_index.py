@@ -0,0 +1,378 @@
+"""
+Approximate nearest-neighbour index over embedding vectors.
+
+This module provides an IVF-flat (inverted file) index written in plain
+NumPy. Vectors are clustered with k-means into a number of lists; a query
+is compared with the list centroids first and then only against the
+vectors in the closest lists, which turns a full scan into a scan over a
+small fraction of the collection.
+
+Key features:
+- Cosine similarity (vectors are L2-normalized on insert)
+- Incremental insert and delete without retraining
+- Exact brute-force search while the collection is small
+- Automatic (re)training as the collection grows
+- Save/load to a single .npz file
+- Optional float16 or per-vector int8 storage (see quantization.py)
+"""
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .quantization import SCORE_BLOCK_ROWS, dequantize, dot_scores, quantize
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize each row, leaving zero rows untouched."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+class IVFFlatIndex:
+    """
+    Inverted-file index with exact (flat) scoring inside each list.
+
+    Until ``min_train_size`` vectors are stored the index performs exact
+    brute-force search. Once trained, new vectors are assigned to their
+    nearest centroid on insert; the centroids are re-fit when the collection
+    has grown ``retrain_factor`` times since the last training.
+
+    Example:
+        >>> index = IVFFlatIndex(dim=384)
+        >>> index.add_many(["r1", "r2"], embeddings)
+        >>> index.search(query_embedding, k=10)
+        [('r2', 0.81), ('r1', 0.42)]
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        nprobe: int = 8,
+        min_train_size: int = 1024,
+        retrain_factor: float = 4.0,
+        kmeans_iterations: int = 10,
+        seed: int = 42,
+        dtype: str = "float32",
+    ):
+        """
+        Initialize an empty index.
+
+        Args:
+            dim: Embedding dimension
+            nprobe: Number of closest lists scanned per query
+            min_train_size: Collection size at which clustering starts
+            retrain_factor: Growth factor that triggers re-clustering
+            kmeans_iterations: Lloyd iterations per training run
+            seed: Random seed for centroid initialization
+            dtype: Storage format of the vectors ("float32", "float16" or "int8")
+        """
+        self.dim = dim
+        self.nprobe = nprobe
+        self.min_train_size = min_train_size
+        self.retrain_factor = retrain_factor
+        self.kmeans_iterations = kmeans_iterations
+        self.seed = seed
+        self.dtype = dtype
+
+        self.ids: List[str] = []
+        self._id_to_row: Dict[str, int] = {}
+        self._vectors, self._scales = quantize(np.zeros((0, dim), dtype=np.float32), dtype)
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self.centroids: Optional[np.ndarray] = None
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._id_to_row
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the stored vectors and their scales."""
+        size = len(self.ids)
+        scales_bytes = 0 if self._scales is None else self._scales[:size].nbytes
+        return self._vectors[:size].nbytes + scales_bytes
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether the index has centroids."""
+        return self.centroids is not None
+
+    def _ensure_capacity(self, extra: int) -> None:
+        """Grow the backing arrays geometrically."""
+        needed = len(self.ids) + extra
+        capacity = self._vectors.shape[0]
+        if needed <= capacity:
+            return
+
+        new_capacity = max(needed, capacity * 2, 64)
+        size = len(self.ids)
+        vectors = np.zeros((new_capacity, self.dim), dtype=self._vectors.dtype)
+        vectors[:size] = self._vectors[:size]
+        assignments = np.full(new_capacity, -1, dtype=np.int32)
+        assignments[:size] = self._assignments[:size]
+        self._vectors = vectors
+        self._assignments = assignments
+        if self._scales is not None:
+            scales = np.ones(new_capacity, dtype=np.float32)
+            scales[:size] = self._scales[:size]
+            self._scales = scales
+
+    def _store_rows(self, rows: np.ndarray, vectors: np.ndarray) -> None:
+        """Quantize normalized vectors into the given rows."""
+        codes, scales = quantize(vectors, self.dtype)
+        self._vectors[rows] = codes
+        if scales is not None:
+            self._scales[rows] = scales
+
+    def _float_rows(self, rows) -> np.ndarray:
+        """Dequantize stored rows (index array or slice) to float32."""
+        return dequantize(
+            self._vectors[rows], None if self._scales is None else self._scales[rows]
+        )
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        """Return the nearest centroid for each vector."""
+        if self.centroids is None:
+            return np.full(len(vectors), -1, dtype=np.int32)
+        return np.argmax(vectors @ self.centroids.T, axis=1).astype(np.int32)
+
+    def add_many(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        """
+        Insert or replace vectors.
+
+        Args:
+            ids: Item identifiers
+            vectors: 2-D array with one row per id
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(ids), self.dim)
+        vectors = _normalize_rows(vectors)
+
+        # Replace existing entries in place; the last duplicate wins
+        pending: Dict[str, int] = {}
+        for i, item_id in enumerate(ids):
+            row = self._id_to_row.get(item_id)
+            if row is None:
+                pending[item_id] = i
+            else:
+                self._store_rows(np.array([row]), vectors[i:i + 1])
+                self._assignments[row] = self._assign(vectors[i:i + 1])[0]
+
+        if pending:
+            new_ids = list(pending)
+            new_rows = list(pending.values())
+            self._ensure_capacity(len(new_ids))
+            start = len(self.ids)
+            end = start + len(new_ids)
+            self._store_rows(np.arange(start, end), vectors[new_rows])
+            self._assignments[start:end] = self._assign(vectors[new_rows])
+            for offset, item_id in enumerate(new_ids):
+                self._id_to_row[item_id] = start + offset
+            self.ids.extend(new_ids)
+
+        self._maybe_train()
+
+    def add(self, item_id: str, vector: np.ndarray) -> None:
+        """
+        Insert or replace a single vector.
+
+        Args:
+            item_id: Item identifier
+            vector: 1-D embedding
+        """
+        self.add_many([item_id], np.asarray(vector).reshape(1, -1))
+
+    def remove(self, item_id: str) -> bool:
+        """
+        Delete a vector by swapping the last row into its slot.
+
+        Args:
+            item_id: Item identifier
+
+        Returns:
+            True if the item was present
+        """
+        row = self._id_to_row.pop(item_id, None)
+        if row is None:
+            return False
+
+        last = len(self.ids) - 1
+        if row != last:
+            moved_id = self.ids[last]
+            self.ids[row] = moved_id
+            self._vectors[row] = self._vectors[last]
+            self._assignments[row] = self._assignments[last]
+            if self._scales is not None:
+                self._scales[row] = self._scales[last]
+            self._id_to_row[moved_id] = row
+
+        self.ids.pop()
+        self._assignments[last] = -1
+        return True
+
+    def _maybe_train(self) -> None:
+        """Train or re-train the centroids when the collection has grown enough."""
+        size = len(self.ids)
+        if size < self.min_train_size:
+            return
+        if self.is_trained and size < self._trained_size * self.retrain_factor:
+            return
+        self.train()
+
+    def train(self, n_lists: Optional[int] = None) -> None:
+        """
+        Cluster the stored vectors with spherical k-means.
+
+        Training runs on a sample of at most 64 vectors per list, then every
+        stored vector is re-assigned to its nearest centroid.
+
+        Args:
+            n_lists: Number of lists (defaults to sqrt of collection size)
+        """
+        size = len(self.ids)
+        if size == 0:
+            return
+
+        n_lists = n_lists or max(1, int(np.sqrt(size)))
+        n_lists = min(n_lists, size)
+
+        rng = np.random.default_rng(self.seed)
+        sample_size = min(size, 64 * n_lists)
+        sample_rows = np.sort(rng.choice(size, sample_size, replace=False)) if sample_size < size else np.arange(size)
+        sample = self._float_rows(sample_rows)
+
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+        for _ in range(self.kmeans_iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=n_lists)
+            empty = counts == 0
+            # Re-seed empty lists with random sample points
+            if empty.any():
+                sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+            centroids = _normalize_rows(sums)
+
+        self.centroids = centroids.astype(np.float32)
+        for start in range(0, size, SCORE_BLOCK_ROWS):
+            end = min(start + SCORE_BLOCK_ROWS, size)
+            self._assignments[start:end] = self._assign(self._float_rows(slice(start, end)))
+        self._trained_size = size
+        logger.info(f"Trained IVF index: {size} vectors in {n_lists} lists")
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        nprobe: Optional[int] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Find the k most similar items to a query vector.
+
+        Args:
+            query: 1-D query embedding
+            k: Number of results
+            nprobe: Lists to scan (defaults to self.nprobe)
+
+        Returns:
+            List of (item_id, cosine_similarity), best first
+        """
+        size = len(self.ids)
+        if size == 0 or k <= 0:
+            return []
+
+        query = _normalize_rows(np.asarray(query, dtype=np.float32).reshape(1, -1))[0]
+
+        rows: Optional[np.ndarray] = None
+        if self.is_trained:
+            nprobe = min(nprobe or self.nprobe, len(self.centroids))
+            centroid_scores = self.centroids @ query
+            probe = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+            rows = np.flatnonzero(np.isin(self._assignments[:size], probe))
+            # Too few candidates in the probed lists: fall back to exact search
+            if len(rows) < k:
+                rows = None
+
+        if rows is None:
+            scores = dot_scores(self._vectors, self._scales, query, slice(0, size))
+            candidate_rows = np.arange(size)
+        else:
+            scores = dot_scores(self._vectors, self._scales, query, rows)
+            candidate_rows = rows
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        return [(self.ids[candidate_rows[i]], float(scores[i])) for i in top]
+
+    def get_vector(self, item_id: str) -> Optional[np.ndarray]:
+        """
+        Get the stored (normalized) vector of an item.
+
+        Args:
+            item_id: Item identifier
+
+        Returns:
+            float32 copy of the vector, or None if not present
+        """
+        row = self._id_to_row.get(item_id)
+        return None if row is None else self._float_rows(np.array([row]))[0]
+
+    def save(self, path: Path) -> None:
+        """
+        Write the index to an .npz file atomically.
+
+        Args:
+            path: Destination file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        size = len(self.ids)
+
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                ids=np.array(self.ids, dtype=str),
+                vectors=self._vectors[:size],
+                scales=self._scales[:size] if self._scales is not None else np.zeros(0, dtype=np.float32),
+                dtype=np.array(self.dtype),
+                assignments=self._assignments[:size],
+                centroids=self.centroids if self.centroids is not None else np.zeros((0, self.dim), dtype=np.float32),
+                params=np.array([self.dim, self.nprobe, self.min_train_size, self._trained_size]),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "IVFFlatIndex":
+        """
+        Read an index written by save().
+
+        Args:
+            path: Source file
+
+        Returns:
+            Loaded IVFFlatIndex
+        """
+        with np.load(Path(path), allow_pickle=False) as data:
+            dim, nprobe, min_train_size, trained_size = (int(v) for v in data["params"])
+            dtype = str(data["dtype"]) if "dtype" in data.files else "float32"
+            index = cls(dim=dim, nprobe=nprobe, min_train_size=min_train_size, dtype=dtype)
+            index.ids = [str(i) for i in data["ids"]]
+            index._vectors = data["vectors"].astype(dtype)
+            if dtype == "int8":
+                index._scales = data["scales"].astype(np.float32)
+            index._assignments = data["assignments"].astype(np.int32)
+            centroids = data["centroids"]
+            index.centroids = centroids.astype(np.float32) if len(centroids) else None
+            index._trained_size = trained_size
+
+        index._id_to_row = {item_id: row for row, item_id in enumerate(index.ids)}
+        return index
@@ -0,0 +1,248 @@
+"""
+Compiled inference form of the random-forest ranking model.
+
+scikit-learn's per-call overhead dominates when a forest scores a handful
+of 13-feature rows. This module flattens a fitted RandomForestClassifier
+and its StandardScaler into a few contiguous NumPy arrays and evaluates
+a whole feature matrix with vectorized traversal, so ranking needs no
+scikit-learn at inference time.
+
+Key features:
+- All trees share one node array; tree t starts at roots[t]
+- Leaves point to themselves, so every (row, tree) pair advances in
+  lock-step for max_depth steps with no per-row branching
+- Leaf values are stored as class probabilities, already normalized
+- Splits compare float32 features with float64 thresholds, as
+  scikit-learn does, so predictions match predict_proba() to rounding
+- Saved as one .npy file per array and loaded memory-mapped read-only
+"""
+import logging
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+from numpy import typing as npt
+
+logger = logging.getLogger(__name__)
+
+# Rows traversed at a time; bounds the (rows, trees) index arrays to a few MB
+PREDICT_BLOCK_ROWS = 2048
+
+# children_left/children_right value marking a leaf in scikit-learn trees
+_TREE_LEAF = -1
+
+# Arrays written by CompiledForest.save(), one .npy file each
+ARRAY_NAMES = ("feature", "threshold", "left", "right", "value", "roots", "classes", "mean", "scale")
+
+
+class CompiledForest:
+    """
+    Random-forest classifier flattened into node arrays.
+
+    Attributes:
+        feature: Feature index tested at each node (int32)
+        threshold: Split threshold of each node; go left if feature <= threshold
+        left: Left child of each node; leaves point to themselves (int32)
+        right: Right child of each node; leaves point to themselves (int32)
+        value: Class probabilities of each node (n_nodes, n_classes)
+        roots: Index of the root node of each tree (int32)
+        classes: Class labels, in predict_proba() column order
+        mean: Per-feature mean subtracted before the trees
+        scale: Per-feature scale divided by before the trees
+        max_depth: Depth of the deepest tree
+    """
+
+    def __init__(
+        self,
+        feature: npt.NDArray[np.int32],
+        threshold: npt.NDArray[np.float64],
+        left: npt.NDArray[np.int32],
+        right: npt.NDArray[np.int32],
+        value: npt.NDArray[np.float64],
+        roots: npt.NDArray[np.int32],
+        classes: npt.NDArray[Any],
+        mean: npt.NDArray[np.float64],
+        scale: npt.NDArray[np.float64],
+    ):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.classes = classes
+        self.mean = mean
+        self.scale = scale
+        self.max_depth = _max_depth(left, right, roots)
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    @classmethod
+    def from_model(cls, model: Any, scaler: Any) -> "CompiledForest":
+        """
+        Flatten a fitted RandomForestClassifier and StandardScaler.
+
+        Args:
+            model: Fitted sklearn RandomForestClassifier
+            scaler: Fitted sklearn StandardScaler applied before the model
+
+        Returns:
+            Compiled forest
+
+        Raises:
+            ValueError: If the model is not a fitted single-output forest
+        """
+        # Forests keep a list of trees; gradient boosting keeps an array of regressors
+        estimators = getattr(model, "estimators_", None)
+        if not isinstance(estimators, list) or not estimators or getattr(model, "n_outputs_", 1) != 1:
+            raise ValueError(f"Cannot compile {type(model).__name__}: not a fitted single-output forest")
+
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        for estimator in estimators:
+            tree = estimator.tree_
+            node_ids = np.arange(tree.node_count, dtype=np.int32) + offset
+            is_leaf = tree.children_left == _TREE_LEAF
+
+            # Leaves loop back to themselves; their feature and threshold are never used
+            lefts.append(np.where(is_leaf, node_ids, tree.children_left + offset).astype(np.int32))
+            rights.append(np.where(is_leaf, node_ids, tree.children_right + offset).astype(np.int32))
+            features.append(np.where(is_leaf, 0, tree.feature).astype(np.int32))
+            thresholds.append(np.where(is_leaf, 0.0, tree.threshold).astype(np.float64))
+
+            # Leaf class weights to probabilities, as DecisionTreeClassifier.predict_proba()
+            value = tree.value[:, 0, :].astype(np.float64)
+            normalizer = value.sum(axis=1, keepdims=True)
+            normalizer[normalizer == 0.0] = 1.0
+            values.append(value / normalizer)
+
+            roots.append(offset)
+            offset += tree.node_count
+
+        return cls(
+            feature=np.concatenate(features),
+            threshold=np.concatenate(thresholds),
+            left=np.concatenate(lefts),
+            right=np.concatenate(rights),
+            value=np.concatenate(values),
+            roots=np.asarray(roots, dtype=np.int32),
+            classes=np.asarray(model.classes_),
+            mean=_scaler_array(scaler, "mean_", "with_mean", 0.0, model.n_features_in_),
+            scale=_scaler_array(scaler, "scale_", "with_std", 1.0, model.n_features_in_),
+        )
+
+    def matches(self, model: Any) -> bool:
+        """Whether this was compiled from the given forest (tree and node counts agree)."""
+        estimators = getattr(model, "estimators_", None)
+        return (
+            isinstance(estimators, list)
+            and len(estimators) == self.n_trees
+            and sum(estimator.tree_.node_count for estimator in estimators) == self.n_nodes
+        )
+
+    def predict_proba(self, X: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """
+        Class probabilities of unscaled feature rows.
+
+        Args:
+            X: Feature matrix (n_samples, n_features), before scaling
+
+        Returns:
+            Probabilities (n_samples, n_classes), averaged over trees
+        """
+        X = np.asarray(X, dtype=np.float64)
+        proba = np.empty((len(X), len(self.classes)), dtype=np.float64)
+        for start in range(0, len(X), PREDICT_BLOCK_ROWS):
+            block = X[start:start + PREDICT_BLOCK_ROWS]
+            leaves = self._leaves(block)
+            proba[start:start + len(block)] = self.value[leaves].sum(axis=1) / self.n_trees
+        return proba
+
+    def predict(self, X: npt.NDArray[np.float64]) -> npt.NDArray[Any]:
+        """Most likely class label of each unscaled feature row."""
+        return self.classes[np.argmax(self.predict_proba(X), axis=1)]
+
+    def _leaves(self, X: npt.NDArray[np.float64]) -> npt.NDArray[np.int32]:
+        """Leaf reached by each row in each tree (n_samples, n_trees)."""
+        # Trees are evaluated on float32 features, like sklearn's tree code
+        X32 = ((X - self.mean) / self.scale).astype(np.float32)
+        rows = np.arange(len(X))[:, None]
+        nodes = np.broadcast_to(self.roots, (len(X), self.n_trees))
+        for _ in range(self.max_depth):
+            go_left = X32[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return nodes
+
+    def save(self, directory: Union[str, Path]) -> None:
+        """Write each array to <directory>/<name>.npy."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in ARRAY_NAMES:
+            np.save(directory / f"{name}.npy", getattr(self, name))
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], mmap_mode: Optional[str] = "r") -> "CompiledForest":
+        """
+        Read a compiled forest written by save().
+
+        Args:
+            directory: Directory holding the .npy files
+            mmap_mode: np.load mmap mode; "r" maps the arrays read-only, so
+                every process loading the same files shares their pages
+
+        Returns:
+            Compiled forest
+        """
+        directory = Path(directory)
+        return cls(**{
+            name: np.load(directory / f"{name}.npy", mmap_mode=mmap_mode, allow_pickle=False)
+            for name in ARRAY_NAMES
+        })
+
+
+def compile_ranking_model(model: Any, scaler: Any) -> Optional[CompiledForest]:
+    """
+    Compile a ranking model if it is a random forest.
+
+    Args:
+        model: Fitted sklearn classifier
+        scaler: Fitted StandardScaler applied before the model
+
+    Returns:
+        Compiled forest, or None for models without a compiled form
+    """
+    try:
+        return CompiledForest.from_model(model, scaler)
+    except ValueError as e:
+        logger.debug(str(e))
+        return None
+
+
+def _scaler_array(
+    scaler: Any, attribute: str, enabled: str, default: float, n_features: int
+) -> npt.NDArray[np.float64]:
+    """Scaler mean_/scale_, or the identity value when centering/scaling is off."""
+    values = getattr(scaler, attribute, None)
+    if values is None or not getattr(scaler, enabled, True):
+        return np.full(n_features, default, dtype=np.float64)
+    return np.asarray(values, dtype=np.float64)
+
+
+def _max_depth(
+    left: npt.NDArray[np.int32], right: npt.NDArray[np.int32], roots: npt.NDArray[np.int32]
+) -> int:
+    """Number of traversal steps after which every row has reached a leaf."""
+    is_split = left != np.arange(len(left))
+    depth = 0
+    frontier = roots[is_split[roots]]
+    while len(frontier):
+        depth += 1
+        children = np.concatenate([left[frontier], right[frontier]])
+        frontier = children[is_split[children]]
+    return depth
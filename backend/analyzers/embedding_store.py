@@ -0,0 +1,497 @@
+"""
+Persistent content-addressed embedding store.
+
+This module provides an on-disk cache for sentence embeddings so that the
+same text is never pushed through a transformer twice, neither within one
+process nor across API and Celery workers sharing the models cache volume.
+
+Key features:
+- Entries keyed by (model_name, sha256 of whitespace-normalized text)
+- Append-only vector file per model, read through np.memmap
+- float32, float16 or per-vector int8 storage (see quantization.py)
+- Plain-text index file that other processes pick up incrementally
+- File locking around writes so concurrent workers never corrupt a shard
+
+Layout on disk (one directory per model):
+    <root>/<model_name>/meta.json    - embedding dimension and dtype
+    <root>/<model_name>/vectors.bin  - contiguous rows in the shard dtype
+    <root>/<model_name>/scales.bin   - float32 scale per row (int8 only)
+    <root>/<model_name>/index.tsv    - "<sha256>\\t<row>" lines
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .quantization import cosine_scores, dequantize, quantize
+
+try:
+    import fcntl
+    _HAS_FCNTL = True
+except ImportError:  # pragma: no cover - Windows
+    _HAS_FCNTL = False
+    fcntl = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Characters allowed in a model directory name
+_SAFE_NAME_PATTERN = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def model_dir_name(model_name: str) -> str:
+    """
+    Turn a model name into a safe directory name.
+
+    Args:
+        model_name: Model name, e.g. "sentence-transformers/all-MiniLM-L6-v2"
+
+    Returns:
+        Name containing only letters, digits, dots, dashes and underscores
+    """
+    return _SAFE_NAME_PATTERN.sub("_", model_name).strip("._") or "default"
+
+
+@contextmanager
+def exclusive_file_lock(lock_path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive cross-process lock for the duration of a block.
+
+    Falls back to no locking on platforms without fcntl.
+
+    Args:
+        lock_path: Lock file (created if missing)
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a") as lock_file:
+        if _HAS_FCNTL:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if _HAS_FCNTL:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class _ModelShard:
+    """
+    Storage for the embeddings of a single model.
+
+    Keeps the key -> row mapping in memory and lazily re-reads the tail of
+    the index file whenever a lookup misses, so rows appended by other
+    processes become visible without a restart. The storage dtype is fixed
+    when the shard is created and recorded in meta.json.
+    """
+
+    def __init__(self, directory: Path, dtype: str = "float32"):
+        self.directory = directory
+        self.meta_path = directory / "meta.json"
+        self.vectors_path = directory / "vectors.bin"
+        self.scales_path = directory / "scales.bin"
+        self.index_path = directory / "index.tsv"
+        self.lock_path = directory / ".lock"
+
+        self.dim: Optional[int] = None
+        self.dtype = dtype
+        self.rows: Dict[str, int] = {}
+        self._index_offset = 0
+        self._vectors: Optional[np.memmap] = None
+        self._scales: Optional[np.memmap] = None
+        self._lock = threading.Lock()
+
+    def _load_meta(self) -> None:
+        """Read the embedding dimension and dtype from meta.json if present."""
+        if self.dim is None and self.meta_path.exists():
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            self.dim = int(meta["dim"])
+            self.dtype = meta.get("dtype", "float32")
+
+    @property
+    def _row_bytes(self) -> int:
+        return self.dim * np.dtype(self.dtype).itemsize
+
+    def refresh(self) -> None:
+        """Pick up index lines appended since the last refresh."""
+        self._load_meta()
+        if not self.index_path.exists():
+            return
+
+        with open(self.index_path, "rb") as f:
+            f.seek(self._index_offset)
+            chunk = f.read()
+
+        # Only consume complete lines; a partial line is retried next time
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return
+
+        for line in chunk[:end].split(b"\n"):
+            key, _, row = line.decode("ascii").partition("\t")
+            if key and row:
+                self.rows[key] = int(row)
+
+        self._index_offset += end + 1
+
+    def _vector_matrix(self) -> Optional[np.memmap]:
+        """Return a memmap covering every row currently on disk."""
+        if self.dim is None or not self.vectors_path.exists():
+            return None
+
+        n_rows = os.path.getsize(self.vectors_path) // self._row_bytes
+        if n_rows == 0:
+            return None
+
+        if self._vectors is None or self._vectors.shape[0] < n_rows:
+            self._vectors = np.memmap(
+                self.vectors_path, dtype=self.dtype, mode="r", shape=(n_rows, self.dim)
+            )
+        return self._vectors
+
+    def _scale_vector(self) -> Optional[np.memmap]:
+        """Return a memmap of the int8 row scales (None for float shards)."""
+        if self.dtype != "int8" or not self.scales_path.exists():
+            return None
+
+        n_rows = os.path.getsize(self.scales_path) // 4
+        if n_rows == 0:
+            return None
+
+        if self._scales is None or self._scales.shape[0] < n_rows:
+            self._scales = np.memmap(self.scales_path, dtype=np.float32, mode="r", shape=(n_rows,))
+        return self._scales
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Look up several keys, returning None for misses."""
+        with self._lock:
+            if any(key not in self.rows for key in keys):
+                self.refresh()
+
+            matrix = self._vector_matrix()
+            scales = self._scale_vector()
+            results: List[Optional[np.ndarray]] = []
+            for key in keys:
+                row = self.rows.get(key)
+                if matrix is None or row is None or row >= matrix.shape[0]:
+                    results.append(None)
+                elif scales is not None:
+                    results.append(dequantize(matrix[row], scales[row]))
+                else:
+                    results.append(dequantize(matrix[row]))
+            return results
+
+    def cosine_many(self, keys: Sequence[str], query: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Score stored keys against a query on the stored codes; returns (scores, found)."""
+        query = np.asarray(query, dtype=np.float32)
+        with self._lock:
+            if any(key not in self.rows for key in keys):
+                self.refresh()
+
+            scores = np.zeros(len(keys), dtype=np.float32)
+            matrix = self._vector_matrix()
+            if matrix is None:
+                return scores, np.zeros(len(keys), dtype=bool)
+            if query.shape != (self.dim,):
+                raise ValueError(
+                    f"Query dimension {query.shape} does not match store dimension {self.dim}"
+                )
+
+            rows = np.array([self.rows.get(key, -1) for key in keys], dtype=np.int64)
+            found = (rows >= 0) & (rows < matrix.shape[0])
+            if found.any():
+                scores[found] = cosine_scores(matrix, query, rows[found])
+            return scores, found
+
+    def put_many(self, keys: Sequence[str], vectors: np.ndarray) -> None:
+        """Append vectors for keys that are not stored yet."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or len(keys) != vectors.shape[0]:
+            raise ValueError("Expected one 1-D embedding per key")
+
+        with self._lock, exclusive_file_lock(self.lock_path):
+            # Another process may have written some of these keys already
+            self.refresh()
+
+            if self.dim is None:
+                self.dim = int(vectors.shape[1])
+                with open(self.meta_path, "w", encoding="utf-8") as f:
+                    json.dump({"dim": self.dim, "dtype": self.dtype}, f)
+            elif vectors.shape[1] != self.dim:
+                raise ValueError(
+                    f"Embedding dimension {vectors.shape[1]} does not match store dimension {self.dim}"
+                )
+
+            new_keys: List[str] = []
+            new_rows: List[int] = []
+            seen = set()
+            for i, key in enumerate(keys):
+                if key not in self.rows and key not in seen:
+                    seen.add(key)
+                    new_keys.append(key)
+                    new_rows.append(i)
+
+            if not new_keys:
+                return
+
+            start_row = 0
+            if self.vectors_path.exists():
+                start_row = os.path.getsize(self.vectors_path) // self._row_bytes
+
+            codes, scales = quantize(vectors[new_rows], self.dtype)
+
+            # Vectors and scales are written before the index so readers
+            # never see a row that has no data behind it.
+            with open(self.vectors_path, "ab") as f:
+                f.write(np.ascontiguousarray(codes).tobytes())
+                f.flush()
+
+            if scales is not None:
+                with open(self.scales_path, "ab") as f:
+                    f.write(scales.tobytes())
+                    f.flush()
+
+            lines = "".join(
+                f"{key}\t{start_row + offset}\n" for offset, key in enumerate(new_keys)
+            )
+            with open(self.index_path, "a", encoding="ascii") as f:
+                f.write(lines)
+                f.flush()
+
+            self.refresh()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.refresh()
+            return len(self.rows)
+
+
+class EmbeddingStore:
+    """
+    Persistent content-addressed store for text embeddings.
+
+    Embeddings are addressed by the model that produced them and a SHA-256
+    digest of the whitespace-normalized text, so identical resumes and job
+    postings are encoded once and then served from disk by every worker
+    that mounts the same directory.
+
+    Example:
+        >>> store = EmbeddingStore(Path("models_cache/embeddings"))
+        >>> store.get("all-MiniLM-L6-v2", "Senior Python developer")
+        None
+        >>> store.put("all-MiniLM-L6-v2", "Senior Python developer", embedding)
+        >>> store.get("all-MiniLM-L6-v2", "Senior  Python developer").shape
+        (384,)
+    """
+
+    def __init__(self, root: Path, dtype: str = "float32"):
+        """
+        Initialize the embedding store.
+
+        Args:
+            root: Directory holding one sub-directory per model
+            dtype: Storage format for newly created model shards
+                   ("float32", "float16" or "int8"); existing shards keep
+                   the format they were created with
+        """
+        self.root = Path(root)
+        self.dtype = dtype
+        self._shards: Dict[str, _ModelShard] = {}
+        self._shards_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """
+        Normalize text before hashing.
+
+        Collapses runs of whitespace so that re-extracted documents with
+        different line wrapping map to the same entry. Case is preserved
+        because it may be significant to the embedding model.
+
+        Args:
+            text: Raw text
+
+        Returns:
+            Normalized text
+        """
+        return " ".join(text.split())
+
+    @classmethod
+    def text_key(cls, text: str) -> str:
+        """
+        Compute the content address of a text.
+
+        Args:
+            text: Raw text
+
+        Returns:
+            Hex-encoded SHA-256 digest of the normalized text
+        """
+        return hashlib.sha256(cls.normalize_text(text).encode("utf-8")).hexdigest()
+
+    def _shard(self, model_name: str) -> _ModelShard:
+        """Get or create the shard for a model."""
+        with self._shards_lock:
+            shard = self._shards.get(model_name)
+            if shard is None:
+                shard = _ModelShard(self.root / model_dir_name(model_name), self.dtype)
+                self._shards[model_name] = shard
+            return shard
+
+    def get(self, model_name: str, text: str) -> Optional[np.ndarray]:
+        """
+        Look up the stored embedding of a text.
+
+        Args:
+            model_name: Name of the model that produced the embedding
+            text: Text that was encoded
+
+        Returns:
+            Embedding vector or None if not stored
+        """
+        return self.get_many(model_name, [text])[0]
+
+    def get_many(self, model_name: str, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up stored embeddings for several texts.
+
+        Args:
+            model_name: Name of the model that produced the embeddings
+            texts: Texts that were encoded
+
+        Returns:
+            List aligned with texts, holding a vector or None per text
+        """
+        if not texts:
+            return []
+
+        try:
+            results = self._shard(model_name).get_many([self.text_key(t) for t in texts])
+        except Exception as e:
+            logger.warning(f"Embedding store lookup failed for {model_name}: {e}")
+            results = [None] * len(texts)
+
+        found = sum(1 for r in results if r is not None)
+        self.hits += found
+        self.misses += len(results) - found
+        return results
+
+    def cosine_many(
+        self, model_name: str, texts: Sequence[str], query: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cosine similarities between stored embeddings and a query.
+
+        Scores are computed on the stored codes in float32 blocks, so
+        float16 and int8 shards are never dequantized row by row. Only hits
+        are counted; callers look misses up again through get_many() when
+        they encode them.
+
+        Args:
+            model_name: Name of the model that produced the embeddings
+            texts: Texts that were encoded
+            query: 1-D embedding of the same model
+
+        Returns:
+            Tuple of (float32 similarities, boolean found mask), both
+            aligned with texts; similarities of misses are 0
+        """
+        if not texts:
+            return np.zeros(0, dtype=np.float32), np.zeros(0, dtype=bool)
+
+        try:
+            scores, found = self._shard(model_name).cosine_many([self.text_key(t) for t in texts], query)
+        except Exception as e:
+            logger.warning(f"Embedding store scoring failed for {model_name}: {e}")
+            scores, found = np.zeros(len(texts), dtype=np.float32), np.zeros(len(texts), dtype=bool)
+
+        self.hits += int(found.sum())
+        return scores, found
+
+    def put(self, model_name: str, text: str, embedding: np.ndarray) -> None:
+        """
+        Store the embedding of a text.
+
+        Args:
+            model_name: Name of the model that produced the embedding
+            text: Text that was encoded
+            embedding: 1-D embedding vector
+        """
+        self.put_many(model_name, [text], np.asarray(embedding).reshape(1, -1))
+
+    def put_many(self, model_name: str, texts: Sequence[str], embeddings: np.ndarray) -> None:
+        """
+        Store embeddings for several texts.
+
+        Texts that are already stored are skipped. Failures are logged and
+        swallowed: the store is a cache and must never break matching.
+
+        Args:
+            model_name: Name of the model that produced the embeddings
+            texts: Texts that were encoded
+            embeddings: 2-D array with one row per text
+        """
+        if not texts:
+            return
+
+        try:
+            self._shard(model_name).put_many([self.text_key(t) for t in texts], embeddings)
+        except Exception as e:
+            logger.warning(f"Failed to persist embeddings for {model_name}: {e}")
+
+    def count(self, model_name: str) -> int:
+        """
+        Count stored embeddings for a model.
+
+        Args:
+            model_name: Model name
+
+        Returns:
+            Number of stored embeddings
+        """
+        return len(self._shard(model_name))
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get lookup statistics for this process.
+
+        Returns:
+            Dict with 'hits' and 'misses' counters
+        """
+        return {"hits": self.hits, "misses": self.misses}
+
+
+# Singleton instance for convenience
+_default_store: Optional[EmbeddingStore] = None
+
+
+def get_embedding_store() -> Optional[EmbeddingStore]:
+    """
+    Get or create the default embedding store.
+
+    The store lives under ``settings.embedding_store_path`` (or
+    ``<models_cache_path>/embeddings``), which is the volume shared by the
+    API and Celery containers.
+
+    Returns:
+        EmbeddingStore instance, or None if the store is disabled
+    """
+    global _default_store
+    if _default_store is None:
+        from config import get_settings
+
+        settings = get_settings()
+        if not settings.embedding_store_enabled:
+            return None
+
+        root = settings.embedding_store_path or settings.models_cache_path / "embeddings"
+        _default_store = EmbeddingStore(root, dtype=settings.embedding_store_dtype)
+        logger.info(f"Embedding store initialized at {root}")
+    return _default_store
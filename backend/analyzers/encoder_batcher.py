@@ -0,0 +1,265 @@
+"""
+Cross-request micro-batching for sentence embeddings.
+
+Concurrent API requests each need a couple of embeddings. Encoding them
+one request at a time produces many tiny forward passes and blocks the
+event loop while the model runs. This module collects texts from all
+requests in an asyncio queue and lets a single background worker encode
+them together.
+
+Key features:
+- Flush when max_batch_size texts are queued or max_wait_ms has passed
+  since the oldest queued text
+- Model calls run in a dedicated worker thread, never on the event loop
+- Identical texts within a batch are encoded once
+- Bounded queue: callers wait for room instead of growing memory
+- Metrics for batch sizes and queue wait times
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EncodeFn = Callable[[List[str]], List[Optional[np.ndarray]]]
+
+
+@dataclass
+class _PendingText:
+    """A text waiting to be encoded and the future of its caller."""
+
+    text: str
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class EmbeddingBatcher:
+    """
+    Asyncio micro-batcher in front of a synchronous batch encoder.
+
+    Example:
+        >>> batcher = EmbeddingBatcher(matcher._encode_texts, max_batch_size=32, max_wait_ms=5)
+        >>> resume_vec, job_vec = await batcher.encode([resume_text, job_text])
+        >>> batcher.get_stats()["avg_batch_size"]
+        12.4
+    """
+
+    def __init__(
+        self,
+        encode_fn: EncodeFn,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        max_queue_size: int = 1024,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            encode_fn: Function mapping a list of texts to a list of embeddings
+                       (None for texts that could not be encoded)
+            max_batch_size: Texts per model call
+            max_wait_ms: Longest time the oldest queued text waits for a batch to fill
+            max_queue_size: Queued texts beyond which callers wait (backpressure)
+        """
+        self.encode_fn = encode_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.max_queue_size = max(1, max_queue_size)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="encoder")
+
+        self._batches = 0
+        self._texts = 0
+        self._unique_texts = 0
+        self._max_batch = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._encode_time_total = 0.0
+        self._errors = 0
+
+    def _ensure_worker(self) -> None:
+        """Start the worker on the running loop (restarting it after a loop change)."""
+        loop = asyncio.get_running_loop()
+        if self._worker is not None and not self._worker.done() and self._loop is loop:
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker = loop.create_task(self._run())
+
+    async def encode(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """
+        Encode texts as part of the next batch.
+
+        Waits for room in the queue when it is full.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            List aligned with texts, holding an embedding or None per text
+        """
+        if not texts:
+            return []
+
+        self._ensure_worker()
+        loop = asyncio.get_running_loop()
+
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            await self._queue.put(_PendingText(text, future))
+            futures.append(future)
+
+        return list(await asyncio.gather(*futures))
+
+    async def _collect(self) -> List[_PendingText]:
+        """Wait for the first text, then fill the batch until it is full or the deadline passes."""
+        first = await self._queue.get()
+        batch = [first]
+        deadline = first.enqueued_at + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        """Worker loop: collect, encode off the event loop, resolve futures."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            batch = [item for item in batch if not item.future.cancelled()]
+            if not batch:
+                continue
+
+            started = time.perf_counter()
+            unique_texts = list(dict.fromkeys(item.text for item in batch))
+
+            try:
+                embeddings = await loop.run_in_executor(self._executor, self.encode_fn, unique_texts)
+                by_text = dict(zip(unique_texts, embeddings))
+                for item in batch:
+                    if not item.future.done():
+                        item.future.set_result(by_text.get(item.text))
+            except Exception as e:
+                self._errors += 1
+                logger.error(f"Batched encoding of {len(unique_texts)} texts failed: {e}")
+                for item in batch:
+                    if not item.future.done():
+                        item.future.set_exception(e)
+
+            waits = [started - item.enqueued_at for item in batch]
+            self._batches += 1
+            self._texts += len(batch)
+            self._unique_texts += len(unique_texts)
+            self._max_batch = max(self._max_batch, len(batch))
+            self._wait_total += sum(waits)
+            self._wait_max = max(self._wait_max, max(waits))
+            self._encode_time_total += time.perf_counter() - started
+
+    async def stop(self) -> None:
+        """Cancel the worker; queued callers are cancelled as well."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        while self._queue is not None and not self._queue.empty():
+            self._queue.get_nowait().future.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get batching metrics for this process.
+
+        Returns:
+            Dict with batch counts, average/max batch size, average/max queue
+            wait and encode time in milliseconds, current queue depth and errors
+        """
+        batches = max(self._batches, 1)
+        texts = max(self._texts, 1)
+        return {
+            "batches": self._batches,
+            "texts": self._texts,
+            "unique_texts": self._unique_texts,
+            "avg_batch_size": round(self._texts / batches, 2),
+            "max_batch_size": self._max_batch,
+            "avg_queue_wait_ms": round(self._wait_total / texts * 1000, 3),
+            "max_queue_wait_ms": round(self._wait_max * 1000, 3),
+            "avg_encode_ms": round(self._encode_time_total / batches * 1000, 3),
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_capacity": self.max_queue_size,
+            "errors": self._errors,
+        }
+
+
+# Singleton instance for convenience
+_default_batcher: Optional[EmbeddingBatcher] = None
+
+
+def get_embedding_batcher() -> Optional[EmbeddingBatcher]:
+    """
+    Get or create the API process embedding batcher.
+
+    The batcher encodes through the unified matcher's VectorSimilarityMatcher,
+    so batched embeddings go through the same embedding store, chunking and
+    inference backend as direct calls.
+
+    Returns:
+        EmbeddingBatcher instance, or None if batching is disabled or
+        vector matching is not available
+    """
+    global _default_batcher
+    if _default_batcher is None:
+        from config import get_settings
+
+        from .unified_matcher import get_unified_matcher
+
+        settings = get_settings()
+        if not settings.encoder_batching_enabled:
+            return None
+
+        vector_matcher = get_unified_matcher().vector_matcher
+        if vector_matcher is None:
+            return None
+
+        _default_batcher = EmbeddingBatcher(
+            vector_matcher._encode_texts,
+            max_batch_size=settings.encoder_batch_size,
+            max_wait_ms=settings.encoder_batch_wait_ms,
+            max_queue_size=settings.encoder_queue_size,
+        )
+        logger.info(
+            f"Embedding batcher initialized: batch={settings.encoder_batch_size}, "
+            f"wait={settings.encoder_batch_wait_ms}ms, queue={settings.encoder_queue_size}"
+        )
+    return _default_batcher
+
+
+async def shutdown_embedding_batcher() -> None:
+    """Stop the default batcher's worker if it was started."""
+    if _default_batcher is not None:
+        await _default_batcher.stop()
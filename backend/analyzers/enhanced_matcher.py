@@ -11,17 +11,53 @@ string comparison to include:
 """
 import json
 import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
 from difflib import SequenceMatcher
 
+from .fuzzy_index import get_fuzzy_index
+from .skill_ids import canonicalize_skill_name, first_skill_by_id, skill_id
+from .synonym_index import get_synonym_index
+
 logger = logging.getLogger(__name__)
 
 # Path to skill synonyms file
 SYNONYMS_FILE = Path(__file__).parent.parent / "models" / "skill_synonyms.json"
 
-# Cache for skill synonyms
-_synonyms_cache: Optional[Dict[str, List[str]]] = None
+# Cache for skill synonyms, shared by all matcher instances:
+# file path -> (file content, synonyms map, taxonomy map by category)
+_synonyms_cache: Dict[str, Tuple[str, Dict[str, List[str]], Dict[str, Dict[str, List[str]]]]] = {}
+
+# Number of required skill lists whose compiled forms are kept
+COMPILED_SKILLS_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class CompiledSkill:
+    """
+    Vacancy-side form of a required skill, prepared once for many resumes.
+
+    Attributes:
+        skill: Skill name as written in the vacancy
+        normalized: Normalized skill name
+        skill_id: Interned ID of the normalized name
+        variants: Normalized synonyms of the skill, itself included
+        per_skill: Whether the skill needs the per-skill matching path
+    """
+
+    skill: str
+    normalized: str
+    skill_id: int
+    variants: FrozenSet[str]
+    per_skill: bool = False
+
+
+# Compiled required skills: (skill list, synonym index id) -> (index, skills)
+_compiled_cache: "OrderedDict[Tuple[Tuple[str, ...], int], Tuple[Any, Tuple[CompiledSkill, ...]]]" = OrderedDict()
+_compiled_cache_lock = threading.Lock()
 
 
 class EnhancedSkillMatcher:
@@ -45,6 +81,13 @@ class EnhancedSkillMatcher:
         0.7
     """
 
+    # Acceptable resume variants for C-family requirements
+    LANGUAGE_HIERARCHY: Dict[str, List[str]] = {
+        'c': ['c', 'c++', 'c/c++'],
+        'c++': ['c++', 'c/c++'],
+        'c#': ['c#', 'c sharp'],
+    }
+
     def __init__(self, synonyms_file: Optional[Path] = None):
         """
         Initialize the enhanced skill matcher.
@@ -81,7 +124,16 @@ class EnhancedSkillMatcher:
 
         try:
             with open(self.synonyms_file, "r", encoding="utf-8") as f:
-                synonyms_data = json.load(f)
+                content = f.read()
+
+            # Reuse the parsed map (and so its synonym index) while the file is unchanged
+            cache_key = str(self.synonyms_file)
+            cached = _synonyms_cache.get(cache_key)
+            if cached is not None and cached[0] == content:
+                _, self._synonyms_map, self._taxonomy_map = cached
+                return self._synonyms_map
+
+            synonyms_data = json.loads(content)
 
             # Flatten the category structure into a single dictionary
             # Input: {"databases": {"SQL": ["SQL", "PostgreSQL", ...]}}
@@ -102,6 +154,7 @@ class EnhancedSkillMatcher:
                             self._taxonomy_map[category][canonical_name] = list(all_synonyms)
 
             self._synonyms_map = flat_synonyms
+            _synonyms_cache[cache_key] = (content, flat_synonyms, self._taxonomy_map)
             logger.info(f"Loaded {len(flat_synonyms)} skill synonym mappings")
             return flat_synonyms
 
@@ -134,14 +187,8 @@ class EnhancedSkillMatcher:
             >>> EnhancedSkillMatcher.normalize_skill_name("  React JS  ")
             "react js"
         """
-        # Remove extra whitespace and convert to lowercase
-        normalized = " ".join(skill.strip().lower().split())
-
-        # Remove common punctuation that doesn't affect meaning
-        # Keep: letters, numbers, spaces, dots, plus, hash
-        normalized = "".join(c for c in normalized if c.isalnum() or c in " .+#")
-
-        return normalized
+        # Memoized process-wide; keeps letters, numbers, spaces, dots, plus, hash
+        return canonicalize_skill_name(skill)
 
     def calculate_fuzzy_similarity(self, skill1: str, skill2: str) -> float:
         """
@@ -176,8 +223,8 @@ class EnhancedSkillMatcher:
         """
         Find a synonym match for the required skill in resume skills.
 
-        Searches through the synonyms map to find if any resume skill
-        is a synonym of the required skill.
+        Looks up the variants of the required skill in the inverted index
+        of the synonyms map and checks whether any resume skill is one of them.
 
         Args:
             resume_skills: List of skills extracted from the resume
@@ -195,19 +242,9 @@ class EnhancedSkillMatcher:
         """
         normalized_required = self.normalize_skill_name(required_skill)
 
-        # Build set of all variants for the required skill
-        all_variants = {normalized_required}
-
-        for canonical_name, synonym_list in synonyms_map.items():
-            normalized_canonical = self.normalize_skill_name(canonical_name)
-            if normalized_canonical == normalized_required:
-                all_variants.update([self.normalize_skill_name(s) for s in synonym_list])
-            else:
-                for synonym in synonym_list:
-                    if self.normalize_skill_name(synonym) == normalized_required:
-                        all_variants.add(normalized_canonical)
-                        all_variants.update([self.normalize_skill_name(s) for s in synonym_list])
-                        break
+        # All variants of the required skill: itself plus the canonical names and
+        # synonyms of every entry it belongs to (one lookup in the inverted index)
+        all_variants = get_synonym_index(synonyms_map, self.normalize_skill_name).variants(normalized_required)
 
         # Find matching resume skill
         for resume_skill in resume_skills:
@@ -305,6 +342,8 @@ class EnhancedSkillMatcher:
 
         Uses string similarity to detect typos and minor variations.
         Useful when the resume has "ReactJS" and vacancy requires "React.js".
+        Resume skills are looked up through a bigram index built once per
+        skill list; scores are the same as calculate_fuzzy_similarity().
 
         Args:
             resume_skills: List of skills extracted from the resume
@@ -320,17 +359,38 @@ class EnhancedSkillMatcher:
             >>> result
             ('ReactJS', 0.85)
         """
-        best_match: Optional[Tuple[str, float]] = None
-        best_similarity = 0.0
+        if not resume_skills:
+            return None
 
-        for resume_skill in resume_skills:
-            similarity = self.calculate_fuzzy_similarity(resume_skill, required_skill)
+        index = get_fuzzy_index(resume_skills, self.normalize_skill_name)
+        return index.best_match(required_skill, threshold)
+
+    def find_canonical_skill(
+        self,
+        skill: str,
+        threshold: float = 0.7
+    ) -> Optional[Tuple[str, float]]:
+        """
+        Resolve a skill name, possibly misspelled, to its canonical taxonomy name.
 
-            if similarity >= threshold and similarity > best_similarity:
-                best_match = (resume_skill, similarity)
-                best_similarity = similarity
+        Args:
+            skill: Skill name as written (e.g. "Kubernets")
+            threshold: Minimum similarity score (0.0-1.0) to consider a match
 
-        return best_match
+        Returns:
+            Tuple of (canonical_name, confidence) if found, None otherwise
+
+        Example:
+            >>> matcher = EnhancedSkillMatcher()
+            >>> matcher.find_canonical_skill("Kubernets")
+            ('Kubernetes', 0.947...)
+        """
+        synonyms_map = self.load_synonyms()
+        if not synonyms_map or not skill:
+            return None
+
+        index = get_synonym_index(synonyms_map, self.normalize_skill_name)
+        return index.closest_canonical(self.normalize_skill_name(skill), threshold)
 
     def _split_compound_skill(self, skill: str) -> List[str]:
         """
@@ -424,16 +484,16 @@ class EnhancedSkillMatcher:
 
         normalized_required = self.normalize_skill_name(required_skill)
 
-        # Strategy 1: Direct match
-        for resume_skill in resume_skills:
-            if self.normalize_skill_name(resume_skill) == normalized_required:
-                result.update({
-                    "matched": True,
-                    "confidence": 1.0,
-                    "matched_as": resume_skill,
-                    "match_type": "direct"
-                })
-                return result
+        # Strategy 1: Direct match (one lookup in the resume's interned skill IDs)
+        direct_match = first_skill_by_id(resume_skills).get(skill_id(required_skill))
+        if direct_match is not None:
+            result.update({
+                "matched": True,
+                "confidence": 1.0,
+                "matched_as": direct_match,
+                "match_type": "direct"
+            })
+            return result
 
         # Strategy 1.5: Compound skill match (e.g., "C/C++" contains "C")
         for resume_skill in resume_skills:
@@ -451,11 +511,7 @@ class EnhancedSkillMatcher:
 
         # Strategy 1.75: C/C++ language hierarchy match
         # C++ implies C knowledge, C# doesn't imply C
-        c_related = {
-            'c': ['c', 'c++', 'c/c++'],
-            'c++': ['c++', 'c/c++'],
-            'c#': ['c#', 'c sharp'],
-        }
+        c_related = self.LANGUAGE_HIERARCHY
         if normalized_required in c_related:
             for resume_skill in resume_skills:
                 normalized_resume = self.normalize_skill_name(resume_skill)
@@ -525,21 +581,81 @@ class EnhancedSkillMatcher:
         # No match found
         return result
 
+    def compile_required_skills(self, required_skills: Sequence[str]) -> Tuple[CompiledSkill, ...]:
+        """
+        Prepare required skills for matching against many resumes.
+
+        Normalizes each skill and expands it to its synonyms once. Results
+        are cached per skill list and synonyms map, so a vacancy is compiled
+        once no matter how many resumes are matched against it.
+
+        Args:
+            required_skills: List of skills required by the vacancy
+
+        Returns:
+            Tuple of CompiledSkill, one per distinct skill, in list order
+
+        Example:
+            >>> matcher = EnhancedSkillMatcher()
+            >>> compiled = matcher.compile_required_skills(['React', 'SQL'])
+            >>> 'postgresql' in compiled[1].variants
+            True
+        """
+        synonym_index = get_synonym_index(self.load_synonyms(), self.normalize_skill_name)
+        key = (tuple(required_skills), id(synonym_index))
+
+        with _compiled_cache_lock:
+            cached = _compiled_cache.get(key)
+            # The index itself is held by the cache, so its id cannot be reused meanwhile
+            if cached is not None and cached[0] is synonym_index:
+                _compiled_cache.move_to_end(key)
+                return cached[1]
+
+        compiled: Dict[str, CompiledSkill] = {}
+        for skill in required_skills:
+            if skill in compiled:
+                continue
+            normalized = self.normalize_skill_name(skill) if skill else ""
+            compiled[skill] = CompiledSkill(
+                skill=skill,
+                normalized=normalized,
+                skill_id=skill_id(skill) if skill else 0,
+                variants=synonym_index.variants(normalized),
+                per_skill=not skill or normalized in self.LANGUAGE_HIERARCHY,
+            )
+        result = tuple(compiled.values())
+
+        with _compiled_cache_lock:
+            _compiled_cache[key] = (synonym_index, result)
+            while len(_compiled_cache) > COMPILED_SKILLS_CACHE_SIZE:
+                _compiled_cache.popitem(last=False)
+
+        return result
+
     def match_multiple(
         self,
         resume_skills: List[str],
         required_skills: List[str],
         context: Optional[str] = None,
-        organization_id: Optional[str] = None
+        organization_id: Optional[str] = None,
+        compiled_skills: Optional[Sequence[CompiledSkill]] = None
     ) -> Dict[str, Dict[str, Any]]:
         """
         Match multiple required skills against resume skills.
 
+        Gives the same results as calling match_with_context() per skill, but
+        normalizes and expands the resume skills once: direct, compound and
+        synonym matches are dict and set lookups, and fuzzy matching only
+        runs for the skills left unmatched.
+
         Args:
             resume_skills: List of skills extracted from the resume
             required_skills: List of skills required by the vacancy
             context: Optional context hint for all matches
             organization_id: Optional organization ID for custom synonyms
+            compiled_skills: required_skills as returned by
+                             compile_required_skills(), to skip the
+                             vacancy-side work when matching many resumes
 
         Returns:
             Dictionary mapping each required skill to its match result
@@ -557,14 +673,96 @@ class EnhancedSkillMatcher:
             True  # PostgreSQL matched via synonym
         """
         results: Dict[str, Dict[str, Any]] = {}
+        if not resume_skills:
+            for skill in required_skills:
+                results[skill] = self.match_with_context(
+                    resume_skills, skill, context, organization_id
+                )
+            return results
+
+        if compiled_skills is None:
+            compiled_skills = self.compile_required_skills(required_skills)
+
+        # Normalize and expand the resume skills once for all required skills:
+        # skill ID -> first skill (direct), compound part -> first compound
+        # skill, normalized name -> first position (synonyms)
+        direct_by_id = first_skill_by_id(resume_skills)
+        compound_by_part: Dict[str, str] = {}
+        first_position: Dict[str, int] = {}
+        for position, resume_skill in enumerate(resume_skills):
+            first_position.setdefault(self.normalize_skill_name(resume_skill), position)
+            parts = self._split_compound_skill(resume_skill)
+            if len(parts) > 1:
+                for part in parts:
+                    compound_by_part.setdefault(self.normalize_skill_name(part), resume_skill)
+        resume_names = first_position.keys()
+
+        for compiled in compiled_skills:
+            skill = compiled.skill
+            if skill in results:
+                continue
+
+            normalized_required = compiled.normalized
+            if compiled.per_skill:
+                # Rare cases keep the per-skill path (same strategy order)
+                results[skill] = self.match_with_context(
+                    resume_skills, skill, context, organization_id
+                )
+                continue
+
+            # Strategy 1: Direct match
+            matched_as = direct_by_id.get(compiled.skill_id)
+            if matched_as is not None:
+                results[skill] = self._match_result(1.0, matched_as, "direct")
+                continue
+
+            # Strategy 1.5: Compound skill match
+            matched_as = compound_by_part.get(normalized_required)
+            if matched_as is not None:
+                results[skill] = self._match_result(0.9, matched_as, "compound")
+                continue
+
+            # Strategy 2: Context-aware match
+            if context:
+                context_match = self.find_context_match(resume_skills, skill, context)
+                if context_match:
+                    results[skill] = self._match_result(context_match[1], context_match[0], "context")
+                    continue
+
+            # Strategy 3: Synonym match, one set intersection with the resume names
+            shared = compiled.variants & resume_names
+            if shared:
+                position = min(first_position[name] for name in shared)
+                normalized_resume = self.normalize_skill_name(resume_skills[position])
+                confidence = 0.95 if normalized_resume == normalized_required else 0.85
+                results[skill] = self._match_result(confidence, resume_skills[position], "synonym")
+                continue
+
+            # Strategy 4: Fuzzy match on the leftovers
+            fuzzy_match = self.find_fuzzy_match(resume_skills, skill)
+            if fuzzy_match:
+                results[skill] = self._match_result(fuzzy_match[1], fuzzy_match[0], "fuzzy")
+                continue
 
-        for skill in required_skills:
-            results[skill] = self.match_with_context(
-                resume_skills, skill, context, organization_id
-            )
+            results[skill] = self._match_result(0.0, None, "none", matched=False)
 
         return results
 
+    @staticmethod
+    def _match_result(
+        confidence: float,
+        matched_as: Optional[str],
+        match_type: str,
+        matched: bool = True
+    ) -> Dict[str, Any]:
+        """Build a match result dict as returned by match_with_context()."""
+        return {
+            "matched": matched,
+            "confidence": confidence,
+            "matched_as": matched_as,
+            "match_type": match_type,
+        }
+
     def calculate_match_percentage(
         self,
         match_results: Dict[str, Dict[str, Any]]
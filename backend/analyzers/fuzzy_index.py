@@ -0,0 +1,185 @@
+"""
+Character bigram index for fuzzy skill lookups.
+
+Fuzzy matching used to run difflib's SequenceMatcher between a required
+skill and every resume skill, normalizing both sides each time. This module
+normalizes a skill list once and keeps postings of padded character bigrams,
+so a lookup only verifies the skills that share a bigram with the query.
+
+Confidence is still SequenceMatcher's ratio(), computed the same way as
+EnhancedSkillMatcher.calculate_fuzzy_similarity, so scores and thresholds
+keep their scale.
+
+Why candidates sharing a bigram are enough: if two strings share no padded
+bigram, every matching block has length 1, and each of the k blocks is
+separated from its neighbours and from both string ends by at least one
+unmatched character. Then len(a) + len(b) >= 3k + 1 and
+ratio = 2k / (len(a) + len(b)) < 2/3. For thresholds of 2/3 and above the
+index returns exactly what a full scan returns; lower thresholds fall back
+to verifying every skill.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Lowest threshold for which bigram candidates are exact (see module docstring)
+MIN_INDEXED_THRESHOLD = 2 / 3
+
+# Number of skill lists whose indexes are kept
+INDEX_CACHE_SIZE = 256
+
+# Padding around names, so first and last characters form bigrams too
+_START, _END = "\x02", "\x03"
+
+
+def _bigrams(text: str) -> set:
+    padded = f"{_START}{text}{_END}"
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+class FuzzySkillIndex:
+    """
+    Fuzzy lookup over a fixed list of skill names.
+
+    Names that normalize to the same string are kept once, under their
+    first occurrence, so lookups return what a scan in list order would.
+
+    Example:
+        >>> index = FuzzySkillIndex(["Kubernetes", "Docker"], str.lower)
+        >>> index.best_match("kubernets")
+        ('Kubernetes', 0.947...)
+    """
+
+    def __init__(self, skills: Sequence[str], normalize: Callable[[str], str]):
+        """
+        Build the index.
+
+        Args:
+            skills: Skill names, in priority order for equal scores
+            normalize: Function normalizing skill names for comparison
+        """
+        self.normalize = normalize
+        self.skills: List[str] = []
+        self.normalized: List[str] = []
+        self._postings: Dict[str, List[int]] = {}
+
+        seen = set()
+        for skill in skills:
+            normalized = normalize(skill)
+            if normalized in seen:
+                continue
+            seen.add(normalized)
+
+            skill_id = len(self.skills)
+            self.skills.append(skill)
+            self.normalized.append(normalized)
+            for bigram in _bigrams(normalized):
+                self._postings.setdefault(bigram, []).append(skill_id)
+
+    def _candidates(self, query: str, threshold: float) -> List[int]:
+        """Skill ids that can reach the threshold, in list order."""
+        if threshold < MIN_INDEXED_THRESHOLD:
+            return list(range(len(self.skills)))
+
+        shared = set()
+        for bigram in _bigrams(query):
+            shared.update(self._postings.get(bigram, ()))
+        return sorted(shared)
+
+    def search(
+        self,
+        query: str,
+        threshold: float = 0.7,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Find skills similar to a query.
+
+        Args:
+            query: Skill name (normalized by the index)
+            threshold: Minimum similarity score (0.0-1.0)
+            limit: Maximum number of results (all if None)
+
+        Returns:
+            List of (skill, similarity), best first; equal scores keep
+            list order
+        """
+        normalized_query = self.normalize(query)
+        hits: List[Tuple[int, float]] = []
+
+        matcher = SequenceMatcher(None, "", normalized_query)
+        for skill_id in self._candidates(normalized_query, threshold):
+            # Cheap upper bounds first, as difflib.get_close_matches does
+            matcher.set_seq1(self.normalized[skill_id])
+            if (
+                matcher.real_quick_ratio() >= threshold
+                and matcher.quick_ratio() >= threshold
+            ):
+                similarity = matcher.ratio()
+                # Unrelated names never match, even with a zero threshold
+                if similarity >= threshold and similarity > 0:
+                    hits.append((skill_id, similarity))
+
+        hits.sort(key=lambda hit: (-hit[1], hit[0]))
+        if limit is not None:
+            hits = hits[:limit]
+        return [(self.skills[skill_id], similarity) for skill_id, similarity in hits]
+
+    def best_match(self, query: str, threshold: float = 0.7) -> Optional[Tuple[str, float]]:
+        """
+        Find the most similar skill.
+
+        Args:
+            query: Skill name (normalized by the index)
+            threshold: Minimum similarity score (0.0-1.0)
+
+        Returns:
+            Tuple of (skill, similarity), or None if no skill reaches the
+            threshold
+        """
+        hits = self.search(query, threshold, limit=1)
+        return hits[0] if hits else None
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+
+_index_cache: "OrderedDict[Tuple[Tuple[str, ...], Callable], FuzzySkillIndex]" = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+
+def get_fuzzy_index(skills: Sequence[str], normalize: Callable[[str], str]) -> FuzzySkillIndex:
+    """
+    Get a fuzzy index for a skill list, reusing recently built ones.
+
+    Matching a resume against a vacancy looks up every required skill in
+    the same resume skills, so the index is built once per resume.
+
+    Args:
+        skills: Skill names
+        normalize: Function normalizing skill names for comparison
+
+    Returns:
+        FuzzySkillIndex over the skills
+    """
+    # Bound methods are recreated on every attribute access; key on the function
+    key = (tuple(skills), getattr(normalize, "__func__", normalize))
+
+    with _index_cache_lock:
+        index = _index_cache.get(key)
+        if index is not None:
+            _index_cache.move_to_end(key)
+            return index
+
+    index = FuzzySkillIndex(key[0], normalize)
+
+    with _index_cache_lock:
+        _index_cache[key] = index
+        while len(_index_cache) > INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+
+    return index
@@ -8,11 +8,14 @@ and its Keras 3 compatibility issues.
 import logging
 from typing import Dict, List, Optional, Tuple, Union
 
+from .inference_backend import load_ner_pipeline, resolve_backend
+from .keyword_scanner import get_keyword_scanner
+from .model_registry import get_model_registry
+
 logger = logging.getLogger(__name__)
 
 # Global model instances to avoid reloading on each call
-_ner_pipeline = None
-_ner_model_name = None
+# (NER pipelines live in the shared model registry, one per language model)
 _zero_shot_pipeline = None
 _zero_shot_model_name = None
 
@@ -968,35 +971,26 @@ def _get_ner_model(model_name: str = None, language: str = None) -> Optional:
 
     Returns:
         Initialized Hugging Face pipeline or None if loading fails
-    """
-    global _ner_pipeline, _ner_model_name
 
+    The inference backend (PyTorch or ONNX Runtime) is taken from
+    settings.inference_backend; see inference_backend.py. Loaded pipelines
+    are kept in the shared model registry, so English and multilingual
+    models stay loaded side by side.
+    """
     # Auto-select model based on language if not specified
     if model_name is None:
         model_name = _get_model_for_language(language or "en")
 
-    if _ner_pipeline is None or _ner_model_name != model_name:
-        try:
-            from transformers import pipeline
+    backend = resolve_backend()
 
-            logger.info(f"Loading NER model: {model_name}")
-            _ner_pipeline = pipeline(
-                "ner",
-                model=model_name,
-                aggregation_strategy="simple",  # Merge sub-tokens
-                device=-1,  # Use CPU (change to 0 for GPU)
-            )
-            _ner_model_name = model_name
-            logger.info(f"NER model '{model_name}' loaded successfully")
-        except ImportError as e:
-            logger.error(f"Transformers not installed: {e}")
-            logger.error("Install with: pip install transformers torch")
-            _ner_pipeline = None
-        except Exception as e:
-            logger.error(f"Failed to load NER model '{model_name}': {e}")
-            _ner_pipeline = None
+    def load():
+        logger.info(f"Loading NER model: {model_name} ({backend})")
+        ner_pipeline, loaded_backend = load_ner_pipeline(model_name, backend)
+        if ner_pipeline is not None:
+            logger.info(f"NER model '{model_name}' loaded successfully on {loaded_backend}")
+        return ner_pipeline
 
-    return _ner_pipeline
+    return get_model_registry().get("ner", model_name, backend, load)
 
 
 def _get_zero_shot_model(model_name: str = "facebook/bart-large-mnli") -> Optional:
@@ -1323,8 +1317,6 @@ def extract_skills_pattern_matching(
             - model: "pattern-matching"
             - error: Error message if extraction failed
     """
-    import re
-
     if skill_list is None:
         skill_list = COMMON_SKILLS
 
@@ -1352,16 +1344,18 @@ def extract_skills_pattern_matching(
         # Prepare text for matching
         search_text = text if case_sensitive else text.lower()
 
-        # Find skills with their counts
+        # Count occurrences of all skills in one pass
+        # (using word boundaries to avoid partial matches)
+        skill_patterns = {
+            skill: skill if case_sensitive else skill.lower() for skill in skill_list
+        }
+        counts = get_keyword_scanner(skill_patterns.values()).count(search_text)
+
         skills_found = {}
-        for skill in skill_list:
-            skill_pattern = skill if case_sensitive else skill.lower()
-            # Count occurrences (using word boundaries to avoid partial matches)
-            pattern = r'\b' + re.escape(skill_pattern) + r'\b'
-            matches = re.findall(pattern, search_text)
-            if matches:
+        for skill, skill_pattern in skill_patterns.items():
+            if counts.get(skill_pattern):
                 # Preserve original casing from skill list
-                skills_found[skill] = len(matches)
+                skills_found[skill] = counts[skill_pattern]
 
         # Convert to (skill, score) tuples where score = count
         skills_with_scores = [
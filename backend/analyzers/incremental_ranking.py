@@ -0,0 +1,342 @@
+"""
+Incremental training of the ranking model from recruiter feedback.
+
+Retraining the forest on the whole feedback history gets slower with
+every rating. Instead, an SGD logistic regression (RankingModel type
+"sgd") keeps learning: each run reads only the feedback submitted since
+the checkpoint of the newest published version, updates that model with
+partial_fit(), evaluates it on a held-out window and publishes the result
+as a new version. The cost of a run depends on the amount of new feedback,
+not on the size of the history.
+
+Key features:
+- Keyset pagination on (created_at, id) from the checkpoint stored in the
+  manifest of the newest version; feedback younger than
+  FEEDBACK_SETTLE_SECONDS is left for the next run, so rows committed late
+  by slower transactions are not skipped
+- Rankings store the feature vector the model scored (extra_metadata),
+  so training uses exactly those inputs; older rankings are recomputed
+- The newest HOLDOUT_FRACTION of the batch is held out and only consumed
+  by the next run, so every row is evaluated once before it is trained on
+- A new version is always published (training continues from it); it is
+  activated only if its holdout log loss is no worse than the active
+  version's, and registered as an MLModelVersion either way
+"""
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+from numpy import typing as npt
+from sklearn.metrics import log_loss, roc_auc_score
+from sklearn.preprocessing import StandardScaler
+from sqlalchemy import and_, or_, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import CandidateRank, JobVacancy, MatchResult, MLModelVersion, RankingFeedback, Resume, ResumeAnalysis
+
+from .embedding_store import exclusive_file_lock
+from .model_versioning import ModelVersionManager
+from .ranking_artifacts import RANKING_MODEL_NAME, RankingArtifactStore, get_ranking_artifact_store
+from .ranking_service import MODELS_DIR, RankingFeatures, RankingModel, RankingService
+
+logger = logging.getLogger(__name__)
+
+# RankingModel type updated incrementally
+ONLINE_MODEL_TYPE = "sgd"
+
+# Name of the online model's versions in MLModelVersion records
+ONLINE_MODEL_NAME = f"{RANKING_MODEL_NAME}_{ONLINE_MODEL_TYPE}"
+
+# Newest share of each batch held out for evaluation
+HOLDOUT_FRACTION = 0.2
+
+# Feedback younger than this is left for the next run
+FEEDBACK_SETTLE_SECONDS = 60
+
+# Labels of the binary ranking target
+_CLASSES = np.array([0, 1])
+
+# Feedback that carries a label (see feedback_label())
+_LABELED_FEEDBACK = or_(
+    RankingFeedback.actual_outcome.in_(("hired", "rejected")),
+    RankingFeedback.adjusted_score.is_not(None),
+    and_(RankingFeedback.rating.is_not(None), RankingFeedback.rating != 3),
+)
+
+# (created_at, id) of a feedback row; training resumes after it
+FeedbackKey = Tuple[datetime, UUID]
+
+
+def feedback_label(feedback: RankingFeedback) -> Optional[int]:
+    """
+    Training label of a feedback entry.
+
+    The hiring outcome wins over the recruiter's adjusted score, which
+    wins over the star rating.
+
+    Args:
+        feedback: RankingFeedback record
+
+    Returns:
+        1 (suitable), 0 (unsuitable) or None if the feedback has no label
+    """
+    if feedback.actual_outcome == "hired":
+        return 1
+    if feedback.actual_outcome == "rejected":
+        return 0
+    if feedback.adjusted_score is not None:
+        return int(float(feedback.adjusted_score) >= 0.5)
+    if feedback.rating is not None:
+        rating = int(feedback.rating)
+        if rating >= 4:
+            return 1
+        if rating <= 2:
+            return 0
+    return None
+
+
+def _checkpoint_key(training: Dict[str, Any]) -> Optional[FeedbackKey]:
+    """Feedback key stored in a manifest's training state."""
+    checkpoint = training.get("checkpoint")
+    if not checkpoint:
+        return None
+    return datetime.fromisoformat(checkpoint["created_at"]), UUID(checkpoint["id"])
+
+
+def _stored_features(rank: CandidateRank) -> Optional[List[float]]:
+    """Feature vector a ranking was scored with, if it was stored."""
+    features = (rank.extra_metadata or {}).get("features")
+    if features is None or len(features) != len(RankingFeatures.FEATURE_NAMES):
+        return None
+    return features
+
+
+async def fetch_feedback_samples(
+    db: AsyncSession,
+    checkpoint: Optional[FeedbackKey],
+    limit: int,
+    settled_before: datetime,
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.int64], List[FeedbackKey]]:
+    """
+    Read the labeled feedback submitted after a checkpoint.
+
+    Args:
+        db: Database session
+        checkpoint: Key of the last feedback already consumed (None = from the start)
+        limit: Maximum number of feedback rows
+        settled_before: Only feedback created up to this time
+
+    Returns:
+        Tuple of (features, labels, keys), oldest feedback first
+    """
+    query = (
+        select(RankingFeedback, CandidateRank)
+        .join(CandidateRank, CandidateRank.id == RankingFeedback.rank_id)
+        .where(_LABELED_FEEDBACK, RankingFeedback.created_at <= settled_before)
+        .order_by(RankingFeedback.created_at, RankingFeedback.id)
+        .limit(limit)
+    )
+    if checkpoint is not None:
+        query = query.where(tuple_(RankingFeedback.created_at, RankingFeedback.id) > tuple_(*checkpoint))
+
+    samples = []
+    for feedback, rank in (await db.execute(query)).all():
+        label = feedback_label(feedback)
+        if label is not None:
+            samples.append((feedback, rank, label))
+
+    # Rankings stored before feature vectors were kept: recompute from their inputs
+    missing = {rank.id for _, rank, _ in samples if _stored_features(rank) is None}
+    recomputed: Dict[UUID, npt.NDArray[np.float64]] = {}
+    if missing:
+        rows = await db.execute(
+            select(CandidateRank.id, Resume, JobVacancy, ResumeAnalysis, MatchResult)
+            .join(Resume, Resume.id == CandidateRank.resume_id)
+            .join(JobVacancy, JobVacancy.id == CandidateRank.vacancy_id)
+            .outerjoin(ResumeAnalysis, ResumeAnalysis.resume_id == Resume.id)
+            .outerjoin(
+                MatchResult,
+                and_(MatchResult.resume_id == Resume.id, MatchResult.vacancy_id == JobVacancy.id),
+            )
+            .where(CandidateRank.id.in_(missing))
+        )
+        inputs = {}
+        for rank_id, resume, vacancy, analysis, match_record in rows.all():
+            inputs.setdefault(rank_id, (
+                RankingService._resume_data(resume, analysis),
+                RankingService._vacancy_data(vacancy),
+                RankingService._match_data(match_record),
+            ))
+        rank_ids = list(inputs)
+        X_missing = RankingFeatures.extract_feature_matrix([inputs[rank_id] for rank_id in rank_ids])
+        recomputed = dict(zip(rank_ids, X_missing))
+
+    features, labels, keys = [], [], []
+    for feedback, rank, label in samples:
+        vector = _stored_features(rank)
+        if vector is None:
+            vector = recomputed.get(rank.id)
+        if vector is None:
+            # Resume or vacancy deleted meanwhile
+            continue
+        features.append(vector)
+        labels.append(label)
+        keys.append((feedback.created_at, feedback.id))
+
+    X = np.asarray(features, dtype=np.float64).reshape(len(features), len(RankingFeatures.FEATURE_NAMES))
+    return X, np.asarray(labels, dtype=np.int64), keys
+
+
+def evaluate(
+    model: Any, scaler: Any, X: npt.NDArray[np.float64], y: npt.NDArray[np.int64]
+) -> Dict[str, float]:
+    """
+    Score a ranking model on labeled rows.
+
+    Args:
+        model: Fitted classifier with predict_proba()
+        scaler: Fitted StandardScaler applied before the model
+        X: Feature matrix, before scaling
+        y: Labels (0/1)
+
+    Returns:
+        accuracy, log_loss, n_samples and, when both labels occur, roc_auc
+    """
+    proba = model.predict_proba(scaler.transform(X))
+    classes = list(model.classes_)
+    positive = proba[:, classes.index(1)] if 1 in classes else np.zeros(len(X))
+
+    metrics = {
+        "accuracy": float(np.mean((positive >= 0.5) == y)),
+        "log_loss": float(log_loss(y, positive, labels=_CLASSES)),
+        "n_samples": int(len(y)),
+    }
+    if len(np.unique(y)) == 2:
+        metrics["roc_auc"] = float(roc_auc_score(y, positive))
+    return metrics
+
+
+def _training_state(key: FeedbackKey, samples_seen: int, parent: Optional[str]) -> Dict[str, Any]:
+    created_at, feedback_id = key
+    return {
+        "checkpoint": {"created_at": created_at.isoformat(), "id": str(feedback_id)},
+        "samples_seen": samples_seen,
+        "parent": parent,
+    }
+
+
+async def update_ranking_model(
+    db: AsyncSession,
+    store: Optional[RankingArtifactStore] = None,
+    max_samples: int = 5000,
+    min_samples: int = 50,
+    holdout_fraction: float = HOLDOUT_FRACTION,
+    max_log_loss_increase: float = 0.01,
+    activate: bool = True,
+) -> Dict[str, Any]:
+    """
+    Update the online ranking model with the feedback since its checkpoint.
+
+    Args:
+        db: Database session (committed when the version is registered)
+        store: Store of the online model (default: the "sgd" RankingModel store)
+        max_samples: Most feedback rows read per run; the rest is left for the next run
+        min_samples: Fewest labeled rows worth a new version
+        holdout_fraction: Newest share of the rows held out for evaluation
+        max_log_loss_increase: Holdout log loss the new version may lose
+            against the active one and still be activated
+        activate: Whether a version passing the gate is activated
+
+    Returns:
+        Dictionary with status, sample counts, holdout metrics and the
+        published version
+    """
+    if store is None:
+        store = get_ranking_artifact_store(MODELS_DIR / ONLINE_MODEL_TYPE)
+
+    # One trainer per store: concurrent runs would consume the same feedback twice
+    with exclusive_file_lock(store.directory / ".train.lock"):
+        versions = store.versions()
+        parent = versions[-1] if versions else None
+        if parent is not None:
+            # Private writable copy to keep training
+            lineage = store.load(parent, mmap_mode=None)
+            model, scaler = lineage.model, lineage.scaler
+            training = lineage.manifest.get("training", {})
+        else:
+            model, scaler = RankingModel.build_estimator(ONLINE_MODEL_TYPE), StandardScaler()
+            training = {}
+
+        settled_before = datetime.now(timezone.utc) - timedelta(seconds=FEEDBACK_SETTLE_SECONDS)
+        X, y, keys = await fetch_feedback_samples(db, _checkpoint_key(training), max_samples, settled_before)
+        result: Dict[str, Any] = {"samples": len(y), "parent_version": parent, "backlog": len(keys) == max_samples}
+
+        n_holdout = int(len(y) * holdout_fraction)
+        n_train = len(y) - n_holdout
+        if len(y) < min_samples or n_train == 0:
+            logger.info(f"Ranking model update skipped: {len(y)} new labeled feedback (< {min_samples})")
+            return {**result, "status": "skipped"}
+
+        # Baseline: the version serving now, on the same holdout
+        baseline = None
+        active = store.active_version()
+        if n_holdout and active is not None:
+            artifact = store.get(active)
+            baseline = evaluate(artifact.model, artifact.scaler, X[n_train:], y[n_train:])
+
+        X_train, y_train = X[:n_train], y[:n_train]
+        scaler.partial_fit(X_train)
+        model.partial_fit(scaler.transform(X_train), y_train, classes=_CLASSES)
+
+        metrics = evaluate(model, scaler, X[n_train:], y[n_train:]) if n_holdout else {}
+        if baseline is not None:
+            metrics["baseline_version"] = active
+            metrics["baseline_log_loss"] = baseline["log_loss"]
+        metrics["n_train"] = n_train
+
+        activated = activate and (
+            baseline is None or metrics["log_loss"] <= baseline["log_loss"] + max_log_loss_increase
+        )
+        # Held-out rows are trained on by the next run
+        samples_seen = training.get("samples_seen", 0) + n_train
+        manifest = store.publish(
+            model,
+            scaler,
+            None,
+            model_type=ONLINE_MODEL_TYPE,
+            feature_names=RankingFeatures.FEATURE_NAMES,
+            metrics=metrics,
+            activate=activated,
+            training=_training_state(keys[n_train - 1], samples_seen, parent),
+        )
+
+    record = ModelVersionManager().build_version_record(
+        ONLINE_MODEL_NAME, manifest, file_path=str(store.directory / manifest["version"]), is_active=activated
+    )
+    record.is_experiment = not activated
+    if activated:
+        await db.execute(
+            update(MLModelVersion)
+            .where(MLModelVersion.model_name == ONLINE_MODEL_NAME, MLModelVersion.is_active.is_(True))
+            .values(is_active=False)
+        )
+    db.add(record)
+    await db.commit()
+
+    logger.info(
+        f"Ranking model {ONLINE_MODEL_TYPE} {manifest['version']} trained on {n_train} new samples "
+        f"(holdout log loss {metrics.get('log_loss')}, baseline "
+        f"{baseline['log_loss'] if baseline else None}, activated: {activated})"
+    )
+    return {
+        **result,
+        "status": "completed",
+        "version": manifest["version"],
+        "is_active": activated,
+        "training_samples": n_train,
+        "holdout_samples": n_holdout,
+        "samples_seen": samples_seen,
+        "metrics": metrics,
+    }
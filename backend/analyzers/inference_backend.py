@@ -0,0 +1,223 @@
+"""
+Pluggable CPU inference backends for transformer models.
+
+This module loads the sentence-transformers encoder and the Hugging Face
+NER models either as plain PyTorch models or as ONNX Runtime sessions,
+optionally with dynamic int8 quantization. ONNX exports are produced once
+and cached under the models cache volume, so API and Celery workers share
+them.
+
+Backends:
+- "torch": PyTorch models, as loaded by sentence-transformers/transformers
+- "onnx": ONNX Runtime with the float32 graph (same outputs as PyTorch)
+- "onnx-int8": ONNX Runtime with dynamically int8-quantized weights
+
+Any failure to export or load an ONNX model (e.g. optimum or onnxruntime
+missing) is logged and the PyTorch model is used instead.
+
+Layout on disk:
+    <models_cache>/onnx/<model_name>/<backend>/  - exported model directory
+"""
+import logging
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from .embedding_store import exclusive_file_lock, model_dir_name
+
+logger = logging.getLogger(__name__)
+
+# Supported inference backends
+INFERENCE_BACKENDS = ("torch", "onnx", "onnx-int8")
+
+# File written by ORTQuantizer for dynamically quantized models
+QUANTIZED_ONNX_FILE = "model_quantized.onnx"
+
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    """
+    Get the backend to use, defaulting to settings.inference_backend.
+
+    Args:
+        backend: Requested backend or None
+
+    Returns:
+        A name from INFERENCE_BACKENDS ("torch" for unknown names)
+    """
+    if backend is None:
+        from config import get_settings
+
+        backend = get_settings().inference_backend
+
+    backend = backend.lower()
+    if backend not in INFERENCE_BACKENDS:
+        logger.warning(f"Unknown inference backend '{backend}', using torch")
+        return "torch"
+    return backend
+
+
+def _quantization_config() -> str:
+    """Instruction-set target for dynamic int8 quantization."""
+    from config import get_settings
+
+    return get_settings().onnx_quantization_config
+
+
+def export_dir(model_name: str, backend: str) -> Path:
+    """
+    Directory holding the exported model for a backend.
+
+    Args:
+        model_name: Hugging Face model name
+        backend: "onnx" or "onnx-int8"
+
+    Returns:
+        Path under <models_cache_path>/onnx
+    """
+    from config import get_settings
+
+    return get_settings().models_cache_path / "onnx" / model_dir_name(model_name) / backend
+
+
+def _load_onnx_sentence_transformer(model_name: str, backend: str, device: Optional[str]) -> Any:
+    """Export (once) and load a sentence-transformers model on ONNX Runtime."""
+    from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+
+    directory = export_dir(model_name, backend)
+    with exclusive_file_lock(directory.parent / f".{backend}.lock"):
+        if not (directory / "modules.json").exists():
+            logger.info(f"Exporting {model_name} to ONNX at {directory}")
+            model = SentenceTransformer(model_name, backend="onnx", device=device)
+            model.save_pretrained(str(directory))
+
+        if backend == "onnx":
+            return SentenceTransformer(str(directory), backend="onnx", device=device)
+
+        config = _quantization_config()
+        file_name = f"onnx/model_qint8_{config}.onnx"
+        if not (directory / file_name).exists():
+            logger.info(f"Quantizing {model_name} to int8 ({config})")
+            model = SentenceTransformer(str(directory), backend="onnx", device=device)
+            export_dynamic_quantized_onnx_model(model, config, str(directory))
+
+        return SentenceTransformer(
+            str(directory), backend="onnx", device=device, model_kwargs={"file_name": file_name}
+        )
+
+
+def load_sentence_transformer(
+    model_name: str,
+    backend: Optional[str] = None,
+    device: Optional[str] = None,
+) -> Tuple[Optional[Any], str]:
+    """
+    Load a sentence-transformers model on the requested backend.
+
+    Args:
+        model_name: Sentence-transformers model name
+        backend: Inference backend (defaults to settings)
+        device: Device for the PyTorch backend
+
+    Returns:
+        Tuple of (model or None, backend actually used)
+
+    Example:
+        >>> model, backend = load_sentence_transformer("all-MiniLM-L6-v2", "onnx-int8")
+        >>> model.encode(["Python developer"]).shape
+        (1, 384)
+    """
+    backend = resolve_backend(backend)
+
+    if backend != "torch":
+        try:
+            return _load_onnx_sentence_transformer(model_name, backend, device), backend
+        except Exception as e:
+            logger.warning(f"ONNX backend unavailable for {model_name}, using torch: {e}")
+
+    try:
+        from sentence_transformers import SentenceTransformer
+
+        return SentenceTransformer(model_name, device=device), "torch"
+    except Exception as e:
+        logger.error(f"Failed to load sentence-transformers model {model_name}: {e}")
+        return None, "torch"
+
+
+def _load_onnx_token_classifier(model_name: str, backend: str) -> Tuple[Any, Any]:
+    """Export (once) and load a token-classification model on ONNX Runtime."""
+    from optimum.onnxruntime import ORTModelForTokenClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+
+    directory = export_dir(model_name, backend)
+    with exclusive_file_lock(directory.parent / f".{backend}.lock"):
+        if not (directory / "config.json").exists():
+            logger.info(f"Exporting {model_name} to ONNX at {directory}")
+            model = ORTModelForTokenClassification.from_pretrained(model_name, export=True)
+            model.save_pretrained(directory)
+            AutoTokenizer.from_pretrained(model_name).save_pretrained(directory)
+
+        tokenizer = AutoTokenizer.from_pretrained(directory)
+        if backend == "onnx":
+            return ORTModelForTokenClassification.from_pretrained(directory), tokenizer
+
+        if not (directory / QUANTIZED_ONNX_FILE).exists():
+            config = _quantization_config()
+            logger.info(f"Quantizing {model_name} to int8 ({config})")
+            quantizer = ORTQuantizer.from_pretrained(directory)
+            quantization_config = getattr(AutoQuantizationConfig, config)(
+                is_static=False, per_channel=False
+            )
+            quantizer.quantize(save_dir=directory, quantization_config=quantization_config)
+
+        model = ORTModelForTokenClassification.from_pretrained(directory, file_name=QUANTIZED_ONNX_FILE)
+        return model, tokenizer
+
+
+def load_ner_pipeline(
+    model_name: str,
+    backend: Optional[str] = None,
+) -> Tuple[Optional[Any], str]:
+    """
+    Load a Hugging Face NER pipeline on the requested backend.
+
+    The pipeline merges sub-tokens (aggregation_strategy="simple") and runs
+    on CPU, as the PyTorch pipeline always did.
+
+    Args:
+        model_name: Hugging Face token-classification model name
+        backend: Inference backend (defaults to settings)
+
+    Returns:
+        Tuple of (pipeline or None, backend actually used)
+    """
+    backend = resolve_backend(backend)
+
+    try:
+        from transformers import pipeline
+    except ImportError as e:
+        logger.error(f"Transformers not installed: {e}")
+        logger.error("Install with: pip install transformers torch")
+        return None, backend
+
+    if backend != "torch":
+        try:
+            model, tokenizer = _load_onnx_token_classifier(model_name, backend)
+            return pipeline(
+                "ner",
+                model=model,
+                tokenizer=tokenizer,
+                aggregation_strategy="simple",
+            ), backend
+        except Exception as e:
+            logger.warning(f"ONNX backend unavailable for {model_name}, using torch: {e}")
+
+    try:
+        return pipeline(
+            "ner",
+            model=model_name,
+            aggregation_strategy="simple",  # Merge sub-tokens
+            device=-1,  # Use CPU (change to 0 for GPU)
+        ), "torch"
+    except Exception as e:
+        logger.error(f"Failed to load NER model '{model_name}': {e}")
+        return None, "torch"
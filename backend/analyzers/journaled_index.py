@@ -0,0 +1,186 @@
+"""
+Snapshot plus journal persistence for in-memory indexes shared by processes.
+
+API and Celery workers each keep an index in memory. Every change is
+appended to a journal under a file lock, and the other processes pick it up
+on their next query. The journal is regularly folded into a new snapshot
+generation, and workers start warm from the latest one.
+
+Layout on disk:
+    CURRENT              - generation number of the live snapshot
+    index-<gen>.npz      - snapshot written by the subclass
+    journal-<gen>.jsonl  - JSON records applied after the snapshot
+"""
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .embedding_store import exclusive_file_lock
+
+logger = logging.getLogger(__name__)
+
+# Times refresh() follows CURRENT when compactions delete the generation it reads
+_REFRESH_ATTEMPTS = 3
+
+
+class JournaledIndex:
+    """
+    Base class for disk-backed, multi-process indexes.
+
+    Subclasses keep their data in memory and implement _reset, _apply,
+    _load_snapshot, _save_snapshot and __len__. Public methods that read
+    should hold self._lock and call refresh() first. Methods that write
+    should go through _append().
+    """
+
+    def __init__(self, directory: Path, compact_every: int = 1000):
+        """
+        Initialize the index and load the latest snapshot.
+
+        Args:
+            directory: Directory holding snapshots and journals
+            compact_every: Journal length that triggers a new snapshot
+        """
+        self.directory = Path(directory)
+        self.compact_every = compact_every
+
+        self.current_path = self.directory / "CURRENT"
+        self.lock_path = self.directory / ".lock"
+
+        self._generation = -1
+        self._journal_offset = 0
+        self._journal_ops = 0
+        self._lock = threading.RLock()
+
+        with self._lock:
+            self.refresh()
+
+    def _reset(self) -> None:
+        """Clear the in-memory data (no snapshot exists yet)."""
+        raise NotImplementedError
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        """Apply one journal record to the in-memory data."""
+        raise NotImplementedError
+
+    def _load_snapshot(self, path: Path) -> None:
+        """Replace the in-memory data with a snapshot."""
+        raise NotImplementedError
+
+    def _save_snapshot(self, path: Path) -> bool:
+        """Write the in-memory data to a snapshot; return False if there is nothing to save."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def _snapshot_path(self, generation: int) -> Path:
+        return self.directory / f"index-{generation}.npz"
+
+    def _journal_path(self, generation: int) -> Path:
+        return self.directory / f"journal-{generation}.jsonl"
+
+    def _read_generation(self) -> int:
+        """Read the live generation number (0 if nothing was written yet)."""
+        try:
+            return int(self.current_path.read_text().strip())
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def refresh(self) -> None:
+        """
+        Load a newer snapshot and replay journal records written since the last refresh.
+
+        Readers refresh without the file lock, so a compaction in another
+        process can delete the generation being read. A vanished file means
+        CURRENT moved on; it is read again and the new generation loaded.
+        """
+        for _ in range(_REFRESH_ATTEMPTS):
+            generation = self._read_generation()
+            try:
+                self._refresh_generation(generation)
+                return
+            except FileNotFoundError:
+                if self._read_generation() == generation:
+                    # Not compacted meanwhile (e.g. nothing journaled yet); keep what is loaded
+                    return
+        logger.warning(f"Gave up refreshing {self.directory}: compacted during {_REFRESH_ATTEMPTS} attempts")
+
+    def _refresh_generation(self, generation: int) -> None:
+        """
+        Bring the in-memory data up to date with one generation.
+
+        Raises:
+            FileNotFoundError: If the generation's files were deleted meanwhile
+        """
+        if generation != self._generation:
+            snapshot = self._snapshot_path(generation)
+            if generation == 0 and not snapshot.exists():
+                # Never compacted: the journal holds everything
+                self._reset()
+            else:
+                self._load_snapshot(snapshot)
+            self._generation = generation
+            self._journal_offset = 0
+            self._journal_ops = 0
+
+        with open(self._journal_path(generation), "rb") as f:
+            f.seek(self._journal_offset)
+            chunk = f.read()
+
+        # Only consume complete lines; a partial line is retried next time
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return
+
+        for line in chunk[:end].split(b"\n"):
+            if line.strip():
+                self._apply(json.loads(line))
+                self._journal_ops += 1
+
+        self._journal_offset += end + 1
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        """Durably append records to the journal and apply them."""
+        with self._lock, exclusive_file_lock(self.lock_path):
+            self.refresh()
+
+            with open(self._journal_path(self._generation), "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(r) + "\n" for r in records))
+                f.flush()
+
+            self.refresh()
+
+            if self._journal_ops >= self.compact_every:
+                self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        """Write a new snapshot generation. Caller holds both locks."""
+        new_generation = self._generation + 1
+        if not self._save_snapshot(self._snapshot_path(new_generation)):
+            return
+        self._journal_path(new_generation).touch()
+
+        tmp_path = self.current_path.with_name("CURRENT.tmp")
+        tmp_path.write_text(str(new_generation))
+        os.replace(tmp_path, self.current_path)
+
+        for old in (self._snapshot_path(self._generation), self._journal_path(self._generation)):
+            try:
+                old.unlink()
+            except FileNotFoundError:
+                pass
+
+        self._generation = new_generation
+        self._journal_offset = 0
+        self._journal_ops = 0
+        logger.info(f"Compacted {self.directory} to generation {new_generation} ({len(self)} items)")
+
+    def compact(self) -> None:
+        """Fold the journal into a new snapshot now."""
+        with self._lock, exclusive_file_lock(self.lock_path):
+            self.refresh()
+            self._compact_locked()
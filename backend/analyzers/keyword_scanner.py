@@ -0,0 +1,183 @@
+"""
+Single-pass multi-keyword scanning with word boundaries.
+
+Skill matching used to run one regular expression per keyword over the
+whole text (hundreds of patterns for the skills taxonomy). This module
+builds an Aho-Corasick automaton once per keyword set and finds every
+keyword, with its occurrence count, in one linear pass.
+
+Matches follow the regex rule r"\\b<keyword>\\b" exactly, including for
+keywords that start or end with punctuation ("c++", "c#", ".net"): a
+boundary sits between a word character (str.isalnum() or "_") and a
+non-word character, and occurrences of one keyword never overlap, as
+with re.findall.
+
+Example:
+    >>> scanner = get_keyword_scanner(["python", "machine learning", "sql"])
+    >>> scanner.count("python, sql and more sql")
+    {'python': 1, 'sql': 2}
+"""
+import logging
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+logger = logging.getLogger(__name__)
+
+# Number of compiled keyword sets kept by get_keyword_scanner
+SCANNER_CACHE_SIZE = 256
+
+
+def _is_word_char(ch: str) -> bool:
+    """Whether ch counts as a word character for regex \\b (Unicode \\w)."""
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordScanner:
+    """
+    Aho-Corasick automaton over a fixed set of keywords.
+
+    Keywords are matched case-sensitively; lowercase both keywords and text
+    for case-insensitive matching.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Build the automaton.
+
+        Args:
+            keywords: Keywords to search for (duplicates are ignored)
+        """
+        self.keywords: List[str] = list(dict.fromkeys(keywords))
+
+        # Empty keywords cannot be placed in the trie; they keep regex semantics
+        self._empty_keyword = "" in self.keywords
+        keywords = [keyword for keyword in self.keywords if keyword]
+
+        self._lengths = [len(keyword) for keyword in keywords]
+        self._names = keywords
+        # Whether the first/last character is a word character, which decides
+        # what the neighbouring text character must be for a \b boundary
+        self._starts_word = [_is_word_char(keyword[0]) for keyword in keywords]
+        self._ends_word = [_is_word_char(keyword[-1]) for keyword in keywords]
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for index, keyword in enumerate(keywords):
+            state = 0
+            for ch in keyword:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][ch] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = next_state
+            self._out[state].append(index)
+
+        # Breadth-first failure links; outputs include those of the fail chain
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    def _scan(self, text: str, stop_when_all_found: bool) -> Dict[str, int]:
+        """Walk the automaton over text, counting boundary-respecting matches."""
+        goto, fail, out = self._goto, self._fail, self._out
+        lengths, starts_word, ends_word = self._lengths, self._starts_word, self._ends_word
+        text_length = len(text)
+
+        counts: Dict[int, int] = {}
+        next_allowed: Dict[int, int] = {}  # end of the last counted occurrence per keyword
+        state = 0
+
+        for position, ch in enumerate(text):
+            transitions = goto[state]
+            while ch not in transitions and state:
+                state = fail[state]
+                transitions = goto[state]
+            state = transitions.get(ch, 0)
+
+            if not out[state]:
+                continue
+
+            end = position + 1
+            after_is_word = end < text_length and _is_word_char(text[end])
+            for index in out[state]:
+                start = end - lengths[index]
+                if start < next_allowed.get(index, 0):
+                    continue
+                before_is_word = start > 0 and _is_word_char(text[start - 1])
+                if before_is_word == starts_word[index] or after_is_word == ends_word[index]:
+                    continue
+                counts[index] = counts.get(index, 0) + 1
+                next_allowed[index] = end
+
+            if stop_when_all_found and len(counts) == len(lengths):
+                break
+
+        return {self._names[index]: count for index, count in counts.items()}
+
+    def count(self, text: str) -> Dict[str, int]:
+        """
+        Count occurrences of every keyword found in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Dict of keyword -> number of non-overlapping occurrences
+            (keywords not found are omitted)
+        """
+        counts = self._scan(text, stop_when_all_found=False)
+        if self._empty_keyword:
+            empty_matches = len(re.findall(r"\b\b", text))
+            if empty_matches:
+                counts[""] = empty_matches
+        return counts
+
+    def find(self, text: str) -> Set[str]:
+        """
+        Get the keywords present in text.
+
+        Stops scanning as soon as every keyword has been seen.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of keywords found at least once
+        """
+        found = set(self._scan(text, stop_when_all_found=True))
+        if self._empty_keyword and re.search(r"\b\b", text):
+            found.add("")
+        return found
+
+
+@lru_cache(maxsize=SCANNER_CACHE_SIZE)
+def _cached_scanner(keywords: FrozenSet[str]) -> KeywordScanner:
+    """Build a scanner for a keyword set (cached)."""
+    logger.debug(f"Building keyword scanner for {len(keywords)} keywords")
+    return KeywordScanner(sorted(keywords))
+
+
+def get_keyword_scanner(keywords: Iterable[str]) -> KeywordScanner:
+    """
+    Get the scanner for a keyword set, building it on first use.
+
+    Args:
+        keywords: Keywords to search for
+
+    Returns:
+        KeywordScanner shared by all callers using the same keyword set
+    """
+    return _cached_scanner(frozenset(keywords))
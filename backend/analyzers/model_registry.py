@@ -0,0 +1,267 @@
+"""
+Shared LRU registry of loaded transformer models.
+
+The API and Celery workers use several large models: the sentence
+encoder and one NER model per language (dslim/bert-base-NER for English,
+Davlan/bert-base-multilingual-cased-ner-hrl for Russian), each possibly on
+several inference backends. A single cached slot per model type made a
+mixed-language queue reload a BERT model on almost every resume. This
+registry keeps the most recently used models in memory instead.
+
+Key features:
+- Entries keyed by (task, model_name, backend)
+- LRU eviction by number of models and by an approximate memory budget
+- Thread-safe: concurrent requests for the same key trigger a single load
+- Hit/miss/eviction counters for monitoring
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ModelKey(NamedTuple):
+    """Identity of a loaded model."""
+
+    task: str
+    model_name: str
+    backend: str
+
+
+def estimate_model_bytes(model: Any) -> int:
+    """
+    Approximate memory held by a loaded model.
+
+    PyTorch weights are counted from their parameters. ONNX Runtime models
+    (which have no torch parameters) are counted by the size of their
+    model file, which is close to the memory the session holds.
+
+    Args:
+        model: SentenceTransformer, transformers pipeline, or other model
+
+    Returns:
+        Size in bytes, or 0 if it cannot be estimated
+    """
+    # transformers pipelines wrap the actual model
+    inner = getattr(model, "model", None)
+    if inner is not None and not isinstance(inner, (str, Path)):
+        model = inner
+
+    try:
+        nbytes = sum(p.numel() * p.element_size() for p in model.parameters())
+        if nbytes:
+            return int(nbytes)
+    except Exception:
+        pass
+
+    candidates = [model]
+    try:
+        # sentence-transformers keeps the ONNX model in its first module
+        candidates.append(model[0].auto_model)
+    except Exception:
+        pass
+
+    for candidate in candidates:
+        model_path = getattr(candidate, "model_path", None)
+        if model_path is not None:
+            try:
+                return Path(model_path).stat().st_size
+            except OSError:
+                pass
+    return 0
+
+
+class _Entry:
+    """A cached model and its estimated size."""
+
+    __slots__ = ("model", "nbytes")
+
+    def __init__(self, model: Any, nbytes: int):
+        self.model = model
+        self.nbytes = nbytes
+
+
+class ModelRegistry:
+    """
+    LRU cache of loaded models shared by all matchers and extractors.
+
+    Example:
+        >>> registry = ModelRegistry(max_models=4, max_memory_mb=2048)
+        >>> ner = registry.get("ner", "dslim/bert-base-NER", "torch",
+        ...                    lambda: load_ner_pipeline("dslim/bert-base-NER", "torch")[0])
+        >>> registry.get_stats()["misses"]
+        1
+    """
+
+    def __init__(self, max_models: int = 4, max_memory_mb: float = 0):
+        """
+        Initialize the registry.
+
+        Args:
+            max_models: Maximum number of models kept loaded
+            max_memory_mb: Approximate memory budget for all loaded models
+                           (0 disables the budget)
+        """
+        self.max_models = max(1, max_models)
+        self.max_bytes = int(max(0.0, max_memory_mb) * 1024 * 1024)
+
+        self._entries: "OrderedDict[ModelKey, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: Dict[ModelKey, threading.Lock] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._load_failures = 0
+        self._load_time_total = 0.0
+
+    def _lookup(self, key: ModelKey) -> Optional[_Entry]:
+        """Return a cached entry and mark it most recently used (lock held)."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def get(self, task: str, model_name: str, backend: str, loader: Callable[[], Any]) -> Optional[Any]:
+        """
+        Get a model, loading it with loader on a miss.
+
+        Concurrent callers asking for the same key wait for a single load;
+        loads of different keys run in parallel. A loader returning None
+        (model unavailable) is not cached, so the next call retries.
+
+        Args:
+            task: Model task, e.g. "sentence-embedding" or "ner"
+            model_name: Model name
+            backend: Inference backend the model is loaded on
+            loader: Function loading the model
+
+        Returns:
+            The loaded model, or None if loading failed
+        """
+        key = ModelKey(task, model_name, backend)
+
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                self._hits += 1
+                return entry.model
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            # Another thread may have loaded it while we waited
+            with self._lock:
+                entry = self._lookup(key)
+                if entry is not None:
+                    self._hits += 1
+                    return entry.model
+                self._misses += 1
+
+            started = time.perf_counter()
+            try:
+                model = loader()
+            except Exception as e:
+                logger.error(f"Failed to load {task} model {model_name} ({backend}): {e}")
+                model = None
+            elapsed = time.perf_counter() - started
+
+            with self._lock:
+                self._load_time_total += elapsed
+                if model is None:
+                    self._load_failures += 1
+                    return None
+
+                nbytes = estimate_model_bytes(model)
+                self._entries[key] = _Entry(model, nbytes)
+                self._evict(keep=key)
+
+            logger.info(
+                f"Model registry loaded {task} model {model_name} ({backend}) "
+                f"in {elapsed:.1f}s, ~{nbytes / 1024 / 1024:.0f} MB"
+            )
+            return model
+
+    def _evict(self, keep: ModelKey) -> None:
+        """Drop least recently used models until within limits (lock held)."""
+        while len(self._entries) > 1:
+            over_count = len(self._entries) > self.max_models
+            over_memory = self.max_bytes and self.memory_bytes > self.max_bytes
+            if not (over_count or over_memory):
+                break
+
+            key = next(iter(self._entries))
+            if key == keep:
+                break
+            del self._entries[key]
+            self._load_locks.pop(key, None)
+            self._evictions += 1
+            logger.info(f"Model registry evicted {key.task} model {key.model_name} ({key.backend})")
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated memory of all loaded models."""
+        return sum(entry.nbytes for entry in self._entries.values())
+
+    def clear(self) -> None:
+        """Unload all models."""
+        with self._lock:
+            self._entries.clear()
+            self._load_locks.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry metrics.
+
+        Returns:
+            Dict with hit/miss/eviction counters, hit rate, load failures,
+            total load time, loaded models and memory use
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "load_failures": self._load_failures,
+                "load_time_s": round(self._load_time_total, 3),
+                "loaded": [
+                    {"task": key.task, "model_name": key.model_name, "backend": key.backend,
+                     "memory_mb": round(entry.nbytes / 1024 / 1024, 1)}
+                    for key, entry in self._entries.items()
+                ],
+                "max_models": self.max_models,
+                "memory_mb": round(self.memory_bytes / 1024 / 1024, 1),
+                "max_memory_mb": round(self.max_bytes / 1024 / 1024, 1),
+            }
+
+
+# Singleton instance for convenience
+_default_registry: Optional[ModelRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """
+    Get or create the process-wide model registry.
+
+    Returns:
+        ModelRegistry sized from settings.model_registry_size and
+        settings.model_registry_memory_mb
+    """
+    global _default_registry
+    if _default_registry is None:
+        with _default_registry_lock:
+            if _default_registry is None:
+                from config import get_settings
+
+                settings = get_settings()
+                _default_registry = ModelRegistry(
+                    max_models=settings.model_registry_size,
+                    max_memory_mb=settings.model_registry_memory_mb,
+                )
+    return _default_registry
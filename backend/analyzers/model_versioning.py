@@ -125,6 +125,53 @@ class ModelVersionManager:
             )
             return None
 
+    def build_version_record(
+        self,
+        model_name: str,
+        manifest: Dict[str, Any],
+        file_path: Optional[str] = None,
+        is_active: bool = False,
+    ) -> MLModelVersion:
+        """
+        Build the MLModelVersion record of a published model artifact.
+
+        The caller adds it to its own (sync or async) session, so versions
+        published to disk by training tasks appear in the registry that
+        promotion and A/B allocation read.
+
+        Args:
+            model_name: Name of the model (e.g., 'candidate_ranking')
+            manifest: Artifact manifest with version, metrics and checksum
+            file_path: Directory of the artifact
+            is_active: Whether the version is the active one
+
+        Returns:
+            Unsaved MLModelVersion instance
+
+        Example:
+            >>> manager = ModelVersionManager()
+            >>> record = manager.build_version_record('candidate_ranking', manifest)
+            >>> print(record.version)
+            'v3'
+        """
+        metrics = manifest.get("metrics", {})
+        accuracy = metrics.get("accuracy")
+        return MLModelVersion(
+            model_name=model_name,
+            version=manifest["version"],
+            is_active=is_active,
+            is_experiment=False,
+            model_metadata={
+                "model_type": manifest.get("model_type"),
+                "feature_names": manifest.get("feature_names", []),
+                "checksum": manifest.get("checksum"),
+                "created_at": manifest.get("created_at"),
+            },
+            accuracy_metrics=metrics,
+            file_path=file_path,
+            performance_score=round(float(accuracy) * 100, 2) if accuracy is not None else None,
+        )
+
     def get_experiment_models(
         self, model_name: str, db_session: Optional[Any] = None
     ) -> List[Dict[str, Any]]:
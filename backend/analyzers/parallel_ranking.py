@@ -0,0 +1,395 @@
+"""
+Process-pool parallel ranking for large candidate pools.
+
+Unified matching and ranking-model scoring are pure Python and NumPy work
+that runs on one core. For large pools this module shards the candidate
+list across a pool of worker processes and merges the results back in
+candidate order, so rankings are the same as the serial path.
+
+Key features:
+- Workers load the matcher, taxonomy snapshot and ranking model once, in
+  the pool initializer, not per task
+- The compiled vacancy is pickled once and sent with each worker's shard,
+  so vacancy-side work (synonyms, TF-IDF profile, job embedding) is never
+  repeated in a worker
+- One contiguous shard per worker; results are merged in shard order, so
+  ordering is deterministic
+- Small pools, disabled pools and daemonic processes (Celery prefork
+  children cannot fork) fall back to serial ranking in-process
+- Workers are spawned rather than forked, so threads of the parent process
+  (encoder batcher, torch) are never copied mid-operation
+"""
+import logging
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .unified_matcher import CompiledVacancy, UnifiedMatchResult, UnifiedSkillMatcher
+
+logger = logging.getLogger(__name__)
+
+# Start method of worker processes
+START_METHOD = "spawn"
+
+# (resume_data, vacancy_data, match_result) of one candidate for the ranking model
+RankingRow = Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]
+
+# (features, rank_score, prediction, confidence) of one candidate
+RankingScore = Tuple[np.ndarray, float, int, float]
+
+
+# Per-worker state, set by _init_worker
+_worker_matcher: Optional[UnifiedSkillMatcher] = None
+_worker_model: Optional[Any] = None
+_worker_vacancy: Optional[Tuple[bytes, CompiledVacancy]] = None
+
+
+def _load_worker_model(model_type: str) -> None:
+    """Load the ranking model of this worker from disk."""
+    global _worker_model
+
+    from .ranking_service import RankingModel
+
+    # Workers use the version the parent asks for, not whatever is active
+    _worker_model = RankingModel(model_type=model_type, follow_active=False)
+
+
+def _init_worker(matcher_config: Dict[str, Any], vector_enabled: bool, model_type: str) -> None:
+    """
+    Pool initializer: load everything a worker needs once.
+
+    Args:
+        matcher_config: UnifiedSkillMatcher constructor arguments of the parent's matcher
+        vector_enabled: Whether the parent's matcher does vector matching
+        model_type: Ranking model type to load
+    """
+    global _worker_matcher
+
+    from .taxonomy_snapshot import get_taxonomy_snapshot
+
+    _worker_matcher = UnifiedSkillMatcher(**matcher_config)
+    if not vector_enabled:
+        _worker_matcher.vector_matcher = None
+
+    # Map the shared snapshot now rather than on the first lookup
+    get_taxonomy_snapshot()
+    _load_worker_model(model_type)
+
+
+def _score_shard(
+    vacancy_payload: bytes,
+    shard: List[Tuple[str, List[str]]],
+    top_k: Optional[int],
+    cascade: Optional[bool],
+) -> List[UnifiedMatchResult]:
+    """Worker task: score (resume_text, resume_skills) pairs against a pickled compiled vacancy."""
+    global _worker_vacancy
+
+    if _worker_vacancy is None or _worker_vacancy[0] != vacancy_payload:
+        _worker_vacancy = (vacancy_payload, pickle.loads(vacancy_payload))
+
+    candidates = [
+        {"resume_text": resume_text, "resume_skills": resume_skills}
+        for resume_text, resume_skills in shard
+    ]
+    return _worker_matcher.score_candidates(candidates, _worker_vacancy[1], top_k=top_k, cascade=cascade)
+
+
+def _score_ranking_shard(
+    rows: List[RankingRow],
+    model_type: str,
+    model_version: str,
+) -> List[RankingScore]:
+    """Worker task: extract ranking features and score them with the parent's model version."""
+    from .ranking_service import score_ranking_rows
+
+    if _worker_model is None or _worker_model.model_type != model_type:
+        _load_worker_model(model_type)
+    if _worker_model.version != model_version:
+        try:
+            _worker_model.use_version(model_version)
+        except ValueError as e:
+            logger.warning(f"Ranking worker cannot load model version {model_version}: {e}")
+    return score_ranking_rows(_worker_model, rows)
+
+
+def _shard_bounds(count: int, shards: int) -> List[Tuple[int, int]]:
+    """Split range(count) into contiguous, nearly equal (start, end) slices."""
+    size, extra = divmod(count, shards)
+    bounds = []
+    start = 0
+    for i in range(shards):
+        end = start + size + (1 if i < extra else 0)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+class ParallelRanker:
+    """
+    Ranks large candidate pools on a pool of worker processes.
+
+    Example:
+        >>> ranker = ParallelRanker(get_unified_matcher(), pool_size=4)
+        >>> ranked = ranker.rank_candidates(candidates, title, description, skills)
+        >>> ranked[0]["overall_score"]
+        0.82
+    """
+
+    def __init__(
+        self,
+        matcher: UnifiedSkillMatcher,
+        pool_size: int,
+        min_candidates: int = 200,
+        model_type: str = "random_forest",
+    ):
+        """
+        Initialize the ranker; worker processes start on first use.
+
+        Args:
+            matcher: Matcher whose configuration the workers replicate
+            pool_size: Number of worker processes (0 ranks in-process)
+            min_candidates: Smallest pool worth sharding across processes
+            model_type: Ranking model type loaded by the workers
+        """
+        self.matcher = matcher
+        self.pool_size = max(0, pool_size)
+        self.min_candidates = max(1, min_candidates)
+        self.model_type = model_type
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _matcher_config(self) -> Dict[str, Any]:
+        """Constructor arguments that rebuild the matcher in a worker."""
+        matcher = self.matcher
+        config = {
+            "keyword_weight": matcher.keyword_weight,
+            "tfidf_weight": matcher.tfidf_weight,
+            "vector_weight": matcher.vector_weight,
+            "tfidf_threshold": matcher.tfidf_threshold,
+            "vector_threshold": matcher.vector_threshold,
+            "overall_threshold": matcher.overall_threshold,
+            "cascade": matcher.cascade,
+        }
+        if matcher.vector_matcher is not None:
+            config["vector_model"] = matcher.vector_matcher.model_name
+        return config
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Get the worker pool, starting it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.pool_size,
+                    mp_context=multiprocessing.get_context(START_METHOD),
+                    initializer=_init_worker,
+                    initargs=(self._matcher_config(), self.matcher.vector_matcher is not None, self.model_type),
+                )
+                logger.info(f"Started ranking pool with {self.pool_size} workers")
+            return self._executor
+
+    def should_parallelize(self, count: int) -> bool:
+        """
+        Whether a pool of this many candidates is sharded across processes.
+
+        Args:
+            count: Number of candidates
+
+        Returns:
+            True if the pool is enabled, large enough, and this process may
+            start child processes
+        """
+        if self.pool_size < 1 or count < self.min_candidates:
+            return False
+        if multiprocessing.current_process().daemon:
+            # Celery prefork children are daemonic and cannot have children
+            logger.debug("Ranking in-process: daemonic processes cannot start a ranking pool")
+            return False
+        return True
+
+    def _shards(self, count: int) -> List[Tuple[int, int]]:
+        """One contiguous shard per worker."""
+        return _shard_bounds(count, min(self.pool_size, count))
+
+    def _run_shards(self, fn: Any, shard_args: List[Tuple[Any, ...]]) -> Optional[List[Any]]:
+        """
+        Run fn once per shard on the pool and collect results in shard order.
+
+        Returns:
+            Results per shard, or None if the pool broke (it is restarted on next use)
+        """
+        executor = self._get_executor()
+        try:
+            futures = [executor.submit(fn, *args) for args in shard_args]
+            return [future.result() for future in futures]
+        except BrokenProcessPool as e:
+            logger.error(f"Ranking pool failed, ranking in-process: {e}")
+            self.shutdown(wait=False)
+            return None
+
+    def score_candidates(
+        self,
+        candidates: Sequence[Dict[str, Any]],
+        compiled: CompiledVacancy,
+        top_k: Optional[int] = None,
+        cascade: Optional[bool] = None,
+    ) -> List[UnifiedMatchResult]:
+        """
+        Score candidates against a compiled vacancy, sharded across workers.
+
+        Same contract as UnifiedSkillMatcher.score_candidates(). In cascade
+        mode each shard keeps its own top_k, which always contains the
+        shard's part of the overall top_k.
+
+        Args:
+            candidates: Candidate dicts with 'resume_text' and 'resume_skills'
+            compiled: Vacancy from compile_vacancy()
+            top_k: Number of best candidates that must be scored exactly in cascade mode
+            cascade: Whether to skip vector matching for ruled-out candidates
+
+        Returns:
+            UnifiedMatchResult per candidate, aligned with candidates
+        """
+        if not self.should_parallelize(len(candidates)):
+            return self.matcher.score_candidates(candidates, compiled, top_k=top_k, cascade=cascade)
+
+        # Pickled once; each worker unpickles it once for its shard
+        payload = pickle.dumps(compiled, protocol=pickle.HIGHEST_PROTOCOL)
+        pairs = [
+            (candidate.get("resume_text", ""), list(candidate.get("resume_skills", [])))
+            for candidate in candidates
+        ]
+        shard_results = self._run_shards(
+            _score_shard,
+            [(payload, pairs[start:end], top_k, cascade) for start, end in self._shards(len(pairs))],
+        )
+        if shard_results is None:
+            return self.matcher.score_candidates(candidates, compiled, top_k=top_k, cascade=cascade)
+        return [result for shard in shard_results for result in shard]
+
+    def rank_candidates(
+        self,
+        candidates: List[Dict[str, Any]],
+        job_title: str,
+        job_description: str,
+        required_skills: List[str],
+        top_k: Optional[int] = None,
+        cascade: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank candidates for a job posting, like UnifiedSkillMatcher.rank_candidates().
+
+        The vacancy is compiled once in this process and shipped to the
+        workers; ties keep candidate order, as in the serial path.
+
+        Args:
+            candidates: List of candidate dicts with 'resume_text', 'resume_skills', 'id', 'name'
+            job_title: Job posting title
+            job_description: Job posting description
+            required_skills: List of required skills
+            top_k: Number of best candidates that must be scored exactly in cascade mode
+            cascade: Whether to skip vector matching for ruled-out candidates
+
+        Returns:
+            List of candidates with added 'match_result' field, sorted by overall_score
+        """
+        if not self.should_parallelize(len(candidates)):
+            return self.matcher.rank_candidates(
+                candidates, job_title, job_description, required_skills, top_k=top_k, cascade=cascade
+            )
+
+        compiled = self.matcher.compile_vacancy(job_title, job_description, required_skills)
+        match_results = self.score_candidates(candidates, compiled, top_k=top_k, cascade=cascade)
+
+        results = [
+            {
+                **candidate,
+                "match_result": match_result.to_dict(),
+                "overall_score": match_result.overall_score,
+            }
+            for candidate, match_result in zip(candidates, match_results)
+        ]
+        results.sort(key=lambda x: x["overall_score"], reverse=True)
+        return results
+
+    def score_ranking_rows(self, rows: Sequence[RankingRow], model: Any) -> List[RankingScore]:
+        """
+        Extract ranking features and score them with the ranking model.
+
+        Workers map the same model version as this process, so all shards
+        are scored by one version even while a new one is being activated.
+
+        Args:
+            rows: (resume_data, vacancy_data, match_result) per candidate
+            model: RankingModel of this process, used for in-process scoring
+
+        Returns:
+            (features, rank_score, prediction, confidence) per row, aligned with rows
+        """
+        from .ranking_service import score_ranking_rows
+
+        if not self.should_parallelize(len(rows)):
+            return score_ranking_rows(model, rows)
+
+        rows = list(rows)
+        model.refresh()
+        shard_results = self._run_shards(
+            _score_ranking_shard,
+            [(rows[start:end], model.model_type, model.version) for start, end in self._shards(len(rows))],
+        )
+        if shard_results is None:
+            return score_ranking_rows(model, rows)
+        return [score for shard in shard_results for score in shard]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes; the pool restarts on next use."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# Singleton instance for convenience
+_default_ranker: Optional[ParallelRanker] = None
+_default_ranker_lock = threading.Lock()
+
+
+def get_parallel_ranker() -> Optional[ParallelRanker]:
+    """
+    Get or create the process's parallel ranker.
+
+    Workers replicate the default unified matcher.
+
+    Returns:
+        ParallelRanker instance, or None if ranking_pool_size is 0
+    """
+    global _default_ranker
+    if _default_ranker is None:
+        from config import get_settings
+
+        from .unified_matcher import get_unified_matcher
+
+        settings = get_settings()
+        if settings.ranking_pool_size < 1:
+            return None
+
+        with _default_ranker_lock:
+            if _default_ranker is None:
+                _default_ranker = ParallelRanker(
+                    get_unified_matcher(),
+                    pool_size=settings.ranking_pool_size,
+                    min_candidates=settings.ranking_pool_min_candidates,
+                )
+    return _default_ranker
+
+
+def shutdown_parallel_ranker() -> None:
+    """Stop the default ranker's worker processes if they were started."""
+    if _default_ranker is not None:
+        _default_ranker.shutdown()
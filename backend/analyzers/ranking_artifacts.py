@@ -0,0 +1,390 @@
+"""
+Versioned, memory-mapped ranking model artifacts with an atomic active pointer.
+
+RankingModel used to pickle its model and scaler to one fixed path with a
+hard-coded version, loaded once per process. Instead, every training run
+publishes an immutable version directory. An atomically replaced CURRENT
+file names the active version. API and Celery processes poll the pointer
+and swap to a new version without a restart.
+
+Layout on disk (one store per model type):
+    CURRENT                - active version, e.g. "v3"
+    v<n>/manifest.json     - format, version, model type, feature names,
+                             training metrics, training state, sha256 of
+                             every file and an overall checksum
+    v<n>/model.joblib      - fitted sklearn model
+    v<n>/scaler.joblib     - fitted StandardScaler
+    v<n>/compiled/*.npy    - CompiledForest arrays (random forests only)
+
+The compiled arrays are loaded memory-mapped read-only, so every worker
+process scoring with the same version shares one copy of the pages. The
+sklearn objects are loaded with joblib's mmap_mode as well; estimators
+that copy their arrays on unpickling keep a private copy, but they are
+only used for feature importances and models without a compiled form.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from .compiled_forest import CompiledForest
+from .embedding_store import exclusive_file_lock
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_FORMAT = 1
+
+# Name of ranking models in MLModelVersion records
+RANKING_MODEL_NAME = "candidate_ranking"
+
+# Version directories kept on disk for rollback (the active one is always kept)
+KEEP_VERSIONS = 5
+
+# Loaded versions cached per store; processes pinned to an older version
+# (parallel-ranking workers) reuse it instead of reloading
+_CACHED_VERSIONS = 2
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _checksum(files: Dict[str, str]) -> str:
+    """Checksum of a version: sha256 over the sorted (file, sha256) pairs."""
+    listing = "".join(f"{name}\t{sha}\n" for name, sha in sorted(files.items()))
+    return hashlib.sha256(listing.encode("utf-8")).hexdigest()
+
+
+def _version_number(version: str) -> int:
+    """Numeric part of "v<n>" (0 if the name is not a version)."""
+    try:
+        return int(version[1:]) if version.startswith("v") else 0
+    except ValueError:
+        return 0
+
+
+class RankingArtifact:
+    """
+    One loaded version of a ranking model.
+
+    Attributes:
+        version: Version name, e.g. "v3"
+        path: Version directory
+        manifest: Parsed manifest.json
+        model: Fitted sklearn model
+        scaler: Fitted StandardScaler
+        compiled: Memory-mapped compiled forest, or None
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        manifest: Dict[str, Any],
+        model: Any,
+        scaler: Any,
+        compiled: Optional[CompiledForest],
+    ):
+        self.path = path
+        self.manifest = manifest
+        self.version: str = manifest["version"]
+        self.model = model
+        self.scaler = scaler
+        self.compiled = compiled
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        return self.manifest.get("metrics", {})
+
+
+class RankingArtifactStore:
+    """
+    Directory of ranking model versions with an atomically updated pointer.
+
+    Writers call publish() under a file lock. Readers call current(), which
+    re-reads the pointer at most once per check interval and loads the new
+    version when it changed.
+    """
+
+    def __init__(self, directory: Path, check_interval: float = 1.0):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory holding the versions of one model type
+            check_interval: Seconds between checks for a new active version (0 = every call)
+        """
+        self.directory = Path(directory)
+        self.check_interval = check_interval
+        self.current_path = self.directory / "CURRENT"
+        self.lock_path = self.directory / ".lock"
+
+        self._loaded: Dict[str, RankingArtifact] = {}
+        self._current: Optional[RankingArtifact] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def active_version(self) -> Optional[str]:
+        """Read the active version name (None if nothing was published yet)."""
+        try:
+            return self.current_path.read_text().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def versions(self) -> List[str]:
+        """Names of the published versions, oldest first."""
+        if not self.directory.exists():
+            return []
+        names = [
+            path.name for path in self.directory.iterdir()
+            if _version_number(path.name) and (path / "manifest.json").exists()
+        ]
+        return sorted(names, key=_version_number)
+
+    def manifest(self, version: str) -> Dict[str, Any]:
+        """
+        Read the manifest of a version.
+
+        Raises:
+            ValueError: If the version does not exist
+        """
+        try:
+            return json.loads((self.directory / version / "manifest.json").read_text())
+        except FileNotFoundError:
+            raise ValueError(f"Unknown ranking model version: {version}")
+
+    def publish(
+        self,
+        model: Any,
+        scaler: Any,
+        compiled: Optional[CompiledForest],
+        model_type: str,
+        feature_names: Sequence[str],
+        metrics: Optional[Dict[str, Any]] = None,
+        activate: bool = True,
+        training: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Write a new version and, by default, make it the active one.
+
+        The version is written to a temporary directory and renamed into
+        place, so readers never see a partial version.
+
+        Args:
+            model: Fitted sklearn model
+            scaler: Fitted StandardScaler
+            compiled: Compiled forest of the model, if it has one
+            model_type: Ranking model type, e.g. "random_forest"
+            feature_names: Names of the model's input features, in order
+            metrics: Training or evaluation metrics
+            activate: Whether to point CURRENT at the new version
+            training: Training state to resume from, e.g. the last feedback consumed
+
+        Returns:
+            Manifest of the new version
+        """
+        import joblib
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with exclusive_file_lock(self.lock_path):
+            existing = [_version_number(name) for name in self.versions()]
+            version = f"v{max(existing, default=0) + 1}"
+            tmp_dir = self.directory / f".{version}.tmp-{os.getpid()}"
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            tmp_dir.mkdir()
+
+            joblib.dump(model, tmp_dir / "model.joblib")
+            joblib.dump(scaler, tmp_dir / "scaler.joblib")
+            if compiled is not None:
+                compiled.save(tmp_dir / "compiled")
+
+            files = {
+                path.relative_to(tmp_dir).as_posix(): _sha256(path)
+                for path in sorted(tmp_dir.rglob("*")) if path.is_file()
+            }
+            manifest = {
+                "format": ARTIFACT_FORMAT,
+                "version": version,
+                "model_type": model_type,
+                "feature_names": list(feature_names),
+                "metrics": metrics or {},
+                "training": training or {},
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "files": files,
+                "checksum": _checksum(files),
+            }
+            (tmp_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+            os.replace(tmp_dir, self.directory / version)
+
+            if activate:
+                self._write_pointer(version)
+            self._prune()
+
+        logger.info(f"Published ranking model {model_type} {version} (active: {activate})")
+        return manifest
+
+    def activate(self, version: str) -> None:
+        """
+        Point readers at an existing version (promotion or rollback).
+
+        Raises:
+            ValueError: If the version does not exist
+        """
+        self.manifest(version)
+        with exclusive_file_lock(self.lock_path):
+            self._write_pointer(version)
+        logger.info(f"Activated ranking model version {version} in {self.directory}")
+
+    def _write_pointer(self, version: str) -> None:
+        tmp_path = self.current_path.with_name("CURRENT.tmp")
+        tmp_path.write_text(version)
+        os.replace(tmp_path, self.current_path)
+
+    def _prune(self) -> None:
+        """Delete old versions; processes still mapping them keep the pages until they swap."""
+        active = self.active_version()
+        for version in self.versions()[:-KEEP_VERSIONS]:
+            if version != active:
+                shutil.rmtree(self.directory / version, ignore_errors=True)
+
+    def load(self, version: str, verify: bool = True, mmap_mode: Optional[str] = "r") -> RankingArtifact:
+        """
+        Load a version, memory-mapping its arrays read-only.
+
+        Args:
+            version: Version name
+            verify: Whether to check every file against the manifest checksums
+            mmap_mode: "r" to map arrays read-only, None for private writable
+                copies (to keep training the loaded model)
+
+        Returns:
+            Loaded artifact
+
+        Raises:
+            ValueError: If the version does not exist, has an unknown format
+                or fails the checksum
+        """
+        import joblib
+
+        path = self.directory / version
+        manifest = self.manifest(version)
+        if manifest.get("format") != ARTIFACT_FORMAT:
+            raise ValueError(f"Unsupported ranking artifact format {manifest.get('format')} in {path}")
+
+        if verify:
+            files = {name: _sha256(path / name) for name in manifest["files"]}
+            if files != manifest["files"] or _checksum(files) != manifest["checksum"]:
+                raise ValueError(f"Checksum mismatch in ranking model {path}")
+
+        compiled = None
+        if (path / "compiled").is_dir():
+            compiled = CompiledForest.load(path / "compiled", mmap_mode=mmap_mode)
+
+        return RankingArtifact(
+            path=path,
+            manifest=manifest,
+            model=joblib.load(path / "model.joblib", mmap_mode=mmap_mode),
+            scaler=joblib.load(path / "scaler.joblib", mmap_mode=mmap_mode),
+            compiled=compiled,
+        )
+
+    def get(self, version: str) -> RankingArtifact:
+        """
+        Get a version, loading it once per process.
+
+        Raises:
+            ValueError: If the version cannot be loaded
+        """
+        with self._lock:
+            artifact = self._loaded.get(version)
+            if artifact is None:
+                artifact = self.load(version)
+                self._loaded[version] = artifact
+                # Keep the most recent versions
+                for old in sorted(self._loaded, key=_version_number)[:-_CACHED_VERSIONS]:
+                    if old != version:
+                        del self._loaded[old]
+            return artifact
+
+    def current(self) -> Optional[RankingArtifact]:
+        """
+        Get the active version, swapping to a newer one if the pointer moved.
+
+        Returns:
+            RankingArtifact, or None if no version was published yet
+        """
+        now = time.monotonic()
+        artifact = self._current
+        if artifact is not None and now - self._checked_at < self.check_interval:
+            return artifact
+
+        self._checked_at = now
+        version = self.active_version()
+        if version is None:
+            return None
+        if artifact is not None and artifact.version == version:
+            return artifact
+
+        try:
+            self._current = self.get(version)
+            logger.info(f"Loaded ranking model version {version} from {self.directory}")
+        except (OSError, ValueError) as e:
+            # Keep serving the previous version
+            logger.warning(f"Failed to load ranking model version {version}: {e}")
+        return self._current
+
+    def follow(self, model_info: Optional[Dict[str, Any]]) -> bool:
+        """
+        Activate the version chosen in the model version registry.
+
+        Args:
+            model_info: Model dict from ModelVersionManager (get_active_model()
+                or allocate_model_for_user())
+
+        Returns:
+            True if the pointer was moved
+        """
+        if not model_info or model_info.get("is_fallback"):
+            return False
+        version = model_info.get("version")
+        if not version or version == self.active_version() or version not in self.versions():
+            return False
+        self.activate(version)
+        return True
+
+
+# Stores per directory, shared by all RankingModel instances of a process
+_stores: Dict[Path, RankingArtifactStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_ranking_artifact_store(directory: Path) -> RankingArtifactStore:
+    """
+    Get or create the process's store for a directory.
+
+    Args:
+        directory: Directory holding the versions of one model type
+
+    Returns:
+        RankingArtifactStore instance
+    """
+    directory = Path(directory)
+    with _stores_lock:
+        store = _stores.get(directory)
+        if store is None:
+            from config import get_settings
+
+            store = RankingArtifactStore(
+                directory, check_interval=get_settings().ranking_model_check_interval
+            )
+            _stores[directory] = store
+        return store
@@ -9,6 +9,7 @@ It considers multiple factors including:
 - Keyword/TF-IDF/Vector scores from unified matching
 - Historical hiring outcomes
 """
+import asyncio
 import json
 import logging
 import pickle
@@ -21,11 +22,18 @@ from uuid import UUID
 import numpy as np
 from numpy import typing as npt
 from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import SGDClassifier
 from sklearn.preprocessing import StandardScaler
-from sqlalchemy import select
+from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from models import CandidateRank, JobVacancy, MatchResult, Resume, ResumeAnalysis
+from models import JobVacancy, MatchResult, Resume, ResumeAnalysis
+from models.upserts import upsert_candidate_ranks
+
+from .compiled_forest import CompiledForest, compile_ranking_model
+from .parallel_ranking import get_parallel_ranker
+from .ranking_artifacts import RankingArtifact, get_ranking_artifact_store
+from .skill_ids import as_skill_id_array, count_shared_skills, skill_id, skill_ids
 
 logger = logging.getLogger(__name__)
 
@@ -140,17 +148,45 @@ class RankingFeatures:
 
         return features
 
+    @classmethod
+    def extract_feature_matrix(
+        cls,
+        rows: List[Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]],
+    ) -> npt.NDArray[np.float64]:
+        """
+        Extract the feature matrix of many candidates.
+
+        Args:
+            rows: (resume_data, vacancy_data, match_result) per candidate
+
+        Returns:
+            numpy array of feature values (shape: [n_rows, n_features])
+        """
+        matrix = np.zeros((len(rows), len(cls.FEATURE_NAMES)), dtype=np.float64)
+        for i, (resume_data, vacancy_data, match_result) in enumerate(rows):
+            matrix[i] = cls.extract_features(resume_data, vacancy_data, match_result)
+        return matrix
+
+    @staticmethod
+    def skill_id_arrays(resume: Dict, vacancy: Dict) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """Skill IDs of the resume and of the required skills, stored or computed from the names."""
+        resume_ids = resume.get("skill_ids")
+        if resume_ids is None:
+            resume_ids = skill_ids(resume.get("skills", []))
+        required_ids = vacancy.get("required_skill_ids")
+        if required_ids is None:
+            required_ids = skill_ids(vacancy.get("required_skills", []))
+        return resume_ids, required_ids
+
     @classmethod
     def _compute_basic_match(cls, resume: Dict, vacancy: Dict) -> float:
         """Compute basic skill match ratio."""
-        resume_skills = set(resume.get("skills", []))
-        required_skills = set(vacancy.get("required_skills", []))
+        resume_ids, required_ids = cls.skill_id_arrays(resume, vacancy)
 
-        if not required_skills:
+        if not len(required_ids):
             return 0.5  # Neutral score if no requirements
 
-        matched = len(resume_skills & required_skills)
-        return matched / len(required_skills)
+        return count_shared_skills(resume_ids, required_ids) / len(required_ids)
 
     @classmethod
     def _compute_skill_ratio(cls, resume: Dict, vacancy: Dict) -> float:
@@ -231,14 +267,18 @@ class RankingFeatures:
         Common skills everyone has get lower scores.
         """
         required_skills = vacancy.get("required_skills", [])
-        resume_skills = resume.get("skills", [])
+        resume_ids, _ = cls.skill_id_arrays(resume, vacancy)
+
+        # Required skills the resume has, by skill ID
+        required_ids = np.fromiter((skill_id(s) for s in required_skills), dtype=np.int64, count=len(required_skills))
+        has_skill = np.isin(required_ids, resume_ids)
 
         # Simple rarity heuristic: longer skill names are often more specific/rare
         rarity_sum = 0
         matched_count = 0
 
-        for skill in required_skills:
-            if any(s.lower() == skill.lower() for s in resume_skills):
+        for skill, matched in zip(required_skills, has_skill):
+            if matched:
                 # Rarity based on skill name length (heuristic)
                 rarity = min(len(skill.split()) / 3, 1.0)
                 rarity_sum += rarity
@@ -301,27 +341,50 @@ class RankingModel:
     """
     ML-based ranking model using scikit-learn.
 
-    Uses ensemble methods (RandomForest + GradientBoosting) for robust predictions.
+    Uses ensemble methods (RandomForest + GradientBoosting) for robust predictions,
+    or an SGD logistic regression that is updated incrementally from
+    recruiter feedback (see incremental_ranking).
+    A trained random forest is also compiled to NumPy node arrays
+    (CompiledForest), which serve all predictions without scikit-learn.
+    Each training run publishes a new version to a RankingArtifactStore,
+    and every process swaps to the active version as soon as it changes.
     """
 
-    def __init__(self, model_type: str = "random_forest"):
+    def __init__(self, model_type: str = "random_forest", follow_active: bool = True):
         """
         Initialize the ranking model.
 
         Args:
-            model_type: Type of model ('random_forest' or 'gradient_boosting')
+            model_type: Type of model ('random_forest', 'gradient_boosting' or 'sgd')
+            follow_active: Whether predictions swap to a newly activated version
         """
         self.model_type = model_type
+        self.follow_active = follow_active
         self.model: Optional[Any] = None
         self.scaler = StandardScaler()
+        self.compiled: Optional[CompiledForest] = None
         self.is_trained = False
         self.version = "1.0.0"
+        self.store = get_ranking_artifact_store(MODELS_DIR / model_type)
 
         # Try to load existing model
         self._load_model()
 
+    def _apply_artifact(self, artifact: RankingArtifact) -> None:
+        """Serve predictions from a loaded model version."""
+        self.model = artifact.model
+        self.scaler = artifact.scaler
+        self.compiled = artifact.compiled
+        self.version = artifact.version
+        self.is_trained = True
+
     def _load_model(self) -> bool:
-        """Load model from disk if available."""
+        """Load the active model version, or a model pickled before versioning."""
+        artifact = self.store.current()
+        if artifact is not None:
+            self._apply_artifact(artifact)
+            return True
+
         model_path = MODELS_DIR / f"ranking_{self.model_type}_model.pkl"
         scaler_path = MODELS_DIR / f"ranking_{self.model_type}_scaler.pkl"
 
@@ -332,6 +395,7 @@ class RankingModel:
                 with open(scaler_path, "rb") as f:
                     self.scaler = pickle.load(f)
                 self.is_trained = True
+                self.compiled = compile_ranking_model(self.model, self.scaler)
                 logger.info(f"Loaded ranking model from {model_path}")
                 return True
             except Exception as e:
@@ -339,25 +403,85 @@ class RankingModel:
 
         return False
 
-    def _save_model(self) -> bool:
-        """Save model to disk."""
-        if not self.is_trained or self.model is None:
+    def refresh(self) -> bool:
+        """
+        Swap to the active model version if another one was activated.
+
+        Cheap enough to call per prediction: the pointer file is read at
+        most once per check interval.
+
+        Returns:
+            True if the model changed
+        """
+        if not self.follow_active:
             return False
+        artifact = self.store.current()
+        if artifact is None or artifact.version == self.version:
+            return False
+        self._apply_artifact(artifact)
+        logger.info(f"Ranking model {self.model_type} swapped to version {artifact.version}")
+        return True
 
-        model_path = MODELS_DIR / f"ranking_{self.model_type}_model.pkl"
-        scaler_path = MODELS_DIR / f"ranking_{self.model_type}_scaler.pkl"
+    def use_version(self, version: str) -> None:
+        """
+        Serve predictions from a specific model version.
+
+        Raises:
+            ValueError: If the version cannot be loaded
+        """
+        if version != self.version:
+            self._apply_artifact(self.store.get(version))
+
+    def _save_model(self, metrics: Optional[Dict[str, Any]] = None) -> bool:
+        """Publish the model as a new version and make it the active one."""
+        if not self.is_trained or self.model is None:
+            return False
 
         try:
-            with open(model_path, "wb") as f:
-                pickle.dump(self.model, f)
-            with open(scaler_path, "wb") as f:
-                pickle.dump(self.scaler, f)
-            logger.info(f"Saved ranking model to {model_path}")
+            manifest = self.store.publish(
+                self.model,
+                self.scaler,
+                self.compiled,
+                model_type=self.model_type,
+                feature_names=RankingFeatures.FEATURE_NAMES,
+                metrics=metrics,
+            )
+            self.version = manifest["version"]
+            logger.info(f"Saved ranking model version {self.version} to {self.store.directory}")
             return True
         except Exception as e:
             logger.error(f"Failed to save model: {e}")
             return False
 
+    @staticmethod
+    def build_estimator(model_type: str) -> Any:
+        """
+        Create an unfitted classifier of a model type.
+
+        Args:
+            model_type: 'random_forest', 'gradient_boosting' or 'sgd'
+
+        Returns:
+            sklearn classifier
+        """
+        if model_type == "gradient_boosting":
+            return GradientBoostingClassifier(
+                n_estimators=100,
+                learning_rate=0.1,
+                max_depth=5,
+                random_state=42,
+            )
+        if model_type == "sgd":
+            # Logistic loss, so predict_proba() works and partial_fit() can update it
+            return SGDClassifier(loss="log_loss", random_state=42)
+        # random_forest
+        return RandomForestClassifier(
+            n_estimators=100,
+            max_depth=10,
+            random_state=42,
+            n_jobs=-1,
+        )
+
     def train(self, X: npt.NDArray[np.float64], y: npt.NDArray[np.int64]) -> Dict[str, float]:
         """
         Train the ranking model.
@@ -375,24 +499,12 @@ class RankingModel:
         X_scaled = self.scaler.fit_transform(X)
 
         # Initialize model
-        if self.model_type == "gradient_boosting":
-            self.model = GradientBoostingClassifier(
-                n_estimators=100,
-                learning_rate=0.1,
-                max_depth=5,
-                random_state=42,
-            )
-        else:  # random_forest
-            self.model = RandomForestClassifier(
-                n_estimators=100,
-                max_depth=10,
-                random_state=42,
-                n_jobs=-1,
-            )
+        self.model = self.build_estimator(self.model_type)
 
         # Train
         self.model.fit(X_scaled, y)
         self.is_trained = True
+        self.compiled = compile_ranking_model(self.model, self.scaler)
 
         # Calculate metrics
         y_pred = self.model.predict(X_scaled)
@@ -405,7 +517,7 @@ class RankingModel:
         }
 
         # Save model
-        self._save_model()
+        self._save_model(metrics)
 
         logger.info(f"Training complete. Accuracy: {accuracy:.3f}")
         return metrics
@@ -420,20 +532,8 @@ class RankingModel:
         Returns:
             Probability of positive outcome (0-1)
         """
-        if not self.is_trained or self.model is None:
-            # Return heuristic score if model not trained
-            return float(np.mean(features))
-
-        # Scale features
-        features_scaled = self.scaler.transform(features.reshape(1, -1))
-
-        # Get probability of positive class
-        proba = self.model.predict_proba(features_scaled)[0]
-
-        # Return probability of class 1 (hired/suitable)
-        if len(proba) > 1:
-            return float(proba[1])
-        return float(proba[0])
+        scores, _, _ = self.predict_batch(features.reshape(1, -1))
+        return float(scores[0])
 
     def predict(self, features: npt.NDArray[np.float64]) -> Tuple[int, float]:
         """
@@ -447,19 +547,43 @@ class RankingModel:
             prediction: 0=reject, 1=accept
             confidence: Model confidence (0-1)
         """
+        _, predictions, confidences = self.predict_batch(features.reshape(1, -1))
+        return (int(predictions[0]), float(confidences[0]))
+
+    def predict_batch(
+        self, X: npt.NDArray[np.float64]
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.int64], npt.NDArray[np.float64]]:
+        """
+        Score many candidates with one model call.
+
+        Uses the compiled forest when there is one, otherwise scikit-learn.
+
+        Args:
+            X: Feature matrix (n_samples, n_features)
+
+        Returns:
+            Tuple of (probabilities, predictions, confidences), one entry per row
+        """
+        if len(X) == 0:
+            return np.zeros(0), np.zeros(0, dtype=np.int64), np.zeros(0)
+
+        self.refresh()
         if not self.is_trained or self.model is None:
             # Use heuristic
-            score = float(np.mean(features))
-            return (1 if score > 0.5 else 0, abs(score - 0.5) * 2)
-
-        features_scaled = self.scaler.transform(features.reshape(1, -1))
-        prediction = int(self.model.predict(features_scaled)[0])
+            scores = X.mean(axis=1)
+            return scores, (scores > 0.5).astype(np.int64), np.abs(scores - 0.5) * 2
 
-        # Get confidence from probability
-        proba = self.model.predict_proba(features_scaled)[0]
-        confidence = float(max(proba))
+        # One consistent version even if another thread swaps models meanwhile
+        model, scaler, compiled = self.model, self.scaler, self.compiled
+        if compiled is not None:
+            proba = compiled.predict_proba(X)
+        else:
+            proba = model.predict_proba(scaler.transform(X))
 
-        return (prediction, confidence)
+        # Probability of class 1 (hired/suitable); the predicted class is the likeliest one
+        scores = proba[:, 1] if proba.shape[1] > 1 else proba[:, 0]
+        predictions = model.classes_[np.argmax(proba, axis=1)].astype(np.int64)
+        return scores, predictions, proba.max(axis=1)
 
     def get_feature_importance(self) -> Dict[str, float]:
         """
@@ -475,9 +599,39 @@ class RankingModel:
             importances = self.model.feature_importances_
             return dict(zip(RankingFeatures.FEATURE_NAMES, importances))
 
+        if hasattr(self.model, "coef_"):
+            # Linear models: weight magnitude on the standardized features
+            return dict(zip(RankingFeatures.FEATURE_NAMES, np.abs(self.model.coef_[0])))
+
         return {}
 
 
+def score_ranking_rows(
+    model: RankingModel,
+    rows: List[Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]],
+) -> List[Tuple[npt.NDArray[np.float64], float, int, float]]:
+    """
+    Extract ranking features of candidates and score them with a model.
+
+    Builds one feature matrix and calls the model once for all rows. Pure
+    computation with no database access, so parallel ranking can run it
+    in worker processes.
+
+    Args:
+        model: Ranking model
+        rows: (resume_data, vacancy_data, match_result) per candidate
+
+    Returns:
+        (features, rank_score, prediction, confidence) per row
+    """
+    X = RankingFeatures.extract_feature_matrix(rows)
+    scores, predictions, confidences = model.predict_batch(X)
+    return [
+        (X[i], float(scores[i]), int(predictions[i]), float(confidences[i]))
+        for i in range(len(rows))
+    ]
+
+
 class RankingService:
     """
     Main service for AI-powered candidate ranking.
@@ -487,7 +641,9 @@ class RankingService:
 
     def __init__(self):
         """Initialize the ranking service."""
-        self.model = RankingModel(model_type="random_forest")
+        from config import get_settings
+
+        self.model = RankingModel(model_type=get_settings().ranking_model_type)
         self.ab_test_ratio = 0.2  # 20% of candidates go to treatment group
 
     async def rank_candidate(
@@ -509,6 +665,35 @@ class RankingService:
         Returns:
             Ranking result with score, position, recommendation, etc.
         """
+        resume_data, vacancy_data, match_result = await self._load_ranking_inputs(db, resume_id, vacancy_id)
+
+        # Extract features and get model prediction
+        [(features, rank_score, _, confidence)] = score_ranking_rows(
+            self.model, [(resume_data, vacancy_data, match_result)]
+        )
+
+        ranking = self._build_ranking(
+            resume_id, vacancy_id, resume_data, vacancy_data, features, rank_score, confidence, use_experiment
+        )
+        await upsert_candidate_ranks(db, [self._rank_row(ranking, features)])
+        await db.commit()
+        return ranking
+
+    async def _load_ranking_inputs(
+        self,
+        db: AsyncSession,
+        resume_id: UUID,
+        vacancy_id: UUID,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Fetch what the ranking model needs about a resume-vacancy pair.
+
+        Returns:
+            Tuple of (resume_data, vacancy_data, match_result)
+
+        Raises:
+            ValueError: If the resume or vacancy does not exist
+        """
         # Fetch resume data
         resume_query = select(Resume).where(Resume.id == resume_id)
         resume_result = await db.execute(resume_query)
@@ -533,16 +718,20 @@ class RankingService:
         match_result_obj = await db.execute(match_query)
         match_record = match_result_obj.scalar_one_or_none()
 
-        match_result = None
-        if match_record:
-            match_result = {
-                "overall_score": float(match_record.overall_score or 0),
-                "keyword_score": float(match_record.keyword_score or 0),
-                "tfidf_score": float(match_record.tfidf_score or 0),
-                "vector_score": float(match_record.vector_score or 0),
-            }
+        # Try to get skills from ResumeAnalysis
+        analysis_query = select(ResumeAnalysis).where(ResumeAnalysis.resume_id == resume_id)
+        analysis_result = await db.execute(analysis_query)
+        analysis = analysis_result.scalar_one_or_none()
+
+        resume_data = self._resume_data(resume, analysis)
+        vacancy_data = self._vacancy_data(vacancy)
+        match_result = self._match_data(match_record)
+
+        return resume_data, vacancy_data, match_result
 
-        # Prepare resume data dict
+    @staticmethod
+    def _resume_data(resume: Resume, analysis: Optional[ResumeAnalysis]) -> Dict[str, Any]:
+        """Prepare the resume data dict used for feature extraction."""
         resume_data = {
             "id": str(resume.id),
             "title": resume.raw_text[:100] if resume.raw_text else "",
@@ -552,32 +741,53 @@ class RankingService:
             "updated_at": resume.updated_at.isoformat() if resume.updated_at else None,
         }
 
-        # Try to get skills from ResumeAnalysis
-        analysis_query = select(ResumeAnalysis).where(ResumeAnalysis.resume_id == resume_id)
-        analysis_result = await db.execute(analysis_query)
-        analysis = analysis_result.scalar_one_or_none()
-
         if analysis:
             if analysis.skills:
                 resume_data["skills"] = analysis.skills
             if analysis.raw_text:
                 resume_data["title"] = analysis.raw_text[:100]
 
-        # Prepare vacancy data dict
-        vacancy_data = {
+        # Persisted skill IDs; computed for analyses stored before they existed
+        resume_data["skill_ids"] = as_skill_id_array(
+            analysis.skill_ids if analysis and analysis.skills else None, resume_data["skills"]
+        )
+        return resume_data
+
+    @staticmethod
+    def _vacancy_data(vacancy: JobVacancy) -> Dict[str, Any]:
+        """Prepare the vacancy data dict used for feature extraction."""
+        return {
             "id": str(vacancy.id),
             "title": vacancy.title,
             "required_skills": vacancy.required_skills or [],
+            "required_skill_ids": as_skill_id_array(vacancy.required_skill_ids, vacancy.required_skills or []),
             "description": vacancy.description or "",
         }
 
-        # Extract features
-        features = RankingFeatures.extract_features(resume_data, vacancy_data, match_result)
-
-        # Get model prediction
-        rank_score = self.model.predict_proba(features)
-        prediction, confidence = self.model.predict(features)
+    @staticmethod
+    def _match_data(match_record: Optional[MatchResult]) -> Optional[Dict[str, Any]]:
+        """Get the unified matching scores of a stored match result."""
+        if not match_record:
+            return None
+        return {
+            "overall_score": float(match_record.overall_score or 0),
+            "keyword_score": float(match_record.keyword_score or 0),
+            "tfidf_score": float(match_record.tfidf_score or 0),
+            "vector_score": float(match_record.vector_score or 0),
+        }
 
+    def _build_ranking(
+        self,
+        resume_id: UUID,
+        vacancy_id: UUID,
+        resume_data: Dict[str, Any],
+        vacancy_data: Dict[str, Any],
+        features: npt.NDArray[np.float64],
+        rank_score: float,
+        confidence: float,
+        use_experiment: bool,
+    ) -> Dict[str, Any]:
+        """Assemble the ranking result of a scored candidate."""
         # Determine A/B test group
         is_experiment = use_experiment and random.random() < self.ab_test_ratio
         experiment_group = None
@@ -595,56 +805,18 @@ class RankingService:
         }
 
         # Build ranking factors detail
+        resume_ids, required_ids = RankingFeatures.skill_id_arrays(resume_data, vacancy_data)
         ranking_factors = {
             "skills_match": {
                 "score": float(features[4]),
-                "matched": len([s for s in vacancy_data["required_skills"]
-                              if s.lower() in [rs.lower() for rs in resume_data["skills"]]]),
-                "total": len(vacancy_data["required_skills"]),
+                "matched": count_shared_skills(resume_ids, required_ids),
+                "total": len(required_ids),
             },
             "experience_score": float(features[5] / 120),  # Normalize to ~0-1
             "education_score": float(features[7]),
             "freshness": float(features[11]),
         }
 
-        # Create or update CandidateRank record
-        existing_rank_query = select(CandidateRank).where(
-            CandidateRank.resume_id == resume_id,
-            CandidateRank.vacancy_id == vacancy_id,
-        )
-        existing_rank_result = await db.execute(existing_rank_query)
-        existing_rank = existing_rank_result.scalar_one_or_none()
-
-        if existing_rank:
-            # Update existing
-            existing_rank.rank_score = rank_score
-            existing_rank.model_version = self.model.version
-            existing_rank.model_type = self.model.model_type
-            existing_rank.is_experiment = is_experiment
-            existing_rank.experiment_group = experiment_group
-            existing_rank.feature_contributions = feature_contributions
-            existing_rank.ranking_factors = ranking_factors
-            existing_rank.prediction_confidence = confidence
-            existing_rank.recommendation = recommendation
-        else:
-            # Create new
-            new_rank = CandidateRank(
-                resume_id=resume_id,
-                vacancy_id=vacancy_id,
-                rank_score=rank_score,
-                model_version=self.model.version,
-                model_type=self.model.model_type,
-                is_experiment=is_experiment,
-                experiment_group=experiment_group,
-                feature_contributions=feature_contributions,
-                ranking_factors=ranking_factors,
-                prediction_confidence=confidence,
-                recommendation=recommendation,
-            )
-            db.add(new_rank)
-
-        await db.commit()
-
         return {
             "resume_id": str(resume_id),
             "vacancy_id": str(vacancy_id),
@@ -658,6 +830,143 @@ class RankingService:
             "ranking_factors": ranking_factors,
         }
 
+    def _rank_row(
+        self, ranking: Dict[str, Any], features: Optional[npt.NDArray[np.float64]] = None
+    ) -> Dict[str, Any]:
+        """
+        CandidateRank column values of a ranking.
+
+        The feature vector the model scored is kept in extra_metadata, so
+        feedback on the ranking can train the model on exactly those inputs.
+        """
+        row = {
+            "resume_id": UUID(ranking["resume_id"]),
+            "vacancy_id": UUID(ranking["vacancy_id"]),
+            "rank_score": ranking["rank_score"],
+            "model_version": ranking["model_version"],
+            "model_type": self.model.model_type,
+            "is_experiment": ranking["is_experiment"],
+            "experiment_group": ranking["experiment_group"],
+            "feature_contributions": ranking["feature_contributions"],
+            "ranking_factors": ranking["ranking_factors"],
+            "prediction_confidence": ranking["confidence"],
+            "recommendation": ranking["recommendation"],
+        }
+        if "rank_position" in ranking:
+            row["rank_position"] = ranking["rank_position"]
+        if features is not None:
+            row["extra_metadata"] = {"features": [float(value) for value in features]}
+        return row
+
+    async def shortlist_resumes(
+        self,
+        db: AsyncSession,
+        vacancy_id: UUID,
+        k: int = 100,
+        vacancy: Optional[JobVacancy] = None,
+        require_full_index: bool = False,
+    ) -> List[Tuple[UUID, float]]:
+        """
+        Retrieve the resumes closest to a vacancy from the ANN index.
+
+        Args:
+            db: Database session
+            vacancy_id: JobVacancy UUID
+            k: Shortlist size
+            vacancy: Already loaded vacancy (fetched here if None)
+            require_full_index: Return nothing unless the index holds at
+                                least as many resumes as are COMPLETED, so a
+                                partly built index never hides resumes
+
+        Returns:
+            (resume UUID, cosine similarity) pairs, best first, or an empty
+            list if the index is unavailable, empty or (with
+            require_full_index) partial
+        """
+        try:
+            from .resume_retrieval import get_resume_retriever
+
+            # Loading the index, refreshing it from its journal and encoding
+            # the vacancy are blocking; keep them off the event loop
+            retriever = await asyncio.to_thread(get_resume_retriever)
+            if retriever is None:
+                return []
+            indexed = await asyncio.to_thread(len, retriever)
+            if indexed == 0:
+                return []
+
+            if require_full_index:
+                completed_result = await db.execute(
+                    select(func.count()).select_from(Resume).where(Resume.status == "COMPLETED")
+                )
+                completed = completed_result.scalar_one()
+                if indexed < completed:
+                    logger.info(
+                        f"Resume index holds {indexed} of {completed} completed resumes; "
+                        f"not shortlisting vacancy {vacancy_id}"
+                    )
+                    return []
+
+            if vacancy is None:
+                vacancy_result = await db.execute(select(JobVacancy).where(JobVacancy.id == vacancy_id))
+                vacancy = vacancy_result.scalar_one_or_none()
+                if vacancy is None:
+                    return []
+
+            hits = await asyncio.to_thread(
+                retriever.retrieve, vacancy.title, vacancy.description, vacancy.required_skills or [], k
+            )
+            return [(UUID(resume_id), similarity) for resume_id, similarity in hits]
+        except Exception as e:
+            logger.warning(f"Resume shortlisting failed for vacancy {vacancy_id}: {e}")
+            return []
+
+    async def keyword_scores_for_vacancy(
+        self,
+        db: AsyncSession,
+        vacancy_id: UUID,
+        k: int = 100,
+    ) -> List[Tuple[UUID, float]]:
+        """
+        Score a vacancy against every resume with corpus-level TF-IDF.
+
+        Vacancies not yet in the corpus are scored from their text.
+
+        Args:
+            db: Database session
+            vacancy_id: JobVacancy UUID
+            k: Number of resumes to return
+
+        Returns:
+            (resume UUID, cosine similarity) pairs, best first, or an empty
+            list if the corpus is unavailable or empty
+        """
+        try:
+            from .tfidf_corpus import compose_vacancy_text, get_corpus_tfidf
+
+            # Loading the corpus and a refresh that rebuilds its matrix read
+            # from disk and scan every resume; keep them off the event loop
+            corpus = await asyncio.to_thread(get_corpus_tfidf)
+            if corpus is None or await asyncio.to_thread(corpus.count, "resume") == 0:
+                return []
+
+            hits = await asyncio.to_thread(corpus.score_document, "vacancy", str(vacancy_id), "resume", k)
+            if not hits:
+                vacancy_result = await db.execute(select(JobVacancy).where(JobVacancy.id == vacancy_id))
+                vacancy = vacancy_result.scalar_one_or_none()
+                if vacancy is None:
+                    return []
+                hits = await asyncio.to_thread(
+                    corpus.score_text,
+                    compose_vacancy_text(vacancy.title, vacancy.description, vacancy.required_skills),
+                    "resume",
+                    k,
+                )
+            return [(UUID(resume_id), score) for resume_id, score in hits]
+        except Exception as e:
+            logger.warning(f"Corpus TF-IDF scoring failed for vacancy {vacancy_id}: {e}")
+            return []
+
     async def rank_candidates_for_vacancy(
         self,
         db: AsyncSession,
@@ -667,6 +976,11 @@ class RankingService:
         """
         Rank multiple candidates for a vacancy.
 
+        Set-based: the vacancy and the resumes with their analyses and
+        match results are each fetched with one query; all candidates are
+        scored with one model call and their CandidateRank records,
+        positions included, upserted in one transaction.
+
         Args:
             db: Database session
             vacancy_id: JobVacancy UUID
@@ -675,27 +989,78 @@ class RankingService:
         Returns:
             List of ranked candidates with scores
         """
-        # Get all resumes
-        resume_query = select(Resume).where(Resume.status == "COMPLETED").limit(limit * 2)
-        resume_result = await db.execute(resume_query)
-        resumes = resume_result.scalars().all()
+        vacancy_result = await db.execute(select(JobVacancy).where(JobVacancy.id == vacancy_id))
+        vacancy = vacancy_result.scalar_one_or_none()
+        if vacancy is None:
+            logger.warning(f"Cannot rank candidates, vacancy not found: {vacancy_id}")
+            return []
 
-        rankings = []
-        for resume in resumes:
-            try:
-                ranking = await self.rank_candidate(
-                    db, resume.id, vacancy_id, use_experiment=True
-                )
-                rankings.append(ranking)
-            except Exception as e:
-                logger.warning(f"Failed to rank candidate {resume.id}: {e}")
+        resume_query = select(Resume).where(Resume.status == "COMPLETED")
+
+        # Restrict to the nearest resumes by embedding when the index covers every resume
+        shortlist = await self.shortlist_resumes(
+            db, vacancy_id, k=max(limit * 2, 1), vacancy=vacancy, require_full_index=True
+        )
+        if shortlist:
+            logger.info(f"Ranking {len(shortlist)} shortlisted resumes for vacancy {vacancy_id}")
+            resume_query = resume_query.where(Resume.id.in_([resume_id for resume_id, _ in shortlist]))
+        else:
+            resume_query = resume_query.limit(limit * 2)
+
+        # Resumes with their analysis and match result in one joined query
+        rows = await db.execute(
+            resume_query.add_columns(ResumeAnalysis, MatchResult)
+            .outerjoin(ResumeAnalysis, ResumeAnalysis.resume_id == Resume.id)
+            .outerjoin(
+                MatchResult,
+                and_(MatchResult.resume_id == Resume.id, MatchResult.vacancy_id == vacancy_id),
+            )
+        )
+
+        vacancy_data = self._vacancy_data(vacancy)
+        resume_ids: List[UUID] = []
+        inputs = []
+        seen = set()
+        for resume, analysis, match_record in rows.all():
+            if resume.id in seen:
+                # Only the first match result of a pair is used
                 continue
+            seen.add(resume.id)
+            resume_ids.append(resume.id)
+            inputs.append((self._resume_data(resume, analysis), vacancy_data, self._match_data(match_record)))
+
+        if not inputs:
+            return []
+
+        # One feature matrix and one model call (sharded across the ranking pool if enabled)
+        ranker = get_parallel_ranker()
+        if ranker is not None and ranker.should_parallelize(len(inputs)):
+            # Workers block on model inference; keep the event loop free meanwhile
+            scores = await asyncio.to_thread(ranker.score_ranking_rows, inputs, self.model)
+        else:
+            scores = score_ranking_rows(self.model, inputs)
+
+        ranked = [
+            (
+                self._build_ranking(
+                    resume_id, vacancy_id, resume_data, vacancy_data, features, rank_score, confidence,
+                    use_experiment=True,
+                ),
+                features,
+            )
+            for resume_id, (resume_data, _, _), (features, rank_score, _, confidence) in zip(resume_ids, inputs, scores)
+        ]
 
         # Sort by rank score and assign positions
-        rankings.sort(key=lambda x: x["rank_score"], reverse=True)
+        ranked.sort(key=lambda pair: pair[0]["rank_score"], reverse=True)
+        rankings = [ranking for ranking, _ in ranked]
         for i, ranking in enumerate(rankings):
             ranking["rank_position"] = i + 1
 
+        # All CandidateRank rows are upserted in a single transaction
+        await upsert_candidate_ranks(db, [self._rank_row(ranking, features) for ranking, features in ranked])
+        await db.commit()
+
         return rankings[:limit]
 
     def _score_to_recommendation(self, score: float) -> str:
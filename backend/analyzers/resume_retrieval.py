@@ -0,0 +1,284 @@
+"""
+Vacancy-to-resume candidate retrieval over an ANN index.
+
+This module keeps an IVF-flat index of resume embeddings on disk and
+answers "which resumes are closest to this vacancy?" in milliseconds, so
+that only a shortlist has to go through full unified matching and the ML
+ranking model.
+
+Persistence model (one directory per embedding model, see journaled_index.py):
+    CURRENT              - generation number of the live snapshot
+    index-<gen>.npz      - IVFFlatIndex snapshot
+    journal-<gen>.jsonl  - inserts/deletes applied after the snapshot
+
+Every insert or delete is appended to the journal under a file lock, so
+API and Celery workers see each other's changes on their next query.
+The journal is folded into a new snapshot generation every
+``compact_every`` operations, and workers start warm from the latest one.
+"""
+import base64
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .ann_index import IVFFlatIndex
+from .embedding_store import model_dir_name
+from .journaled_index import JournaledIndex
+from .vector_matcher import VectorSimilarityMatcher, get_vector_matcher
+
+logger = logging.getLogger(__name__)
+
+
+class ResumeVectorIndex(JournaledIndex):
+    """
+    Disk-backed, multi-process IVF index of resume embeddings.
+
+    Example:
+        >>> index = ResumeVectorIndex(Path("models_cache/resume_index/all-MiniLM-L6-v2"))
+        >>> index.add("3f1c...", embedding)
+        >>> index.search(vacancy_embedding, k=100)
+        [('3f1c...', 0.74), ...]
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        nprobe: int = 8,
+        compact_every: int = 1000,
+        dtype: str = "float32",
+    ):
+        """
+        Initialize the index and load the latest snapshot.
+
+        Args:
+            directory: Directory holding snapshots and journals
+            nprobe: Number of IVF lists scanned per query
+            compact_every: Journal length that triggers a new snapshot
+            dtype: In-memory storage format ("float32", "float16" or "int8");
+                   snapshots keep the format they were written with
+        """
+        self.nprobe = nprobe
+        self.dtype = dtype
+        self.index: Optional[IVFFlatIndex] = None
+
+        super().__init__(directory, compact_every=compact_every)
+
+    def _reset(self) -> None:
+        self.index = None
+
+    def _load_snapshot(self, path: Path) -> None:
+        self.index = IVFFlatIndex.load(path)
+        self.index.nprobe = self.nprobe
+
+    def _save_snapshot(self, path: Path) -> bool:
+        if self.index is None:
+            return False
+        self.index.save(path)
+        return True
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        """Apply one journal record to the in-memory index."""
+        if record["op"] == "add":
+            vector = np.frombuffer(base64.b64decode(record["vector"]), dtype=np.float32)
+            if self.index is None:
+                self.index = IVFFlatIndex(dim=len(vector), nprobe=self.nprobe, dtype=self.dtype)
+            self.index.add(record["id"], vector)
+        elif record["op"] == "remove" and self.index is not None:
+            self.index.remove(record["id"])
+
+    def add_many(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        """
+        Insert or replace resume embeddings.
+
+        Args:
+            ids: Resume identifiers
+            vectors: 2-D array with one embedding per resume
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        self._append([
+            {
+                "op": "add",
+                "id": str(item_id),
+                "vector": base64.b64encode(np.ascontiguousarray(vector).tobytes()).decode("ascii"),
+            }
+            for item_id, vector in zip(ids, vectors)
+        ])
+
+    def add(self, item_id: str, vector: np.ndarray) -> None:
+        """
+        Insert or replace a single resume embedding.
+
+        Args:
+            item_id: Resume identifier
+            vector: 1-D embedding
+        """
+        self.add_many([item_id], np.asarray(vector).reshape(1, -1))
+
+    def remove(self, item_id: str) -> None:
+        """
+        Delete a resume from the index.
+
+        Args:
+            item_id: Resume identifier
+        """
+        self._append([{"op": "remove", "id": str(item_id)}])
+
+    def search(self, query: np.ndarray, k: int = 100) -> List[Tuple[str, float]]:
+        """
+        Find the resumes most similar to a query embedding.
+
+        Args:
+            query: 1-D query embedding
+            k: Number of results
+
+        Returns:
+            List of (resume_id, cosine_similarity), best first
+        """
+        with self._lock:
+            self.refresh()
+            if self.index is None:
+                return []
+            return self.index.search(query, k=k)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.refresh()
+            return 0 if self.index is None else len(self.index)
+
+
+class ResumeRetriever:
+    """
+    Shortlist resumes for a vacancy by embedding similarity.
+
+    Resume and vacancy texts are encoded with the same VectorSimilarityMatcher
+    used by unified matching (and therefore hit the same embedding store),
+    so indexing a resume also warms the cache for its later full match.
+
+    Example:
+        >>> retriever = get_resume_retriever()
+        >>> retriever.index_resume("3f1c...", resume_text)
+        >>> retriever.retrieve("Backend Developer", "Python, Django", ["Python"], k=50)
+        [('3f1c...', 0.74), ...]
+    """
+
+    def __init__(self, index: ResumeVectorIndex, vector_matcher: VectorSimilarityMatcher):
+        """
+        Initialize the retriever.
+
+        Args:
+            index: Resume vector index
+            vector_matcher: Matcher used to encode texts
+        """
+        self.index = index
+        self.vector_matcher = vector_matcher
+
+    def index_resume(self, resume_id: str, resume_text: str) -> bool:
+        """
+        Add or refresh a resume in the index.
+
+        Args:
+            resume_id: Resume identifier
+            resume_text: Full resume text
+
+        Returns:
+            True if the resume was indexed
+        """
+        return self.index_resumes([(resume_id, resume_text)]) == 1
+
+    def index_resumes(self, items: Sequence[Tuple[str, str]]) -> int:
+        """
+        Add or refresh several resumes using batched encoding.
+
+        Args:
+            items: (resume_id, resume_text) pairs
+
+        Returns:
+            Number of resumes indexed
+        """
+        items = [(str(rid), text) for rid, text in items if text and text.strip()]
+        if not items:
+            return 0
+
+        embeddings = self.vector_matcher._encode_texts([text for _, text in items])
+        indexed = [(rid, emb) for (rid, _), emb in zip(items, embeddings) if emb is not None]
+        if not indexed:
+            return 0
+
+        self.index.add_many([rid for rid, _ in indexed], np.vstack([emb for _, emb in indexed]))
+        return len(indexed)
+
+    def remove_resume(self, resume_id: str) -> None:
+        """
+        Remove a resume from the index.
+
+        Args:
+            resume_id: Resume identifier
+        """
+        self.index.remove(str(resume_id))
+
+    def retrieve(
+        self,
+        job_title: str,
+        job_description: str,
+        required_skills: List[str],
+        k: int = 100,
+    ) -> List[Tuple[str, float]]:
+        """
+        Get the top-K resumes for a vacancy.
+
+        Args:
+            job_title: Vacancy title
+            job_description: Vacancy description
+            required_skills: Required skills
+            k: Shortlist size
+
+        Returns:
+            List of (resume_id, cosine_similarity), best first
+        """
+        job_text = self.vector_matcher.compose_job_text(job_title, job_description, required_skills)
+        job_embedding = self.vector_matcher._encode_text(job_text)
+        if job_embedding is None:
+            return []
+        return self.index.search(job_embedding, k=k)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+# Singleton instance for convenience
+_default_retriever: Optional[ResumeRetriever] = None
+
+
+def get_resume_retriever() -> Optional[ResumeRetriever]:
+    """
+    Get or create the default resume retriever.
+
+    Returns:
+        ResumeRetriever instance, or None if the index is disabled or
+        sentence-transformers is not available
+    """
+    global _default_retriever
+    if _default_retriever is None:
+        from config import get_settings
+
+        settings = get_settings()
+        if not settings.resume_index_enabled:
+            return None
+
+        vector_matcher = get_vector_matcher()
+        if vector_matcher is None:
+            return None
+
+        directory = settings.models_cache_path / "resume_index" / model_dir_name(vector_matcher.embedding_key)
+        _default_retriever = ResumeRetriever(
+            ResumeVectorIndex(
+                directory,
+                nprobe=settings.resume_index_nprobe,
+                dtype=settings.resume_index_dtype,
+            ),
+            vector_matcher,
+        )
+        logger.info(f"Resume retriever initialized at {directory}")
+    return _default_retriever
@@ -0,0 +1,252 @@
+"""
+Memoized skill name normalization and interned integer skill IDs.
+
+Skill names are normalized in nearly every inner loop of the matchers, and
+the same few thousand names come back again and again. Normalization is
+memoized here, and every normalized name is interned into an integer ID,
+so skill lists can be stored and compared as NumPy ID arrays instead of
+strings.
+
+IDs are derived from a hash of the normalized name rather than assigned in
+order: API and Celery processes agree on them without coordination, and
+IDs persisted in ResumeAnalysis.skill_ids and JobVacancy.required_skill_ids
+stay valid across restarts; ranking compares them with set operations. They
+fit in 53 bits so they round-trip through JSON unchanged.
+
+Example:
+    >>> ids = skill_ids(["React", " react ", "PostgreSQL"])
+    >>> len(ids)
+    2
+    >>> count_shared_skills(ids, skill_ids(["postgresql", "Go"]))
+    1
+"""
+import hashlib
+import logging
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Number of distinct names kept by each normalization memo
+NORMALIZE_CACHE_SIZE = 65536
+
+# Number of skill lists whose ID maps are kept by first_skill_by_id
+SKILL_LIST_CACHE_SIZE = 256
+
+# IDs are masked to this many bits (largest exact integer in a JSON double)
+SKILL_ID_BITS = 53
+
+_SKILL_ID_MASK = (1 << SKILL_ID_BITS) - 1
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_skill_name(skill: str) -> str:
+    """
+    Collapse whitespace and lowercase a skill name (memoized).
+
+    Args:
+        skill: The skill name to normalize
+
+    Returns:
+        Normalized skill name
+
+    Example:
+        >>> normalize_skill_name("  React JS  ")
+        'react js'
+    """
+    return " ".join(skill.strip().lower().split())
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def canonicalize_skill_name(skill: str) -> str:
+    """
+    Normalize a skill name and drop punctuation that does not affect meaning (memoized).
+
+    Keeps letters, numbers, spaces, dots, plus and hash, so "C++", "C#" and
+    ".NET" stay distinct.
+
+    Args:
+        skill: The skill name to normalize
+
+    Returns:
+        Normalized skill name
+
+    Example:
+        >>> canonicalize_skill_name("Node-JS")
+        'nodejs'
+    """
+    return "".join(c for c in normalize_skill_name(skill) if c.isalnum() or c in " .+#")
+
+
+class SkillInterner:
+    """
+    Process-wide table of normalized skill names and their IDs.
+
+    Example:
+        >>> interner = get_skill_interner()
+        >>> skill_id = interner.intern("postgresql")
+        >>> interner.name(skill_id)
+        'postgresql'
+    """
+
+    def __init__(self):
+        """Initialize an empty table."""
+        self._ids: Dict[str, int] = {}
+        self._names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def intern(self, normalized_skill: str) -> int:
+        """
+        Get the ID of a normalized skill name.
+
+        Args:
+            normalized_skill: Skill name from canonicalize_skill_name()
+
+        Returns:
+            Stable integer ID
+        """
+        skill_id = self._ids.get(normalized_skill)
+        if skill_id is not None:
+            return skill_id
+
+        digest = hashlib.blake2b(normalized_skill.encode("utf-8"), digest_size=8).digest()
+        skill_id = int.from_bytes(digest, "big") & _SKILL_ID_MASK
+
+        with self._lock:
+            other = self._names.setdefault(skill_id, normalized_skill)
+            if other != normalized_skill:
+                logger.warning(f"Skill ID collision between '{other}' and '{normalized_skill}'")
+            self._ids[normalized_skill] = skill_id
+        return skill_id
+
+    def name(self, skill_id: int) -> Optional[str]:
+        """
+        Get the normalized name of an ID seen by this process.
+
+        Args:
+            skill_id: Skill ID
+
+        Returns:
+            Normalized skill name, or None if the ID was never interned here
+        """
+        return self._names.get(int(skill_id))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+_default_interner: Optional[SkillInterner] = None
+_interner_lock = threading.Lock()
+
+
+def get_skill_interner() -> SkillInterner:
+    """
+    Get or create the shared skill interner.
+
+    Returns:
+        SkillInterner instance
+    """
+    global _default_interner
+    if _default_interner is None:
+        with _interner_lock:
+            if _default_interner is None:
+                _default_interner = SkillInterner()
+    return _default_interner
+
+
+def skill_id(skill: str) -> int:
+    """
+    Get the ID of a skill name.
+
+    Args:
+        skill: Skill name as written
+
+    Returns:
+        Stable integer ID of its normalized form
+    """
+    return get_skill_interner().intern(canonicalize_skill_name(skill))
+
+
+def skill_ids(skills: Optional[Iterable[str]]) -> np.ndarray:
+    """
+    Get the sorted, unique IDs of a skill list.
+
+    Args:
+        skills: Skill names as written
+
+    Returns:
+        int64 array of skill IDs
+    """
+    if not skills:
+        return np.zeros(0, dtype=np.int64)
+    return np.unique(np.fromiter((skill_id(s) for s in skills if s), dtype=np.int64))
+
+
+@lru_cache(maxsize=SKILL_LIST_CACHE_SIZE)
+def _first_skill_by_id(skills: Tuple[str, ...]) -> Dict[int, str]:
+    by_id: Dict[int, str] = {}
+    for skill in skills:
+        by_id.setdefault(skill_id(skill), skill)
+    return by_id
+
+
+def first_skill_by_id(skills: Sequence[str]) -> Dict[int, str]:
+    """
+    Map each skill ID to the first skill of a list having it.
+
+    Matching a resume looks up every required skill in the same list, so
+    maps are cached per skill list; do not modify the returned dict.
+
+    Args:
+        skills: Skill names as written, in priority order
+
+    Returns:
+        Dict of skill ID -> skill name as written
+    """
+    return _first_skill_by_id(tuple(skills))
+
+
+def as_skill_id_array(ids: Optional[Sequence[int]], skills: Optional[Iterable[str]] = None) -> np.ndarray:
+    """
+    Convert persisted skill IDs (ResumeAnalysis.skill_ids, JobVacancy.required_skill_ids) to an array.
+
+    Args:
+        ids: Sorted unique skill IDs, or None if they were never stored
+        skills: Skill names to compute the IDs from when none were stored
+
+    Returns:
+        int64 array of skill IDs
+    """
+    if ids is None:
+        return skill_ids(skills)
+    return np.asarray(ids, dtype=np.int64)
+
+
+def count_shared_skills(ids_a: np.ndarray, ids_b: np.ndarray) -> int:
+    """
+    Count skills present in both sorted, unique ID arrays.
+
+    Args:
+        ids_a: Skill IDs from skill_ids()
+        ids_b: Skill IDs from skill_ids()
+
+    Returns:
+        Number of shared skills
+    """
+    return int(np.intersect1d(ids_a, ids_b, assume_unique=True).size)
+
+
+def serialize_skill_ids(skills: Optional[Iterable[str]]) -> List[int]:
+    """
+    Get the skill IDs of a skill list for storage in a JSON column.
+
+    Args:
+        skills: Skill names as written
+
+    Returns:
+        Sorted list of unique skill IDs
+    """
+    return skill_ids(skills).tolist()
@@ -21,6 +21,10 @@ from typing import Any, Dict, List, Optional
 from models.skill_taxonomy import SkillTaxonomy
 from models.custom_synonyms import CustomSynonym
 
+from .skill_ids import normalize_skill_name
+from .synonym_index import get_synonym_index
+from .taxonomy_snapshot import get_taxonomy_snapshot
+
 logger = logging.getLogger(__name__)
 
 # Path to static skill synonyms file
@@ -269,6 +273,9 @@ class TaxonomyLoader:
         This ensures organization-specific customizations take precedence,
         while maintaining industry context and baseline knowledge.
 
+        Once a taxonomy snapshot has been published (see taxonomy_snapshot.py),
+        the merged taxonomy comes from the latest snapshot instead.
+
         Args:
             organization_id: Organization identifier
             industry: Industry sector (tech, healthcare, finance, etc.)
@@ -284,6 +291,11 @@ class TaxonomyLoader:
             >>> print(len(taxonomies))
             250
         """
+        # The shared snapshot is always current; the per-process cache is not
+        snapshot = get_taxonomy_snapshot()
+        if snapshot is not None:
+            return snapshot.merged(organization_id, industry)
+
         # Check cache first
         cache_key = f"merged:{organization_id}:{industry}"
         if self.use_cache and cache_key in _taxonomy_cache:
@@ -412,7 +424,7 @@ class TaxonomyLoader:
             >>> loader.normalize_skill_name("  React JS  ")
             "react js"
         """
-        return " ".join(skill.strip().lower().split())
+        return normalize_skill_name(skill)
 
     def find_matching_skill(
         self,
@@ -455,24 +467,11 @@ class TaxonomyLoader:
             organization_id, industry, db_session
         )
 
-        # Build set of all variants for the required skill
-        all_variants = {normalized_required}
-
-        for canonical_name, synonym_list in merged_taxonomies.items():
-            normalized_canonical = self.normalize_skill_name(canonical_name)
-            if normalized_canonical == normalized_required:
-                # This canonical name matches - add all its variants
-                all_variants.update([self.normalize_skill_name(s) for s in synonym_list])
-            else:
-                # Check if any synonym matches
-                for synonym in synonym_list:
-                    if self.normalize_skill_name(synonym) == normalized_required:
-                        # This synonym matches - add canonical and all variants
-                        all_variants.add(normalized_canonical)
-                        all_variants.update(
-                            [self.normalize_skill_name(s) for s in synonym_list]
-                        )
-                        break
+        # All variants of the required skill, from the inverted index of the
+        # merged taxonomies (built once per merged map)
+        all_variants = get_synonym_index(
+            merged_taxonomies, self.normalize_skill_name
+        ).variants(normalized_required)
 
         # Find matching resume skill
         for resume_skill in resume_skills:
@@ -0,0 +1,475 @@
+"""
+Versioned, memory-mapped taxonomy snapshots shared by all workers.
+
+Each API and Celery worker used to keep its own copy of the synonyms and
+taxonomies, loaded once and never invalidated, so edits to custom synonyms
+or skill taxonomies were not seen until a restart. Instead, every change
+publishes a new immutable snapshot: static synonyms, industry taxonomies
+and organization synonyms compiled into one binary file. Workers map the
+file read-only (the OS shares the pages between processes), notice a new
+version by polling a small pointer file, and swap to it atomically.
+
+Layout on disk:
+    CURRENT                  - version number of the live snapshot
+    taxonomy-<version>.bin   - compiled snapshot
+
+Snapshot file format (little endian):
+    8 bytes   magic b"TAXSNAP1"
+    8 bytes   header length
+    header    JSON: version, scopes, and offset/dtype/count of each array
+    arrays    8-byte aligned:
+              strings        uint8  - UTF-8 of every distinct name, concatenated
+              string_offsets int64  - start of each string (plus end)
+              scope_ptr      int64  - first entry of each scope (plus end)
+              canonical      int32  - string of each entry's canonical name
+              variant_ptr    int64  - first variant of each entry (plus end)
+              variants       int32  - strings of the variants
+"""
+import json
+import logging
+import mmap
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .embedding_store import exclusive_file_lock
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"TAXSNAP1"
+
+# Scope kinds, in merge priority order (lowest first)
+STATIC_SCOPE = "static"
+INDUSTRY_SCOPE = "industry"
+ORGANIZATION_SCOPE = "organization"
+
+# Number of snapshot versions kept on disk (older ones may still be mapped)
+KEEP_VERSIONS = 2
+
+ScopeKey = Tuple[str, str]
+
+_ARRAY_DTYPES = {
+    "strings": np.uint8,
+    "string_offsets": np.int64,
+    "scope_ptr": np.int64,
+    "canonical": np.int32,
+    "variant_ptr": np.int64,
+    "variants": np.int32,
+}
+
+
+def write_taxonomy_snapshot(
+    path: Path,
+    version: int,
+    scopes: Dict[ScopeKey, Dict[str, Sequence[str]]],
+) -> None:
+    """
+    Compile taxonomies into a snapshot file.
+
+    Args:
+        path: Destination file (written to a temporary file, then renamed)
+        version: Snapshot version stored in the header
+        scopes: (scope kind, scope id) -> canonical name -> variants
+    """
+    string_ids: Dict[str, int] = {}
+
+    def intern(text: str) -> int:
+        string_id = string_ids.get(text)
+        if string_id is None:
+            string_id = string_ids[text] = len(string_ids)
+        return string_id
+
+    scope_keys = sorted(scopes)
+    scope_ptr, canonical, variant_ptr, variants = [0], [], [0], []
+    for key in scope_keys:
+        for canonical_name, names in scopes[key].items():
+            canonical.append(intern(canonical_name))
+            variants.extend(intern(name) for name in dict.fromkeys(names))
+            variant_ptr.append(len(variants))
+        scope_ptr.append(len(canonical))
+
+    encoded = [text.encode("utf-8") for text in string_ids]
+    string_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(data) for data in encoded], out=string_offsets[1:])
+
+    arrays = {
+        "strings": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        "string_offsets": string_offsets,
+        "scope_ptr": np.asarray(scope_ptr, dtype=np.int64),
+        "canonical": np.asarray(canonical, dtype=np.int32),
+        "variant_ptr": np.asarray(variant_ptr, dtype=np.int64),
+        "variants": np.asarray(variants, dtype=np.int32),
+    }
+
+    # Offsets are relative to the start of the array section
+    layout, offset = {}, 0
+    for name, array in arrays.items():
+        layout[name] = [offset, int(array.size)]
+        offset += -(-array.nbytes // 8) * 8
+    header = json.dumps({
+        "version": version,
+        "scopes": [list(key) for key in scope_keys],
+        "arrays": layout,
+    }).encode("utf-8")
+    header += b" " * (-(len(SNAPSHOT_MAGIC) + 8 + len(header)) % 8)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(len(header).to_bytes(8, "little"))
+        f.write(header)
+        for array in arrays.values():
+            data = array.tobytes()
+            f.write(data)
+            f.write(b"\0" * (-len(data) % 8))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class TaxonomySnapshot:
+    """
+    Read-only view of a compiled taxonomy snapshot.
+
+    Arrays are zero-copy views of the mapped file. Dictionaries are only
+    built for the scopes and organizations actually looked up, and are
+    cached for the lifetime of the snapshot, so synonym indexes built on
+    them are reused until the next version.
+
+    Example:
+        >>> snapshot = TaxonomySnapshot(Path("models_cache/taxonomy_snapshot/taxonomy-3.bin"))
+        >>> snapshot.merged("org123", "tech")["React"]
+        ['React', 'ReactJS', 'React.js', 'OurReact']
+    """
+
+    def __init__(self, path: Path):
+        """
+        Map a snapshot file.
+
+        Args:
+            path: Snapshot file written by write_taxonomy_snapshot()
+
+        Raises:
+            ValueError: If the file is not a taxonomy snapshot
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            raise ValueError(f"Not a taxonomy snapshot: {self.path}")
+        header_start = len(SNAPSHOT_MAGIC) + 8
+        header_length = int.from_bytes(self._mmap[len(SNAPSHOT_MAGIC):header_start], "little")
+        header = json.loads(self._mmap[header_start:header_start + header_length])
+        base = header_start + header_length
+
+        self.version: int = header["version"]
+        self._scope_index: Dict[ScopeKey, int] = {
+            (kind, scope_id): i for i, (kind, scope_id) in enumerate(header["scopes"])
+        }
+        self._arrays: Dict[str, np.ndarray] = {
+            name: np.frombuffer(self._mmap, dtype=_ARRAY_DTYPES[name], count=count, offset=base + offset)
+            for name, (offset, count) in header["arrays"].items()
+        }
+
+        self._scopes: Dict[ScopeKey, Dict[str, List[str]]] = {}
+        self._merged: Dict[Tuple[str, str], Dict[str, List[str]]] = {}
+        self._lock = threading.Lock()
+
+    def _string(self, string_id: int) -> str:
+        offsets = self._arrays["string_offsets"]
+        start, end = offsets[string_id], offsets[string_id + 1]
+        return self._arrays["strings"][start:end].tobytes().decode("utf-8")
+
+    def scopes(self) -> List[ScopeKey]:
+        """
+        Get the scopes stored in the snapshot.
+
+        Returns:
+            List of (scope kind, scope id)
+        """
+        return list(self._scope_index)
+
+    def synonyms(self, kind: str, scope_id: str = "") -> Dict[str, List[str]]:
+        """
+        Get the taxonomy of one scope.
+
+        Args:
+            kind: "static", "industry" or "organization"
+            scope_id: Industry or organization identifier ("" for static)
+
+        Returns:
+            Dictionary mapping canonical names to variants (empty if the
+            scope is not in the snapshot); do not modify
+        """
+        key = (kind, scope_id or "")
+        cached = self._scopes.get(key)
+        if cached is not None:
+            return cached
+
+        result: Dict[str, List[str]] = {}
+        scope = self._scope_index.get(key)
+        if scope is not None:
+            scope_ptr, canonical = self._arrays["scope_ptr"], self._arrays["canonical"]
+            variant_ptr, variants = self._arrays["variant_ptr"], self._arrays["variants"]
+            for entry in range(scope_ptr[scope], scope_ptr[scope + 1]):
+                names = variants[variant_ptr[entry]:variant_ptr[entry + 1]]
+                result[self._string(canonical[entry])] = [self._string(i) for i in names]
+
+        with self._lock:
+            return self._scopes.setdefault(key, result)
+
+    def merged(self, organization_id: str, industry: str) -> Dict[str, List[str]]:
+        """
+        Get the merged taxonomy of an organization.
+
+        Merges like TaxonomyLoader.load_for_organization(): static synonyms,
+        then industry taxonomies (variants added to existing skills), then
+        organization synonyms (replacing existing skills).
+
+        Args:
+            organization_id: Organization identifier
+            industry: Industry sector
+
+        Returns:
+            Dictionary mapping skill names to their synonym lists; do not
+            modify
+        """
+        key = (organization_id or "", industry or "")
+        cached = self._merged.get(key)
+        if cached is not None:
+            return cached
+
+        merged: Dict[str, List[str]] = {
+            skill: list(variants) for skill, variants in self.synonyms(STATIC_SCOPE).items()
+        }
+        for skill, variants in self.synonyms(INDUSTRY_SCOPE, industry).items():
+            merged[skill] = list(dict.fromkeys(merged.get(skill, []) + variants))
+        for skill, variants in self.synonyms(ORGANIZATION_SCOPE, organization_id).items():
+            merged[skill] = list(variants)
+
+        with self._lock:
+            return self._merged.setdefault(key, merged)
+
+    def __len__(self) -> int:
+        return int(self._arrays["canonical"].size)
+
+
+class TaxonomySnapshotStore:
+    """
+    Directory of snapshot versions with an atomically updated pointer.
+
+    Writers call publish() under a file lock. Readers call current(), which
+    re-reads the pointer at most once per check interval and swaps to the
+    new snapshot when the version changed.
+    """
+
+    def __init__(self, directory: Path, check_interval: float = 1.0):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory holding snapshots
+            check_interval: Seconds between checks for a new version (0 = every call)
+        """
+        self.directory = Path(directory)
+        self.check_interval = check_interval
+        self.current_path = self.directory / "CURRENT"
+        self.lock_path = self.directory / ".lock"
+
+        self._snapshot: Optional[TaxonomySnapshot] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _snapshot_path(self, version: int) -> Path:
+        return self.directory / f"taxonomy-{version}.bin"
+
+    def _read_version(self) -> int:
+        """Read the live version number (0 if nothing was published yet)."""
+        try:
+            return int(self.current_path.read_text().strip())
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    @property
+    def version(self) -> int:
+        """Version of the live snapshot on disk."""
+        return self._read_version()
+
+    def publish(self, scopes: Dict[ScopeKey, Dict[str, Sequence[str]]]) -> int:
+        """
+        Write a new snapshot version and point readers at it.
+
+        Args:
+            scopes: (scope kind, scope id) -> canonical name -> variants
+
+        Returns:
+            The new version number
+        """
+        with exclusive_file_lock(self.lock_path):
+            version = self._read_version() + 1
+            write_taxonomy_snapshot(self._snapshot_path(version), version, scopes)
+
+            tmp_path = self.current_path.with_name("CURRENT.tmp")
+            tmp_path.write_text(str(version))
+            os.replace(tmp_path, self.current_path)
+
+            # Workers still mapping an older file keep it alive until they swap
+            for old in self.directory.glob("taxonomy-*.bin"):
+                try:
+                    if int(old.stem.split("-", 1)[1]) <= version - KEEP_VERSIONS:
+                        old.unlink()
+                except (ValueError, FileNotFoundError):
+                    pass
+
+        logger.info(f"Published taxonomy snapshot version {version} ({sum(len(s) for s in scopes.values())} entries)")
+        return version
+
+    def current(self) -> Optional[TaxonomySnapshot]:
+        """
+        Get the live snapshot, swapping to a newer version if one was published.
+
+        Returns:
+            TaxonomySnapshot, or None if no snapshot was published yet
+        """
+        now = time.monotonic()
+        snapshot = self._snapshot
+        if snapshot is not None and now - self._checked_at < self.check_interval:
+            return snapshot
+
+        with self._lock:
+            self._checked_at = now
+            version = self._read_version()
+            if version == 0:
+                return None
+            if self._snapshot is not None and self._snapshot.version == version:
+                return self._snapshot
+
+            try:
+                self._snapshot = TaxonomySnapshot(self._snapshot_path(version))
+                logger.info(f"Loaded taxonomy snapshot version {version}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to load taxonomy snapshot version {version}: {e}")
+            return self._snapshot
+
+
+# Singleton instance for convenience
+_default_store: Optional[TaxonomySnapshotStore] = None
+
+
+def get_taxonomy_snapshot_store() -> Optional[TaxonomySnapshotStore]:
+    """
+    Get or create the shared snapshot store.
+
+    Returns:
+        TaxonomySnapshotStore instance, or None if disabled in settings
+    """
+    global _default_store
+    if _default_store is None:
+        from config import get_settings
+
+        settings = get_settings()
+        if not settings.taxonomy_snapshot_enabled:
+            return None
+
+        _default_store = TaxonomySnapshotStore(
+            settings.models_cache_path / "taxonomy_snapshot",
+            check_interval=settings.taxonomy_snapshot_check_interval,
+        )
+    return _default_store
+
+
+def get_taxonomy_snapshot() -> Optional[TaxonomySnapshot]:
+    """
+    Get the live taxonomy snapshot of this process.
+
+    Returns:
+        TaxonomySnapshot, or None if snapshots are disabled or none was
+        published yet
+    """
+    store = get_taxonomy_snapshot_store()
+    return store.current() if store is not None else None
+
+
+async def collect_taxonomy_scopes(db: Any) -> Dict[ScopeKey, Dict[str, List[str]]]:
+    """
+    Read every taxonomy source into snapshot scopes.
+
+    Args:
+        db: Async database session
+
+    Returns:
+        (scope kind, scope id) -> canonical name -> variants
+    """
+    from sqlalchemy import select
+
+    from models.custom_synonyms import CustomSynonym
+    from models.skill_taxonomy import SkillTaxonomy
+
+    from .taxonomy_loader import TaxonomyLoader
+
+    # Read the static file fresh, not from the per-process cache
+    scopes: Dict[ScopeKey, Dict[str, List[str]]] = {
+        (STATIC_SCOPE, ""): TaxonomyLoader(use_cache=False).load_static_synonyms(),
+    }
+
+    # Only the latest version of each taxonomy entry is live
+    result = await db.execute(
+        select(SkillTaxonomy)
+        .where(SkillTaxonomy.is_active == True, SkillTaxonomy.is_latest == True)  # noqa: E712
+        .order_by(SkillTaxonomy.updated_at)
+    )
+    for entry in result.scalars().all():
+        scope = scopes.setdefault((INDUSTRY_SCOPE, entry.industry), {})
+        scope[entry.skill_name] = list(dict.fromkeys([entry.skill_name, *(entry.variants or [])]))
+
+    result = await db.execute(
+        select(CustomSynonym)
+        .where(CustomSynonym.is_active == True)  # noqa: E712
+        .order_by(CustomSynonym.updated_at)
+    )
+    for entry in result.scalars().all():
+        scope = scopes.setdefault((ORGANIZATION_SCOPE, entry.organization_id), {})
+        scope[entry.canonical_skill] = list(
+            dict.fromkeys([entry.canonical_skill, *(entry.custom_synonyms or [])])
+        )
+
+    return scopes
+
+
+async def publish_taxonomy_snapshot(db: Optional[Any] = None) -> Optional[int]:
+    """
+    Publish a new taxonomy snapshot after a taxonomy change, logging failures.
+
+    Call after committing changes to skill taxonomies, taxonomy versions or
+    custom synonyms.
+
+    Args:
+        db: Async database session (a new one is opened if None)
+
+    Returns:
+        The new snapshot version, or None if snapshots are disabled or
+        publishing failed
+    """
+    try:
+        store = get_taxonomy_snapshot_store()
+        if store is None:
+            return None
+
+        if db is None:
+            from database import async_session_maker
+
+            async with async_session_maker() as session:
+                scopes = await collect_taxonomy_scopes(session)
+        else:
+            scopes = await collect_taxonomy_scopes(db)
+
+        return store.publish(scopes)
+    except Exception as e:
+        logger.warning(f"Failed to publish taxonomy snapshot: {e}")
+        return None
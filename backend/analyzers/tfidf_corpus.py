@@ -0,0 +1,471 @@
+"""
+Corpus-level TF-IDF over all stored resumes and vacancies.
+
+TfidfSkillMatcher fits its vectorizer on a single job posting, so every
+term gets the same IDF there. This module keeps one vocabulary and
+document frequencies over the whole corpus, updated as resumes and
+vacancies are added, changed or deleted. Term counts are stored as sparse
+CSR rows, so one vacancy is scored against every resume (or one resume
+against every vacancy) with a single sparse matrix product.
+
+Weighting (as sklearn's TfidfVectorizer with sublinear_tf=True):
+- tf = 1 + log(count)
+- idf = log((1 + N) / (1 + df)) + 1, with N the number of live documents
+- rows are L2-normalized, so scores are cosine similarities
+
+Persistence uses the snapshot plus journal layout from journaled_index.py,
+so API and Celery workers see each other's updates.
+"""
+import logging
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+from .journaled_index import JournaledIndex
+from .tfidf_matcher import TOKEN_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# Document collections held by the corpus
+DOCUMENT_KINDS = ("resume", "vacancy")
+
+
+def build_analyzer() -> Callable[[str], List[str]]:
+    """
+    Get the tokenizer used for corpus documents.
+
+    Uses the same settings as TfidfSkillMatcher: lowercase, English stop
+    words removed, unigrams and bigrams.
+
+    Returns:
+        Function mapping text to a list of terms
+    """
+    return TfidfVectorizer(
+        stop_words="english",
+        ngram_range=(1, 2),
+        token_pattern=TOKEN_PATTERN,
+        lowercase=True,
+    ).build_analyzer()
+
+
+def compose_vacancy_text(title: str, description: str, required_skills: Sequence[str]) -> str:
+    """
+    Build the text indexed for a vacancy.
+
+    Args:
+        title: Vacancy title
+        description: Vacancy description
+        required_skills: Required skills
+
+    Returns:
+        Title, description and skills joined into one text
+    """
+    return f"{title or ''} {description or ''} {' '.join(required_skills or [])}"
+
+
+class _Collection:
+    """Append-only CSR term counts of one document kind."""
+
+    def __init__(self):
+        self.ids: List[Optional[str]] = []
+        self.rows: Dict[str, int] = {}
+        self.indptr = array("q", [0])
+        self.indices = array("i")
+        self.counts = array("f")
+
+    def append(self, doc_id: str, term_ids: Sequence[int], counts: Sequence[float]) -> None:
+        self.rows[doc_id] = len(self.ids)
+        self.ids.append(doc_id)
+        self.indices.extend(term_ids)
+        self.counts.extend(counts)
+        self.indptr.append(len(self.indices))
+
+    def row_terms(self, row: int) -> np.ndarray:
+        return np.array(self.indices[self.indptr[row]:self.indptr[row + 1]], dtype=np.int32)
+
+    def matrix(self, n_terms: int) -> sparse.csr_matrix:
+        """Raw counts as a CSR matrix (dead rows included)."""
+        # Copies, so the append-only arrays can keep growing
+        return sparse.csr_matrix(
+            (
+                np.array(self.counts, dtype=np.float32),
+                np.array(self.indices, dtype=np.int32),
+                np.array(self.indptr, dtype=np.int64),
+            ),
+            shape=(len(self.ids), n_terms),
+        )
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+class CorpusTfidfIndex(JournaledIndex):
+    """
+    Incrementally updated TF-IDF model over resumes and vacancies.
+
+    Example:
+        >>> corpus = CorpusTfidfIndex(Path("models_cache/tfidf_corpus"))
+        >>> corpus.add_document("resume", "3f1c...", resume_text)
+        >>> corpus.add_document("vacancy", "9a7e...", vacancy_text)
+        >>> corpus.score_document("vacancy", "9a7e...", "resume", k=50)
+        [('3f1c...', 0.41), ...]
+    """
+
+    def __init__(self, directory: Path, compact_every: int = 1000):
+        """
+        Initialize the corpus and load the latest snapshot.
+
+        Args:
+            directory: Directory holding snapshots and journals
+            compact_every: Journal length that triggers a new snapshot
+        """
+        self._analyzer = build_analyzer()
+        self._reset()
+        super().__init__(directory, compact_every=compact_every)
+
+    # In-memory state
+
+    def _reset(self) -> None:
+        self._terms: List[str] = []
+        self._vocabulary: Dict[str, int] = {}
+        self._df = np.zeros(0, dtype=np.int64)
+        self._collections: Dict[str, _Collection] = {kind: _Collection() for kind in DOCUMENT_KINDS}
+        self._weighted: Dict[str, Tuple[int, sparse.csr_matrix]] = {}
+        self._version = 0
+
+    def _term_id(self, term: str) -> int:
+        term_id = self._vocabulary.get(term)
+        if term_id is None:
+            term_id = len(self._terms)
+            self._vocabulary[term] = term_id
+            self._terms.append(term)
+        return term_id
+
+    def _remove_locked(self, kind: str, doc_id: str) -> None:
+        collection = self._collections[kind]
+        row = collection.rows.pop(doc_id, None)
+        if row is None:
+            return
+        collection.ids[row] = None
+        np.subtract.at(self._df, collection.row_terms(row), 1)
+        self._version += 1
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        """Apply one journal record."""
+        kind, doc_id = record["kind"], record["id"]
+        self._remove_locked(kind, doc_id)
+        if record["op"] != "add":
+            return
+
+        term_ids = [self._term_id(term) for term in record["terms"]]
+        if len(self._terms) > len(self._df):
+            # Grow geometrically; only the first len(self._terms) entries are used
+            grown = np.zeros(max(len(self._terms), 2 * len(self._df)), dtype=np.int64)
+            grown[:len(self._df)] = self._df
+            self._df = grown
+        np.add.at(self._df, np.asarray(term_ids, dtype=np.int64), 1)
+
+        self._collections[kind].append(doc_id, term_ids, list(record["terms"].values()))
+        self._version += 1
+
+    def _load_snapshot(self, path: Path) -> None:
+        # Open first: if compaction deleted the file, the loaded state stays intact
+        with np.load(path) as data:
+            self._reset()
+            self._terms = data["terms"].tolist()
+            self._vocabulary = {term: i for i, term in enumerate(self._terms)}
+            self._df = data["df"].astype(np.int64)
+            for kind in DOCUMENT_KINDS:
+                collection = self._collections[kind]
+                collection.ids = data[f"{kind}_ids"].tolist()
+                collection.rows = {doc_id: row for row, doc_id in enumerate(collection.ids)}
+                collection.indptr = array("q", data[f"{kind}_indptr"].astype(np.int64).tobytes())
+                collection.indices = array("i", data[f"{kind}_indices"].astype(np.int32).tobytes())
+                collection.counts = array("f", data[f"{kind}_counts"].astype(np.float32).tobytes())
+
+    def _save_snapshot(self, path: Path) -> bool:
+        """Write live documents only; terms no longer used by any document are dropped."""
+        keep = self._df[:len(self._terms)] > 0
+        new_ids = np.cumsum(keep) - 1
+
+        arrays: Dict[str, np.ndarray] = {
+            "terms": np.array([t for t, k in zip(self._terms, keep) if k], dtype=str),
+            "df": self._df[:len(self._terms)][keep],
+        }
+        for kind, collection in self._collections.items():
+            live = [row for row, doc_id in enumerate(collection.ids) if doc_id is not None]
+            counts = collection.matrix(len(self._terms))[live]
+            arrays[f"{kind}_ids"] = np.array([collection.ids[row] for row in live], dtype=str)
+            arrays[f"{kind}_indptr"] = counts.indptr.astype(np.int64)
+            arrays[f"{kind}_indices"] = new_ids[counts.indices].astype(np.int32)
+            arrays[f"{kind}_counts"] = counts.data.astype(np.float32)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(f, **arrays)
+        return True
+
+    # Weighting
+
+    @property
+    def document_count(self) -> int:
+        """Number of live documents of all kinds."""
+        return sum(len(collection) for collection in self._collections.values())
+
+    def _idf(self) -> np.ndarray:
+        n_documents = self.document_count
+        return np.log((1 + n_documents) / (1 + self._df[:len(self._terms)])) + 1
+
+    def _weighted_matrix(self, kind: str) -> sparse.csr_matrix:
+        """L2-normalized TF-IDF rows of a collection, rebuilt after changes."""
+        cached = self._weighted.get(kind)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
+        matrix = self._collections[kind].matrix(len(self._terms)).astype(np.float64)
+        matrix.data = 1 + np.log(matrix.data)
+        matrix = normalize(matrix @ sparse.diags(self._idf()), norm="l2", copy=False).tocsr()
+        self._weighted[kind] = (self._version, matrix)
+        return matrix
+
+    def _query_vector(self, term_counts: Dict[str, float]) -> Optional[sparse.csr_matrix]:
+        """TF-IDF row for a query; unknown terms count towards its norm only."""
+        idf = self._idf()
+        n_documents = self.document_count
+        columns, values, norm = [], [], 0.0
+        for term, count in term_counts.items():
+            tf = 1 + np.log(count)
+            term_id = self._vocabulary.get(term)
+            weight = tf * (idf[term_id] if term_id is not None else np.log(1 + n_documents) + 1)
+            norm += weight * weight
+            if term_id is not None:
+                columns.append(term_id)
+                values.append(weight)
+
+        if not columns or norm == 0:
+            return None
+        values = np.asarray(values) / np.sqrt(norm)
+        return sparse.csr_matrix((values, ([0] * len(columns), columns)), shape=(1, len(self._terms)))
+
+    def _rank(self, query: Optional[sparse.csr_matrix], kind: str, k: Optional[int]) -> List[Tuple[str, float]]:
+        """Score a query row against every live document of a kind."""
+        collection = self._collections[kind]
+        if query is None or not len(collection):
+            return []
+
+        scores = (self._weighted_matrix(kind) @ query.T).toarray().ravel()
+        live = np.fromiter((doc_id is not None for doc_id in collection.ids), dtype=bool, count=len(collection.ids))
+        scores[~live] = -1.0
+
+        count = int(live.sum()) if k is None else min(k, int(live.sum()))
+        top = np.argpartition(-scores, count - 1)[:count] if count < len(scores) else np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")][:count]
+        return [(collection.ids[row], float(scores[row])) for row in top]
+
+    # Public API
+
+    def analyze(self, text: str) -> Dict[str, int]:
+        """
+        Count the terms of a text.
+
+        Args:
+            text: Document text
+
+        Returns:
+            Dict of term -> count
+        """
+        return dict(Counter(self._analyzer(text or "")))
+
+    def add_documents(self, kind: str, items: Sequence[Tuple[str, str]]) -> int:
+        """
+        Add or replace documents.
+
+        Args:
+            kind: "resume" or "vacancy"
+            items: (document_id, text) pairs
+
+        Returns:
+            Number of documents added
+        """
+        if kind not in DOCUMENT_KINDS:
+            raise ValueError(f"Unknown document kind: {kind}")
+
+        records = []
+        for doc_id, text in items:
+            terms = self.analyze(text)
+            if terms:
+                records.append({"op": "add", "kind": kind, "id": str(doc_id), "terms": terms})
+            else:
+                records.append({"op": "remove", "kind": kind, "id": str(doc_id)})
+
+        if records:
+            self._append(records)
+        return sum(1 for record in records if record["op"] == "add")
+
+    def add_document(self, kind: str, doc_id: str, text: str) -> bool:
+        """
+        Add or replace one document.
+
+        Args:
+            kind: "resume" or "vacancy"
+            doc_id: Document identifier
+            text: Document text
+
+        Returns:
+            True if the document has indexable terms
+        """
+        return self.add_documents(kind, [(doc_id, text)]) == 1
+
+    def remove_document(self, kind: str, doc_id: str) -> None:
+        """
+        Delete a document and its contribution to document frequencies.
+
+        Args:
+            kind: "resume" or "vacancy"
+            doc_id: Document identifier
+        """
+        self._append([{"op": "remove", "kind": kind, "id": str(doc_id)}])
+
+    def score_text(self, text: str, kind: str, k: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Score a text against every document of a kind.
+
+        Args:
+            text: Query text (e.g. a vacancy not stored yet)
+            kind: Documents to score ("resume" or "vacancy")
+            k: Number of results (all documents if None)
+
+        Returns:
+            List of (document_id, cosine similarity), best first
+        """
+        with self._lock:
+            self.refresh()
+            return self._rank(self._query_vector(self.analyze(text)), kind, k)
+
+    def score_document(
+        self,
+        source_kind: str,
+        source_id: str,
+        target_kind: str,
+        k: Optional[int] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Score a stored document against every document of another kind.
+
+        Args:
+            source_kind: Kind of the query document
+            source_id: Identifier of the query document
+            target_kind: Documents to score
+            k: Number of results (all documents if None)
+
+        Returns:
+            List of (document_id, cosine similarity), best first, or an
+            empty list if the query document is not in the corpus
+        """
+        with self._lock:
+            self.refresh()
+            row = self._collections[source_kind].rows.get(str(source_id))
+            if row is None:
+                return []
+            query = self._weighted_matrix(source_kind)[row]
+            return self._rank(query, target_kind, k)
+
+    def idf(self, term: str) -> float:
+        """
+        Get the corpus IDF of a term.
+
+        Args:
+            term: Lowercase term or bigram
+
+        Returns:
+            IDF weight (terms not in the corpus get the highest weight)
+        """
+        with self._lock:
+            self.refresh()
+            term_id = self._vocabulary.get(term)
+            if term_id is None:
+                return float(np.log(1 + self.document_count) + 1)
+            return float(self._idf()[term_id])
+
+    def count(self, kind: str) -> int:
+        """
+        Get the number of documents of a kind.
+
+        Args:
+            kind: "resume" or "vacancy"
+
+        Returns:
+            Number of live documents
+        """
+        with self._lock:
+            self.refresh()
+            return len(self._collections[kind])
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.refresh()
+            return self.document_count
+
+
+# Singleton instance for convenience
+_default_corpus: Optional[CorpusTfidfIndex] = None
+
+
+def get_corpus_tfidf() -> Optional[CorpusTfidfIndex]:
+    """
+    Get or create the shared corpus TF-IDF index.
+
+    Returns:
+        CorpusTfidfIndex instance, or None if disabled in settings
+    """
+    global _default_corpus
+    if _default_corpus is None:
+        from config import get_settings
+
+        settings = get_settings()
+        if not settings.tfidf_corpus_enabled:
+            return None
+
+        directory = settings.models_cache_path / "tfidf_corpus"
+        _default_corpus = CorpusTfidfIndex(directory)
+        logger.info(f"Corpus TF-IDF index initialized at {directory}")
+    return _default_corpus
+
+
+def index_corpus_document(kind: str, doc_id: str, text: str) -> None:
+    """
+    Add or replace a document in the shared corpus, logging failures.
+
+    Args:
+        kind: "resume" or "vacancy"
+        doc_id: Document identifier
+        text: Document text
+    """
+    try:
+        corpus = get_corpus_tfidf()
+        if corpus is not None:
+            corpus.add_document(kind, str(doc_id), text)
+    except Exception as e:
+        logger.warning(f"Failed to index {kind} {doc_id} in TF-IDF corpus: {e}")
+
+
+def remove_corpus_document(kind: str, doc_id: str) -> None:
+    """
+    Remove a document from the shared corpus, logging failures.
+
+    Args:
+        kind: "resume" or "vacancy"
+        doc_id: Document identifier
+    """
+    try:
+        corpus = get_corpus_tfidf()
+        if corpus is not None:
+            corpus.remove_document(kind, str(doc_id))
+    except Exception as e:
+        logger.warning(f"Failed to remove {kind} {doc_id} from TF-IDF corpus: {e}")
@@ -9,16 +9,28 @@ Key features:
 - Missing keywords ranked by TF-IDF importance
 - N-gram support (1-2 grams) for phrase matching
 - Configurable thresholds and feature limits
+- Compiled vacancy profiles cached by content hash, so ranking many
+  resumes against one vacancy fits the job text only once
 """
+import hashlib
 import logging
-import re
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
 from sklearn.feature_extraction.text import TfidfVectorizer
 
+from .keyword_scanner import KeywordScanner, get_keyword_scanner
+
 logger = logging.getLogger(__name__)
 
+# Token pattern keeping skills like "c++", "c#" and "node.js" in one token
+TOKEN_PATTERN = r"(?u)\b[a-zA-Z][a-zA-Z0-9+#.-]*\b"
+
+# Maximum number of compiled vacancy profiles kept in memory
+PROFILE_CACHE_SIZE = 512
+
 
 @dataclass
 class TfidfMatchResult:
@@ -31,6 +43,81 @@ class TfidfMatchResult:
     keyword_weights: Dict[str, float]
 
 
+def vacancy_content_hash(job_title: str, job_description: str, required_skills: List[str]) -> str:
+    """
+    Hash of the vacancy fields a TF-IDF profile is built from.
+
+    Args:
+        job_title: Job title
+        job_description: Job description text
+        required_skills: List of required skills
+
+    Returns:
+        Hex digest identifying the vacancy content
+    """
+    content = "\x1e".join([job_title or "", job_description or "", "\x1f".join(required_skills or [])])
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class VacancyProfile:
+    """
+    Compiled TF-IDF profile of a vacancy.
+
+    Holds everything about the job side of a match, so scoring a resume
+    is a single scan of its text for all keywords.
+    """
+
+    content_hash: str
+    keywords: List[str]
+    tfidf_scores: Dict[str, float]
+    scanner: KeywordScanner = field(default_factory=lambda: KeywordScanner([]))
+    total_weight: float = 0.0
+
+    def scan(self, resume_text: str) -> Tuple[List[str], List[str]]:
+        """
+        Find which profile keywords are present in resume text.
+
+        Args:
+            resume_text: Lowercase resume text
+
+        Returns:
+            Tuple of (matched_keywords, missing_keywords), in keyword order
+        """
+        found = self.scanner.find(resume_text)
+        matched = [keyword for keyword in self.keywords if keyword in found]
+        missing = [keyword for keyword in self.keywords if keyword not in found]
+        return matched, missing
+
+
+# Compiled profiles shared by all matcher instances, keyed by
+# (content hash, max_features, tfidf_cutoff)
+_profile_cache: "OrderedDict[Tuple[str, int, float], VacancyProfile]" = OrderedDict()
+_profile_cache_lock = threading.Lock()
+
+
+def invalidate_vacancy_profile(job_title: str, job_description: str, required_skills: List[str]) -> int:
+    """
+    Drop compiled profiles of a vacancy's content.
+
+    Call with the vacancy fields as they were before an update.
+
+    Args:
+        job_title: Job title
+        job_description: Job description text
+        required_skills: List of required skills
+
+    Returns:
+        Number of profiles removed
+    """
+    content_hash = vacancy_content_hash(job_title, job_description, required_skills)
+    with _profile_cache_lock:
+        stale = [key for key in _profile_cache if key[0] == content_hash]
+        for key in stale:
+            del _profile_cache[key]
+    return len(stale)
+
+
 class TfidfSkillMatcher:
     """
     TF-IDF based skill matcher with weighted scoring.
@@ -85,7 +172,7 @@ class TfidfSkillMatcher:
             stop_words="english",
             ngram_range=(1, 2),  # Include bigrams for phrases like "machine learning"
             max_features=self.max_features,
-            token_pattern=r"(?u)\b[a-zA-Z][a-zA-Z0-9+#.-]*\b",
+            token_pattern=TOKEN_PATTERN,
             lowercase=True,
         )
 
@@ -138,6 +225,53 @@ class TfidfSkillMatcher:
 
         return list(significant_keywords), tfidf_scores
 
+    def compile_profile(
+        self,
+        job_title: str,
+        job_description: str,
+        required_skills: List[str],
+    ) -> VacancyProfile:
+        """
+        Get the compiled profile of a job posting, building it on first use.
+
+        Profiles are cached by vacancy content hash, so an unchanged vacancy
+        is fitted once no matter how many resumes are matched against it.
+
+        Args:
+            job_title: Job title
+            job_description: Job description text
+            required_skills: List of required skills
+
+        Returns:
+            VacancyProfile with significant keywords, weights and keyword scanner
+        """
+        content_hash = vacancy_content_hash(job_title, job_description, required_skills)
+        key = (content_hash, self.max_features, self.tfidf_cutoff)
+
+        with _profile_cache_lock:
+            profile = _profile_cache.get(key)
+            if profile is not None:
+                _profile_cache.move_to_end(key)
+                return profile
+
+        keywords, tfidf_scores = self._extract_keywords_from_job(
+            job_title, job_description, required_skills
+        )
+        profile = VacancyProfile(
+            content_hash=content_hash,
+            keywords=keywords,
+            tfidf_scores=tfidf_scores,
+            scanner=KeywordScanner(keywords),
+            total_weight=sum(tfidf_scores.get(kw, 0.1) for kw in keywords),
+        )
+
+        with _profile_cache_lock:
+            _profile_cache[key] = profile
+            while len(_profile_cache) > PROFILE_CACHE_SIZE:
+                _profile_cache.popitem(last=False)
+
+        return profile
+
     def _find_keyword_matches(
         self,
         resume_text: str,
@@ -153,16 +287,10 @@ class TfidfSkillMatcher:
         Returns:
             Tuple of (matched_keywords, missing_keywords)
         """
-        matched = []
-        missing = []
-
-        for keyword in keywords:
-            # Use word boundary pattern for accurate matching
-            pattern = rf"\b{re.escape(keyword)}\b"
-            if re.search(pattern, resume_text):
-                matched.append(keyword)
-            else:
-                missing.append(keyword)
+        # One pass over the text with word-boundary matching for all keywords
+        found = get_keyword_scanner(keywords).find(resume_text)
+        matched = [keyword for keyword in keywords if keyword in found]
+        missing = [keyword for keyword in keywords if keyword not in found]
 
         return matched, missing
 
@@ -173,6 +301,7 @@ class TfidfSkillMatcher:
         job_description: str,
         required_skills: List[str],
         threshold: Optional[float] = None,
+        profile: Optional[VacancyProfile] = None,
     ) -> TfidfMatchResult:
         """
         Match resume against job posting using TF-IDF weighted scoring.
@@ -183,6 +312,8 @@ class TfidfSkillMatcher:
             job_description: Job posting description
             required_skills: List of required skills from job posting
             threshold: Override default threshold
+            profile: Compiled profile of the job posting (looked up in the
+                     profile cache if not given)
 
         Returns:
             TfidfMatchResult with score, passed status, and keyword details
@@ -193,10 +324,10 @@ class TfidfSkillMatcher:
         # Normalize resume text
         resume_lower = resume_text.lower()
 
-        # Extract significant keywords from job
-        keywords, tfidf_scores = self._extract_keywords_from_job(
-            job_title, job_description, required_skills
-        )
+        # Significant keywords of the job, fitted once per vacancy content
+        if profile is None:
+            profile = self.compile_profile(job_title, job_description, required_skills)
+        keywords, tfidf_scores = profile.keywords, profile.tfidf_scores
 
         if not keywords:
             # No keywords to match
@@ -209,11 +340,11 @@ class TfidfSkillMatcher:
             )
 
         # Find matches
-        matched, missing = self._find_keyword_matches(resume_lower, keywords)
+        matched, missing = profile.scan(resume_lower)
 
         # Calculate weighted score
         matched_weight = sum(tfidf_scores.get(kw, 0.1) for kw in matched)
-        total_weight = sum(tfidf_scores.get(kw, 0.1) for kw in keywords)
+        total_weight = profile.total_weight
         score = matched_weight / total_weight if total_weight > 0 else 1.0
 
         # Sort missing by TF-IDF importance (most important first)
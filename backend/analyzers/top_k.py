@@ -0,0 +1,111 @@
+"""
+Bounded heap keeping the K best-scoring items of a stream.
+
+Ranking used to build a full record per candidate and sort the whole list,
+while callers only show the first few dozen. TopK keeps just the K best
+(score, position) entries in a min-heap, so memory stays flat however many
+candidates stream through, and a candidate that cannot beat the current
+K-th score can be dropped early.
+
+Order matches a stable descending sort of the whole stream: equal scores
+keep arrival order, and a later item never displaces an earlier one with
+the same score.
+
+Example:
+    >>> top = TopK(2)
+    >>> for name, score in [("a", 0.4), ("b", 0.9), ("c", 0.7)]:
+    ...     top.push(score, name)
+    >>> top.items()
+    [(0.9, 'b'), (0.7, 'c')]
+"""
+import heapq
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class TopK(Generic[T]):
+    """
+    The K highest-scoring items pushed so far.
+
+    Attributes:
+        k: Number of items kept
+        pushed: Number of items offered so far
+    """
+
+    def __init__(self, k: int):
+        """
+        Initialize an empty heap.
+
+        Args:
+            k: Number of items to keep (at least 1)
+        """
+        if k < 1:
+            raise ValueError(f"k must be at least 1, got {k}")
+        self.k = k
+        self.pushed = 0
+        # (score, -position, position, item); the root is the current K-th best
+        self._heap: List[Tuple[float, int, int, Any]] = []
+
+    @property
+    def full(self) -> bool:
+        """Whether K items are held, so new items must beat the cutoff."""
+        return len(self._heap) >= self.k
+
+    @property
+    def cutoff(self) -> Optional[float]:
+        """
+        Score an item must exceed to enter once full.
+
+        Returns:
+            Score of the K-th best item, or None while fewer than K are held
+        """
+        return self._heap[0][0] if self.full else None
+
+    def accepts(self, score: float) -> bool:
+        """
+        Whether an item with this score would be kept if pushed now.
+
+        Args:
+            score: Candidate score
+
+        Returns:
+            True if the heap is not full or the score beats the cutoff
+        """
+        return not self.full or score > self._heap[0][0]
+
+    def push(self, score: float, item: T) -> bool:
+        """
+        Offer an item.
+
+        Args:
+            score: Item score (higher is better)
+            item: Item to keep if it ranks among the K best
+
+        Returns:
+            True if the item was kept
+        """
+        position = self.pushed
+        self.pushed += 1
+        entry = (score, -position, position, item)
+
+        if not self.full:
+            heapq.heappush(self._heap, entry)
+            return True
+        if score > self._heap[0][0]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def items(self) -> List[Tuple[float, T]]:
+        """
+        Get the kept items, best first.
+
+        Returns:
+            List of (score, item); equal scores in arrival order
+        """
+        ranked = sorted(self._heap, key=lambda entry: (-entry[0], entry[2]))
+        return [(score, item) for score, _, _, item in ranked]
+
+    def __len__(self) -> int:
+        return len(self._heap)
@@ -13,15 +13,45 @@ The unified approach provides the best of all worlds:
 """
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from .enhanced_matcher import EnhancedSkillMatcher
-from .tfidf_matcher import TfidfSkillMatcher, TfidfMatchResult
+import numpy as np
+
+from .enhanced_matcher import CompiledSkill, EnhancedSkillMatcher
+from .top_k import TopK
+from .tfidf_matcher import TfidfSkillMatcher, TfidfMatchResult, VacancyProfile
 from .vector_matcher import VectorSimilarityMatcher, VectorMatchResult, _HAS_SENTENCE_TRANSFORMERS
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class CompiledVacancy:
+    """
+    Vacancy side of a unified match, prepared once for many resumes.
+
+    Built by UnifiedSkillMatcher.compile_vacancy() and passed to
+    match_compiled(); treat it as read-only.
+
+    Attributes:
+        job_title: Job posting title
+        job_description: Job posting description
+        required_skills: Required skills, as written in the posting
+        skills: Normalized required skills with their synonym sets
+        tfidf_profile: Significant keywords, weights and keyword scanner
+        job_embedding: Embedding of the job text (None if vector matching
+                       is disabled or encoding failed)
+    """
+
+    job_title: str
+    job_description: str
+    required_skills: Tuple[str, ...]
+    skills: Tuple[CompiledSkill, ...]
+    tfidf_profile: VacancyProfile
+    job_embedding: Optional[np.ndarray] = None
+
+
 @dataclass
 class UnifiedMatchResult:
     """Comprehensive result from unified matching."""
@@ -51,6 +81,9 @@ class UnifiedMatchResult:
     # Recommendation
     recommendation: str = "neutral"
 
+    # Vector matching was skipped in cascade mode; overall_score is a lower bound
+    bounded: bool = False
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary for JSON serialization."""
         return {
@@ -68,9 +101,56 @@ class UnifiedMatchResult:
             "matched_skills": self.matched_skills,
             "missing_skills": self.missing_skills,
             "recommendation": self.recommendation,
+            "bounded": self.bounded,
         }
 
 
+@dataclass
+class RankingSnapshot:
+    """
+    State of a streaming ranking, from stream_top_candidates().
+
+    Attributes:
+        processed: Number of candidates scored so far
+        candidates: Best candidates so far, best first. Intermediate
+                    snapshots hold only 'id' and 'overall_score'; the final
+                    one holds full candidate dicts as from rank_candidates()
+        final: Whether every candidate has been processed
+    """
+
+    processed: int
+    candidates: List[Dict[str, Any]] = field(default_factory=list)
+    final: bool = False
+
+
+# Highest score vector matching can give
+MAX_VECTOR_SCORE = 1.0
+
+
+@dataclass
+class _PartialMatch:
+    """Keyword and TF-IDF results of a resume, before vector matching."""
+
+    weights: Tuple[float, float, float]
+    keyword_results: Dict[str, Dict[str, Any]]
+    matched_skills: List[str]
+    missing_skills: List[str]
+    keyword_score: float
+    keyword_passed: bool
+    tfidf_result: TfidfMatchResult
+
+    @property
+    def lower_bound(self) -> float:
+        """Overall score with a vector score of 0."""
+        kw, tw, _ = self.weights
+        return kw * self.keyword_score + tw * self.tfidf_result.score
+
+    @property
+    def upper_bound(self) -> float:
+        """Best overall score still reachable after vector matching."""
+        return self.lower_bound + self.weights[2] * MAX_VECTOR_SCORE
+
+
 class UnifiedSkillMatcher:
     """
     Unified skill matcher combining multiple strategies.
@@ -114,6 +194,9 @@ class UnifiedSkillMatcher:
 
         # Model configuration
         vector_model: str = "all-MiniLM-L6-v2",
+
+        # Skip vector matching for resumes that cannot pass
+        cascade: bool = False,
     ):
         """
         Initialize the unified skill matcher.
@@ -127,6 +210,8 @@ class UnifiedSkillMatcher:
             vector_threshold: Threshold for vector matching pass/fail
             overall_threshold: Threshold for overall pass/fail
             vector_model: Name of sentence-transformers model
+            cascade: Skip vector matching when keyword and TF-IDF scores
+                     already rule a resume out (see match_compiled)
         """
         # Normalize weights
         total_weight = keyword_weight + tfidf_weight + vector_weight
@@ -137,6 +222,7 @@ class UnifiedSkillMatcher:
         self.tfidf_threshold = tfidf_threshold
         self.vector_threshold = vector_threshold
         self.overall_threshold = overall_threshold
+        self.cascade = cascade
 
         # Initialize matchers
         self.keyword_matcher = EnhancedSkillMatcher()
@@ -167,6 +253,8 @@ class UnifiedSkillMatcher:
         required_skills: List[str],
         context: Optional[str] = None,
         weights: Optional[Dict[str, float]] = None,
+        vector_embeddings: Optional[Tuple[Any, Any]] = None,
+        tfidf_profile: Optional[VacancyProfile] = None,
     ) -> UnifiedMatchResult:
         """
         Perform unified matching using all three methods.
@@ -179,10 +267,143 @@ class UnifiedSkillMatcher:
             required_skills: List of required skills from job posting
             context: Optional context hint for keyword matching
             weights: Optional custom weights dict with 'keyword_weight', 'tfidf_weight', 'vector_weight'
+            vector_embeddings: Precomputed (resume, job) embeddings for vector matching
+            tfidf_profile: Compiled TF-IDF profile of the job posting
+
+        Returns:
+            UnifiedMatchResult with comprehensive match information
+        """
+        compiled = self.compile_vacancy(
+            job_title,
+            job_description,
+            required_skills,
+            tfidf_profile=tfidf_profile,
+            encode_job=False,
+        )
+        return self._match_compiled(resume_text, resume_skills, compiled, context, weights, vector_embeddings)
+
+    def compile_vacancy(
+        self,
+        job_title: str,
+        job_description: str,
+        required_skills: Sequence[str],
+        tfidf_profile: Optional[VacancyProfile] = None,
+        encode_job: bool = True,
+    ) -> CompiledVacancy:
+        """
+        Prepare the vacancy side of matching once for many resumes.
+
+        Expands the required skills to their synonyms, fits the TF-IDF
+        keyword profile and encodes the job text, so match_compiled() only
+        does resume-side work.
+
+        Args:
+            job_title: Job posting title
+            job_description: Job posting description
+            required_skills: List of required skills from job posting
+            tfidf_profile: Already compiled TF-IDF profile of the job posting
+            encode_job: Whether to encode the job text for vector matching
+
+        Returns:
+            CompiledVacancy to pass to match_compiled()
+
+        Example:
+            >>> matcher = get_unified_matcher()
+            >>> compiled = matcher.compile_vacancy("Backend Developer", "Python APIs", ["Python"])
+            >>> result = matcher.match_compiled("Python developer", ["Python"], compiled)
+        """
+        required_skills = tuple(required_skills)
+
+        if tfidf_profile is None:
+            tfidf_profile = self.tfidf_matcher.compile_profile(
+                job_title, job_description, list(required_skills)
+            )
+
+        job_embedding = None
+        if encode_job and self.vector_matcher:
+            job_text = self.vector_matcher.compose_job_text(
+                job_title, job_description, list(required_skills)
+            )
+            job_embedding = self.vector_matcher._encode_text(job_text)
+            if job_embedding is not None:
+                # Shared by every match of the vacancy; keep it read-only
+                job_embedding = np.array(job_embedding)
+                job_embedding.setflags(write=False)
+
+        return CompiledVacancy(
+            job_title=job_title,
+            job_description=job_description,
+            required_skills=required_skills,
+            skills=self.keyword_matcher.compile_required_skills(required_skills),
+            tfidf_profile=tfidf_profile,
+            job_embedding=job_embedding,
+        )
+
+    def match_compiled(
+        self,
+        resume_text: str,
+        resume_skills: List[str],
+        compiled: CompiledVacancy,
+        context: Optional[str] = None,
+        weights: Optional[Dict[str, float]] = None,
+        resume_embedding: Optional[np.ndarray] = None,
+        cascade: Optional[bool] = None,
+        min_score: Optional[float] = None,
+    ) -> UnifiedMatchResult:
+        """
+        Match a resume against a compiled vacancy.
+
+        Gives the same result as match() with the vacancy's fields, without
+        repeating any vacancy-side work.
+
+        In cascade mode keyword and TF-IDF matching run first. If the best
+        overall score still reachable (vector score 1.0) is below
+        overall_threshold or min_score, vector matching is skipped and the
+        result is marked as bounded.
+
+        Args:
+            resume_text: Full resume text
+            resume_skills: List of skills extracted from resume
+            compiled: Vacancy from compile_vacancy()
+            context: Optional context hint for keyword matching
+            weights: Optional custom weights dict with 'keyword_weight', 'tfidf_weight', 'vector_weight'
+            resume_embedding: Precomputed resume embedding (encoded here if not given)
+            cascade: Whether to skip vector matching for ruled-out resumes
+                     (defaults to the matcher's cascade setting)
+            min_score: Overall score a resume must be able to reach to be
+                       fully scored in cascade mode, e.g. a top-K cutoff
 
         Returns:
             UnifiedMatchResult with comprehensive match information
         """
+        partial = self._match_cheap_stages(resume_text, resume_skills, compiled, context, weights)
+
+        if self._use_cascade(cascade) and self._cannot_reach(partial, min_score):
+            return self._bounded_result(partial)
+
+        vector_embeddings = None
+        if self.vector_matcher and compiled.job_embedding is not None:
+            if resume_embedding is None:
+                resume_embedding = self.vector_matcher._encode_text(resume_text)
+            vector_embeddings = (resume_embedding, compiled.job_embedding)
+
+        return self._complete_match(partial, resume_text, compiled, vector_embeddings)
+
+    def _match_compiled(
+        self,
+        resume_text: str,
+        resume_skills: List[str],
+        compiled: CompiledVacancy,
+        context: Optional[str],
+        weights: Optional[Dict[str, float]],
+        vector_embeddings: Optional[Tuple[Any, Any]],
+    ) -> UnifiedMatchResult:
+        """Score a resume against a compiled vacancy with all three methods."""
+        partial = self._match_cheap_stages(resume_text, resume_skills, compiled, context, weights)
+        return self._complete_match(partial, resume_text, compiled, vector_embeddings)
+
+    def _resolve_weights(self, weights: Optional[Dict[str, float]]) -> Tuple[float, float, float]:
+        """Get normalized (keyword, tfidf, vector) weights for a match."""
         # Use custom weights if provided, otherwise use instance weights
         if weights:
             total = weights.get('keyword_weight', 0) + weights.get('tfidf_weight', 0) + weights.get('vector_weight', 0)
@@ -193,12 +414,25 @@ class UnifiedSkillMatcher:
             kw = self.keyword_weight
             tw = self.tfidf_weight
             vw = self.vector_weight
+        return kw, tw, vw
+
+    def _match_cheap_stages(
+        self,
+        resume_text: str,
+        resume_skills: List[str],
+        compiled: CompiledVacancy,
+        context: Optional[str],
+        weights: Optional[Dict[str, float]],
+    ) -> _PartialMatch:
+        """Run keyword and TF-IDF matching, the stages that need no encoder."""
+        required_skills = list(compiled.required_skills)
 
         # 1. Enhanced keyword matching
         keyword_results = self.keyword_matcher.match_multiple(
             resume_skills=resume_skills,
             required_skills=required_skills,
             context=context,
+            compiled_skills=compiled.skills,
         )
 
         matched_skills = [
@@ -217,30 +451,94 @@ class UnifiedSkillMatcher:
         # 2. TF-IDF matching
         tfidf_result = self.tfidf_matcher.match(
             resume_text=resume_text,
-            job_title=job_title,
-            job_description=job_description,
+            job_title=compiled.job_title,
+            job_description=compiled.job_description,
             required_skills=required_skills,
+            profile=compiled.tfidf_profile,
+        )
+
+        return _PartialMatch(
+            weights=self._resolve_weights(weights),
+            keyword_results=keyword_results,
+            matched_skills=matched_skills,
+            missing_skills=missing_skills,
+            keyword_score=keyword_score,
+            keyword_passed=keyword_passed,
+            tfidf_result=tfidf_result,
         )
 
+    def _complete_match(
+        self,
+        partial: _PartialMatch,
+        resume_text: str,
+        compiled: CompiledVacancy,
+        vector_embeddings: Optional[Tuple[Any, Any]],
+        vector_similarity: Optional[float] = None,
+    ) -> UnifiedMatchResult:
+        """Run vector matching and combine it with the cheap stages."""
         # 3. Vector matching
         vector_score = 0.0
         vector_passed = False
-        vector_similarity = 0.0
+        similarity_out = 0.0
 
         if self.vector_matcher:
             vector_result = self.vector_matcher.match(
                 resume_text=resume_text,
-                job_title=job_title,
-                job_description=job_description,
-                required_skills=required_skills,
+                job_title=compiled.job_title,
+                job_description=compiled.job_description,
+                required_skills=list(compiled.required_skills),
+                embeddings=vector_embeddings,
+                similarity=vector_similarity,
             )
             vector_score = vector_result.score
             vector_passed = vector_result.passed
-            vector_similarity = vector_result.similarity
+            similarity_out = vector_result.similarity
+
+        return self._combine(partial, vector_score, vector_passed, similarity_out)
+
+    def _vector_similarities(self, texts: Sequence[str], compiled: CompiledVacancy) -> List[Optional[float]]:
+        """Cosine similarities of resume texts to the compiled vacancy's embedding."""
+        if not texts:
+            return []
+        return self.vector_matcher.cosine_similarities(texts, compiled.job_embedding)
+
+    def _complete_scored_match(
+        self,
+        partial: _PartialMatch,
+        resume_text: str,
+        compiled: CompiledVacancy,
+        similarities: List[Optional[float]],
+        index: int,
+        encode: bool,
+    ) -> UnifiedMatchResult:
+        """Complete a match with a similarity from _vector_similarities()."""
+        if not encode:
+            return self._complete_match(partial, resume_text, compiled, None)
+        # A resume that could not be encoded goes through the embedding path,
+        # which reports the failure
+        return self._complete_match(
+            partial, resume_text, compiled, (None, compiled.job_embedding), similarities[index]
+        )
+
+    def _bounded_result(self, partial: _PartialMatch) -> UnifiedMatchResult:
+        """Result of a resume whose vector matching was skipped."""
+        return self._combine(partial, 0.0, False, 0.0, bounded=True)
+
+    def _combine(
+        self,
+        partial: _PartialMatch,
+        vector_score: float,
+        vector_passed: bool,
+        vector_similarity: float,
+        bounded: bool = False,
+    ) -> UnifiedMatchResult:
+        """Combine the per-method scores into a UnifiedMatchResult."""
+        kw, tw, vw = partial.weights
+        tfidf_result = partial.tfidf_result
 
         # Calculate overall score (weighted combination)
         overall_score = (
-            kw * keyword_score +
+            kw * partial.keyword_score +
             tw * tfidf_result.score +
             vw * vector_score
         )
@@ -249,15 +547,15 @@ class UnifiedSkillMatcher:
 
         # Generate recommendation
         recommendation = self._generate_recommendation(
-            overall_score, keyword_passed, tfidf_result.passed, vector_passed
+            overall_score, partial.keyword_passed, tfidf_result.passed, vector_passed
         )
 
         return UnifiedMatchResult(
             overall_score=round(overall_score, 3),
             passed=overall_passed,
-            keyword_score=round(keyword_score, 3),
-            keyword_passed=keyword_passed,
-            keyword_matches=keyword_results,
+            keyword_score=round(partial.keyword_score, 3),
+            keyword_passed=partial.keyword_passed,
+            keyword_matches=partial.keyword_results,
             tfidf_score=round(tfidf_result.score, 3),
             tfidf_passed=tfidf_result.passed,
             tfidf_matched=tfidf_result.matched_keywords,
@@ -265,11 +563,36 @@ class UnifiedSkillMatcher:
             vector_score=round(vector_score, 3),
             vector_passed=vector_passed,
             vector_similarity=round(vector_similarity, 3),
-            matched_skills=matched_skills,
-            missing_skills=missing_skills,
+            matched_skills=partial.matched_skills,
+            missing_skills=partial.missing_skills,
             recommendation=recommendation,
+            bounded=bounded,
         )
 
+    def _use_cascade(self, cascade: Optional[bool]) -> bool:
+        """Whether cascade mode applies; without vector matching there is nothing to skip."""
+        if cascade is None:
+            cascade = self.cascade
+        return bool(cascade) and self.vector_matcher is not None
+
+    def _cannot_reach(self, partial: _PartialMatch, min_score: Optional[float] = None) -> bool:
+        """
+        Whether a resume is ruled out before vector matching.
+
+        Args:
+            partial: Keyword and TF-IDF results of the resume
+            min_score: Overall score the resume must be able to reach, if any
+
+        Returns:
+            True if even a perfect vector score cannot bring the overall
+            score to overall_threshold or min_score
+        """
+        upper_bound = partial.upper_bound
+        if upper_bound < self.overall_threshold:
+            return True
+        # Compared as reported (rounded), so ties with the cutoff are still scored
+        return min_score is not None and round(upper_bound, 3) < round(min_score, 3)
+
     def update_weights(
         self,
         keyword_weight: Optional[float] = None,
@@ -388,40 +711,241 @@ class UnifiedSkillMatcher:
         job_title: str,
         job_description: str,
         required_skills: List[str],
+        top_k: Optional[int] = None,
+        cascade: Optional[bool] = None,
     ) -> List[Dict[str, Any]]:
         """
         Rank multiple candidates for a job posting.
 
+        In cascade mode keyword and TF-IDF matching run for every candidate
+        first. Candidates are then vector-matched in order of their best
+        reachable score, and skipped (bounded) once they cannot reach
+        overall_threshold or the score of the current top_k-th candidate.
+        The top_k candidates that pass are the same as without cascade.
+
         Args:
             candidates: List of candidate dicts with 'resume_text', 'resume_skills', 'id', 'name'
             job_title: Job posting title
             job_description: Job posting description
             required_skills: List of required skills
+            top_k: Number of best candidates that must be scored exactly
+                   in cascade mode (all passing candidates if None)
+            cascade: Whether to skip vector matching for ruled-out
+                     candidates (defaults to the matcher's cascade setting)
 
         Returns:
             List of candidates with added 'match_result' field, sorted by overall_score
         """
-        results = []
-
-        for candidate in candidates:
-            match_result = self.match(
-                resume_text=candidate.get("resume_text", ""),
-                resume_skills=candidate.get("resume_skills", []),
-                job_title=job_title,
-                job_description=job_description,
-                required_skills=required_skills,
-            )
+        # The job side is the same for every candidate
+        compiled = self.compile_vacancy(job_title, job_description, required_skills)
+        match_results = self.score_candidates(candidates, compiled, top_k=top_k, cascade=cascade)
 
-            results.append({
+        results = [
+            {
                 **candidate,
                 "match_result": match_result.to_dict(),
                 "overall_score": match_result.overall_score,
-            })
+            }
+            for candidate, match_result in zip(candidates, match_results)
+        ]
 
         # Sort by overall score descending
         results.sort(key=lambda x: x["overall_score"], reverse=True)
         return results
 
+    def score_candidates(
+        self,
+        candidates: Sequence[Dict[str, Any]],
+        compiled: CompiledVacancy,
+        top_k: Optional[int] = None,
+        cascade: Optional[bool] = None,
+    ) -> List[UnifiedMatchResult]:
+        """
+        Score candidates against a compiled vacancy, in candidate order.
+
+        The scoring half of rank_candidates(): resume texts are encoded in
+        batches and, in cascade mode, ruled-out candidates are bounded.
+        Parallel ranking runs it on each shard of the candidate pool.
+
+        Args:
+            candidates: Candidate dicts with 'resume_text' and 'resume_skills'
+            compiled: Vacancy from compile_vacancy()
+            top_k: Number of best candidates that must be scored exactly
+                   in cascade mode (all passing candidates if None)
+            cascade: Whether to skip vector matching for ruled-out
+                     candidates (defaults to the matcher's cascade setting)
+
+        Returns:
+            UnifiedMatchResult per candidate, aligned with candidates
+        """
+        texts = [candidate.get("resume_text", "") for candidate in candidates]
+        partials = [
+            self._match_cheap_stages(text, candidate.get("resume_skills", []), compiled, None, None)
+            for text, candidate in zip(texts, candidates)
+        ]
+        encode = bool(self.vector_matcher) and compiled.job_embedding is not None
+
+        match_results: List[Optional[UnifiedMatchResult]] = [None] * len(candidates)
+        if not self._use_cascade(cascade):
+            # Resumes are scored together: stored ones on their stored codes,
+            # the rest encoded with as few forward passes as possible
+            similarities = self._vector_similarities(texts, compiled) if encode else []
+            for i, partial in enumerate(partials):
+                match_results[i] = self._complete_scored_match(partial, texts[i], compiled, similarities, i, encode)
+        else:
+            # Most promising candidates first, so the top-K cutoff rises quickly
+            order = sorted(range(len(candidates)), key=lambda i: -partials[i].upper_bound)
+            top = TopK(top_k) if top_k else None
+            batch_size = getattr(self.vector_matcher, "batch_size", None) or 32
+
+            for start in range(0, len(order), batch_size):
+                cutoff = top.cutoff if top is not None else None
+                batch = [i for i in order[start:start + batch_size] if not self._cannot_reach(partials[i], cutoff)]
+                if not batch:
+                    # Bounds only decrease from here on
+                    break
+
+                similarities = self._vector_similarities([texts[i] for i in batch], compiled) if encode else []
+                for j, i in enumerate(batch):
+                    match_results[i] = self._complete_scored_match(partials[i], texts[i], compiled, similarities, j, encode)
+                    if top is not None and match_results[i].passed:
+                        top.push(match_results[i].overall_score, i)
+
+            skipped = sum(result is None for result in match_results)
+            for i, result in enumerate(match_results):
+                if result is None:
+                    match_results[i] = self._bounded_result(partials[i])
+            logger.debug(f"Cascade ranking skipped vector matching for {skipped}/{len(candidates)} candidates")
+
+        return match_results  # type: ignore[return-value]
+
+    def stream_top_candidates(
+        self,
+        candidates: Iterable[Dict[str, Any]],
+        job_title: str,
+        job_description: str,
+        required_skills: List[str],
+        k: int = 50,
+        snapshot_every: Optional[int] = None,
+        cascade: Optional[bool] = None,
+    ) -> Iterator[RankingSnapshot]:
+        """
+        Rank a stream of candidates, keeping only the best k.
+
+        Candidates are consumed in encoder-sized batches and scored against
+        the compiled vacancy. Only the k best (score, candidate) pairs are
+        kept, so memory does not grow with the pool; match details are
+        serialized only for those. Order is the same as rank_candidates().
+
+        In cascade mode candidates that cannot beat the current k-th score
+        or pass overall_threshold skip vector matching, and only passing
+        candidates are ranked.
+
+        Args:
+            candidates: Iterable of candidate dicts with 'resume_text', 'resume_skills', 'id'
+            job_title: Job posting title
+            job_description: Job posting description
+            required_skills: List of required skills
+            k: Number of best candidates to return
+            snapshot_every: Yield an intermediate snapshot each time this
+                            many more candidates have been processed
+            cascade: Whether to skip vector matching for ruled-out
+                     candidates (defaults to the matcher's cascade setting)
+
+        Yields:
+            Intermediate RankingSnapshot objects, then a final one
+
+        Example:
+            >>> for snapshot in matcher.stream_top_candidates(pool, title, text, skills, k=50, snapshot_every=1000):
+            ...     print(snapshot.processed, snapshot.candidates[:1])
+        """
+        compiled = self.compile_vacancy(job_title, job_description, required_skills)
+        use_cascade = self._use_cascade(cascade)
+        encode = bool(self.vector_matcher) and compiled.job_embedding is not None
+        batch_size = getattr(self.vector_matcher, "batch_size", None) or 32
+
+        top: TopK[Tuple[Dict[str, Any], UnifiedMatchResult]] = TopK(k)
+        processed = 0
+        next_snapshot = snapshot_every
+
+        iterator = iter(candidates)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                break
+
+            texts = [candidate.get("resume_text", "") for candidate in batch]
+            partials = [
+                self._match_cheap_stages(text, candidate.get("resume_skills", []), compiled, None, None)
+                for text, candidate in zip(texts, batch)
+            ]
+            pending = list(range(len(batch)))
+            if use_cascade:
+                cutoff = top.cutoff
+                pending = [i for i in pending if not self._cannot_reach(partials[i], cutoff)]
+
+            similarities = self._vector_similarities([texts[i] for i in pending], compiled) if encode and pending else []
+            for j, i in enumerate(pending):
+                match_result = self._complete_scored_match(partials[i], texts[i], compiled, similarities, j, encode)
+                if use_cascade and not match_result.passed:
+                    continue
+                top.push(match_result.overall_score, (batch[i], match_result))
+
+            processed += len(batch)
+            if next_snapshot and processed >= next_snapshot:
+                while next_snapshot <= processed:
+                    next_snapshot += snapshot_every
+                yield RankingSnapshot(
+                    processed=processed,
+                    candidates=[
+                        {"id": candidate.get("id"), "overall_score": score}
+                        for score, (candidate, _) in top.items()
+                    ],
+                )
+
+        yield RankingSnapshot(
+            processed=processed,
+            candidates=[
+                {
+                    **candidate,
+                    "match_result": match_result.to_dict(),
+                    "overall_score": match_result.overall_score,
+                }
+                for _, (candidate, match_result) in top.items()
+            ],
+            final=True,
+        )
+
+    def rank_top_candidates(
+        self,
+        candidates: Iterable[Dict[str, Any]],
+        job_title: str,
+        job_description: str,
+        required_skills: List[str],
+        k: int = 50,
+        cascade: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the k best candidates of a stream with flat memory use.
+
+        Args:
+            candidates: Iterable of candidate dicts with 'resume_text', 'resume_skills', 'id'
+            job_title: Job posting title
+            job_description: Job posting description
+            required_skills: List of required skills
+            k: Number of best candidates to return
+            cascade: Whether to skip vector matching for ruled-out candidates
+
+        Returns:
+            Up to k candidates with added 'match_result' field, sorted by overall_score
+        """
+        snapshot = None
+        for snapshot in self.stream_top_candidates(
+            candidates, job_title, job_description, required_skills, k=k, cascade=cascade
+        ):
+            pass
+        return snapshot.candidates if snapshot else []
+
 
 # Singleton instance
 _default_matcher: Optional[UnifiedSkillMatcher] = None
@@ -458,5 +982,7 @@ def get_unified_matcher(
 
     # Return default singleton
     if _default_matcher is None:
-        _default_matcher = UnifiedSkillMatcher()
+        from config import get_settings
+
+        _default_matcher = UnifiedSkillMatcher(cascade=get_settings().matching_cascade_enabled)
     return _default_matcher
@@ -9,10 +9,12 @@ Key features:
 - Context-aware matching (e.g., "JS developer" ≈ "JavaScript programmer")
 - Cosine similarity scoring
 - Cached model loading for performance
+- Persistent embedding store so unchanged texts are never re-encoded
+- Long documents split into token windows whose embeddings are pooled
 """
 import logging
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 # Try to import sentence-transformers
 try:
@@ -24,8 +26,70 @@ except ImportError:
 
 import numpy as np
 
+from .embedding_store import EmbeddingStore, get_embedding_store
+from .quantization import cosine_scores
+from .inference_backend import load_sentence_transformer, resolve_backend
+from .model_registry import get_model_registry
+
 logger = logging.getLogger(__name__)
 
+# Rough character cap per text (model max is usually 256-512 tokens, 1 token ≈ 4 chars)
+MAX_TEXT_CHARS = 8000
+
+# Supported ways of combining chunk embeddings into one document embedding
+POOLING_METHODS = ("none", "mean", "max", "attention")
+
+# Softmax temperature for attention pooling over cosine scores
+ATTENTION_TEMPERATURE = 0.1
+
+# Fallback input length when the model does not report max_seq_length
+DEFAULT_MAX_SEQ_LENGTH = 256
+
+
+def pool_embeddings(
+    vectors: np.ndarray,
+    method: str = "mean",
+    weights: Optional[Sequence[float]] = None,
+) -> np.ndarray:
+    """
+    Combine chunk embeddings into a single document embedding.
+
+    Args:
+        vectors: 2-D array with one embedding per chunk
+        method: "mean" (weighted average), "max" (element-wise maximum) or
+                "attention" (average weighted by each chunk's agreement with
+                the document centroid, so off-topic chunks count less)
+        weights: Optional per-chunk weights such as token counts
+
+    Returns:
+        1-D pooled embedding
+
+    Example:
+        >>> pool_embeddings(np.array([[1.0, 0.0], [0.0, 1.0]]), "max")
+        array([1., 1.])
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if len(vectors) == 1:
+        return vectors[0]
+
+    weights = np.ones(len(vectors)) if weights is None else np.asarray(weights, dtype=np.float64)
+
+    if method == "max":
+        return vectors.max(axis=0)
+
+    if method == "attention":
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        unit = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+        centroid = unit.mean(axis=0)
+        centroid /= np.linalg.norm(centroid) or 1.0
+        logits = (unit @ centroid) / ATTENTION_TEMPERATURE + np.log(np.maximum(weights, 1e-12))
+        weights = np.exp(logits - logits.max())
+
+    if method not in ("mean", "attention"):
+        raise ValueError(f"Unknown pooling method: {method}")
+
+    return (weights / weights.sum()) @ vectors
+
 
 @dataclass
 class VectorMatchResult:
@@ -57,15 +121,18 @@ class VectorSimilarityMatcher:
         0.85
     """
 
-    # Class-level model cache
-    _model: Optional['SentenceTransformer'] = None
-    _model_name: Optional[str] = None
-
     def __init__(
         self,
         threshold: float = 0.5,
         model_name: str = "all-MiniLM-L6-v2",
         device: Optional[str] = None,
+        embedding_store: Optional[EmbeddingStore] = None,
+        use_embedding_store: bool = True,
+        batch_size: int = 32,
+        pooling: Optional[str] = None,
+        max_chunks: Optional[int] = None,
+        chunk_overlap: Optional[int] = None,
+        backend: Optional[str] = None,
     ):
         """
         Initialize the vector similarity matcher.
@@ -79,21 +146,48 @@ class VectorSimilarityMatcher:
                        - "all-mpnet-base-v2": Slower, better quality, 768dim
                        - "paraphrase-multilingual-MiniLM-L12-v2": Multilingual
             device: Device to run model on ("cpu", "cuda", or None for auto)
+            embedding_store: Store consulted before encoding (defaults to the shared store)
+            use_embedding_store: Whether to read and write persisted embeddings
+            batch_size: Number of texts per forward pass in bulk encoding
+            pooling: How long documents are embedded: "none" truncates to
+                     the model input, "mean", "max" or "attention" encode
+                     every token window and pool them (defaults to settings)
+            max_chunks: Maximum windows per document (defaults to settings)
+            chunk_overlap: Tokens shared by consecutive windows (defaults to settings)
+            backend: Inference backend: "torch", "onnx" or "onnx-int8"
+                     (defaults to settings.inference_backend)
         """
+        from config import get_settings
+
+        settings = get_settings()
+
         self.threshold = threshold
         self.model_name = model_name
         self.device = device
+        self.batch_size = max(1, batch_size)
+        self.pooling = (pooling or settings.vector_pooling).lower()
+        self.max_chunks = max(1, max_chunks or settings.vector_max_chunks)
+        self.chunk_overlap = max(0, settings.vector_chunk_overlap if chunk_overlap is None else chunk_overlap)
+        self.backend = resolve_backend(backend)
+
+        if self.pooling not in POOLING_METHODS:
+            raise ValueError(f"Unknown pooling method: {self.pooling}")
+
+        if use_embedding_store and embedding_store is None:
+            embedding_store = get_embedding_store()
+        self.embedding_store = embedding_store if use_embedding_store else None
 
         if not _HAS_SENTENCE_TRANSFORMERS:
             logger.warning("sentence-transformers not installed, vector matching disabled")
 
     @classmethod
-    def _get_model(cls, model_name: str) -> Optional['SentenceTransformer']:
+    def _get_model(cls, model_name: str, backend: str = "torch") -> Optional['SentenceTransformer']:
         """
-        Get or load the sentence transformer model (cached).
+        Get or load the sentence transformer model (cached in the model registry).
 
         Args:
             model_name: Name of the model to load
+            backend: Inference backend ("torch", "onnx" or "onnx-int8")
 
         Returns:
             SentenceTransformer instance or None if not available
@@ -101,52 +195,288 @@ class VectorSimilarityMatcher:
         if not _HAS_SENTENCE_TRANSFORMERS:
             return None
 
-        # Return cached model if same
-        if cls._model is not None and cls._model_name == model_name:
-            return cls._model
-
-        try:
-            logger.info(f"Loading sentence-transformers model: {model_name}")
-            cls._model = SentenceTransformer(model_name)
-            cls._model_name = model_name
-            logger.info(f"Model loaded successfully")
-            return cls._model
-        except Exception as e:
-            logger.error(f"Failed to load sentence-transformers model: {e}")
-            return None
+        def load() -> Optional['SentenceTransformer']:
+            logger.info(f"Loading sentence-transformers model: {model_name} ({backend})")
+            model, loaded_backend = load_sentence_transformer(model_name, backend)
+            if model is not None:
+                logger.info(f"Model loaded successfully on {loaded_backend}")
+            return model
+
+        return get_model_registry().get("sentence-embedding", model_name, backend, load)
+
+    @property
+    def encoder_key(self) -> str:
+        """
+        Name under which single-pass (window) embeddings are stored.
+
+        The float32 ONNX graph reproduces PyTorch outputs and shares their
+        namespace; int8-quantized models get their own.
+        """
+        if self.backend == "onnx-int8":
+            return f"{self.model_name}:{self.backend}"
+        return self.model_name
+
+    @property
+    def embedding_key(self) -> str:
+        """
+        Name under which document embeddings are stored.
+
+        Pooled document embeddings differ from single-pass embeddings of the
+        same text, so they get their own namespace in the embedding store.
+        """
+        if self.pooling == "none":
+            return self.encoder_key
+        return f"{self.encoder_key}:{self.pooling}-pool"
+
+    def _chunk_text(self, text: str, model) -> List[Tuple[str, int]]:
+        """
+        Split text into windows that fit the model's input length.
+
+        Windows are cut on token boundaries using the model's tokenizer when
+        it provides offsets, otherwise on whitespace with roughly 0.75 words
+        per token. At most ``self.max_chunks`` windows are returned.
+
+        Args:
+            text: Text to split
+            model: Loaded sentence-transformers model
+
+        Returns:
+            List of (window_text, token_count)
+        """
+        max_tokens = max(8, (getattr(model, "max_seq_length", None) or DEFAULT_MAX_SEQ_LENGTH) - 2)
+        overlap = min(self.chunk_overlap, max_tokens // 2)
+
+        spans: Optional[List[Tuple[int, int]]] = None
+        tokenizer = getattr(model, "tokenizer", None)
+        if tokenizer is not None:
+            try:
+                encoded = tokenizer(
+                    text,
+                    add_special_tokens=False,
+                    return_offsets_mapping=True,
+                    truncation=False,
+                    verbose=False,
+                )
+                spans = [tuple(span) for span in encoded["offset_mapping"]]
+            except Exception as e:
+                logger.debug(f"Tokenizer offsets unavailable, chunking on words: {e}")
+
+        if spans is None:
+            max_tokens = max(1, int(max_tokens * 0.75))
+            overlap = min(overlap, max_tokens // 2)
+            words = text.split()
+            units = [(w, 1) for w in words]
+        else:
+            units = spans
+
+        n_units = len(units)
+        if n_units <= max_tokens:
+            return [(text, max(n_units, 1))]
+
+        stride = max_tokens - overlap
+        starts = list(range(0, n_units - max_tokens + 1, stride))
+        if starts[-1] + max_tokens < n_units:
+            starts.append(n_units - max_tokens)
+        if len(starts) > self.max_chunks:
+            logger.debug(f"Document has {len(starts)} windows, encoding the first {self.max_chunks}")
+            starts = starts[:self.max_chunks]
+
+        chunks: List[Tuple[str, int]] = []
+        for window_start in starts:
+            window_end = min(window_start + max_tokens, n_units)
+            if spans is None:
+                chunk = " ".join(words[window_start:window_end])
+            else:
+                chunk = text[spans[window_start][0]:spans[window_end - 1][1]]
+            chunks.append((chunk, window_end - window_start))
+        return chunks
+
+    def _encode_groups(
+        self,
+        groups: Sequence[Sequence[str]],
+        batch_size: Optional[int] = None,
+    ) -> List[List[Optional[np.ndarray]]]:
+        """
+        Encode groups of texts through the store and the model.
+
+        Stored embeddings are fetched in one lookup. Groups with missing
+        texts are sorted by length and packed into mini-batches without
+        splitting a group, so each batch is padded only to the length of its
+        longest member and a group (the chunks of one document) never costs
+        more than one forward pass. New embeddings are persisted in one write.
+
+        Args:
+            groups: Lists of texts; each list is kept within one batch
+            batch_size: Texts per forward pass (defaults to self.batch_size)
+
+        Returns:
+            Embeddings aligned with groups, None where encoding failed
+        """
+        flat = [text for group in groups for text in group]
+        if self.embedding_store is not None:
+            flat_embeddings = self.embedding_store.get_many(self.encoder_key, flat)
+        else:
+            flat_embeddings = [None] * len(flat)
+
+        results: List[List[Optional[np.ndarray]]] = []
+        pending: List[List[Tuple[int, int]]] = []
+        offset = 0
+        for g, group in enumerate(groups):
+            results.append(flat_embeddings[offset:offset + len(group)])
+            missing = [(g, j) for j, emb in enumerate(results[g]) if emb is None]
+            if missing:
+                pending.append(missing)
+            offset += len(group)
+
+        if not pending:
+            return results
+
+        model = self._get_model(self.model_name, self.backend)
+        if model is None:
+            return results
+
+        batch_size = max(1, batch_size or self.batch_size)
+        pending.sort(key=lambda items: max(len(groups[g][j][:MAX_TEXT_CHARS]) for g, j in items))
+
+        batches: List[List[Tuple[int, int]]] = []
+        for items in pending:
+            if batches and len(batches[-1]) + len(items) <= batch_size:
+                batches[-1].extend(items)
+            else:
+                batches.append(list(items))
+
+        encoded_texts: List[str] = []
+        encoded_vectors: List[np.ndarray] = []
+
+        for batch in batches:
+            try:
+                vectors = model.encode(
+                    [groups[g][j][:MAX_TEXT_CHARS] for g, j in batch],
+                    batch_size=len(batch),
+                    convert_to_numpy=True,
+                    show_progress_bar=False,
+                )
+            except Exception as e:
+                logger.error(f"Failed to encode batch of {len(batch)} texts: {e}")
+                continue
+
+            for (g, j), vector in zip(batch, vectors):
+                results[g][j] = vector
+                encoded_texts.append(groups[g][j])
+                encoded_vectors.append(vector)
+
+        if self.embedding_store is not None and encoded_vectors:
+            self.embedding_store.put_many(
+                self.encoder_key, encoded_texts, np.vstack(encoded_vectors)
+            )
+
+        return results
 
     def _encode_text(self, text: str) -> Optional[np.ndarray]:
         """
         Encode text to vector embedding.
 
+        The embedding store is consulted first; only texts that have never
+        been encoded with this model reach the transformer.
+
         Args:
             text: Text to encode
 
         Returns:
             Numpy array of embeddings or None if encoding failed
         """
-        if not _HAS_SENTENCE_TRANSFORMERS:
-            return None
+        return self._encode_texts([text])[0]
+
+    def _encode_texts(
+        self,
+        texts: Sequence[str],
+        batch_size: Optional[int] = None,
+    ) -> List[Optional[np.ndarray]]:
+        """
+        Encode many texts with as few forward passes as possible.
+
+        With pooling disabled each text is truncated and encoded once. With
+        pooling enabled each text is split into token windows; all windows
+        missing from the store are encoded together (at most one forward
+        pass per document), stored individually for section-level reuse,
+        and pooled into a document embedding that is stored as well.
 
-        model = self._get_model(self.model_name)
+        Args:
+            texts: Texts to encode
+            batch_size: Texts per forward pass (defaults to self.batch_size)
+
+        Returns:
+            List aligned with texts, holding an embedding or None per text
+        """
+        if not _HAS_SENTENCE_TRANSFORMERS or not texts:
+            return [None] * len(texts)
+
+        if self.pooling == "none":
+            return [group[0] for group in self._encode_groups([[t] for t in texts], batch_size)]
+
+        if self.embedding_store is not None:
+            embeddings = self.embedding_store.get_many(self.embedding_key, texts)
+        else:
+            embeddings = [None] * len(texts)
+
+        pending = [i for i, emb in enumerate(embeddings) if emb is None]
+        if not pending:
+            return embeddings
+
+        model = self._get_model(self.model_name, self.backend)
         if model is None:
-            return None
+            return embeddings
+
+        chunked = {i: self._chunk_text(texts[i], model) for i in pending}
+        chunk_vectors = self._encode_groups(
+            [[chunk for chunk, _ in chunked[i]] for i in pending], batch_size
+        )
 
-        try:
-            # Truncate text if too long (model max is usually 256-512 tokens)
-            # Rough estimate: 1 token ≈ 4 characters
-            max_chars = 8000
-            truncated_text = text[:max_chars] if len(text) > max_chars else text
+        pooled_texts: List[str] = []
+        pooled_vectors: List[np.ndarray] = []
+        for i, vectors in zip(pending, chunk_vectors):
+            if any(v is None for v in vectors):
+                continue
+            embeddings[i] = pool_embeddings(
+                np.vstack(vectors), self.pooling, [n for _, n in chunked[i]]
+            )
+            pooled_texts.append(texts[i])
+            pooled_vectors.append(embeddings[i])
 
-            embedding = model.encode(
-                truncated_text,
-                convert_to_numpy=True,
-                show_progress_bar=False,
+        if self.embedding_store is not None and pooled_vectors:
+            self.embedding_store.put_many(
+                self.embedding_key, pooled_texts, np.vstack(pooled_vectors)
             )
-            return embedding
-        except Exception as e:
-            logger.error(f"Failed to encode text: {e}")
-            return None
+
+        return embeddings
+
+    def encode_chunks(self, text: str) -> List[Tuple[str, np.ndarray]]:
+        """
+        Get the window embeddings of a document.
+
+        Windows are cut exactly as for pooled encoding, so after a document
+        has been matched once its windows are served from the store. Useful
+        for section-level similarity, e.g. finding which part of a resume
+        best matches a vacancy.
+
+        Args:
+            text: Document text
+
+        Returns:
+            List of (window_text, embedding); empty if encoding failed
+        """
+        if not _HAS_SENTENCE_TRANSFORMERS:
+            return []
+
+        model = self._get_model(self.model_name, self.backend)
+        if model is None:
+            return []
+
+        chunks = [chunk for chunk, _ in self._chunk_text(text, model)]
+        vectors = self._encode_groups([chunks])[0]
+        if any(v is None for v in vectors):
+            return []
+        return list(zip(chunks, vectors))
 
     def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         """
@@ -168,6 +498,25 @@ class VectorSimilarityMatcher:
 
         return float(dot_product / (norm1 * norm2))
 
+    @staticmethod
+    def compose_job_text(
+        job_title: str,
+        job_description: str,
+        required_skills: List[str],
+    ) -> str:
+        """
+        Build the text that represents a job posting for embedding.
+
+        Args:
+            job_title: Job posting title
+            job_description: Job posting description
+            required_skills: List of required skills
+
+        Returns:
+            Combined job text
+        """
+        return f"{job_title} {job_description} {' '.join(required_skills)}"
+
     def _normalize_score(self, cosine_sim: float) -> float:
         """
         Normalize cosine similarity to 0-1 range.
@@ -187,6 +536,8 @@ class VectorSimilarityMatcher:
         job_description: str,
         required_skills: List[str],
         threshold: Optional[float] = None,
+        embeddings: Optional[Tuple[Optional[np.ndarray], Optional[np.ndarray]]] = None,
+        similarity: Optional[float] = None,
     ) -> VectorMatchResult:
         """
         Match resume against job posting using vector similarity.
@@ -197,6 +548,10 @@ class VectorSimilarityMatcher:
             job_description: Job posting description
             required_skills: List of required skills from job posting
             threshold: Override default threshold
+            embeddings: Precomputed (resume, job) embeddings, e.g. from the
+                        API's EmbeddingBatcher; encoded here if not given
+            similarity: Precomputed cosine similarity, e.g. from
+                        cosine_similarities(); takes precedence over embeddings
 
         Returns:
             VectorMatchResult with similarity score and pass status
@@ -212,12 +567,23 @@ class VectorSimilarityMatcher:
                 method="disabled",
             )
 
-        # Combine job text
-        job_text = f"{job_title} {job_description} {' '.join(required_skills)}"
+        if similarity is not None:
+            score = self._normalize_score(similarity)
+            return VectorMatchResult(
+                similarity=float(similarity),
+                score=score,
+                passed=bool(score >= threshold),
+                method="cosine",
+            )
+
+        if embeddings is not None:
+            resume_embedding, job_embedding = embeddings
+        else:
+            # Combine job text
+            job_text = self.compose_job_text(job_title, job_description, required_skills)
 
-        # Encode both texts
-        resume_embedding = self._encode_text(resume_text)
-        job_embedding = self._encode_text(job_text)
+            # Encode both texts in one pass
+            resume_embedding, job_embedding = self._encode_texts([resume_text, job_text])
 
         if resume_embedding is None or job_embedding is None:
             logger.warning("Failed to encode texts for vector matching")
@@ -275,42 +641,82 @@ class VectorSimilarityMatcher:
             required_skills=vacancy_skills,
         )
 
+    def cosine_similarities(
+        self,
+        resume_texts: Sequence[str],
+        job_embedding: Optional[np.ndarray],
+        batch_size: Optional[int] = None,
+    ) -> List[Optional[float]]:
+        """
+        Cosine similarities between resume texts and an encoded job posting.
+
+        Resumes already in the embedding store are scored directly on the
+        stored codes in float32 blocks, so float16 and int8 shards are never
+        dequantized. The rest are encoded through the batched path first and
+        scored in float32.
+
+        Args:
+            resume_texts: Resume texts
+            job_embedding: Embedding of the job posting text
+            batch_size: Texts per forward pass (defaults to self.batch_size)
+
+        Returns:
+            List aligned with resume_texts, holding a similarity (-1 to 1)
+            or None for texts that could not be encoded
+        """
+        similarities: List[Optional[float]] = [None] * len(resume_texts)
+        if not _HAS_SENTENCE_TRANSFORMERS or not resume_texts or job_embedding is None:
+            return similarities
+
+        job_vector = np.asarray(job_embedding, dtype=np.float32)
+        pending = list(range(len(resume_texts)))
+
+        if self.embedding_store is not None:
+            stored, found = self.embedding_store.cosine_many(self.embedding_key, resume_texts, job_vector)
+            for i in np.flatnonzero(found):
+                similarities[i] = float(stored[i])
+            pending = [i for i in pending if not found[i]]
+
+        if pending:
+            embeddings = self._encode_texts([resume_texts[i] for i in pending], batch_size)
+            encoded = [(i, emb) for i, emb in zip(pending, embeddings) if emb is not None]
+            if encoded:
+                matrix = np.vstack([emb for _, emb in encoded]).astype(np.float32, copy=False)
+                for (i, _), value in zip(encoded, cosine_scores(matrix, job_vector)):
+                    similarities[i] = float(value)
+
+        return similarities
+
     def batch_match(
         self,
         resume_texts: List[str],
         job_text: str,
+        batch_size: Optional[int] = None,
     ) -> List[float]:
         """
         Match multiple resumes against a single job posting.
 
-        Useful for ranking candidates for a position.
+        Useful for ranking candidates for a position. The job posting is
+        encoded once and the resumes are scored with cosine_similarities(),
+        on the stored codes where possible.
 
         Args:
             resume_texts: List of resume texts
             job_text: Combined job posting text
+            batch_size: Texts per forward pass (defaults to self.batch_size)
 
         Returns:
             List of similarity scores (0-1)
         """
-        if not _HAS_SENTENCE_TRANSFORMERS:
-            return [0.0] * len(resume_texts)
-
-        job_embedding = self._encode_text(job_text)
-        if job_embedding is None:
+        if not _HAS_SENTENCE_TRANSFORMERS or not resume_texts:
             return [0.0] * len(resume_texts)
 
-        scores = []
-        for resume_text in resume_texts:
-            resume_embedding = self._encode_text(resume_text)
-            if resume_embedding is None:
-                scores.append(0.0)
-                continue
-
-            cosine_sim = self._cosine_similarity(resume_embedding, job_embedding)
-            score = self._normalize_score(cosine_sim)
-            scores.append(score)
-
-        return scores
+        job_embedding = self._encode_texts([job_text], batch_size)[0]
+        similarities = self.cosine_similarities(resume_texts, job_embedding, batch_size)
+        return [
+            self._normalize_score(similarity) if similarity is not None else 0.0
+            for similarity in similarities
+        ]
 
 
 # Singleton instance for convenience
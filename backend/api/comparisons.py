@@ -118,6 +118,14 @@ def compare_multiple_resumes(
         if isinstance(required_skills, str):
             required_skills = [required_skills]
 
+        # The vacancy side of skill matching is the same for every resume
+        enhanced_matcher = EnhancedSkillMatcher()
+        synonyms_map = enhanced_matcher.load_synonyms()
+        logger.info(f"Initialized enhanced skill matcher with {len(synonyms_map)} synonym mappings")
+        compiled_required = enhanced_matcher.compile_required_skills(required_skills)
+        compiled_additional = enhanced_matcher.compile_required_skills(additional_skills)
+        skill_context = vacancy_title.lower()
+
         # Process each resume
         comparison_results = []
 
@@ -221,20 +229,24 @@ def compare_multiple_resumes(
 
                 logger.info(f"Extracted {len(resume_skills)} unique skills from resume")
 
-                # Step 5: Initialize enhanced skill matcher
-                enhanced_matcher = EnhancedSkillMatcher()
-                synonyms_map = enhanced_matcher.load_synonyms()
-                logger.info(f"Initialized enhanced skill matcher with {len(synonyms_map)} synonym mappings")
+                # Step 5: Match all skills against the compiled vacancy skills
+                required_results = enhanced_matcher.match_multiple(
+                    resume_skills=resume_skills,
+                    required_skills=required_skills,
+                    context=skill_context,
+                    compiled_skills=compiled_required,
+                )
+                additional_results = enhanced_matcher.match_multiple(
+                    resume_skills=resume_skills,
+                    required_skills=additional_skills,
+                    context=skill_context,
+                    compiled_skills=compiled_additional,
+                )
 
                 # Step 6: Match required skills
                 required_skills_matches = []
                 for skill in required_skills:
-                    match_result = enhanced_matcher.match_with_context(
-                        resume_skills=resume_skills,
-                        required_skill=skill,
-                        context=vacancy_title.lower(),
-                        use_fuzzy=True
-                    )
+                    match_result = required_results[skill]
 
                     if match_result["matched"]:
                         required_skills_matches.append({
@@ -258,12 +270,7 @@ def compare_multiple_resumes(
                 # Step 7: Match additional/preferred skills
                 additional_skills_matches = []
                 for skill in additional_skills:
-                    match_result = enhanced_matcher.match_with_context(
-                        resume_skills=resume_skills,
-                        required_skill=skill,
-                        context=vacancy_title.lower(),
-                        use_fuzzy=True
-                    )
+                    match_result = additional_results[skill]
 
                     if match_result["matched"]:
                         additional_skills_matches.append({
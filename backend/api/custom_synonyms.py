@@ -13,6 +13,7 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.exc import SQLAlchemyError
 
+from analyzers.taxonomy_snapshot import publish_taxonomy_snapshot
 from models.custom_synonyms import CustomSynonym
 
 logger = logging.getLogger(__name__)
@@ -157,6 +158,9 @@ async def create_custom_synonyms(request: CustomSynonymCreate) -> JSONResponse:
 
         logger.info(f"Created {len(created_synonyms)} custom synonyms for organization: {request.organization_id}")
 
+        # Workers pick up the change from the next taxonomy snapshot
+        await publish_taxonomy_snapshot()
+
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
             content=response_data,
@@ -302,6 +306,7 @@ async def update_custom_synonym(
 
         # For now, return placeholder response
         # Database integration will be added in a later subtask when we have async session setup
+        await publish_taxonomy_snapshot()
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={
@@ -351,6 +356,7 @@ async def delete_custom_synonym(synonym_id: str) -> JSONResponse:
 
         # For now, return placeholder response
         # Database integration will be added in a later subtask when we have async session setup
+        await publish_taxonomy_snapshot()
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"message": f"Custom synonym {synonym_id} deleted successfully"},
@@ -389,6 +395,7 @@ async def delete_custom_synonyms_by_organization(organization_id: str) -> JSONRe
 
         # For now, return placeholder response
         # Database integration will be added in a later subtask when we have async session setup
+        await publish_taxonomy_snapshot()
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"message": f"Deleted custom synonyms for organization: {organization_id}", "deleted_count": 0},
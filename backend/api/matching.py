@@ -22,8 +22,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "services" / "data_extractor"))
 
 from database import get_db
-from models.match_result import MatchResult
+from models.upserts import upsert_match_results
 
+from analyzers.skill_ids import normalize_skill_name as cached_normalize_skill_name
+from analyzers.synonym_index import get_synonym_index
 from analyzers import (
     extract_resume_keywords_hf as extract_resume_keywords,
     extract_resume_entities,
@@ -31,7 +33,11 @@ from analyzers import (
     format_experience_summary,
     EnhancedSkillMatcher,
     UnifiedSkillMatcher,
+    VectorSimilarityMatcher,
     get_unified_matcher,
+    get_embedding_batcher,
+    get_embedding_store,
+    get_model_registry,
 )
 from i18n.backend_translations import get_error_message, get_success_message
 
@@ -138,7 +144,7 @@ def normalize_skill_name(skill: str) -> str:
         >>> normalize_skill_name("  React JS  ")
         "react js"
     """
-    return " ".join(skill.strip().lower().split())
+    return cached_normalize_skill_name(skill)
 
 
 def check_skill_match(
@@ -172,28 +178,10 @@ def check_skill_match(
             return True
 
     # Then check for synonym matches
-    # Get all synonyms for the required skill
-    all_required_variants = [normalized_required]
-
-    for canonical_name, synonym_list in synonyms_map.items():
-        normalized_canonical = normalize_skill_name(canonical_name)
-        # If this canonical name matches the required skill
-        if normalized_canonical == normalized_required:
-            # Add all its synonyms
-            all_required_variants.extend(
-                [normalize_skill_name(s) for s in synonym_list]
-            )
-        # Also check if any synonym matches
-        for synonym in synonym_list:
-            if normalize_skill_name(synonym) == normalized_required:
-                all_required_variants.extend(
-                    [normalize_skill_name(canonical_name)] +
-                    [normalize_skill_name(s) for s in synonym_list]
-                )
-                break
+    # Get all synonyms for the required skill from the inverted index
+    unique_variants = get_synonym_index(synonyms_map, normalize_skill_name).variants(normalized_required)
 
     # Check if any resume skill matches any variant
-    unique_variants = set(all_required_variants)
     for resume_skill in resume_skills:
         if normalize_skill_name(resume_skill) in unique_variants:
             return True
@@ -226,19 +214,8 @@ def find_matching_synonym(
     """
     normalized_required = normalize_skill_name(required_skill)
 
-    # Build set of all variants for the required skill
-    all_variants = {normalized_required}
-
-    for canonical_name, synonym_list in synonyms_map.items():
-        normalized_canonical = normalize_skill_name(canonical_name)
-        if normalized_canonical == normalized_required:
-            all_variants.update([normalize_skill_name(s) for s in synonym_list])
-        else:
-            for synonym in synonym_list:
-                if normalize_skill_name(synonym) == normalized_required:
-                    all_variants.add(normalized_canonical)
-                    all_variants.update([normalize_skill_name(s) for s in synonym_list])
-                    break
+    # Set of all variants for the required skill, from the inverted index
+    all_variants = get_synonym_index(synonyms_map, normalize_skill_name).variants(normalized_required)
 
     # Find matching resume skill
     for resume_skill in resume_skills:
@@ -954,6 +931,19 @@ async def compare_resume_to_vacancy_unified(
         # Step 5: Use unified matcher
         unified_matcher = get_unified_matcher()
 
+        # Encode both texts through the shared micro-batcher so concurrent
+        # requests share forward passes and the event loop is not blocked
+        vector_embeddings = None
+        batcher = get_embedding_batcher()
+        if batcher is not None:
+            try:
+                job_text = VectorSimilarityMatcher.compose_job_text(
+                    vacancy_title, vacancy_description, required_skills
+                )
+                vector_embeddings = tuple(await batcher.encode([resume_text, job_text]))
+            except Exception as e:
+                logger.warning(f"Batched encoding failed, encoding inline: {e}")
+
         # DEBUG: Log what's being passed to matcher
         logger.info(f"[DEBUG] resume_skills (len={len(resume_skills)}): {resume_skills[:10]}...")
         logger.info(f"[DEBUG] required_skills: {required_skills}")
@@ -966,6 +956,7 @@ async def compare_resume_to_vacancy_unified(
             job_description=vacancy_description,
             required_skills=required_skills,
             context=vacancy_title.lower(),
+            vector_embeddings=vector_embeddings,
         )
 
         # DEBUG: Log what matcher returned
@@ -983,16 +974,6 @@ async def compare_resume_to_vacancy_unified(
             vacancy_id = request.vacancy_data.get("id")
             vacancy_uuid = UUID(vacancy_id) if vacancy_id else None
 
-            # Check if match result already exists
-            existing_match = None
-            if vacancy_uuid:
-                existing_query = select(MatchResult).where(
-                    MatchResult.resume_id == resume_uuid,
-                    MatchResult.vacancy_id == vacancy_uuid
-                )
-                existing_result = await db.execute(existing_query)
-                existing_match = existing_result.scalar_one_or_none()
-
             # Prepare match data for storage
             match_percentage = round(match_result.overall_score * 100, 2)
             matched_skills_detailed = [
@@ -1004,48 +985,28 @@ async def compare_resume_to_vacancy_unified(
                 for s in match_result.missing_skills
             ]
 
-            if existing_match:
-                # Update existing record
-                existing_match.match_percentage = match_percentage
-                existing_match.matched_skills = matched_skills_detailed
-                existing_match.missing_skills = missing_skills_detailed
-                existing_match.overall_score = match_result.overall_score
-                existing_match.keyword_score = match_result.keyword_score
-                existing_match.tfidf_score = match_result.tfidf_score
-                existing_match.vector_score = match_result.vector_score
-                existing_match.vector_similarity = match_result.vector_similarity
-                existing_match.recommendation = match_result.recommendation
-                existing_match.keyword_passed = match_result.keyword_passed
-                existing_match.tfidf_passed = match_result.tfidf_passed
-                existing_match.vector_passed = match_result.vector_passed
-                existing_match.tfidf_matched = match_result.tfidf_matched
-                existing_match.tfidf_missing = match_result.tfidf_missing
-                existing_match.matcher_version = "unified-v1"
-                logger.info(f"Updated existing match result: {existing_match.id}")
-            else:
-                # Create new match result record (only if we have a vacancy_id)
-                if vacancy_uuid:
-                    new_match = MatchResult(
-                        resume_id=resume_uuid,
-                        vacancy_id=vacancy_uuid,
-                        match_percentage=match_percentage,
-                        matched_skills=matched_skills_detailed,
-                        missing_skills=missing_skills_detailed,
-                        overall_score=match_result.overall_score,
-                        keyword_score=match_result.keyword_score,
-                        tfidf_score=match_result.tfidf_score,
-                        vector_score=match_result.vector_score,
-                        vector_similarity=match_result.vector_similarity,
-                        recommendation=match_result.recommendation,
-                        keyword_passed=match_result.keyword_passed,
-                        tfidf_passed=match_result.tfidf_passed,
-                        vector_passed=match_result.vector_passed,
-                        tfidf_matched=match_result.tfidf_matched,
-                        tfidf_missing=match_result.tfidf_missing,
-                        matcher_version="unified-v1",
-                    )
-                    db.add(new_match)
-                    logger.info(f"Created new match result for resume {resume_uuid} and vacancy {vacancy_uuid}")
+            # Insert or update the pair's record in one statement (only if we have a vacancy_id)
+            if vacancy_uuid:
+                await upsert_match_results(db, [{
+                    "resume_id": resume_uuid,
+                    "vacancy_id": vacancy_uuid,
+                    "match_percentage": match_percentage,
+                    "matched_skills": matched_skills_detailed,
+                    "missing_skills": missing_skills_detailed,
+                    "overall_score": match_result.overall_score,
+                    "keyword_score": match_result.keyword_score,
+                    "tfidf_score": match_result.tfidf_score,
+                    "vector_score": match_result.vector_score,
+                    "vector_similarity": match_result.vector_similarity,
+                    "recommendation": match_result.recommendation,
+                    "keyword_passed": match_result.keyword_passed,
+                    "tfidf_passed": match_result.tfidf_passed,
+                    "vector_passed": match_result.vector_passed,
+                    "tfidf_matched": match_result.tfidf_matched,
+                    "tfidf_missing": match_result.tfidf_missing,
+                    "matcher_version": "unified-v1",
+                }])
+                logger.info(f"Saved match result for resume {resume_uuid} and vacancy {vacancy_uuid}")
 
             await db.commit()
 
@@ -1095,3 +1056,52 @@ async def compare_resume_to_vacancy_unified(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Unified matching failed: {str(e)}",
         ) from e
+
+
+@router.get(
+    "/encoder-stats",
+    status_code=status.HTTP_200_OK,
+    tags=["Matching"],
+)
+async def get_encoder_stats() -> JSONResponse:
+    """
+    Get embedding micro-batcher and embedding store metrics.
+
+    Returns:
+        JSON response with batch size and queue wait statistics of this
+        API process, or enabled=false when batching is disabled
+
+    Example:
+        >>> requests.get("http://localhost:8000/api/matching/encoder-stats").json()
+        {"enabled": true, "batches": 120, "avg_batch_size": 7.5, "avg_queue_wait_ms": 3.1, ...}
+    """
+    batcher = get_embedding_batcher()
+    if batcher is None:
+        return JSONResponse(status_code=status.HTTP_200_OK, content={"enabled": False})
+
+    content = {"enabled": True, **batcher.get_stats()}
+    store = get_embedding_store()
+    if store is not None:
+        content["embedding_store"] = store.get_stats()
+
+    return JSONResponse(status_code=status.HTTP_200_OK, content=content)
+
+
+@router.get(
+    "/model-stats",
+    status_code=status.HTTP_200_OK,
+    tags=["Matching"],
+)
+async def get_model_stats() -> JSONResponse:
+    """
+    Get model registry metrics for this process.
+
+    Returns:
+        JSON response with hit/miss/eviction counters and the models
+        currently loaded with their approximate memory use
+
+    Example:
+        >>> requests.get("http://localhost:8000/api/matching/model-stats").json()
+        {"hits": 812, "misses": 3, "evictions": 0, "hit_rate": 0.9963, "loaded": [...], ...}
+    """
+    return JSONResponse(status_code=status.HTTP_200_OK, content=get_model_registry().get_stats())
@@ -255,6 +255,129 @@ async def get_ranked_candidates(
         )
 
 
+@router.get(
+    "/vacancy/{vacancy_id}/shortlist",
+    tags=["Ranking"],
+)
+async def get_vacancy_shortlist(
+    vacancy_id: str,
+    k: int = Query(100, ge=1, le=1000, description="Number of resumes to retrieve"),
+    db: AsyncSession = Depends(get_db),
+) -> JSONResponse:
+    """
+    Get the resumes closest to a vacancy by embedding similarity.
+
+    Uses the approximate nearest-neighbour index of resume embeddings, so
+    the response time does not grow with the size of the resume pool. The
+    shortlist is intended as input for full matching and ranking.
+
+    Args:
+        vacancy_id: Vacancy UUID
+        k: Number of resumes to retrieve
+        db: Database session
+
+    Returns:
+        Resume IDs with their cosine similarity to the vacancy
+
+    Raises:
+        HTTPException(422): If the vacancy UUID is invalid
+        HTTPException(500): If retrieval fails
+    """
+    try:
+        try:
+            vacancy_uuid = UUID(vacancy_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Invalid vacancy UUID format",
+            )
+
+        ranking_service = get_ranking_service()
+        shortlist = await ranking_service.shortlist_resumes(db, vacancy_uuid, k=k)
+
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={
+                "vacancy_id": vacancy_id,
+                "total_candidates": len(shortlist),
+                "candidates": [
+                    {"resume_id": str(resume_id), "similarity": round(similarity, 4)}
+                    for resume_id, similarity in shortlist
+                ],
+            },
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting shortlist: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get shortlist: {str(e)}",
+        )
+
+
+@router.get(
+    "/vacancy/{vacancy_id}/keyword-scores",
+    tags=["Ranking"],
+)
+async def get_vacancy_keyword_scores(
+    vacancy_id: str,
+    k: int = Query(100, ge=1, le=10000, description="Number of resumes to return"),
+    db: AsyncSession = Depends(get_db),
+) -> JSONResponse:
+    """
+    Score a vacancy against every resume with corpus-level TF-IDF.
+
+    One sparse matrix product over all stored resumes, with IDF weights
+    fitted on the whole resume and vacancy corpus.
+
+    Args:
+        vacancy_id: Vacancy UUID
+        k: Number of resumes to return
+        db: Database session
+
+    Returns:
+        Resume IDs with their TF-IDF cosine similarity to the vacancy
+
+    Raises:
+        HTTPException(422): If the vacancy UUID is invalid
+        HTTPException(500): If scoring fails
+    """
+    try:
+        try:
+            vacancy_uuid = UUID(vacancy_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Invalid vacancy UUID format",
+            )
+
+        ranking_service = get_ranking_service()
+        scores = await ranking_service.keyword_scores_for_vacancy(db, vacancy_uuid, k=k)
+
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={
+                "vacancy_id": vacancy_id,
+                "total_candidates": len(scores),
+                "candidates": [
+                    {"resume_id": str(resume_id), "score": round(score, 4)}
+                    for resume_id, score in scores
+                ],
+            },
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting keyword scores: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get keyword scores: {str(e)}",
+        )
+
+
 @router.post(
     "/feedback",
     response_model=FeedbackResponse,
@@ -4,6 +4,7 @@ Resume upload and management endpoints.
 This module provides endpoints for uploading resume files (PDF, DOCX),
 validating file format and size, storing files, and creating database records.
 """
+import asyncio
 import logging
 import os
 from pathlib import Path
@@ -609,6 +610,21 @@ async def delete_resume(
         if file_path and file_path.exists():
             file_path.unlink()
 
+        # Drop the resume from the vacancy shortlisting index
+        try:
+            from analyzers.resume_retrieval import get_resume_retriever
+
+            retriever = get_resume_retriever()
+            if retriever is not None:
+                retriever.remove_resume(resume_id)
+        except Exception as e:
+            logger.warning(f"Failed to remove resume {resume_id} from retrieval index: {e}")
+
+        # Drop it from corpus TF-IDF statistics
+        from analyzers.tfidf_corpus import remove_corpus_document
+
+        await asyncio.to_thread(remove_corpus_document, "resume", resume_id)
+
         logger.info(f"Deleted resume: {resume_id}")
 
         return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content=None)
@@ -17,6 +17,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy import select, delete
 from sqlalchemy.exc import SQLAlchemyError
 
+from analyzers.taxonomy_snapshot import publish_taxonomy_snapshot
 from database import get_db
 from models.skill_taxonomy import SkillTaxonomy
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -147,6 +148,7 @@ async def create_skill_taxonomies(
             })
 
         await db.commit()
+        await publish_taxonomy_snapshot(db)
 
         response_data = {
             "industry": request.industry,
@@ -335,6 +337,7 @@ async def update_skill_taxonomy(
             taxonomy.is_active = request.is_active
 
         await db.commit()
+        await publish_taxonomy_snapshot(db)
         await db.refresh(taxonomy)
 
         return JSONResponse(
@@ -398,6 +401,7 @@ async def delete_skill_taxonomy(
         # Delete
         await db.delete(taxonomy)
         await db.commit()
+        await publish_taxonomy_snapshot(db)
 
         return JSONResponse(
             status_code=status.HTTP_200_OK,
@@ -438,6 +442,7 @@ async def delete_skill_taxonomies_by_industry(
             delete(SkillTaxonomy).where(SkillTaxonomy.industry == industry)
         )
         await db.commit()
+        await publish_taxonomy_snapshot(db)
 
         return JSONResponse(
             status_code=status.HTTP_200_OK,
@@ -530,6 +535,7 @@ async def load_industry_taxonomy(
             created_count += 1
 
         await db.commit()
+        await publish_taxonomy_snapshot(db)
 
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
@@ -640,6 +646,7 @@ async def load_it_taxonomy(
             await process_skill_category(taxonomy_data["soft_skills"])
 
         await db.commit()
+        await publish_taxonomy_snapshot(db)
 
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
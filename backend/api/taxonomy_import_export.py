@@ -18,6 +18,7 @@ from sqlalchemy import delete, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from analyzers.taxonomy_snapshot import publish_taxonomy_snapshot
 from database import get_db
 from models.skill_taxonomy import SkillTaxonomy
 
@@ -297,6 +298,7 @@ async def import_taxonomies(
                         logger.warning(error_msg)
 
                 await db.commit()
+                await publish_taxonomy_snapshot(db)
 
             except json.JSONDecodeError as e:
                 raise HTTPException(
@@ -367,6 +369,7 @@ async def import_taxonomies(
                         logger.warning(error_msg)
 
                 await db.commit()
+                await publish_taxonomy_snapshot(db)
 
             except Exception as e:
                 raise HTTPException(
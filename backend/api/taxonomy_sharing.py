@@ -15,6 +15,7 @@ from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from analyzers.taxonomy_snapshot import publish_taxonomy_snapshot
 from database import get_db
 from models.skill_taxonomy import SkillTaxonomy
 
@@ -235,6 +236,7 @@ async def fork_taxonomy(
 
         db.add(forked_taxonomy)
         await db.commit()
+        await publish_taxonomy_snapshot(db)
         await db.refresh(forked_taxonomy)
 
         logger.info(f"Successfully forked taxonomy {taxonomy_id} to organization {request.organization_id}")
@@ -16,6 +16,7 @@ from sqlalchemy import select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from analyzers.taxonomy_snapshot import publish_taxonomy_snapshot
 from database import get_db
 from models.skill_taxonomy import SkillTaxonomy
 
@@ -156,6 +157,7 @@ async def create_taxonomy_version(
 
         db.add(new_version)
         await db.commit()
+        await publish_taxonomy_snapshot(db)
         await db.refresh(new_version)
 
         logger.info(f"Created version {new_version_number} for taxonomy {taxonomy_id}")
@@ -389,6 +391,7 @@ async def rollback_taxonomy_version(
 
         db.add(rollback_version)
         await db.commit()
+        await publish_taxonomy_snapshot(db)
         await db.refresh(rollback_version)
 
         logger.info(f"Rolled back taxonomy {taxonomy_id} to version {version_id}, created version {new_version_number}")
@@ -4,6 +4,7 @@ Job Vacancy API endpoints for creating and managing job requisitions.
 This module provides endpoints for recruiters to create, view, update,
 and delete job vacancy requests that define the candidate profile they're looking for.
 """
+import asyncio
 import logging
 from datetime import datetime
 from typing import Optional
@@ -19,9 +20,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from analyzers import (
     extract_resume_entities,
     EnhancedSkillMatcher,
+    invalidate_vacancy_profile,
 )
 from database import get_db
 from models.job_vacancy import JobVacancy
+from analyzers.tfidf_corpus import compose_vacancy_text, index_corpus_document, remove_corpus_document
 
 logger = logging.getLogger(__name__)
 
@@ -167,6 +170,13 @@ async def create_vacancy(
         await db.commit()
         await db.refresh(new_vacancy)
 
+        await asyncio.to_thread(
+            index_corpus_document,
+            "vacancy",
+            new_vacancy.id,
+            compose_vacancy_text(new_vacancy.title, new_vacancy.description, new_vacancy.required_skills),
+        )
+
         logger.info(f"Created vacancy: {new_vacancy.id} - {new_vacancy.title}")
 
         return JSONResponse(
@@ -344,10 +354,12 @@ async def match_resume_with_all_vacancies(
         for vacancy in vacancies:
             required_skills = vacancy.required_skills or []
 
-            # Match skills using EnhancedSkillMatcher
+            # Match skills using EnhancedSkillMatcher; compiled skills are
+            # cached per vacancy, so only the resume side is done per request
             match_results = matcher.match_multiple(
                 resume_skills=resume_skills,
                 required_skills=required_skills,
+                compiled_skills=matcher.compile_required_skills(required_skills),
             )
 
             # Extract matched and missing skills
@@ -700,6 +712,12 @@ async def update_vacancy(
                 detail="Vacancy not found",
             )
 
+        # Compiled TF-IDF profiles of the old text must not be reused
+        if any(v is not None for v in (vacancy.title, vacancy.description, vacancy.required_skills)):
+            invalidate_vacancy_profile(
+                vacancy_obj.title, vacancy_obj.description, vacancy_obj.required_skills or []
+            )
+
         # Update fields
         if vacancy.title is not None:
             vacancy_obj.title = vacancy.title
@@ -732,6 +750,13 @@ async def update_vacancy(
         await db.commit()
         await db.refresh(vacancy_obj)
 
+        await asyncio.to_thread(
+            index_corpus_document,
+            "vacancy",
+            vacancy_id,
+            compose_vacancy_text(vacancy_obj.title, vacancy_obj.description, vacancy_obj.required_skills),
+        )
+
         logger.info(f"Updated vacancy: {vacancy_id}")
 
         return JSONResponse(
@@ -796,6 +821,8 @@ async def delete_vacancy(
         await db.delete(vacancy)
         await db.commit()
 
+        await asyncio.to_thread(remove_corpus_document, "vacancy", vacancy_id)
+
         logger.info(f"Deleted vacancy: {vacancy_id}")
 
         return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content=None)
@@ -4,6 +4,7 @@ Job Vacancy API endpoints with database integration and matching functionality.
 This module provides endpoints for managing job vacancies in the database
 and matching resumes against all available vacancies.
 """
+import asyncio
 import logging
 from typing import List, Optional
 from uuid import UUID, uuid4
@@ -16,7 +17,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db
 from models.job_vacancy import JobVacancy
-from analyzers import EnhancedSkillMatcher
+from analyzers.tfidf_corpus import compose_vacancy_text, index_corpus_document, remove_corpus_document
+from analyzers import EnhancedSkillMatcher, invalidate_vacancy_profile
 from analyzers.hf_skill_extractor import extract_resume_keywords, extract_resume_entities
 
 logger = logging.getLogger(__name__)
@@ -181,6 +183,13 @@ async def create_vacancy(
         await db.commit()
         await db.refresh(new_vacancy)
 
+        await asyncio.to_thread(
+            index_corpus_document,
+            "vacancy",
+            new_vacancy.id,
+            compose_vacancy_text(new_vacancy.title, new_vacancy.description, new_vacancy.required_skills),
+        )
+
         logger.info(f"Created vacancy: {new_vacancy.id} - {new_vacancy.title}")
 
         return JSONResponse(
@@ -341,6 +350,12 @@ async def update_vacancy(
                 detail=f"Vacancy {vacancy_id} not found",
             )
 
+        # Compiled TF-IDF profiles of the old text must not be reused
+        if any(v is not None for v in (vacancy.title, vacancy.description, vacancy.required_skills)):
+            invalidate_vacancy_profile(
+                db_vacancy.title, db_vacancy.description, db_vacancy.required_skills or []
+            )
+
         # Update fields
         if vacancy.title is not None:
             db_vacancy.title = vacancy.title
@@ -370,6 +385,13 @@ async def update_vacancy(
         await db.commit()
         await db.refresh(db_vacancy)
 
+        await asyncio.to_thread(
+            index_corpus_document,
+            "vacancy",
+            vacancy_id,
+            compose_vacancy_text(db_vacancy.title, db_vacancy.description, db_vacancy.required_skills),
+        )
+
         logger.info(f"Updated vacancy: {vacancy_id}")
 
         return JSONResponse(
@@ -428,6 +450,8 @@ async def delete_vacancy(
         await db.delete(vacancy)
         await db.commit()
 
+        await asyncio.to_thread(remove_corpus_document, "vacancy", vacancy_id)
+
         logger.info(f"Deleted vacancy: {vacancy_id}")
 
         return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content=None)
@@ -558,17 +582,25 @@ async def match_resume_against_all_vacancies(
         matches = []
 
         for vacancy in vacancies:
-            # Combine required and additional skills
-            all_vacancy_skills = set(vacancy.required_skills or [])
-            if vacancy.additional_requirements:
-                all_vacancy_skills.update(vacancy.additional_requirements)
+            required_skills = vacancy.required_skills or []
 
-            # Calculate match
-            match_result = matcher.calculate_match_score(
+            # Match skills; compiled skills are cached per vacancy, so only
+            # the resume side is done per request
+            match_results = matcher.match_multiple(
                 resume_skills=resume_skills,
-                vacancy_skills=list(all_vacancy_skills),
-                required_skills=vacancy.required_skills or [],
+                required_skills=required_skills,
+                compiled_skills=matcher.compile_required_skills(required_skills),
             )
+            matched_skills = [
+                skill for skill, result in match_results.items()
+                if result.get("matched", False)
+            ]
+            missing_skills = [
+                skill for skill, result in match_results.items()
+                if not result.get("matched", False)
+            ]
+            total_required = len(required_skills)
+            match_percentage = (len(matched_skills) / total_required * 100) if total_required > 0 else 0.0
 
             # Check experience match
             experience_match = True
@@ -578,7 +610,7 @@ async def match_resume_against_all_vacancies(
                 experience_match = True
 
             # Determine additional skills matched
-            required_set = set(vacancy.required_skills or [])
+            required_set = set(required_skills)
             additional_skills = vacancy.additional_requirements or []
             additional_matched = [
                 skill for skill in additional_skills
@@ -588,9 +620,9 @@ async def match_resume_against_all_vacancies(
             matches.append({
                 "vacancy_id": str(vacancy.id),
                 "vacancy_title": vacancy.title,
-                "match_percentage": match_result["match_percentage"],
-                "matched_skills": match_result["matched_skills"],
-                "missing_skills": match_result["missing_skills"],
+                "match_percentage": round(match_percentage, 1),
+                "matched_skills": matched_skills,
+                "missing_skills": missing_skills,
                 "additional_matched": additional_matched,
                 "experience_match": experience_match,
             })
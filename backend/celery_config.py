@@ -51,6 +51,7 @@ celery_config: Dict[str, Any] = {
         "tasks.learning_tasks.review_and_activate_synonyms": {"queue": "learning"},
         "tasks.learning_tasks.periodic_feedback_aggregation": {"queue": "learning"},
         "tasks.learning_tasks.*": {"queue": "learning"},
+        "tasks.ranking_tasks.*": {"queue": "ranking"},
     },
 
     # Task priority (if needed in future)
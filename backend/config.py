@@ -25,6 +25,32 @@ class Settings(BaseSettings):
         backend_port: Port to bind the FastAPI server
         frontend_url: Frontend URL for CORS configuration
         models_cache_path: Path to cache ML models
+        embedding_store_enabled: Whether to persist sentence embeddings on disk
+        embedding_store_path: Directory for the persistent embedding store
+        embedding_store_dtype: Storage format for newly created embedding store shards
+        resume_index_enabled: Whether to maintain the ANN index of resume embeddings
+        resume_index_nprobe: Number of IVF lists scanned per retrieval query
+        resume_index_dtype: In-memory storage format of the resume index
+        resume_shortlist_size: Resumes retrieved per vacancy before full ranking
+        tfidf_corpus_enabled: Whether to maintain corpus-level TF-IDF over resumes and vacancies
+        taxonomy_snapshot_enabled: Whether workers share a versioned taxonomy snapshot
+        taxonomy_snapshot_check_interval: Seconds between checks for a new taxonomy snapshot
+        matching_cascade_enabled: Whether unified matching skips vector scoring for ruled-out resumes
+        ranking_pool_size: Worker processes for parallel ranking (0 = rank in-process)
+        ranking_pool_min_candidates: Smallest candidate pool ranked on the worker pool
+        ranking_model_check_interval: Seconds between checks for a newly activated ranking model
+        ranking_model_type: Ranking model served by the API (random_forest, gradient_boosting, sgd)
+        vector_pooling: How chunk embeddings of long documents are pooled
+        vector_max_chunks: Maximum number of chunks encoded per document
+        vector_chunk_overlap: Tokens shared by consecutive chunks
+        inference_backend: Runtime for transformer models (torch, onnx, onnx-int8)
+        onnx_quantization_config: CPU target for dynamic int8 quantization
+        model_registry_size: Maximum number of transformer models kept loaded
+        model_registry_memory_mb: Approximate memory budget for loaded models (0 = unlimited)
+        encoder_batching_enabled: Whether API requests share batched encoder calls
+        encoder_batch_size: Maximum texts per batched encoder call
+        encoder_batch_wait_ms: Longest wait for a batch to fill
+        encoder_queue_size: Queued texts beyond which requests wait
         languagetool_server: LanguageTool server URL for grammar checking
         max_upload_size_mb: Maximum file upload size in megabytes
         allowed_file_types: Comma-separated list of allowed file extensions
@@ -75,6 +101,144 @@ class Settings(BaseSettings):
         description="Path to cache ML models",
     )
 
+    # Embedding Store Configuration
+    embedding_store_enabled: bool = Field(
+        default=True,
+        description="Persist sentence embeddings so identical texts are encoded once",
+    )
+    embedding_store_path: Optional[Path] = Field(
+        default=None,
+        description="Directory for the embedding store (defaults to <models_cache_path>/embeddings)",
+    )
+    embedding_store_dtype: str = Field(
+        default="float16",
+        description="Storage format for new embedding store shards: float32, float16 or int8",
+    )
+
+    # Resume Retrieval Index Configuration
+    resume_index_enabled: bool = Field(
+        default=True,
+        description="Maintain an ANN index of resume embeddings for vacancy shortlisting",
+    )
+    resume_index_nprobe: int = Field(
+        default=8,
+        ge=1,
+        description="Number of IVF lists scanned per retrieval query",
+    )
+    resume_index_dtype: str = Field(
+        default="int8",
+        description="In-memory storage format of the resume index: float32, float16 or int8",
+    )
+    resume_shortlist_size: int = Field(
+        default=200,
+        ge=1,
+        description="Resumes retrieved per vacancy before full ranking",
+    )
+
+    # Corpus TF-IDF Configuration
+    tfidf_corpus_enabled: bool = Field(
+        default=True,
+        description="Maintain corpus-level TF-IDF vectors of resumes and vacancies",
+    )
+
+    # Taxonomy Snapshot Configuration
+    taxonomy_snapshot_enabled: bool = Field(
+        default=True,
+        description="Publish taxonomy changes as a versioned snapshot shared by all workers",
+    )
+    taxonomy_snapshot_check_interval: float = Field(
+        default=1.0,
+        ge=0,
+        description="Seconds between checks for a new taxonomy snapshot version (0 = every lookup)",
+    )
+
+    # Cascade Matching Configuration
+    matching_cascade_enabled: bool = Field(
+        default=False,
+        description="Skip vector scoring for resumes whose keyword and TF-IDF scores rule them out",
+    )
+
+    # Parallel Ranking Configuration
+    ranking_pool_size: int = Field(
+        default=0,
+        ge=0,
+        description="Worker processes that rank large candidate pools (0 = rank in-process)",
+    )
+    ranking_pool_min_candidates: int = Field(
+        default=200,
+        ge=1,
+        description="Smallest candidate pool sharded across the ranking workers",
+    )
+    ranking_model_check_interval: float = Field(
+        default=1.0,
+        ge=0,
+        description="Seconds between checks for a new active ranking model version (0 = every prediction)",
+    )
+    ranking_model_type: str = Field(
+        default="random_forest",
+        description="Ranking model served by the API: random_forest, gradient_boosting or sgd "
+        "(sgd is updated incrementally from recruiter feedback)",
+    )
+
+    # Long-document Embedding Configuration
+    vector_pooling: str = Field(
+        default="none",
+        description="Chunk pooling for long documents: none (truncate), mean, max or attention",
+    )
+    vector_max_chunks: int = Field(
+        default=16,
+        ge=1,
+        description="Maximum number of token windows encoded per document",
+    )
+    vector_chunk_overlap: int = Field(
+        default=32,
+        ge=0,
+        description="Tokens shared by consecutive windows",
+    )
+
+    # Inference Backend Configuration
+    inference_backend: str = Field(
+        default="torch",
+        description="Runtime for sentence-transformers and NER models: torch, onnx or onnx-int8",
+    )
+    onnx_quantization_config: str = Field(
+        default="avx2",
+        description="CPU target for onnx-int8 quantization: avx2, avx512, avx512_vnni or arm64",
+    )
+
+    # Model Registry Configuration
+    model_registry_size: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of transformer models (encoder, NER per language) kept loaded",
+    )
+    model_registry_memory_mb: float = Field(
+        default=3072,
+        ge=0,
+        description="Approximate memory budget for loaded models in MB (0 disables the budget)",
+    )
+
+    # Encoder Micro-batching Configuration (API process)
+    encoder_batching_enabled: bool = Field(
+        default=True,
+        description="Batch embedding requests from concurrent API calls",
+    )
+    encoder_batch_size: int = Field(
+        default=32,
+        ge=1,
+        description="Maximum texts per batched encoder call",
+    )
+    encoder_batch_wait_ms: float = Field(
+        default=5.0,
+        ge=0,
+        description="Longest time a text waits for its batch to fill, in milliseconds",
+    )
+    encoder_queue_size: int = Field(
+        default=1024,
+        ge=1,
+        description="Queued texts beyond which new requests wait for room",
+    )
+
     # LanguageTool Server Configuration
     languagetool_server: Optional[str] = Field(
         default=None,
@@ -140,6 +304,50 @@ class Settings(BaseSettings):
             return "INFO"
         return v_upper
 
+    @field_validator("embedding_store_dtype", "resume_index_dtype")
+    @classmethod
+    def validate_vector_dtype(cls, v: str) -> str:
+        """Validate vector storage format."""
+        valid_dtypes = ["float32", "float16", "int8"]
+        v_lower = v.lower()
+        if v_lower not in valid_dtypes:
+            logger.warning(f"Invalid vector storage dtype '{v}', defaulting to float32")
+            return "float32"
+        return v_lower
+
+    @field_validator("inference_backend")
+    @classmethod
+    def validate_inference_backend(cls, v: str) -> str:
+        """Validate inference backend."""
+        valid_backends = ["torch", "onnx", "onnx-int8"]
+        v_lower = v.lower()
+        if v_lower not in valid_backends:
+            logger.warning(f"Invalid inference backend '{v}', defaulting to torch")
+            return "torch"
+        return v_lower
+
+    @field_validator("onnx_quantization_config")
+    @classmethod
+    def validate_onnx_quantization_config(cls, v: str) -> str:
+        """Validate ONNX quantization target."""
+        valid_configs = ["avx2", "avx512", "avx512_vnni", "arm64"]
+        v_lower = v.lower()
+        if v_lower not in valid_configs:
+            logger.warning(f"Invalid ONNX quantization config '{v}', defaulting to avx2")
+            return "avx2"
+        return v_lower
+
+    @field_validator("vector_pooling")
+    @classmethod
+    def validate_vector_pooling(cls, v: str) -> str:
+        """Validate chunk pooling strategy."""
+        valid_poolings = ["none", "mean", "max", "attention"]
+        v_lower = v.lower()
+        if v_lower not in valid_poolings:
+            logger.warning(f"Invalid vector pooling '{v}', defaulting to none")
+            return "none"
+        return v_lower
+
     @property
     def max_upload_size_bytes(self) -> int:
         """Convert max_upload_size_mb to bytes."""
@@ -48,6 +48,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Shutdown
     logger.info("Shutting down Resume Analysis API")
 
+    from analyzers.encoder_batcher import shutdown_embedding_batcher
+
+    await shutdown_embedding_batcher()
+
+    from analyzers.parallel_ranking import shutdown_parallel_ranker
+
+    shutdown_parallel_ranker()
+
 
 # Create FastAPI application
 app = FastAPI(
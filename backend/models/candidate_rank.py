@@ -4,7 +4,7 @@ CandidateRank model for storing AI-powered candidate ranking scores
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, JSON, Numeric, String, Text
+from sqlalchemy import ForeignKey, JSON, Numeric, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin, UUIDMixin
@@ -37,6 +37,11 @@ class CandidateRank(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "candidate_ranks"
 
+    # One row per resume-vacancy pair; writers upsert on this constraint
+    __table_args__ = (
+        UniqueConstraint("resume_id", "vacancy_id", name="uq_candidate_ranks_resume_vacancy"),
+    )
+
     resume_id: Mapped[UUID] = mapped_column(
         ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True
     )
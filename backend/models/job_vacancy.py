@@ -4,7 +4,7 @@ JobVacancy model for storing job vacancy descriptions
 from typing import Optional
 
 from sqlalchemy import JSON, String, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from .base import Base, TimestampMixin, UUIDMixin
 
@@ -18,6 +18,8 @@ class JobVacancy(Base, UUIDMixin, TimestampMixin):
         title: Job title
         description: Full job description
         required_skills: JSON array of required skills
+        required_skill_ids: Sorted unique IDs of the normalized required skills
+            (see analyzers/skill_ids.py), kept in sync with required_skills
         min_experience_months: Minimum required experience in months
         additional_requirements: JSON array of additional (preferred) skills
         industry: Industry sector
@@ -33,6 +35,7 @@ class JobVacancy(Base, UUIDMixin, TimestampMixin):
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     required_skills: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    required_skill_ids: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
     min_experience_months: Mapped[Optional[int]] = mapped_column(
         nullable=True, default=None
     )
@@ -60,5 +63,18 @@ class JobVacancy(Base, UUIDMixin, TimestampMixin):
         cascade="all, delete-orphan"
     )
 
+    @validates("required_skills")
+    def _sync_required_skill_ids(self, key: str, skills: Optional[list]) -> Optional[list]:
+        """Recompute required_skill_ids whenever required_skills are assigned."""
+        # Imported here: analyzers import models
+        from analyzers.skill_ids import serialize_skill_ids
+
+        self.required_skill_ids = (
+            serialize_skill_ids(s for s in skills if isinstance(s, str))
+            if skills is not None
+            else None
+        )
+        return skills
+
     def __repr__(self) -> str:
         return f"<JobVacancy(id={self.id}, title={self.title})>"
@@ -4,7 +4,7 @@ MatchResult model for storing resume-vacancy matching results
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, JSON, Numeric, String
+from sqlalchemy import ForeignKey, JSON, Numeric, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin, UUIDMixin
@@ -45,6 +45,11 @@ class MatchResult(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "match_results"
 
+    # One row per resume-vacancy pair; writers upsert on this constraint
+    __table_args__ = (
+        UniqueConstraint("resume_id", "vacancy_id", name="uq_match_results_resume_vacancy"),
+    )
+
     resume_id: Mapped[UUID] = mapped_column(
         ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True
     )
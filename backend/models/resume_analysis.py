@@ -12,7 +12,7 @@ from typing import Optional
 from uuid import UUID
 
 from sqlalchemy import ForeignKey, JSON, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, validates
 
 from .base import Base, TimestampMixin, UUIDMixin
 
@@ -32,6 +32,7 @@ class ResumeAnalysis(Base, UUIDMixin, TimestampMixin):
 
         # Extracted data
         skills: List of extracted technical skills
+        skill_ids: Sorted interned IDs of the normalized skills (kept in sync with skills)
         keywords: List of key phrases with relevance scores
         entities: Named entities (persons, orgs, dates, locations)
 
@@ -63,6 +64,7 @@ class ResumeAnalysis(Base, UUIDMixin, TimestampMixin):
 
     # Extracted data (JSON fields for flexibility)
     skills: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    skill_ids: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
     keywords: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
     entities: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
@@ -80,5 +82,18 @@ class ResumeAnalysis(Base, UUIDMixin, TimestampMixin):
     processing_time_seconds: Mapped[Optional[float]] = mapped_column(nullable=True)
     analyzer_version: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    @validates("skills")
+    def _sync_skill_ids(self, key: str, skills: Optional[list]) -> Optional[list]:
+        """Recompute skill_ids whenever skills are assigned."""
+        # Imported here: analyzers import models
+        from analyzers.skill_ids import serialize_skill_ids
+
+        self.skill_ids = (
+            serialize_skill_ids(s for s in skills if isinstance(s, str))
+            if skills is not None
+            else None
+        )
+        return skills
+
     def __repr__(self) -> str:
         return f"<ResumeAnalysis(id={self.id}, resume_id={self.resume_id}, language={self.language})>"
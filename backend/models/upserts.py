@@ -0,0 +1,95 @@
+"""
+Bulk UPSERT of per resume-vacancy pair rows (CandidateRank, MatchResult)
+
+Rows are written with PostgreSQL INSERT ... ON CONFLICT (resume_id,
+vacancy_id) DO UPDATE, in batches of UPSERT_BATCH_SIZE rows per
+statement. Concurrent writers cannot create duplicate pairs, and no
+row needs to be read before it is written.
+"""
+from typing import Any, Dict, List, Sequence, Type
+from uuid import uuid4
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .base import Base
+from .candidate_rank import CandidateRank
+from .match_result import MatchResult
+
+# Rows per INSERT statement
+UPSERT_BATCH_SIZE = 500
+
+# Columns identifying a row; never updated on conflict
+_KEY_COLUMNS = ("id", "resume_id", "vacancy_id")
+
+
+async def _upsert_pairs(
+    db: AsyncSession,
+    model: Type[Base],
+    constraint: str,
+    rows: Sequence[Dict[str, Any]],
+) -> int:
+    """
+    Insert rows or update the existing row of each (resume_id, vacancy_id).
+
+    Args:
+        db: Database session (not committed here)
+        model: Mapped class of the table
+        constraint: Name of the unique constraint on (resume_id, vacancy_id)
+        rows: Column values per row; every row must have the same columns
+
+    Returns:
+        Number of rows written
+    """
+    # A statement may touch each pair once; the last row of a pair wins
+    unique_rows: List[Dict[str, Any]] = list(
+        {(row["resume_id"], row["vacancy_id"]): row for row in rows}.values()
+    )
+    if not unique_rows:
+        return 0
+
+    insert_stmt = pg_insert(model.__table__)
+    updated = {
+        column: insert_stmt.excluded[column]
+        for column in unique_rows[0]
+        if column not in _KEY_COLUMNS
+    }
+    stmt = insert_stmt.on_conflict_do_update(
+        constraint=constraint,
+        # ON CONFLICT bypasses the ORM's onupdate
+        set_={**updated, "updated_at": func.now()},
+    )
+
+    for start in range(0, len(unique_rows), UPSERT_BATCH_SIZE):
+        batch = [{"id": uuid4(), **row} for row in unique_rows[start:start + UPSERT_BATCH_SIZE]]
+        await db.execute(stmt, batch)
+    return len(unique_rows)
+
+
+async def upsert_candidate_ranks(db: AsyncSession, rows: Sequence[Dict[str, Any]]) -> int:
+    """
+    Write CandidateRank rows, one per resume-vacancy pair.
+
+    Args:
+        db: Database session (not committed here)
+        rows: CandidateRank column values, including resume_id and vacancy_id
+
+    Returns:
+        Number of rows written
+    """
+    return await _upsert_pairs(db, CandidateRank, "uq_candidate_ranks_resume_vacancy", rows)
+
+
+async def upsert_match_results(db: AsyncSession, rows: Sequence[Dict[str, Any]]) -> int:
+    """
+    Write MatchResult rows, one per resume-vacancy pair.
+
+    Args:
+        db: Database session (not committed here)
+        rows: MatchResult column values, including resume_id and vacancy_id
+
+    Returns:
+        Number of rows written
+    """
+    return await _upsert_pairs(db, MatchResult, "uq_match_results_resume_vacancy", rows)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Latency and accuracy benchmark for the inference backends.
+
+Runs the sentence-transformers encoder and the NER models on PyTorch,
+ONNX Runtime and int8-quantized ONNX Runtime, and reports per-text
+latency plus parity with the PyTorch outputs:
+- embeddings: cosine similarity to the PyTorch embedding (min / mean)
+- NER: F1 of (entity text, label) pairs against PyTorch entities
+
+The first run of an ONNX backend exports the model into the models cache.
+
+Usage:
+    python scripts/benchmark_inference.py --task all
+    python scripts/benchmark_inference.py --task ner --texts-file resumes.txt --repeat 3
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analyzers.hf_skill_extractor import LANGUAGE_MODELS
+from analyzers.inference_backend import INFERENCE_BACKENDS, load_ner_pipeline, load_sentence_transformer
+
+SAMPLE_TEXTS = [
+    "Senior Python developer with 7 years of experience building REST APIs with Django and FastAPI.",
+    "Worked at Google and Yandex on distributed systems; led a team of five engineers in Berlin.",
+    "Frontend engineer: React, TypeScript, Redux, Webpack. Previously at Microsoft in Seattle.",
+    "Data scientist skilled in PyTorch, scikit-learn, SQL and Apache Spark. MSc from ETH Zurich.",
+    "DevOps engineer experienced with Kubernetes, Docker, Terraform and AWS at Amazon.",
+    "Java backend developer, Spring Boot, PostgreSQL, Kafka. Worked for Sberbank in Moscow.",
+    "Разработчик Python с опытом работы в Яндексе, Москва. Django, PostgreSQL, Redis.",
+    "Mobile developer (Kotlin, Swift) who shipped apps for Uber and Airbnb from San Francisco.",
+]
+
+
+def load_texts(path: str) -> List[str]:
+    """Read one text per non-empty line."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def benchmark_embeddings(model_name: str, texts: List[str], backends: List[str], repeat: int) -> None:
+    """Compare encoder latency and embedding parity across backends."""
+    print(f"\nSentence embeddings: {model_name}")
+    print(f"{'backend':<10} {'ms/text':>8} {'speedup':>8} {'min cos':>8} {'mean cos':>9}")
+
+    reference = None
+    reference_ms = None
+    for backend in backends:
+        model, loaded = load_sentence_transformer(model_name, backend)
+        if model is None or loaded != backend:
+            print(f"{backend:<10} unavailable")
+            continue
+
+        model.encode(texts[:2], show_progress_bar=False)  # warm-up
+        start = time.perf_counter()
+        for _ in range(repeat):
+            embeddings = model.encode(texts, batch_size=32, convert_to_numpy=True, show_progress_bar=False)
+        ms = (time.perf_counter() - start) * 1000 / (repeat * len(texts))
+
+        embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+        if reference is None:
+            reference, reference_ms = embeddings, ms
+        cosine = np.sum(embeddings * reference, axis=1)
+        print(f"{backend:<10} {ms:>8.2f} {reference_ms / ms:>7.2f}x {cosine.min():>8.4f} {cosine.mean():>9.4f}")
+
+
+def _entity_set(entities: List[Dict]) -> Set[Tuple[str, str]]:
+    return {(e["word"].strip().lower(), e["entity_group"]) for e in entities}
+
+
+def benchmark_ner(model_name: str, texts: List[str], backends: List[str], repeat: int) -> None:
+    """Compare NER latency and entity parity across backends."""
+    print(f"\nNER: {model_name}")
+    print(f"{'backend':<10} {'ms/text':>8} {'speedup':>8} {'entity F1':>10}")
+
+    reference = None
+    reference_ms = None
+    for backend in backends:
+        ner, loaded = load_ner_pipeline(model_name, backend)
+        if ner is None or loaded != backend:
+            print(f"{backend:<10} unavailable")
+            continue
+
+        ner(texts[0])  # warm-up
+        start = time.perf_counter()
+        for _ in range(repeat):
+            outputs = [_entity_set(ner(text)) for text in texts]
+        ms = (time.perf_counter() - start) * 1000 / (repeat * len(texts))
+
+        if reference is None:
+            reference, reference_ms = outputs, ms
+        true_positive = sum(len(a & b) for a, b in zip(outputs, reference))
+        predicted = sum(len(a) for a in outputs)
+        expected = sum(len(b) for b in reference)
+        f1 = 2 * true_positive / (predicted + expected) if predicted + expected else 1.0
+        print(f"{backend:<10} {ms:>8.2f} {reference_ms / ms:>7.2f}x {f1:>10.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark inference backends")
+    parser.add_argument("--task", choices=["embed", "ner", "all"], default="all")
+    parser.add_argument("--texts-file", help="File with one text per line")
+    parser.add_argument("--embedding-model", default="all-MiniLM-L6-v2")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes over the texts")
+    parser.add_argument("--backends", nargs="+", default=list(INFERENCE_BACKENDS), choices=INFERENCE_BACKENDS)
+    args = parser.parse_args()
+
+    texts = load_texts(args.texts_file) if args.texts_file else SAMPLE_TEXTS
+    # PyTorch goes first: it is the reference for parity
+    backends = ["torch"] + [b for b in args.backends if b != "torch"]
+
+    if args.task in ("embed", "all"):
+        benchmark_embeddings(args.embedding_model, texts, backends, args.repeat)
+
+    if args.task in ("ner", "all"):
+        for model_name in dict.fromkeys(LANGUAGE_MODELS.values()):
+            benchmark_ner(model_name, texts, backends, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Accuracy and speed benchmark for quantized embedding storage.
+
+Compares float16 and per-vector int8 storage with float32: bytes per
+vector, cosine score error, top-k recall and brute-force scan time.
+Uses real embeddings from an embedding store shard when one is given,
+otherwise synthetic clustered vectors.
+
+Usage:
+    python scripts/benchmark_quantization.py --vectors 50000 --dim 384
+    python scripts/benchmark_quantization.py --shard models_cache/embeddings/all-MiniLM-L6-v2
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analyzers.quantization import (
+    QUANTIZATION_DTYPES,
+    dequantize,
+    dot_scores,
+    measure_quantization_error,
+    quantize,
+)
+
+
+def load_shard(directory: Path) -> np.ndarray:
+    """Read all vectors of an embedding store shard as float32."""
+    meta = json.loads((directory / "meta.json").read_text())
+    dim, dtype = int(meta["dim"]), meta.get("dtype", "float32")
+    codes = np.fromfile(directory / "vectors.bin", dtype=dtype).reshape(-1, dim)
+    scales = None
+    if dtype == "int8":
+        scales = np.fromfile(directory / "scales.bin", dtype=np.float32)[:len(codes)]
+    return dequantize(codes, scales)
+
+
+def synthetic_vectors(n: int, dim: int, seed: int = 0) -> np.ndarray:
+    """Generate clustered vectors resembling sentence embeddings."""
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((max(1, n // 100), dim))
+    labels = rng.integers(0, len(centres), n)
+    return (centres[labels] + 0.5 * rng.standard_normal((n, dim))).astype(np.float32)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark quantized embedding storage")
+    parser.add_argument("--shard", type=Path, help="Embedding store shard directory")
+    parser.add_argument("--vectors", type=int, default=20000, help="Synthetic vector count")
+    parser.add_argument("--dim", type=int, default=384, help="Synthetic vector dimension")
+    parser.add_argument("--queries", type=int, default=100, help="Number of queries")
+    parser.add_argument("--k", type=int, default=10, help="Top-k cut-off for recall")
+    args = parser.parse_args()
+
+    vectors = load_shard(args.shard) if args.shard else synthetic_vectors(args.vectors, args.dim)
+    rng = np.random.default_rng(1)
+    queries = vectors[rng.choice(len(vectors), min(args.queries, len(vectors)), replace=False)]
+    queries = queries + 0.1 * rng.standard_normal(queries.shape).astype(np.float32)
+
+    print(f"{len(vectors)} vectors, dim={vectors.shape[1]}, {len(queries)} queries, k={args.k}")
+    report = measure_quantization_error(vectors, queries, k=args.k)
+
+    normalized = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+    print(f"{'dtype':<8} {'bytes/vec':>10} {'ratio':>6} {'max err':>9} {'mean err':>9} {'recall':>7} {'scan ms':>8}")
+    for dtype in QUANTIZATION_DTYPES:
+        codes, scales = quantize(normalized, dtype)
+        start = time.perf_counter()
+        for query in queries:
+            dot_scores(codes, scales, query)
+        scan_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        r = report[dtype]
+        print(
+            f"{dtype:<8} {r['bytes_per_vector']:>10} {r['compression']:>6.2f} "
+            f"{r['max_abs_error']:>9.5f} {r['mean_abs_error']:>9.6f} "
+            f"{r['recall_at_k']:>7.3f} {scan_ms:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Latency and parity benchmark for compiled ranking-model inference.
+
+Trains a random forest like RankingModel.train() on synthetic ranking
+features, then scores 1, 100 and 10k rows with scikit-learn
+(scaler.transform + predict_proba) and with the compiled NumPy forest,
+reporting ms per call, speedup and the largest probability difference.
+
+Usage:
+    python scripts/benchmark_ranking_model.py
+    python scripts/benchmark_ranking_model.py --rows 1 100 10000 --trees 100 --repeat 20
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Callable
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analyzers.compiled_forest import CompiledForest
+from analyzers.ranking_service import RankingFeatures
+
+
+def synthetic_features(n: int, seed: int = 0) -> np.ndarray:
+    """Generate feature rows resembling RankingFeatures output."""
+    rng = np.random.default_rng(seed)
+    X = rng.random((n, len(RankingFeatures.FEATURE_NAMES)))
+    X[:, 5] = rng.integers(0, 240, n)  # experience months
+    return X
+
+
+def time_ms(fn: Callable[[], object], repeat: int) -> float:
+    """Mean wall time of fn() in milliseconds, after one warm-up call."""
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark compiled ranking-model inference")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1, 100, 10000], help="Rows per call")
+    parser.add_argument("--trees", type=int, default=100, help="Trees in the forest")
+    parser.add_argument("--max-depth", type=int, default=10, help="Maximum tree depth")
+    parser.add_argument("--train", type=int, default=5000, help="Training rows")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per row count")
+    args = parser.parse_args()
+
+    X_train = synthetic_features(args.train)
+    noise = 0.3 * np.random.default_rng(1).standard_normal(len(X_train))
+    y_train = (X_train[:, 0] + X_train[:, 4] + noise > 1).astype(np.int64)
+
+    # Same settings as RankingModel.train(); one job, as when scoring a request
+    scaler = StandardScaler().fit(X_train)
+    forest = RandomForestClassifier(n_estimators=args.trees, max_depth=args.max_depth, random_state=42)
+    forest.fit(scaler.transform(X_train), y_train)
+    compiled = CompiledForest.from_model(forest, scaler)
+
+    print(f"{args.trees} trees, max depth {compiled.max_depth}, {compiled.n_nodes} nodes")
+    print(f"{'rows':>7} {'sklearn ms':>11} {'compiled ms':>12} {'speedup':>8} {'max diff':>9}")
+    for n in args.rows:
+        X = synthetic_features(n, seed=2)
+        expected = forest.predict_proba(scaler.transform(X))
+        max_diff = float(np.abs(compiled.predict_proba(X) - expected).max())
+
+        sklearn_ms = time_ms(lambda: forest.predict_proba(scaler.transform(X)), args.repeat)
+        compiled_ms = time_ms(lambda: compiled.predict_proba(X), args.repeat)
+        print(f"{n:>7} {sklearn_ms:>11.3f} {compiled_ms:>12.3f} {sklearn_ms / compiled_ms:>7.1f}x {max_diff:>9.1e}")
+
+
+if __name__ == "__main__":
+    main()
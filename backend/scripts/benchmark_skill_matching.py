@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark of bulk skill matching against per-skill matching.
+
+Compares EnhancedSkillMatcher.match_multiple with calling
+match_with_context once per required skill, on generated vacancies of
+10, 50 and 200 required skills drawn from the synonyms taxonomy (with
+synonyms, typos and unknown skills mixed in), and checks that both give
+identical results.
+
+Usage:
+    python scripts/benchmark_skill_matching.py
+    python scripts/benchmark_skill_matching.py --sizes 10 50 200 --resume-skills 40 --repeat 20
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analyzers.enhanced_matcher import EnhancedSkillMatcher
+
+
+def make_skills(matcher: EnhancedSkillMatcher, rng: random.Random, count: int) -> List[str]:
+    """Draw skills from the taxonomy, with synonyms, typos and unknown names."""
+    synonyms_map = matcher.load_synonyms()
+    canonical_names = sorted(synonyms_map)
+    skills = []
+    for i in range(count):
+        name = rng.choice(canonical_names)
+        roll = rng.random()
+        if roll < 0.3:
+            name = rng.choice(sorted(synonyms_map[name]))
+        elif roll < 0.4 and len(name) > 4:
+            cut = rng.randrange(len(name))
+            name = name[:cut] + name[cut + 1:]
+        elif roll < 0.5:
+            name = f"Unknown Skill {i}"
+        skills.append(name)
+    return skills
+
+
+def time_call(fn: Callable[[], object], repeat: int) -> float:
+    """Best wall time of fn in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(sizes: List[int], resume_size: int, repeat: int, seed: int) -> List[Tuple[int, float, float]]:
+    """Benchmark each vacancy size and check parity."""
+    matcher = EnhancedSkillMatcher()
+    rng = random.Random(seed)
+    resume_skills = make_skills(matcher, rng, resume_size)
+
+    print(f"{'required':>8} {'per-skill ms':>13} {'bulk ms':>9} {'speedup':>8}")
+    rows = []
+    for size in sizes:
+        required_skills = make_skills(matcher, rng, size)
+
+        def per_skill():
+            return {
+                skill: matcher.match_with_context(resume_skills, skill)
+                for skill in required_skills
+            }
+
+        def bulk():
+            return matcher.match_multiple(resume_skills, required_skills)
+
+        if per_skill() != bulk():
+            raise SystemExit(f"Results differ for {size} required skills")
+
+        per_skill_ms = time_call(per_skill, repeat)
+        bulk_ms = time_call(bulk, repeat)
+        rows.append((size, per_skill_ms, bulk_ms))
+        print(f"{size:>8} {per_skill_ms:>13.2f} {bulk_ms:>9.2f} {per_skill_ms / bulk_ms:>7.1f}x")
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark bulk skill matching")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--resume-skills", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    run(args.sizes, args.resume_skills, args.repeat, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Backfill the resume retrieval index.
+
+Encodes every completed resume that has extracted text and adds it to the
+ANN index used for vacancy shortlisting. New resumes are indexed by the
+analysis task automatically; run this once after enabling the index or
+after changing the sentence-transformers model.
+
+Usage:
+    python scripts/build_resume_index.py --batch-size 256
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select
+
+from analyzers.resume_retrieval import get_resume_retriever
+from database import async_session_maker
+from models.resume import Resume
+
+
+async def build_index(batch_size: int) -> None:
+    """Index all completed resumes in batches."""
+    retriever = get_resume_retriever()
+    if retriever is None:
+        print("Resume index is disabled or sentence-transformers is not installed")
+        return
+
+    start_time = time.time()
+    indexed = 0
+    offset = 0
+
+    async with async_session_maker() as db:
+        while True:
+            result = await db.execute(
+                select(Resume.id, Resume.raw_text)
+                .where(Resume.status == "COMPLETED", Resume.raw_text.isnot(None))
+                .order_by(Resume.id)
+                .offset(offset)
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                break
+
+            indexed += retriever.index_resumes([(str(row.id), row.raw_text) for row in rows])
+            offset += len(rows)
+            print(f"Indexed {indexed}/{offset} resumes")
+
+    retriever.index.compact()
+    print(f"Done: {indexed} resumes in {time.time() - start_time:.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill the resume retrieval index")
+    parser.add_argument("--batch-size", type=int, default=256, help="Resumes encoded per batch")
+    args = parser.parse_args()
+
+    asyncio.run(build_index(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Backfill the corpus-level TF-IDF index.
+
+Adds every completed resume and every vacancy to the TF-IDF corpus used
+for IDF weights and sparse batch scoring. New and updated documents are
+indexed by the analysis task and the vacancy API automatically; run this
+once after enabling the corpus.
+
+Usage:
+    python scripts/build_tfidf_corpus.py --batch-size 500
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select
+
+from analyzers.tfidf_corpus import compose_vacancy_text, get_corpus_tfidf
+from database import async_session_maker
+from models.job_vacancy import JobVacancy
+from models.resume import Resume
+
+
+async def build_corpus(batch_size: int) -> None:
+    """Index all completed resumes and all vacancies in batches."""
+    corpus = get_corpus_tfidf()
+    if corpus is None:
+        print("Corpus TF-IDF is disabled")
+        return
+
+    start_time = time.time()
+
+    async with async_session_maker() as db:
+        for kind, query in (
+            (
+                "resume",
+                select(Resume.id, Resume.raw_text)
+                .where(Resume.status == "COMPLETED", Resume.raw_text.isnot(None))
+                .order_by(Resume.id),
+            ),
+            (
+                "vacancy",
+                select(JobVacancy.id, JobVacancy.title, JobVacancy.description, JobVacancy.required_skills)
+                .order_by(JobVacancy.id),
+            ),
+        ):
+            indexed = 0
+            offset = 0
+            while True:
+                result = await db.execute(query.offset(offset).limit(batch_size))
+                rows = result.all()
+                if not rows:
+                    break
+
+                if kind == "resume":
+                    items = [(str(row.id), row.raw_text) for row in rows]
+                else:
+                    items = [
+                        (str(row.id), compose_vacancy_text(row.title, row.description, row.required_skills))
+                        for row in rows
+                    ]
+                indexed += corpus.add_documents(kind, items)
+                offset += len(rows)
+                print(f"Indexed {indexed}/{offset} {kind} documents")
+
+    corpus.compact()
+    print(f"Done: {len(corpus)} documents in {time.time() - start_time:.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill the corpus TF-IDF index")
+    parser.add_argument("--batch-size", type=int, default=500, help="Documents added per batch")
+    args = parser.parse_args()
+
+    asyncio.run(build_corpus(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,9 @@ from .learning_tasks import (
     review_and_activate_synonyms,
     periodic_feedback_aggregation,
     retrain_skill_matching_model,
+    update_ranking_model_incremental,
 )
+from .ranking_tasks import rank_vacancy_candidates
 from .report_generation import (
     generate_scheduled_reports,
     process_all_pending_reports,
@@ -24,6 +26,8 @@ __all__ = [
     "review_and_activate_synonyms",
     "periodic_feedback_aggregation",
     "retrain_skill_matching_model",
+    "update_ranking_model_incremental",
+    "rank_vacancy_candidates",
     "generate_scheduled_reports",
     "process_all_pending_reports",
 ]
@@ -55,7 +55,9 @@ from analyzers import (
     format_experience_summary,
     detect_resume_errors,
     extract_work_experience,
+    get_resume_retriever,
 )
+from analyzers.tfidf_corpus import index_corpus_document
 from config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -263,6 +265,17 @@ def analyze_resume_core(
             except Exception as e:
                 logger.warning(f"Error detection failed: {e}")
 
+        # Keep the vacancy shortlisting index in sync with analyzed resumes
+        try:
+            retriever = get_resume_retriever()
+            if retriever is not None:
+                retriever.index_resume(resume_id, resume_text)
+        except Exception as e:
+            logger.warning(f"Failed to index resume {resume_id} for retrieval: {e}")
+
+        # Keep corpus-level TF-IDF statistics up to date
+        index_corpus_document("resume", resume_id, resume_text)
+
         processing_time_ms = round((time.time() - start_time) * 1000, 2)
 
         result = {
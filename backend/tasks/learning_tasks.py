@@ -3,8 +3,10 @@ ML learning tasks for skill synonym discovery and model improvement.
 
 This module provides Celery tasks for processing recruiter feedback,
 aggregating corrections, and generating new synonym candidates to improve
-matching accuracy over time.
+matching accuracy over time, and for incrementally updating the candidate
+ranking model from ranking feedback.
 """
+import asyncio
 import logging
 import time
 from collections import defaultdict
@@ -808,3 +810,94 @@ def retrain_skill_matching_model(
             "error": str(e),
             "processing_time_ms": round((time.time() - start_time) * 1000, 2),
         }
+
+
+async def _update_ranking_model(**kwargs: Any) -> Dict[str, Any]:
+    """Update the online ranking model in a fresh database session."""
+    from analyzers.incremental_ranking import update_ranking_model
+    from database import async_session_maker, engine
+
+    try:
+        async with async_session_maker() as db:
+            return await update_ranking_model(db, **kwargs)
+    finally:
+        # Pooled connections belong to this event loop; the next task runs a new one
+        await engine.dispose()
+
+
+@shared_task(
+    name="tasks.learning_tasks.update_ranking_model_incremental",
+    bind=True,
+    max_retries=1,
+    default_retry_delay=300,
+)
+def update_ranking_model_incremental(
+    self,
+    max_samples: int = 5000,
+    min_samples: int = 50,
+    auto_activate: bool = True,
+) -> Dict[str, Any]:
+    """
+    Update the candidate ranking model with new recruiter feedback.
+
+    Reads only the ranking feedback submitted since the last run's
+    checkpoint, updates the online ("sgd") ranking model with it,
+    evaluates the result on the newest feedback held out from training
+    and publishes it as a new model version. The version is activated
+    only if it does no worse than the active one on that holdout.
+
+    Args:
+        self: Celery task instance (bind=True)
+        max_samples: Maximum feedback rows consumed per run (default: 5000)
+        min_samples: Minimum new labeled feedback for a new version (default: 50)
+        auto_activate: Whether a version passing evaluation is activated (default: True)
+
+    Returns:
+        Dictionary containing update results:
+        - samples: New labeled feedback read
+        - training_samples / holdout_samples: How they were split
+        - version: Published model version
+        - is_active: Whether the version was activated
+        - metrics: Holdout metrics, with the active version's log loss
+        - backlog: Whether more feedback is waiting than max_samples
+        - processing_time_ms: Total processing time
+        - status: Task status (completed/skipped/failed)
+
+    Example:
+        >>> # Scheduled via Celery beat, e.g. hourly:
+        >>> # 'ranking-model-update': {
+        >>> #     'task': 'tasks.learning_tasks.update_ranking_model_incremental',
+        >>> #     'schedule': crontab(minute=15),
+        >>> # }
+    """
+    start_time = time.time()
+    logger.info(f"Task {self.request.id}: updating ranking model from new feedback")
+
+    try:
+        result = asyncio.run(_update_ranking_model(
+            max_samples=max_samples,
+            min_samples=min_samples,
+            activate=auto_activate,
+        ))
+        result["processing_time_ms"] = round((time.time() - start_time) * 1000, 2)
+
+        if result.get("status") == "completed" and result.get("backlog"):
+            # More feedback waiting: continue from the new checkpoint right away
+            update_ranking_model_incremental.delay(max_samples, min_samples, auto_activate)
+        return result
+
+    except SoftTimeLimitExceeded:
+        logger.error(f"Task {self.request.id} exceeded time limit")
+        return {
+            "status": "failed",
+            "error": "Ranking model update exceeded maximum time limit",
+            "processing_time_ms": round((time.time() - start_time) * 1000, 2),
+        }
+
+    except Exception as e:
+        logger.error(f"Error in ranking model update: {e}", exc_info=True)
+        return {
+            "status": "failed",
+            "error": str(e),
+            "processing_time_ms": round((time.time() - start_time) * 1000, 2),
+        }
@@ -0,0 +1,87 @@
+"""
+Candidate ranking tasks.
+
+This module provides Celery tasks that rank candidate pools for a vacancy
+outside the API process. Large pools are sharded across the parallel
+ranking pool when the worker can start one (solo or threads pool);
+prefork children rank in-process.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Dict
+from uuid import UUID
+
+from celery import shared_task
+from celery.exceptions import SoftTimeLimitExceeded
+
+logger = logging.getLogger(__name__)
+
+
+async def _rank_vacancy(vacancy_id: UUID, limit: int) -> list:
+    """Rank candidates for a vacancy in a fresh database session."""
+    from analyzers.ranking_service import get_ranking_service
+    from database import async_session_maker, engine
+
+    try:
+        async with async_session_maker() as db:
+            return await get_ranking_service().rank_candidates_for_vacancy(db, vacancy_id, limit=limit)
+    finally:
+        # Pooled connections belong to this event loop; the next task runs a new one
+        await engine.dispose()
+
+
+@shared_task(
+    name="tasks.ranking_tasks.rank_vacancy_candidates",
+    bind=True,
+    max_retries=1,
+    default_retry_delay=60,
+)
+def rank_vacancy_candidates(self, vacancy_id: str, limit: int = 50) -> Dict[str, Any]:
+    """
+    Rank candidates for a vacancy and store their CandidateRank records.
+
+    Args:
+        self: Celery task instance (bind=True)
+        vacancy_id: JobVacancy UUID
+        limit: Maximum number of candidates to return
+
+    Returns:
+        Dictionary with status, the ranked candidates and processing time
+
+    Example:
+        >>> from tasks import rank_vacancy_candidates
+        >>> task = rank_vacancy_candidates.delay("5f0c...", limit=20)
+        >>> task.get()["total"]
+        20
+    """
+    start_time = time.time()
+    logger.info(f"Ranking candidates for vacancy {vacancy_id}")
+
+    try:
+        rankings = asyncio.run(_rank_vacancy(UUID(vacancy_id), limit))
+        return {
+            "vacancy_id": vacancy_id,
+            "status": "completed",
+            "total": len(rankings),
+            "rankings": rankings,
+            "processing_time_ms": round((time.time() - start_time) * 1000, 2),
+        }
+
+    except SoftTimeLimitExceeded:
+        logger.error(f"Ranking for vacancy {vacancy_id} exceeded time limit")
+        return {
+            "vacancy_id": vacancy_id,
+            "status": "failed",
+            "error": "Ranking exceeded time limit",
+            "processing_time_ms": round((time.time() - start_time) * 1000, 2),
+        }
+
+    except Exception as e:
+        logger.error(f"Ranking for vacancy {vacancy_id} failed: {e}", exc_info=True)
+        return {
+            "vacancy_id": vacancy_id,
+            "status": "failed",
+            "error": str(e),
+            "processing_time_ms": round((time.time() - start_time) * 1000, 2),
+        }
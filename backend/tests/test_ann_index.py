@@ -0,0 +1,142 @@
+"""
+Tests for the IVF-flat ANN index and the persistent resume index.
+
+Tests cover exact search before training, recall after training,
+insert/replace/delete, snapshot round-trips, journal sharing between
+index instances and refreshes racing with compaction.
+"""
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from analyzers.ann_index import IVFFlatIndex
+from analyzers.resume_retrieval import ResumeVectorIndex
+
+
+def _clustered_vectors(n: int, dim: int = 16, n_clusters: int = 20, seed: int = 0) -> np.ndarray:
+    """Generate vectors grouped around random cluster centres."""
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((n_clusters, dim))
+    labels = rng.integers(0, n_clusters, n)
+    return (centres[labels] + 0.3 * rng.standard_normal((n, dim))).astype(np.float32)
+
+
+class TestIVFFlatIndex:
+    """Tests for the in-memory index."""
+
+    def test_empty_search(self):
+        """Test search on an empty index."""
+        assert IVFFlatIndex(dim=4).search(np.ones(4), k=5) == []
+
+    def test_exact_search_before_training(self):
+        """Test that a small index returns exact cosine neighbours."""
+        vectors = _clustered_vectors(50)
+        index = IVFFlatIndex(dim=16)
+        index.add_many([f"r{i}" for i in range(50)], vectors)
+
+        results = index.search(vectors[7], k=3)
+
+        assert not index.is_trained
+        assert results[0][0] == "r7"
+        assert results[0][1] == pytest.approx(1.0, abs=1e-5)
+        assert [s for _, s in results] == sorted((s for _, s in results), reverse=True)
+
+    def test_recall_after_training(self):
+        """Test that IVF search finds most exact top-10 neighbours."""
+        vectors = _clustered_vectors(2000)
+        index = IVFFlatIndex(dim=16, nprobe=8, min_train_size=500)
+        index.add_many([str(i) for i in range(2000)], vectors)
+        assert index.is_trained
+
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        queries = _clustered_vectors(20, seed=1)
+        found = 0
+        for query in queries:
+            exact = np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:10]
+            approx = {item_id for item_id, _ in index.search(query, k=10)}
+            found += len({str(i) for i in exact} & approx)
+
+        assert found / (len(queries) * 10) >= 0.9
+
+    def test_replace_and_remove(self):
+        """Test that re-adding replaces a vector and removal hides it."""
+        index = IVFFlatIndex(dim=2)
+        index.add_many(["a", "b", "c"], np.array([[1, 0], [0, 1], [1, 1]], dtype=np.float32))
+
+        index.add("a", np.array([0, 1], dtype=np.float32))
+        assert len(index) == 3
+        np.testing.assert_allclose(index.get_vector("a"), [0, 1])
+
+        assert index.remove("b")
+        assert not index.remove("b")
+        assert "b" not in index
+        assert {item_id for item_id, _ in index.search(np.array([0, 1]), k=5)} == {"a", "c"}
+
+    def test_save_and_load(self, tmp_path):
+        """Test that a trained index survives a round-trip to disk."""
+        vectors = _clustered_vectors(600)
+        index = IVFFlatIndex(dim=16, min_train_size=500)
+        index.add_many([str(i) for i in range(600)], vectors)
+
+        index.save(tmp_path / "index.npz")
+        loaded = IVFFlatIndex.load(tmp_path / "index.npz")
+
+        assert loaded.is_trained
+        assert loaded.search(vectors[3], k=5) == index.search(vectors[3], k=5)
+
+
+class TestResumeVectorIndex:
+    """Tests for the journaled on-disk index."""
+
+    def test_changes_visible_to_other_instance(self, tmp_path):
+        """Test that a second process sees inserts and deletes via the journal."""
+        writer = ResumeVectorIndex(tmp_path)
+        reader = ResumeVectorIndex(tmp_path)
+
+        writer.add_many(["r1", "r2"], np.eye(2, 4, dtype=np.float32))
+        assert reader.search(np.array([1, 0, 0, 0]), k=1)[0][0] == "r1"
+
+        writer.remove("r1")
+        assert [item_id for item_id, _ in reader.search(np.array([1, 0, 0, 0]), k=5)] == ["r2"]
+
+    def test_compaction(self, tmp_path):
+        """Test that compaction writes a snapshot that new instances load."""
+        index = ResumeVectorIndex(tmp_path, compact_every=3)
+        reader = ResumeVectorIndex(tmp_path)
+        for i in range(4):
+            index.add(f"r{i}", np.eye(4, dtype=np.float32)[i])
+
+        assert (tmp_path / "CURRENT").read_text() == "1"
+        assert not (tmp_path / "journal-0.jsonl").exists()
+        assert len(reader) == 4
+        assert len(ResumeVectorIndex(tmp_path)) == 4
+
+    def test_refresh_follows_concurrent_compaction(self, tmp_path):
+        """Test that a reader whose generation is deleted mid-refresh loads the new one."""
+        writer = ResumeVectorIndex(tmp_path, compact_every=3)
+        reader = ResumeVectorIndex(tmp_path)
+        writer.add("r0", np.eye(4, dtype=np.float32)[0])
+        assert len(reader) == 1
+
+        for i in range(1, 4):
+            writer.add(f"r{i}", np.eye(4, dtype=np.float32)[i])
+
+        # CURRENT read just before the compaction replaced generation 0
+        with patch.object(reader, "_read_generation", side_effect=[0, 1, 1]):
+            reader.refresh()
+
+        assert len(reader) == 4
+
+    def test_missing_snapshot_keeps_loaded_data(self, tmp_path):
+        """Test that a vanished snapshot never empties the index."""
+        writer = ResumeVectorIndex(tmp_path, compact_every=2)
+        for i in range(2):
+            writer.add(f"r{i}", np.eye(4, dtype=np.float32)[i])
+        reader = ResumeVectorIndex(tmp_path)
+        (tmp_path / "index-1.npz").unlink()
+        (tmp_path / "CURRENT").write_text("2")
+
+        reader.refresh()
+
+        assert len(reader) == 2
@@ -0,0 +1,180 @@
+"""
+Tests for the compiled random-forest ranking model.
+
+Tests cover parity with scikit-learn's predict_proba() and predict(),
+saving and loading the compiled arrays, and how RankingModel produces
+and uses them.
+"""
+import pickle
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+from analyzers import compiled_forest, ranking_service
+from analyzers.compiled_forest import CompiledForest, compile_ranking_model
+from analyzers.ranking_service import RankingFeatures, RankingModel
+
+N_FEATURES = len(RankingFeatures.FEATURE_NAMES)
+
+
+def fitted_forest(n_classes=2):
+    """Forest and scaler fitted on synthetic ranking features."""
+    rng = np.random.default_rng(0)
+    X = rng.random((300, N_FEATURES))
+    X[:, 5] = rng.integers(0, 240, len(X))  # experience months, far from unit scale
+    y = np.digitize(X[:, 0] + X[:, 4] + 0.2 * rng.standard_normal(len(X)), np.linspace(0.5, 1.5, n_classes - 1))
+    scaler = StandardScaler().fit(X)
+    forest = RandomForestClassifier(n_estimators=25, max_depth=8, random_state=0)
+    forest.fit(scaler.transform(X), y)
+    return forest, scaler
+
+
+@pytest.fixture
+def rows():
+    """Rows to score, on the same scales as the training features."""
+    rng = np.random.default_rng(1)
+    X = rng.random((500, N_FEATURES))
+    X[:, 5] = rng.integers(0, 240, len(X))
+    return X
+
+
+class TestParity:
+    """Tests that compiled predictions equal scikit-learn's."""
+
+    @pytest.mark.parametrize("n_classes", [2, 3])
+    def test_predict_proba(self, rows, n_classes):
+        """Test that probabilities match sklearn for every row."""
+        forest, scaler = fitted_forest(n_classes)
+        compiled = CompiledForest.from_model(forest, scaler)
+
+        expected = forest.predict_proba(scaler.transform(rows))
+
+        np.testing.assert_allclose(compiled.predict_proba(rows), expected, rtol=0, atol=1e-12)
+        np.testing.assert_array_equal(compiled.predict(rows), forest.predict(scaler.transform(rows)))
+
+    def test_unbounded_depth(self, rows):
+        """Test parity for fully grown trees of uneven depth."""
+        scaler = StandardScaler().fit(rows)
+        forest = RandomForestClassifier(n_estimators=10, random_state=0)
+        forest.fit(scaler.transform(rows), (rows[:, 0] + rows[:, 1] > 1).astype(int))
+        compiled = CompiledForest.from_model(forest, scaler)
+
+        assert compiled.max_depth == max(e.tree_.max_depth for e in forest.estimators_)
+        np.testing.assert_allclose(
+            compiled.predict_proba(rows), forest.predict_proba(scaler.transform(rows)), rtol=0, atol=1e-12
+        )
+
+    def test_blocks(self, rows):
+        """Test that scoring in row blocks gives the unblocked result."""
+        forest, scaler = fitted_forest()
+        compiled = CompiledForest.from_model(forest, scaler)
+        expected = compiled.predict_proba(rows)
+
+        with patch.object(compiled_forest, "PREDICT_BLOCK_ROWS", 7):
+            np.testing.assert_array_equal(compiled.predict_proba(rows), expected)
+
+    def test_empty_matrix(self):
+        """Test that an empty matrix gives no rows."""
+        compiled = CompiledForest.from_model(*fitted_forest())
+
+        assert compiled.predict_proba(np.zeros((0, N_FEATURES))).shape == (0, 2)
+
+
+class TestCompile:
+    """Tests for producing, saving and loading compiled forests."""
+
+    def test_save_load_roundtrip(self, rows, tmp_path):
+        """Test that a loaded forest predicts like the saved one."""
+        compiled = CompiledForest.from_model(*fitted_forest())
+        compiled.save(tmp_path / "forest")
+
+        loaded = CompiledForest.load(tmp_path / "forest")
+
+        np.testing.assert_array_equal(loaded.predict_proba(rows), compiled.predict_proba(rows))
+        assert loaded.max_depth == compiled.max_depth
+        # Arrays are mapped read-only, not copied
+        assert isinstance(loaded.value, np.memmap)
+        assert not loaded.value.flags.writeable
+
+    def test_matches(self):
+        """Test that a compiled forest recognizes the forest it came from."""
+        forest, scaler = fitted_forest()
+        other, _ = fitted_forest(n_classes=3)
+
+        compiled = CompiledForest.from_model(forest, scaler)
+
+        assert compiled.matches(forest)
+        assert not compiled.matches(other)
+
+    def test_unsupported_model(self):
+        """Test that models other than forests have no compiled form."""
+        X = np.random.default_rng(0).random((40, N_FEATURES))
+        model = GradientBoostingClassifier(n_estimators=5).fit(X, X[:, 0] > 0.5)
+
+        assert compile_ranking_model(model, StandardScaler().fit(X)) is None
+
+
+class TestRankingModel:
+    """Tests for RankingModel with a compiled forest."""
+
+    @pytest.fixture
+    def models_dir(self, tmp_path):
+        with patch.object(ranking_service, "MODELS_DIR", tmp_path):
+            yield tmp_path
+
+    @pytest.fixture
+    def training_data(self):
+        rng = np.random.default_rng(0)
+        X = rng.random((80, N_FEATURES))
+        return X, (X[:, 0] + X[:, 4] > 1).astype(np.int64)
+
+    def test_saved_and_loaded(self, models_dir, training_data, rows):
+        """Test that training saves the compiled form and loading uses it."""
+        trained = RankingModel()
+        trained.train(*training_data)
+
+        assert (models_dir / "random_forest" / trained.version / "compiled").is_dir()
+        with patch.object(CompiledForest, "from_model") as from_model:
+            loaded = RankingModel()
+        from_model.assert_not_called()
+        np.testing.assert_array_equal(loaded.predict_batch(rows)[0], trained.predict_batch(rows)[0])
+
+    def test_matches_sklearn(self, models_dir, training_data, rows):
+        """Test that batch scores equal sklearn on the scaled features."""
+        model = RankingModel()
+        model.train(*training_data)
+
+        scores, predictions, confidences = model.predict_batch(rows)
+
+        proba = model.model.predict_proba(model.scaler.transform(rows))
+        np.testing.assert_allclose(scores, proba[:, 1], rtol=0, atol=1e-12)
+        np.testing.assert_array_equal(predictions, model.model.predict(model.scaler.transform(rows)))
+        np.testing.assert_allclose(confidences, proba.max(axis=1), rtol=0, atol=1e-12)
+
+    def test_legacy_pickle_compiled_on_load(self, models_dir, training_data):
+        """Test that models pickled before versioned artifacts are compiled on load."""
+        X, y = training_data
+        scaler = StandardScaler().fit(X)
+        forest = RandomForestClassifier(n_estimators=5, random_state=0).fit(scaler.transform(X), y)
+        with open(models_dir / "ranking_random_forest_model.pkl", "wb") as f:
+            pickle.dump(forest, f)
+        with open(models_dir / "ranking_random_forest_scaler.pkl", "wb") as f:
+            pickle.dump(scaler, f)
+
+        model = RankingModel()
+
+        assert model.is_trained
+        assert model.compiled is not None and model.compiled.matches(forest)
+
+    def test_gradient_boosting_uses_sklearn(self, models_dir, training_data, rows):
+        """Test that models without a compiled form still score through sklearn."""
+        model = RankingModel(model_type="gradient_boosting")
+        model.train(*training_data)
+
+        scores, _, _ = model.predict_batch(rows)
+
+        assert model.compiled is None
+        np.testing.assert_allclose(scores, model.model.predict_proba(model.scaler.transform(rows))[:, 1])
@@ -0,0 +1,91 @@
+"""
+Tests for the persistent embedding store.
+
+Tests cover content addressing, persistence across store instances,
+per-model isolation and deduplication of repeated writes.
+"""
+import numpy as np
+import pytest
+
+from analyzers.embedding_store import EmbeddingStore
+
+
+class TestTextKey:
+    """Tests for text normalization and hashing."""
+
+    def test_whitespace_is_normalized(self):
+        """Test that different whitespace maps to the same key."""
+        assert EmbeddingStore.text_key("Senior  Python\ndeveloper ") == \
+            EmbeddingStore.text_key("Senior Python developer")
+
+    def test_case_is_preserved(self):
+        """Test that case differences produce different keys."""
+        assert EmbeddingStore.text_key("Python") != EmbeddingStore.text_key("python")
+
+
+class TestEmbeddingStore:
+    """Tests for storing and retrieving embeddings."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create a store in a temporary directory."""
+        return EmbeddingStore(tmp_path / "embeddings")
+
+    def test_miss_returns_none(self, store):
+        """Test lookup of a text that was never stored."""
+        assert store.get("all-MiniLM-L6-v2", "unknown text") is None
+        assert store.get_stats()["misses"] == 1
+
+    def test_put_and_get(self, store):
+        """Test round-trip of a single embedding."""
+        vector = np.arange(8, dtype=np.float32)
+        store.put("all-MiniLM-L6-v2", "React developer", vector)
+
+        result = store.get("all-MiniLM-L6-v2", "React   developer")
+        assert result is not None
+        np.testing.assert_array_equal(result, vector)
+        assert store.get_stats()["hits"] == 1
+
+    def test_persists_across_instances(self, store, tmp_path):
+        """Test that a second store instance sees entries from the first."""
+        vectors = np.random.rand(3, 4).astype(np.float32)
+        store.put_many("model-a", ["a", "b", "c"], vectors)
+
+        reopened = EmbeddingStore(tmp_path / "embeddings")
+        results = reopened.get_many("model-a", ["c", "a", "missing"])
+
+        np.testing.assert_array_equal(results[0], vectors[2])
+        np.testing.assert_array_equal(results[1], vectors[0])
+        assert results[2] is None
+
+    def test_sees_rows_appended_by_other_instance(self, store, tmp_path):
+        """Test that rows written by another process become visible."""
+        store.put("model-a", "first", np.ones(4, dtype=np.float32))
+        assert store.get("model-a", "second") is None
+
+        other = EmbeddingStore(tmp_path / "embeddings")
+        other.put("model-a", "second", np.full(4, 2.0, dtype=np.float32))
+
+        np.testing.assert_array_equal(store.get("model-a", "second"), np.full(4, 2.0))
+
+    def test_models_are_isolated(self, store):
+        """Test that the same text is stored separately per model."""
+        store.put("sentence-transformers/all-MiniLM-L6-v2", "text", np.ones(4))
+        assert store.get("all-mpnet-base-v2", "text") is None
+
+    def test_duplicate_puts_are_skipped(self, store):
+        """Test that re-storing a text does not append a new row."""
+        store.put("model-a", "text", np.ones(4))
+        store.put("model-a", "text", np.zeros(4))
+        store.put_many("model-a", ["text", "text"], np.zeros((2, 4)))
+
+        assert store.count("model-a") == 1
+        np.testing.assert_array_equal(store.get("model-a", "text"), np.ones(4))
+
+    def test_dimension_mismatch_is_not_stored(self, store):
+        """Test that vectors with a different dimension are rejected."""
+        store.put("model-a", "text", np.ones(4))
+        store.put("model-a", "other", np.ones(8))
+
+        assert store.get("model-a", "other") is None
+        assert store.count("model-a") == 1
@@ -0,0 +1,99 @@
+"""
+Tests for the cross-request embedding micro-batcher.
+
+A synchronous fake encoder records the batches it receives, so the tests
+cover batching across concurrent callers, the wait deadline, per-caller
+results, error propagation and metrics.
+"""
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from analyzers.encoder_batcher import EmbeddingBatcher
+
+
+class RecordingEncoder:
+    """Encode each text as [len(text)] and remember every call."""
+
+    def __init__(self, fail: bool = False):
+        self.calls = []
+        self.threads = []
+        self.fail = fail
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        self.threads.append(threading.current_thread().name)
+        if self.fail:
+            raise RuntimeError("model crashed")
+        return [np.array([float(len(t))]) for t in texts]
+
+
+class TestEmbeddingBatcher:
+    """Tests for EmbeddingBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_a_batch(self):
+        """Test that texts from concurrent callers go into one model call."""
+        encoder = RecordingEncoder()
+        batcher = EmbeddingBatcher(encoder, max_batch_size=16, max_wait_ms=50)
+
+        results = await asyncio.gather(*(batcher.encode(["a" * i, "job"]) for i in range(1, 6)))
+
+        assert len(encoder.calls) == 1
+        assert [r[0][0] for r in results] == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert all(r[1][0] == 3.0 for r in results)
+        # The shared job text is encoded once
+        assert len(encoder.calls[0]) == 6
+        await batcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_batch_size_limit(self):
+        """Test that a full batch is flushed without waiting for the deadline."""
+        encoder = RecordingEncoder()
+        batcher = EmbeddingBatcher(encoder, max_batch_size=4, max_wait_ms=10_000)
+
+        await asyncio.wait_for(batcher.encode([str(i) for i in range(8)]), timeout=2)
+
+        assert [len(call) for call in encoder.calls] == [4, 4]
+        await batcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_flushed_after_wait(self):
+        """Test that a lone request is encoded once max_wait_ms has passed."""
+        encoder = RecordingEncoder()
+        batcher = EmbeddingBatcher(encoder, max_batch_size=32, max_wait_ms=5)
+
+        result = await asyncio.wait_for(batcher.encode(["solo"]), timeout=2)
+
+        assert result[0][0] == 4.0
+        assert encoder.threads[0].startswith("encoder")
+        await batcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_callers(self):
+        """Test that an encoder failure is raised in every waiting caller."""
+        batcher = EmbeddingBatcher(RecordingEncoder(fail=True), max_wait_ms=1)
+
+        with pytest.raises(RuntimeError):
+            await batcher.encode(["text"])
+
+        assert batcher.get_stats()["errors"] == 1
+        await batcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_backpressure_and_stats(self):
+        """Test that a small queue still serves every caller and metrics add up."""
+        encoder = RecordingEncoder()
+        batcher = EmbeddingBatcher(encoder, max_batch_size=3, max_wait_ms=1, max_queue_size=2)
+
+        await asyncio.gather(*(batcher.encode([f"t{i}"]) for i in range(10)))
+        stats = batcher.get_stats()
+
+        assert stats["texts"] == 10
+        assert stats["max_batch_size"] <= 3
+        assert stats["queue_capacity"] == 2
+        assert stats["avg_batch_size"] == pytest.approx(10 / stats["batches"], abs=0.01)
+        assert stats["queue_depth"] == 0
+        await batcher.stop()
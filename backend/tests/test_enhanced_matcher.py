@@ -570,6 +570,52 @@ class TestMatchMultiple:
             assert "matched_as" in result
             assert "match_type" in result
 
+    @pytest.mark.parametrize("context", [None, "web_framework", "database", "language"])
+    def test_identical_to_per_skill_matching(self, context):
+        """Test that bulk matching gives exactly the per-skill results."""
+        matcher = EnhancedSkillMatcher()
+        resume_skills = [
+            "ReactJS", "C/C++", "Python, Django", "PostgreSQL", "Kubernets",
+            "vue.js", "JS", "Node-JS", "reactjs", "SQL & NoSQL",
+        ]
+        required_skills = [
+            "React", "C", "C++", "C#", "Django", "SQL", "Kubernetes", "Vue",
+            "JavaScript", "NodeJS", "NoSQL", "Rust", "", "React",
+        ]
+
+        results = matcher.match_multiple(resume_skills, required_skills, context=context)
+        expected = {
+            skill: matcher.match_with_context(resume_skills, skill, context)
+            for skill in required_skills
+        }
+
+        assert results == expected
+        assert list(results) == list(expected)
+
+    def test_compiled_skills_give_same_results(self):
+        """Test that precompiled required skills give the uncompiled results."""
+        matcher = EnhancedSkillMatcher()
+        resume_skills = ["ReactJS", "C/C++", "PostgreSQL", "Kubernets"]
+        required_skills = ["React", "C", "SQL", "Kubernetes", "Rust", "", "React"]
+
+        compiled = matcher.compile_required_skills(required_skills)
+        results = matcher.match_multiple(
+            resume_skills, required_skills, compiled_skills=compiled
+        )
+
+        assert results == matcher.match_multiple(resume_skills, required_skills)
+
+    def test_compile_required_skills(self):
+        """Test that compiled skills are deduplicated, expanded and cached."""
+        matcher = EnhancedSkillMatcher()
+
+        compiled = matcher.compile_required_skills(["React", "SQL", "C", "React"])
+
+        assert [c.skill for c in compiled] == ["React", "SQL", "C"]
+        assert "postgresql" in compiled[1].variants
+        assert compiled[2].per_skill is True
+        assert matcher.compile_required_skills(["React", "SQL", "C", "React"]) is compiled
+
 
 class TestCalculateMatchPercentage:
     """Tests for calculate_match_percentage method."""
@@ -0,0 +1,98 @@
+"""
+Tests for the bigram fuzzy skill index.
+
+Lookups are checked against the SequenceMatcher scan that
+EnhancedSkillMatcher.find_fuzzy_match used before the index existed.
+"""
+import random
+from difflib import SequenceMatcher
+
+import pytest
+
+from analyzers.enhanced_matcher import EnhancedSkillMatcher
+from analyzers.fuzzy_index import FuzzySkillIndex, get_fuzzy_index
+
+normalize = EnhancedSkillMatcher.normalize_skill_name
+
+
+def _scan_best_match(skills, query, threshold):
+    """Best match as found by the previous linear scan."""
+    best_match, best_similarity = None, 0.0
+    for skill in skills:
+        similarity = SequenceMatcher(None, normalize(skill), normalize(query)).ratio()
+        if similarity >= threshold and similarity > best_similarity:
+            best_match, best_similarity = (skill, similarity), similarity
+    return best_match
+
+
+class TestFuzzySkillIndex:
+    """Tests for FuzzySkillIndex."""
+
+    def test_typo_resolves(self):
+        """Test that a misspelled skill finds the right name."""
+        index = FuzzySkillIndex(["Docker", "Kubernetes", "Kafka"], normalize)
+        skill, similarity = index.best_match("Kubernets")
+        assert skill == "Kubernetes"
+        assert similarity == pytest.approx(SequenceMatcher(None, "kubernetes", "kubernets").ratio())
+
+    def test_no_match_below_threshold(self):
+        """Test that unrelated skills are not returned."""
+        index = FuzzySkillIndex(["Python", "Java"], normalize)
+        assert index.best_match("Kubernetes") is None
+        assert index.search("Kubernetes", threshold=0.5) == []
+
+    def test_search_sorted_and_limited(self):
+        """Test that results are best first and cut at the limit."""
+        index = FuzzySkillIndex(["React", "ReactJS", "React Native", "Redux"], normalize)
+        hits = index.search("React", threshold=0.5)
+        assert hits[0] == ("React", 1.0)
+        assert [score for _, score in hits] == sorted((score for _, score in hits), reverse=True)
+        assert len(index.search("React", threshold=0.5, limit=2)) == 2
+
+    def test_duplicates_keep_first(self):
+        """Test that names normalizing alike are kept under their first spelling."""
+        index = FuzzySkillIndex(["react", "React", " REACT "], normalize)
+        assert len(index) == 1
+        assert index.best_match("React") == ("react", 1.0)
+
+    @pytest.mark.parametrize("threshold", [0.5, 2 / 3, 0.7, 0.9])
+    def test_matches_linear_scan(self, threshold):
+        """Test that random lookups give the same result as a full scan."""
+        rng = random.Random(7)
+        alphabet = "abcde .+#"
+        for _ in range(2000):
+            skills = [
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+                for _ in range(rng.randint(1, 6))
+            ]
+            query = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+            expected = _scan_best_match(skills, query, threshold)
+            assert FuzzySkillIndex(skills, normalize).best_match(query, threshold) == expected
+
+
+class TestGetFuzzyIndex:
+    """Tests for the fuzzy index cache."""
+
+    def test_index_reused_for_same_skills(self):
+        """Test that the index is built once per skill list."""
+        skills = ["Python", "Django", "PostgreSQL"]
+        assert get_fuzzy_index(skills, normalize) is get_fuzzy_index(list(skills), normalize)
+
+    def test_different_skills_new_index(self):
+        """Test that another skill list gets its own index."""
+        assert get_fuzzy_index(["Python"], normalize) is not get_fuzzy_index(["Java"], normalize)
+
+
+class TestFindCanonicalSkill:
+    """Tests for fuzzy lookups against the full taxonomy."""
+
+    def test_typo_resolves_to_canonical_name(self):
+        """Test that a typo resolves to the canonical taxonomy name."""
+        matcher = EnhancedSkillMatcher()
+        canonical, confidence = matcher.find_canonical_skill("Kubernets")
+        assert canonical == "Kubernetes"
+        assert 0.7 <= confidence < 1.0
+
+    def test_unknown_skill(self):
+        """Test that a name far from every variant is not resolved."""
+        assert EnhancedSkillMatcher().find_canonical_skill("Zzzzqqq") is None
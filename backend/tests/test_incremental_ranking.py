@@ -0,0 +1,177 @@
+"""
+Tests for incremental ranking-model training from recruiter feedback.
+
+Tests cover feedback labels, reading feedback with stored feature
+vectors, and update runs: checkpoints, the chronological holdout, the
+activation gate and version registration.
+"""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from analyzers import incremental_ranking
+from analyzers.incremental_ranking import (
+    ONLINE_MODEL_NAME,
+    feedback_label,
+    fetch_feedback_samples,
+    update_ranking_model,
+)
+from analyzers.ranking_artifacts import RankingArtifactStore
+from analyzers.ranking_service import RankingFeatures
+
+N_FEATURES = len(RankingFeatures.FEATURE_NAMES)
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def feedback(outcome=None, adjusted_score=None, rating=None):
+    return SimpleNamespace(actual_outcome=outcome, adjusted_score=adjusted_score, rating=rating)
+
+
+def samples(n, seed=0, offset=0):
+    """(features, labels, keys) as returned by fetch_feedback_samples()."""
+    rng = np.random.default_rng(seed)
+    X = rng.random((n, N_FEATURES))
+    y = (X[:, 0] + X[:, 4] > 1).astype(np.int64)
+    keys = [(START + timedelta(minutes=offset + i), uuid4()) for i in range(n)]
+    return X, y, keys
+
+
+def session():
+    db = MagicMock()
+    db.execute = AsyncMock()
+    db.commit = AsyncMock()
+    return db
+
+
+@pytest.fixture
+def store(tmp_path):
+    return RankingArtifactStore(tmp_path / "sgd", check_interval=0)
+
+
+@pytest.fixture
+def fetch():
+    with patch.object(incremental_ranking, "fetch_feedback_samples", AsyncMock()) as fetch:
+        yield fetch
+
+
+class TestFeedbackLabel:
+    """Tests for turning feedback into training labels."""
+
+    @pytest.mark.parametrize("entry, label", [
+        (feedback(outcome="hired", adjusted_score=0.1), 1),
+        (feedback(outcome="rejected", rating=5), 0),
+        (feedback(outcome="interviewing", adjusted_score=0.7), 1),
+        (feedback(adjusted_score=0.2), 0),
+        (feedback(rating=4), 1),
+        (feedback(rating=2), 0),
+        (feedback(rating=3), None),
+        (feedback(outcome="pending"), None),
+    ])
+    def test_label(self, entry, label):
+        """Test that outcome wins over adjusted score, which wins over rating."""
+        assert feedback_label(entry) == label
+
+
+class TestFetchFeedback:
+    """Tests for reading new feedback."""
+
+    @pytest.mark.asyncio
+    async def test_stored_features_used(self):
+        """Test that rankings with stored features need no further queries."""
+        features = [0.5] * N_FEATURES
+        rank = SimpleNamespace(id=uuid4(), extra_metadata={"features": features})
+        rows = [
+            (SimpleNamespace(id=uuid4(), created_at=START, actual_outcome="hired", adjusted_score=None, rating=None), rank),
+            (SimpleNamespace(id=uuid4(), created_at=START, actual_outcome=None, adjusted_score=None, rating=3), rank),
+        ]
+        db = session()
+        db.execute.return_value.all = MagicMock(return_value=rows)
+
+        X, y, keys = await fetch_feedback_samples(db, (START, uuid4()), limit=10, settled_before=START)
+
+        assert db.execute.await_count == 1
+        assert X.tolist() == [features]
+        assert y.tolist() == [1]
+        assert keys == [(START, rows[0][0].id)]
+
+
+class TestUpdateRankingModel:
+    """Tests for update runs."""
+
+    @pytest.mark.asyncio
+    async def test_first_run(self, store, fetch):
+        """Test that a run trains on the older rows and checkpoints the last of them."""
+        X, y, keys = samples(100)
+        fetch.return_value = (X, y, keys)
+        db = session()
+
+        result = await update_ranking_model(db, store=store, min_samples=10)
+
+        assert fetch.await_args.args[1] is None
+        assert result["status"] == "completed"
+        assert (result["training_samples"], result["holdout_samples"]) == (80, 20)
+        assert result["version"] == "v1" and result["is_active"]
+        assert store.active_version() == "v1"
+
+        training = store.manifest("v1")["training"]
+        assert training["checkpoint"] == {"created_at": keys[79][0].isoformat(), "id": str(keys[79][1])}
+        assert training["samples_seen"] == 80
+        assert result["metrics"]["n_samples"] == 20
+
+        record = db.add.call_args.args[0]
+        assert record.model_name == ONLINE_MODEL_NAME
+        assert record.version == "v1" and record.is_active and not record.is_experiment
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_checkpoint(self, store, fetch):
+        """Test that the next run reads after the checkpoint and continues the model."""
+        first = samples(100)
+        fetch.return_value = first
+        await update_ranking_model(session(), store=store, min_samples=10)
+
+        fetch.return_value = samples(50, seed=1, offset=100)
+        result = await update_ranking_model(session(), store=store, min_samples=10)
+
+        assert fetch.await_args.args[1] == first[2][79]
+        assert result["parent_version"] == "v1"
+        assert result["samples_seen"] == 80 + 40
+        assert result["metrics"]["baseline_version"] == "v1"
+        assert store.versions() == ["v1", "v2"]
+
+    @pytest.mark.asyncio
+    async def test_worse_version_not_activated(self, store, fetch):
+        """Test that a version losing against the active one on the holdout stays inactive."""
+        fetch.return_value = samples(100)
+        await update_ranking_model(session(), store=store, min_samples=10)
+
+        fetch.return_value = samples(100, seed=1, offset=100)
+        db = session()
+        baseline = {"accuracy": 0.9, "log_loss": 0.30, "n_samples": 20}
+        candidate = {"accuracy": 0.7, "log_loss": 0.50, "n_samples": 20}
+        with patch.object(incremental_ranking, "evaluate", side_effect=[baseline, candidate]):
+            result = await update_ranking_model(db, store=store, min_samples=10)
+
+        assert not result["is_active"]
+        assert store.active_version() == "v1"
+        # Published anyway: the next run continues from it
+        assert store.versions() == ["v1", "v2"]
+        record = db.add.call_args.args[0]
+        assert not record.is_active and record.is_experiment
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_too_little_feedback(self, store, fetch):
+        """Test that a run with too few new labels publishes nothing."""
+        fetch.return_value = samples(5)
+        db = session()
+
+        result = await update_ranking_model(db, store=store, min_samples=10)
+
+        assert result["status"] == "skipped"
+        assert store.versions() == []
+        db.commit.assert_not_awaited()
@@ -0,0 +1,76 @@
+"""
+Tests for inference backend selection.
+
+Tests cover backend resolution, fallback to PyTorch when an ONNX model
+cannot be loaded, and model caching per backend.
+"""
+from unittest.mock import patch
+
+from analyzers import hf_skill_extractor, inference_backend
+from analyzers.inference_backend import export_dir, load_sentence_transformer, resolve_backend
+from analyzers.model_registry import ModelRegistry
+from analyzers.vector_matcher import VectorSimilarityMatcher
+
+
+class TestResolveBackend:
+    """Tests for backend names."""
+
+    def test_known_backend(self):
+        """Test that supported names are accepted case-insensitively."""
+        assert resolve_backend("ONNX-int8") == "onnx-int8"
+
+    def test_unknown_backend_falls_back(self):
+        """Test that an unknown backend resolves to torch."""
+        assert resolve_backend("tensorrt") == "torch"
+
+    def test_export_dir_per_backend(self):
+        """Test that exports are kept apart per model and backend."""
+        path = export_dir("dslim/bert-base-NER", "onnx-int8")
+        assert path.parts[-3:] == ("onnx", "dslim_bert-base-NER", "onnx-int8")
+
+
+class TestLoading:
+    """Tests for loading with fallback."""
+
+    def test_onnx_model_is_used(self):
+        """Test that a loaded ONNX model is returned with its backend."""
+        model = object()
+        with patch.object(inference_backend, "_load_onnx_sentence_transformer", return_value=model):
+            assert load_sentence_transformer("all-MiniLM-L6-v2", "onnx") == (model, "onnx")
+
+    def test_onnx_failure_falls_back_to_torch(self):
+        """Test that an export error degrades to the PyTorch path."""
+        with patch.object(
+            inference_backend, "_load_onnx_sentence_transformer", side_effect=ImportError("optimum")
+        ):
+            _, backend = load_sentence_transformer("all-MiniLM-L6-v2", "onnx-int8")
+        assert backend == "torch"
+
+    def test_ner_pipeline_reloaded_on_backend_change(self):
+        """Test that the cached NER pipeline is keyed by backend."""
+        with patch.object(hf_skill_extractor, "get_model_registry", return_value=ModelRegistry()), \
+                patch.object(hf_skill_extractor, "load_ner_pipeline", side_effect=lambda m, b: (f"{m}@{b}", b)) as loader, \
+                patch.object(hf_skill_extractor, "resolve_backend", return_value="onnx"):
+            assert hf_skill_extractor._get_ner_model("dslim/bert-base-NER") == "dslim/bert-base-NER@onnx"
+            hf_skill_extractor._get_ner_model("dslim/bert-base-NER")
+            assert loader.call_count == 1
+
+            with patch.object(hf_skill_extractor, "resolve_backend", return_value="onnx-int8"):
+                assert hf_skill_extractor._get_ner_model("dslim/bert-base-NER") == "dslim/bert-base-NER@onnx-int8"
+            assert loader.call_count == 2
+
+
+class TestEncoderKey:
+    """Tests for embedding store namespaces per backend."""
+
+    def test_float_backends_share_namespace(self):
+        """Test that torch and float32 ONNX embeddings share store entries."""
+        torch_matcher = VectorSimilarityMatcher(use_embedding_store=False, backend="torch")
+        onnx_matcher = VectorSimilarityMatcher(use_embedding_store=False, backend="onnx")
+        assert torch_matcher.encoder_key == onnx_matcher.encoder_key == "all-MiniLM-L6-v2"
+
+    def test_int8_backend_has_own_namespace(self):
+        """Test that quantized-model embeddings are stored separately."""
+        matcher = VectorSimilarityMatcher(use_embedding_store=False, backend="onnx-int8", pooling="mean")
+        assert matcher.encoder_key == "all-MiniLM-L6-v2:onnx-int8"
+        assert matcher.embedding_key == "all-MiniLM-L6-v2:onnx-int8:mean-pool"
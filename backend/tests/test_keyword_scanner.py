@@ -0,0 +1,98 @@
+"""
+Tests for the single-pass multi-keyword scanner.
+
+Results are compared with the per-keyword regular expressions the scanner
+replaces (r"\\b<keyword>\\b" with re.findall), including keywords with
+punctuation such as "c++", "c#" and ".net".
+"""
+import random
+import re
+
+import pytest
+
+from analyzers.hf_skill_extractor import COMMON_SKILLS, extract_skills_pattern_matching
+from analyzers.keyword_scanner import KeywordScanner, get_keyword_scanner
+
+PUNCTUATION_SKILLS = ["c++", "c#", ".net", "asp.net", "node.js", "ci/cd", "utf-8", "f#", "c"]
+
+
+def _regex_counts(keywords, text):
+    """Reference counts from one regex per keyword."""
+    counts = {}
+    for keyword in keywords:
+        matches = re.findall(rf"\b{re.escape(keyword)}\b", text)
+        if matches:
+            counts[keyword] = len(matches)
+    return counts
+
+
+class TestKeywordScanner:
+    """Tests for KeywordScanner."""
+
+    def test_counts_occurrences(self):
+        """Test that every keyword is counted in one pass."""
+        scanner = KeywordScanner(["python", "sql", "machine learning", "learning"])
+        counts = scanner.count("python and sql, machine learning; more sql")
+        assert counts == {"python": 1, "sql": 2, "machine learning": 1, "learning": 1}
+
+    def test_word_boundaries(self):
+        """Test that keywords inside longer words are not matched."""
+        scanner = KeywordScanner(["java", "go", "r"])
+        assert scanner.count("javascript, golang and rust") == {}
+        assert scanner.find("java, go, r") == {"java", "go", "r"}
+
+    @pytest.mark.parametrize("text", [
+        "c++ developer with c# and .net experience",
+        "asp.net, node.js; c++/c# (c) f#.",
+        "skills: c++,c#,.net,ci/cd,utf-8",
+        "Used .NET at work; cc++ and c## are not skills",
+        "c c c++ c#c# .net.net asp.net.net",
+    ])
+    def test_punctuation_skills_match_regex(self, text):
+        """Test parity with regex \\b semantics for punctuation-bearing skills."""
+        text = text.lower()
+        assert KeywordScanner(PUNCTUATION_SKILLS).count(text) == _regex_counts(PUNCTUATION_SKILLS, text)
+
+    def test_overlapping_occurrences_match_findall(self):
+        """Test that occurrences of one keyword do not overlap, as with re.findall."""
+        text = "a.a.a.a x-x-x"
+        keywords = ["a.a", "x-x"]
+        assert KeywordScanner(keywords).count(text) == _regex_counts(keywords, text)
+
+    def test_unicode_text(self):
+        """Test word boundaries in Cyrillic text."""
+        text = "опыт python, sql и машинное обучение; pythonист"
+        keywords = ["python", "sql", "машинное обучение", "обучение"]
+        assert KeywordScanner(keywords).count(text) == _regex_counts(keywords, text)
+
+    def test_random_texts_match_regex(self):
+        """Test parity with regexes on random texts over the skills taxonomy."""
+        rng = random.Random(7)
+        skills = sorted(COMMON_SKILLS)
+        vocabulary = skills[:300] + PUNCTUATION_SKILLS + ["and", "with", "(", ")", ",", "-"]
+        scanner = KeywordScanner(skills)
+
+        for _ in range(20):
+            text = rng.choice(["", " "]).join(rng.choice(vocabulary) + rng.choice(["", " ", ",", "."])
+                                              for _ in range(60))
+            assert scanner.count(text) == _regex_counts(skills, text)
+
+    def test_scanner_cached_per_keyword_set(self):
+        """Test that the same keyword set returns the same scanner."""
+        assert get_keyword_scanner(["a", "b"]) is get_keyword_scanner(("b", "a", "a"))
+
+
+class TestPatternMatchingExtraction:
+    """Tests for extract_skills_pattern_matching on the scanner."""
+
+    def test_counts_match_regex(self):
+        """Test that extracted skill counts equal the regex version."""
+        text = "Senior C++ and C# developer. .NET, ASP.NET, Docker, docker-compose and Kubernetes; Python."
+        result = extract_skills_pattern_matching(text, top_n=100)
+        expected = _regex_counts(sorted(COMMON_SKILLS), text.lower())
+        assert dict(result["skills_with_scores"]) == expected
+
+    def test_original_casing_preserved(self):
+        """Test that skills keep the casing of a custom skill list."""
+        result = extract_skills_pattern_matching("We use PostgreSQL and Redis daily", {"PostgreSQL", "Redis", "Kafka"})
+        assert sorted(result["skills"]) == ["PostgreSQL", "Redis"]
@@ -0,0 +1,136 @@
+"""
+Tests for the shared model registry.
+
+Tests cover LRU eviction by count and memory budget, single loading of a
+key under concurrent requests, failed loads and the metrics counters.
+"""
+import threading
+import time
+from unittest.mock import patch
+
+from analyzers import model_registry
+from analyzers.model_registry import ModelRegistry
+
+
+class FakeModel:
+    """Model stand-in with a fixed size."""
+
+    def __init__(self, name: str, nbytes: int = 0):
+        self.name = name
+        self.nbytes = nbytes
+
+
+def _fake_size(model):
+    return model.nbytes
+
+
+class TestModelRegistry:
+    """Tests for ModelRegistry."""
+
+    def test_hit_after_first_load(self):
+        """Test that a loaded model is reused and counted as a hit."""
+        registry = ModelRegistry(max_models=2)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return FakeModel("en")
+
+        first = registry.get("ner", "dslim/bert-base-NER", "torch", loader)
+        second = registry.get("ner", "dslim/bert-base-NER", "torch", loader)
+
+        assert first is second
+        assert len(calls) == 1
+        stats = registry.get_stats()
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 1, 0)
+
+    def test_keys_include_task_and_backend(self):
+        """Test that the same model name on another backend is a separate entry."""
+        registry = ModelRegistry(max_models=4)
+        torch_model = registry.get("ner", "m", "torch", lambda: FakeModel("torch"))
+        onnx_model = registry.get("ner", "m", "onnx", lambda: FakeModel("onnx"))
+        embedder = registry.get("sentence-embedding", "m", "torch", lambda: FakeModel("embed"))
+
+        assert len({id(torch_model), id(onnx_model), id(embedder)}) == 3
+        assert len(registry.get_stats()["loaded"]) == 3
+
+    def test_alternating_languages_stay_loaded(self):
+        """Test that alternating between two NER models does not reload them."""
+        registry = ModelRegistry(max_models=2)
+        for _ in range(5):
+            registry.get("ner", "dslim/bert-base-NER", "torch", lambda: FakeModel("en"))
+            registry.get("ner", "Davlan/bert-base-multilingual-cased-ner-hrl", "torch", lambda: FakeModel("ru"))
+
+        stats = registry.get_stats()
+        assert stats["misses"] == 2
+        assert stats["hits"] == 8
+
+    def test_lru_eviction_by_count(self):
+        """Test that the least recently used model is evicted first."""
+        registry = ModelRegistry(max_models=2)
+        registry.get("ner", "a", "torch", lambda: FakeModel("a"))
+        registry.get("ner", "b", "torch", lambda: FakeModel("b"))
+        registry.get("ner", "a", "torch", lambda: FakeModel("a"))  # a is now most recent
+        registry.get("ner", "c", "torch", lambda: FakeModel("c"))
+
+        loaded = [entry["model_name"] for entry in registry.get_stats()["loaded"]]
+        assert loaded == ["a", "c"]
+        assert registry.get_stats()["evictions"] == 1
+
+    def test_eviction_by_memory_budget(self):
+        """Test that models are evicted to stay within the memory budget."""
+        mb = 1024 * 1024
+        registry = ModelRegistry(max_models=10, max_memory_mb=500)
+        with patch.object(model_registry, "estimate_model_bytes", side_effect=_fake_size):
+            registry.get("ner", "a", "torch", lambda: FakeModel("a", 300 * mb))
+            registry.get("ner", "b", "torch", lambda: FakeModel("b", 150 * mb))
+            registry.get("ner", "c", "torch", lambda: FakeModel("c", 300 * mb))
+
+        stats = registry.get_stats()
+        assert [entry["model_name"] for entry in stats["loaded"]] == ["b", "c"]
+        assert stats["memory_mb"] == 450
+
+    def test_oversized_model_is_still_kept(self):
+        """Test that a model larger than the budget stays loaded on its own."""
+        registry = ModelRegistry(max_models=10, max_memory_mb=1)
+        with patch.object(model_registry, "estimate_model_bytes", side_effect=_fake_size):
+            model = registry.get("ner", "big", "torch", lambda: FakeModel("big", 10 * 1024 * 1024))
+
+        assert registry.get("ner", "big", "torch", lambda: None) is model
+
+    def test_failed_load_is_not_cached(self):
+        """Test that a failed load returns None and is retried next time."""
+        registry = ModelRegistry()
+
+        def broken():
+            raise OSError("model not found")
+
+        assert registry.get("ner", "m", "torch", broken) is None
+        assert registry.get("ner", "m", "torch", lambda: FakeModel("m")) is not None
+        stats = registry.get_stats()
+        assert stats["load_failures"] == 1
+        assert stats["misses"] == 2
+
+    def test_concurrent_requests_load_once(self):
+        """Test that threads asking for the same key share a single load."""
+        registry = ModelRegistry()
+        calls = []
+
+        def slow_loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return FakeModel("slow")
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get("ner", "m", "torch", slow_loader)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert len({id(model) for model in results}) == 1
+        assert registry.get_stats()["hits"] == 7
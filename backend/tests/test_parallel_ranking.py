@@ -0,0 +1,138 @@
+"""
+Tests for process-pool parallel ranking.
+
+Tests cover sharding, parity of parallel ranking with serial ranking,
+deterministic ordering and the in-process fallbacks.
+"""
+import pytest
+from unittest.mock import patch
+
+from analyzers.parallel_ranking import ParallelRanker, _shard_bounds
+from analyzers.ranking_service import RankingModel, score_ranking_rows
+from analyzers.unified_matcher import UnifiedSkillMatcher
+
+
+JOB_TITLE = "Senior Backend Developer"
+JOB_DESCRIPTION = "We build Python APIs with Django and PostgreSQL, deployed on Kubernetes."
+REQUIRED_SKILLS = ["Python", "Django", "SQL", "Kubernetes"]
+
+RESUMES = [
+    ("Python developer, Django and PostgreSQL, some Kubernetes.", ["Python", "Django", "PostgreSQL"]),
+    ("Frontend engineer working with React and TypeScript.", ["ReactJS", "TypeScript"]),
+    ("Rust and Python systems programmer using Redis.", ["Rust", "Python", "Redis"]),
+    ("Django REST framework and SQL reporting.", ["Django", "SQL"]),
+]
+
+# Repeated resumes give many equal scores, which must keep candidate order
+CANDIDATES = [
+    {"id": str(i), "resume_text": text, "resume_skills": skills}
+    for i, (text, skills) in enumerate(RESUMES * 6)
+]
+
+
+@pytest.fixture
+def matcher():
+    """Unified matcher without vector matching (deterministic scores)."""
+    matcher = UnifiedSkillMatcher()
+    matcher.vector_matcher = None
+    return matcher
+
+
+@pytest.fixture
+def ranker(matcher):
+    """Parallel ranker with two workers that shards every pool."""
+    ranker = ParallelRanker(matcher, pool_size=2, min_candidates=1)
+    yield ranker
+    ranker.shutdown()
+
+
+class TestShardBounds:
+    """Tests for splitting candidates into shards."""
+
+    def test_contiguous_and_complete(self):
+        """Test that shards cover every index once, in order."""
+        bounds = _shard_bounds(10, 3)
+
+        assert bounds == [(0, 4), (4, 7), (7, 10)]
+
+    def test_more_shards_than_items(self):
+        """Test that extra shards are empty."""
+        assert _shard_bounds(2, 3) == [(0, 1), (1, 2), (2, 2)]
+
+
+class TestShouldParallelize:
+    """Tests for choosing between the pool and in-process ranking."""
+
+    def test_disabled_pool(self, matcher):
+        """Test that a pool size of 0 always ranks in-process."""
+        assert not ParallelRanker(matcher, pool_size=0).should_parallelize(10_000)
+
+    def test_small_pool_in_process(self, matcher):
+        """Test that pools below min_candidates rank in-process."""
+        ranker = ParallelRanker(matcher, pool_size=2, min_candidates=100)
+
+        assert not ranker.should_parallelize(99)
+        assert ranker.should_parallelize(100)
+
+    def test_daemonic_process_in_process(self, matcher):
+        """Test that daemonic processes (Celery prefork children) rank in-process."""
+        ranker = ParallelRanker(matcher, pool_size=2, min_candidates=1)
+
+        with patch("analyzers.parallel_ranking.multiprocessing.current_process") as current_process:
+            current_process.return_value.daemon = True
+            assert not ranker.should_parallelize(1000)
+
+    def test_fallback_does_not_start_pool(self, matcher):
+        """Test that in-process ranking never starts workers."""
+        ranker = ParallelRanker(matcher, pool_size=2, min_candidates=1000)
+
+        ranker.rank_candidates(CANDIDATES, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+
+        assert ranker._executor is None
+
+
+class TestParallelRanking:
+    """Tests for ranking on the worker pool."""
+
+    def test_matches_serial_ranking(self, matcher, ranker):
+        """Test that parallel ranking gives the serial ranking, order included."""
+        serial = matcher.rank_candidates(CANDIDATES, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+        parallel = ranker.rank_candidates(CANDIDATES, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+
+        assert [c["id"] for c in parallel] == [c["id"] for c in serial]
+        assert [c["match_result"] for c in parallel] == [c["match_result"] for c in serial]
+        assert ranker._executor is not None
+
+    def test_deterministic_order(self, ranker):
+        """Test that repeated runs rank candidates identically."""
+        first = ranker.rank_candidates(CANDIDATES, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+        second = ranker.rank_candidates(CANDIDATES, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+
+        assert [c["id"] for c in first] == [c["id"] for c in second]
+
+    def test_score_candidates_aligned(self, matcher, ranker):
+        """Test that scores come back aligned with the candidates."""
+        compiled = matcher.compile_vacancy(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+
+        parallel = ranker.score_candidates(CANDIDATES, compiled)
+        serial = matcher.score_candidates(CANDIDATES, compiled)
+
+        assert [r.to_dict() for r in parallel] == [r.to_dict() for r in serial]
+
+    def test_score_ranking_rows_matches_serial(self, ranker):
+        """Test that ranking-model scoring on the pool matches in-process scoring."""
+        model = RankingModel()
+        rows = [
+            (
+                {"skills": skills, "title": text[:100], "experience": {"total_months": 12 * i}},
+                {"title": JOB_TITLE, "required_skills": REQUIRED_SKILLS},
+                None,
+            )
+            for i, (text, skills) in enumerate(RESUMES)
+        ]
+
+        parallel = ranker.score_ranking_rows(rows, model)
+        serial = score_ranking_rows(model, rows)
+
+        assert [score[1:] for score in parallel] == [score[1:] for score in serial]
+        assert all((p[0] == s[0]).all() for p, s in zip(parallel, serial))
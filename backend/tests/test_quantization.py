@@ -0,0 +1,139 @@
+"""
+Tests for quantized embedding storage.
+
+Tests cover the float16/int8 codecs and scoring kernel, the accuracy
+report against float32, and quantized storage in the ANN index and the
+embedding store.
+"""
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from analyzers.ann_index import IVFFlatIndex
+from analyzers.embedding_store import EmbeddingStore
+from analyzers.quantization import (
+    cosine_scores,
+    dequantize,
+    dot_scores,
+    measure_quantization_error,
+    quantize,
+)
+
+
+@pytest.fixture
+def vectors():
+    """Random unit vectors."""
+    data = np.random.default_rng(0).standard_normal((500, 64)).astype(np.float32)
+    return data / np.linalg.norm(data, axis=1, keepdims=True)
+
+
+class TestCodecs:
+    """Tests for quantize/dequantize and dot_scores."""
+
+    @pytest.mark.parametrize("dtype,tolerance", [("float32", 0), ("float16", 1e-3), ("int8", 1e-2)])
+    def test_round_trip(self, vectors, dtype, tolerance):
+        """Test that dequantized vectors stay close to the originals."""
+        codes, scales = quantize(vectors, dtype)
+        np.testing.assert_allclose(dequantize(codes, scales), vectors, atol=tolerance)
+
+    def test_int8_layout(self, vectors):
+        """Test int8 codes use the full range with one scale per row."""
+        codes, scales = quantize(vectors, "int8")
+        assert codes.dtype == np.int8
+        assert scales.shape == (len(vectors),)
+        assert np.all(np.abs(codes).max(axis=1) == 127)
+
+    def test_zero_vector(self):
+        """Test that an all-zero row quantizes without division errors."""
+        codes, scales = quantize(np.zeros((1, 4)), "int8")
+        np.testing.assert_array_equal(dequantize(codes, scales), np.zeros((1, 4)))
+
+    @pytest.mark.parametrize("dtype", ["float32", "float16", "int8"])
+    def test_dot_scores_match_dequantized(self, vectors, dtype):
+        """Test scores for all rows, a slice and unsorted row indices."""
+        codes, scales = quantize(vectors, dtype)
+        query = vectors[3]
+        expected = dequantize(codes, scales) @ query
+        rows = np.array([7, 2, 400, 3])
+
+        np.testing.assert_allclose(dot_scores(codes, scales, query), expected, rtol=1e-5, atol=1e-6)
+        np.testing.assert_allclose(dot_scores(codes, scales, query, slice(10, 20)), expected[10:20], rtol=1e-5, atol=1e-6)
+        np.testing.assert_allclose(dot_scores(codes, scales, query, rows), expected[rows], rtol=1e-5, atol=1e-6)
+
+    @pytest.mark.parametrize("dtype", ["float32", "float16", "int8"])
+    def test_cosine_scores_match_dequantized(self, vectors, dtype):
+        """Test that cosine scores need no scales and handle zero rows."""
+        codes, scales = quantize(np.vstack([vectors, np.zeros((1, 64))]), dtype)
+        query = vectors[3]
+        decoded = dequantize(codes, scales)
+        norms = np.linalg.norm(decoded, axis=1) * np.linalg.norm(query)
+        expected = np.divide(decoded @ query, norms, out=np.zeros(len(decoded)), where=norms > 0)
+        rows = np.array([len(vectors), 7, 2, 400, 3])
+
+        scores = cosine_scores(codes, query)
+        assert scores.dtype == np.float32
+        np.testing.assert_allclose(scores, expected, rtol=1e-5, atol=1e-6)
+        np.testing.assert_allclose(cosine_scores(codes, query, rows), expected[rows], rtol=1e-5, atol=1e-6)
+
+    def test_accuracy_report(self, vectors):
+        """Test the measured accuracy delta against float32."""
+        report = measure_quantization_error(vectors, vectors[:20], k=10)
+
+        assert report["float32"]["max_abs_error"] == pytest.approx(0.0, abs=1e-6)
+        assert report["float16"]["compression"] == 2.0
+        assert report["int8"]["compression"] > 3.5
+        assert report["int8"]["max_abs_error"] < 0.02
+        assert report["int8"]["recall_at_k"] >= 0.9
+
+
+class TestQuantizedStorage:
+    """Tests for quantized ANN index and embedding store."""
+
+    def test_int8_index(self, vectors, tmp_path):
+        """Test search, removal and persistence of an int8 index."""
+        index = IVFFlatIndex(dim=64, dtype="int8")
+        index.add_many([str(i) for i in range(len(vectors))], vectors)
+
+        assert index.search(vectors[42], k=1)[0][0] == "42"
+        assert index.nbytes == len(vectors) * (64 + 4)
+
+        index.remove("42")
+        index.save(tmp_path / "index.npz")
+        loaded = IVFFlatIndex.load(tmp_path / "index.npz")
+
+        assert loaded.dtype == "int8"
+        assert "42" not in loaded
+        assert loaded.search(vectors[7], k=3) == index.search(vectors[7], k=3)
+        np.testing.assert_allclose(loaded.get_vector("7"), vectors[7], atol=1e-2)
+
+    def test_int8_store(self, vectors, tmp_path):
+        """Test that an int8 store returns close float32 vectors."""
+        store = EmbeddingStore(tmp_path, dtype="int8")
+        store.put_many("model-a", ["a", "b"], vectors[:2])
+
+        result = EmbeddingStore(tmp_path).get("model-a", "b")
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, vectors[1], atol=1e-2)
+        assert (tmp_path / "model-a" / "vectors.bin").stat().st_size == 2 * 64
+
+    def test_int8_store_cosine(self, vectors, tmp_path):
+        """Test that stored rows are scored without dequantizing them."""
+        store = EmbeddingStore(tmp_path, dtype="int8")
+        store.put_many("model-a", ["a", "b"], vectors[:2])
+
+        with patch("analyzers.embedding_store.dequantize") as dequantize_rows:
+            scores, found = store.cosine_many("model-a", ["b", "missing", "a"], vectors[0])
+
+        dequantize_rows.assert_not_called()
+        assert found.tolist() == [True, False, True]
+        expected = vectors[1] @ vectors[0] / (np.linalg.norm(vectors[1]) * np.linalg.norm(vectors[0]))
+        np.testing.assert_allclose(scores[[0, 2]], [expected, 1.0], atol=1e-2)
+        assert scores[1] == 0.0
+
+    def test_existing_shard_keeps_dtype(self, vectors, tmp_path):
+        """Test that a float32 shard stays float32 when the default changes."""
+        EmbeddingStore(tmp_path).put("model-a", "a", vectors[0])
+        EmbeddingStore(tmp_path, dtype="float16").put("model-a", "b", vectors[1])
+
+        np.testing.assert_array_equal(EmbeddingStore(tmp_path).get("model-a", "b"), vectors[1])
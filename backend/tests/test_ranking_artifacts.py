@@ -0,0 +1,217 @@
+"""
+Tests for versioned ranking model artifacts.
+
+Tests cover publishing versions with manifests, checksum verification,
+memory-mapped loading, the atomic active pointer, pruning, and hot swap
+of running RankingModel instances.
+"""
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+from analyzers import ranking_artifacts, ranking_service
+from analyzers.compiled_forest import CompiledForest
+from analyzers.model_versioning import ModelVersionManager
+from analyzers.ranking_artifacts import RANKING_MODEL_NAME, RankingArtifactStore
+from analyzers.ranking_service import RankingFeatures, RankingModel
+
+N_FEATURES = len(RankingFeatures.FEATURE_NAMES)
+
+
+def fitted(seed=0):
+    """Small forest, scaler and compiled form."""
+    rng = np.random.default_rng(seed)
+    X = rng.random((60, N_FEATURES))
+    y = (X[:, 0] + X[:, 4] > 1).astype(np.int64)
+    scaler = StandardScaler().fit(X)
+    forest = RandomForestClassifier(n_estimators=5, random_state=seed).fit(scaler.transform(X), y)
+    return forest, scaler, CompiledForest.from_model(forest, scaler)
+
+
+def publish(store, seed=0, **kwargs):
+    forest, scaler, compiled = fitted(seed)
+    return store.publish(
+        forest, scaler, compiled,
+        model_type="random_forest",
+        feature_names=RankingFeatures.FEATURE_NAMES,
+        metrics={"accuracy": 0.9},
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return RankingArtifactStore(tmp_path / "random_forest", check_interval=0)
+
+
+class TestPublish:
+    """Tests for writing versions."""
+
+    def test_manifest(self, store):
+        """Test that a version records its features, metrics and checksums."""
+        manifest = publish(store)
+
+        assert manifest["version"] == "v1"
+        assert store.active_version() == "v1"
+        on_disk = json.loads((store.directory / "v1" / "manifest.json").read_text())
+        assert on_disk == manifest
+        assert manifest["feature_names"] == RankingFeatures.FEATURE_NAMES
+        assert manifest["metrics"] == {"accuracy": 0.9}
+        assert {"model.joblib", "scaler.joblib", "compiled/value.npy"} <= set(manifest["files"])
+        assert manifest["checksum"]
+
+    def test_versions_increase(self, store):
+        """Test that each publish adds the next version."""
+        publish(store)
+        publish(store, seed=1)
+
+        assert store.versions() == ["v1", "v2"]
+        assert store.active_version() == "v2"
+
+    def test_publish_without_activating(self, store):
+        """Test that a version can be published for later promotion."""
+        publish(store)
+        publish(store, seed=1, activate=False)
+
+        assert store.active_version() == "v1"
+        assert not list(store.directory.glob(".*tmp*"))
+
+    def test_prune_keeps_active(self, store):
+        """Test that old versions are deleted, except the active one."""
+        publish(store)
+        with patch.object(ranking_artifacts, "KEEP_VERSIONS", 2):
+            for seed in range(1, 4):
+                publish(store, seed=seed, activate=False)
+
+        assert store.versions() == ["v1", "v3", "v4"]
+
+
+class TestLoad:
+    """Tests for loading versions."""
+
+    def test_memory_mapped(self, store):
+        """Test that compiled arrays are mapped read-only and predict like the original."""
+        forest, scaler, compiled = fitted()
+        publish(store)
+
+        artifact = store.load("v1")
+
+        assert isinstance(artifact.compiled.threshold, np.memmap)
+        X = np.random.default_rng(2).random((20, N_FEATURES))
+        np.testing.assert_array_equal(artifact.compiled.predict_proba(X), compiled.predict_proba(X))
+        np.testing.assert_array_equal(artifact.model.predict(scaler.transform(X)), forest.predict(scaler.transform(X)))
+
+    def test_checksum_mismatch(self, store):
+        """Test that a modified file is refused."""
+        publish(store)
+        with open(store.directory / "v1" / "compiled" / "threshold.npy", "r+b") as f:
+            f.seek(-1, 2)
+            f.write(b"\x01")
+
+        with pytest.raises(ValueError, match="Checksum"):
+            store.load("v1")
+
+    def test_unknown_version(self, store):
+        """Test that unknown versions raise ValueError."""
+        with pytest.raises(ValueError):
+            store.load("v9")
+
+
+class TestActivePointer:
+    """Tests for swapping the active version."""
+
+    def test_current_follows_pointer(self, store):
+        """Test that current() swaps when another version is activated."""
+        publish(store)
+        publish(store, seed=1)
+        assert store.current().version == "v2"
+
+        store.activate("v1")
+
+        assert store.current().version == "v1"
+
+    def test_failed_load_keeps_previous(self, store):
+        """Test that a broken new version does not take the live model down."""
+        publish(store)
+        assert store.current().version == "v1"
+        publish(store, seed=1)
+        (store.directory / "v2" / "model.joblib").write_bytes(b"broken")
+
+        assert store.current().version == "v1"
+
+    def test_activate_unknown_version(self, store):
+        """Test that the pointer cannot name a missing version."""
+        with pytest.raises(ValueError):
+            store.activate("v3")
+
+    def test_follow_registry(self, store):
+        """Test that the store follows the version chosen in the registry."""
+        publish(store)
+        publish(store, seed=1)
+
+        assert store.follow({"version": "v1", "is_fallback": False})
+        assert store.active_version() == "v1"
+        assert not store.follow({"version": "v1.0.0", "is_fallback": True})
+        assert not store.follow({"version": "v7"})
+
+
+class TestHotSwap:
+    """Tests for RankingModel picking up new versions."""
+
+    @pytest.fixture
+    def models_dir(self, tmp_path):
+        with patch.object(ranking_service, "MODELS_DIR", tmp_path):
+            yield tmp_path
+
+    def test_running_model_swaps(self, models_dir):
+        """Test that a loaded model serves a version activated by another process."""
+        serving = RankingModel()
+        serving.store.check_interval = 0
+        assert not serving.is_trained
+
+        trainer = RankingModel()
+        rng = np.random.default_rng(0)
+        X = rng.random((60, N_FEATURES))
+        trainer.train(X, (X[:, 0] > 0.5).astype(np.int64))
+
+        scores, _, _ = serving.predict_batch(X[:5])
+
+        assert serving.version == trainer.version == "v1"
+        np.testing.assert_allclose(scores, trainer.predict_batch(X[:5])[0])
+
+    def test_pinned_model_does_not_swap(self, models_dir):
+        """Test that a model not following the pointer keeps its version."""
+        store = ranking_artifacts.get_ranking_artifact_store(models_dir / "random_forest")
+        store.check_interval = 0
+        publish(store)
+        pinned = RankingModel(follow_active=False)
+        publish(store, seed=1)
+
+        pinned.predict_batch(np.zeros((1, N_FEATURES)))
+        assert pinned.version == "v1"
+
+        pinned.use_version("v2")
+        assert pinned.version == "v2"
+
+
+class TestVersionRecord:
+    """Tests for registering published versions."""
+
+    def test_build_version_record(self, store):
+        """Test that a manifest becomes an MLModelVersion record."""
+        manifest = publish(store)
+
+        record = ModelVersionManager().build_version_record(
+            RANKING_MODEL_NAME, manifest, file_path=str(store.directory / "v1"), is_active=True
+        )
+
+        assert record.model_name == RANKING_MODEL_NAME
+        assert record.version == "v1"
+        assert record.is_active and not record.is_experiment
+        assert record.performance_score == 90.0
+        assert record.model_metadata["checksum"] == manifest["checksum"]
+        assert record.accuracy_metrics == {"accuracy": 0.9}
@@ -0,0 +1,260 @@
+"""
+Tests for set-based ranking in RankingService.
+
+Tests cover batch scoring parity with per-candidate scoring and the bulk
+rank_candidates_for_vacancy path: one query per table, one model call and
+one upsert in one commit.
+"""
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import numpy as np
+import pytest
+
+from analyzers import ranking_service
+from analyzers.ranking_service import RankingFeatures, RankingModel, RankingService, score_ranking_rows
+from analyzers.skill_ids import serialize_skill_ids, skill_ids
+
+
+VACANCY = SimpleNamespace(
+    id=uuid4(),
+    title="Senior Python Developer",
+    required_skills=["Python", "Django", "PostgreSQL"],
+    required_skill_ids=serialize_skill_ids(["Python", "Django", "PostgreSQL"]),
+    description="Backend APIs",
+)
+
+
+def make_row(skills, overall_score=None):
+    """(resume, analysis, match_result) row as returned by the joined query."""
+    resume = SimpleNamespace(id=uuid4(), raw_text="Python developer", updated_at=datetime(2026, 1, 1))
+    analysis = SimpleNamespace(skills=skills, skill_ids=serialize_skill_ids(skills), raw_text="Senior Python Developer")
+    match = None
+    if overall_score is not None:
+        match = SimpleNamespace(overall_score=overall_score, keyword_score=0.5, tfidf_score=0.4, vector_score=0.6)
+    return resume, analysis, match
+
+
+def result(scalar=None, rows=None, scalars=None):
+    """Mock of an AsyncSession.execute() result."""
+    mock = MagicMock()
+    mock.scalar_one_or_none.return_value = scalar
+    mock.all.return_value = rows or []
+    mock.scalars.return_value.all.return_value = scalars or []
+    return mock
+
+
+@pytest.fixture
+def untrained_model(tmp_path):
+    """Ranking model without a saved model (heuristic scoring)."""
+    with patch.object(ranking_service, "MODELS_DIR", tmp_path):
+        yield RankingModel()
+
+
+@pytest.fixture
+def trained_model(tmp_path):
+    """Small random forest trained on synthetic features."""
+    rng = np.random.default_rng(0)
+    X = rng.random((60, len(RankingFeatures.FEATURE_NAMES)))
+    y = (X[:, 0] + X[:, 4] > 1).astype(np.int64)
+    with patch.object(ranking_service, "MODELS_DIR", tmp_path):
+        model = RankingModel()
+        model.train(X, y)
+        yield model
+
+
+class TestPredictBatch:
+    """Tests for scoring a feature matrix with one model call."""
+
+    @pytest.mark.parametrize("model_fixture", ["untrained_model", "trained_model"])
+    def test_matches_single_row_predictions(self, model_fixture, request):
+        """Test that batch scores equal predict_proba() and predict() per row."""
+        model = request.getfixturevalue(model_fixture)
+        X = np.random.default_rng(1).random((8, len(RankingFeatures.FEATURE_NAMES)))
+
+        scores, predictions, confidences = model.predict_batch(X)
+
+        for i, features in enumerate(X):
+            prediction, confidence = model.predict(features)
+            assert scores[i] == pytest.approx(model.predict_proba(features))
+            assert predictions[i] == prediction
+            assert confidences[i] == pytest.approx(confidence)
+
+    def test_empty_matrix(self, trained_model):
+        """Test that an empty matrix gives empty results."""
+        scores, predictions, confidences = trained_model.predict_batch(
+            np.zeros((0, len(RankingFeatures.FEATURE_NAMES)))
+        )
+
+        assert len(scores) == len(predictions) == len(confidences) == 0
+
+    def test_model_called_once(self, trained_model):
+        """Test that score_ranking_rows calls the model once for all rows."""
+        vacancy_data = RankingService._vacancy_data(VACANCY)
+        rows = [({"skills": ["Python"]}, vacancy_data, None)] * 5
+
+        with patch.object(trained_model.compiled, "predict_proba", wraps=trained_model.compiled.predict_proba) as proba:
+            scores = score_ranking_rows(trained_model, rows)
+
+        assert proba.call_count == 1
+        assert len(scores) == 5
+
+
+class TestSkillIdFeatures:
+    """Tests for skill features computed on skill ID arrays."""
+
+    def test_stored_ids_used(self):
+        """Test that persisted skill IDs are compared instead of the names."""
+        resume = {"skills": ["Python"], "skill_ids": skill_ids(["Go"])}
+        vacancy = {"required_skills": ["Python", "Rust"], "required_skill_ids": skill_ids(["Go", "Rust"])}
+
+        assert RankingFeatures._compute_basic_match(resume, vacancy) == 0.5
+
+    def test_ids_computed_from_names(self):
+        """Test that inputs without stored IDs match on normalized names."""
+        resume = {"skills": ["postgresql", "Go"]}
+        vacancy = {"required_skills": ["PostgreSQL ", "Docker Compose"]}
+
+        assert RankingFeatures._compute_basic_match(resume, vacancy) == 0.5
+        assert RankingFeatures._compute_skill_rarity(resume, vacancy) == pytest.approx(1 / 3)
+
+    def test_resume_data_without_stored_ids(self):
+        """Test that analyses stored before skill IDs get them computed."""
+        resume, analysis, _ = make_row(["Python", "python", "Docker"])
+        analysis.skill_ids = None
+
+        data = RankingService._resume_data(resume, analysis)
+
+        assert data["skill_ids"].tolist() == serialize_skill_ids(["Python", "Docker"])
+
+
+class TestBulkRanking:
+    """Tests for rank_candidates_for_vacancy."""
+
+    @pytest.fixture
+    def service(self, untrained_model):
+        service = RankingService.__new__(RankingService)
+        service.model = untrained_model
+        service.ab_test_ratio = 0.0
+        return service
+
+    @pytest.fixture(autouse=True)
+    def no_pool_or_index(self, service):
+        with patch.object(ranking_service, "get_parallel_ranker", return_value=None), \
+                patch.object(service, "shortlist_resumes", AsyncMock(return_value=[])):
+            yield
+
+    @pytest.fixture(autouse=True)
+    def upsert(self):
+        with patch.object(ranking_service, "upsert_candidate_ranks", AsyncMock()) as upsert:
+            yield upsert
+
+    @pytest.mark.asyncio
+    async def test_set_based_queries_and_single_commit(self, service, upsert):
+        """Test that ranking uses one query per table, one upsert and one transaction."""
+        rows = [make_row(["Python", "Django"], 0.8), make_row(["Java"]), make_row(["Python"], 0.4)]
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[result(scalar=VACANCY), result(rows=rows)])
+        db.commit = AsyncMock()
+
+        rankings = await service.rank_candidates_for_vacancy(db, VACANCY.id, limit=10)
+
+        assert db.execute.await_count == 2
+        db.commit.assert_awaited_once()
+        db.add.assert_not_called()
+        upsert.assert_awaited_once()
+        written = upsert.await_args.args[1]
+        assert [row["resume_id"] for row in written] == [UUID(r["resume_id"]) for r in rankings]
+        assert [row["rank_position"] for row in written] == [1, 2, 3]
+        # The scored feature vectors are kept for training on feedback
+        assert all(len(row["extra_metadata"]["features"]) == len(RankingFeatures.FEATURE_NAMES) for row in written)
+        assert [r["rank_position"] for r in rankings] == [1, 2, 3]
+        assert [r["rank_score"] for r in rankings] == sorted((r["rank_score"] for r in rankings), reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_matches_per_candidate_scores(self, service):
+        """Test that bulk ranking scores candidates like rank_candidate would."""
+        rows = [make_row(["Python", "Django"], 0.8), make_row(["Java"])]
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[result(scalar=VACANCY), result(rows=rows)])
+        db.commit = AsyncMock()
+
+        rankings = await service.rank_candidates_for_vacancy(db, VACANCY.id)
+
+        by_resume = {r["resume_id"]: r["rank_score"] for r in rankings}
+        for resume, analysis, match in rows:
+            features = RankingFeatures.extract_features(
+                service._resume_data(resume, analysis), service._vacancy_data(VACANCY), service._match_data(match)
+            )
+            assert by_resume[str(resume.id)] == pytest.approx(service.model.predict_proba(features))
+
+    @pytest.mark.asyncio
+    async def test_duplicate_match_results_ranked_once(self, service):
+        """Test that a resume joined to several match results is ranked once."""
+        resume, analysis, match = make_row(["Python"], 0.8)
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[
+            result(scalar=VACANCY),
+            result(rows=[(resume, analysis, match), (resume, analysis, match)]),
+        ])
+        db.commit = AsyncMock()
+
+        rankings = await service.rank_candidates_for_vacancy(db, VACANCY.id)
+
+        assert len(rankings) == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_vacancy(self, service):
+        """Test that an unknown vacancy ranks nobody."""
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result())
+        db.commit = AsyncMock()
+
+        assert await service.rank_candidates_for_vacancy(db, uuid4()) == []
+        db.commit.assert_not_awaited()
+
+
+class TestShortlist:
+    """Tests for ANN shortlisting of resumes."""
+
+    @pytest.fixture
+    def retriever(self):
+        retriever = MagicMock()
+        retriever.__len__.return_value = 2
+        retriever.retrieve.return_value = [(str(uuid4()), 0.9), (str(uuid4()), 0.7)]
+        with patch("analyzers.resume_retrieval.get_resume_retriever", return_value=retriever):
+            yield retriever
+
+    @staticmethod
+    def session(completed):
+        db = MagicMock()
+        count = MagicMock()
+        count.scalar_one.return_value = completed
+        db.execute = AsyncMock(return_value=count)
+        return db
+
+    @pytest.mark.asyncio
+    async def test_full_index_shortlists(self, retriever):
+        """Test that an index covering every completed resume is used."""
+        service = RankingService.__new__(RankingService)
+
+        shortlist = await service.shortlist_resumes(
+            self.session(2), VACANCY.id, k=5, vacancy=VACANCY, require_full_index=True
+        )
+
+        assert [similarity for _, similarity in shortlist] == [0.9, 0.7]
+        retriever.retrieve.assert_called_once_with(VACANCY.title, VACANCY.description, VACANCY.required_skills, 5)
+
+    @pytest.mark.asyncio
+    async def test_partial_index_not_used(self, retriever):
+        """Test that a partly built index does not hide un-indexed resumes."""
+        service = RankingService.__new__(RankingService)
+
+        shortlist = await service.shortlist_resumes(
+            self.session(3), VACANCY.id, k=5, vacancy=VACANCY, require_full_index=True
+        )
+
+        assert shortlist == []
+        retriever.retrieve.assert_not_called()
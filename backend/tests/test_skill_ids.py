@@ -0,0 +1,98 @@
+"""
+Tests for memoized skill normalization and interned skill IDs.
+"""
+import numpy as np
+
+from analyzers.enhanced_matcher import EnhancedSkillMatcher
+from analyzers.skill_ids import (
+    SKILL_ID_BITS,
+    canonicalize_skill_name,
+    count_shared_skills,
+    first_skill_by_id,
+    get_skill_interner,
+    normalize_skill_name,
+    serialize_skill_ids,
+    skill_id,
+    skill_ids,
+)
+from models.job_vacancy import JobVacancy
+from models.resume_analysis import ResumeAnalysis
+
+
+class TestNormalization:
+    """Tests for the memoized normalizers."""
+
+    def test_normalize_collapses_whitespace(self):
+        """Test whitespace collapsing and lowercasing."""
+        assert normalize_skill_name("  React   JS ") == "react js"
+
+    def test_canonicalize_drops_punctuation(self):
+        """Test that only meaningful punctuation is kept."""
+        assert canonicalize_skill_name("Node-JS") == "nodejs"
+        assert canonicalize_skill_name(" C++ ") == "c++"
+        assert canonicalize_skill_name("C#") == "c#"
+        assert canonicalize_skill_name(".NET") == ".net"
+
+    def test_matcher_uses_canonical_form(self):
+        """Test that EnhancedSkillMatcher normalization is unchanged."""
+        for name in ["React.js", "  Machine   Learning ", "CI/CD", "C++", "Node-JS"]:
+            assert EnhancedSkillMatcher.normalize_skill_name(name) == canonicalize_skill_name(name)
+
+
+class TestSkillIds:
+    """Tests for interned skill IDs."""
+
+    def test_same_normalized_name_same_id(self):
+        """Test that spellings normalizing alike share an ID."""
+        assert skill_id("PostgreSQL") == skill_id("  postgresql ")
+        assert skill_id("C++") != skill_id("C#")
+
+    def test_ids_are_stable_and_json_safe(self):
+        """Test that IDs come from the name only and fit in 53 bits."""
+        ids = serialize_skill_ids(["Python", "Docker"])
+        assert all(0 <= i < 2 ** SKILL_ID_BITS for i in ids)
+        assert ids == serialize_skill_ids(["docker", "PYTHON", "python"])
+
+    def test_interner_resolves_names(self):
+        """Test that interned IDs map back to normalized names."""
+        assert get_skill_interner().name(skill_id("Kubernetes")) == "kubernetes"
+
+    def test_skill_ids_sorted_unique(self):
+        """Test that ID arrays are sorted and deduplicated."""
+        ids = skill_ids(["React", "react", "Go", ""])
+        assert ids.dtype == np.int64
+        assert len(ids) == 2
+        assert list(ids) == sorted(ids)
+        assert len(skill_ids(None)) == 0
+
+    def test_set_operations(self):
+        """Test shared skill counts on ID arrays."""
+        resume = skill_ids(["Python", "Django", "PostgreSQL"])
+        vacancy = skill_ids(["python", "postgresql", "Kubernetes"])
+        assert count_shared_skills(resume, vacancy) == 2
+
+    def test_first_skill_by_id_keeps_first_spelling(self):
+        """Test that the first spelling of a skill wins."""
+        by_id = first_skill_by_id(["ReactJS", "reactjs", "Go"])
+        assert by_id[skill_id("REACTJS")] == "ReactJS"
+        assert len(by_id) == 2
+
+
+class TestResumeAnalysisSkillIds:
+    """Tests for skill IDs persisted with ResumeAnalysis and JobVacancy."""
+
+    def test_skill_ids_follow_skills(self):
+        """Test that assigning skills recomputes skill_ids."""
+        analysis = ResumeAnalysis(skills=["Python", "python", "Docker"])
+        assert analysis.skill_ids == serialize_skill_ids(["Python", "Docker"])
+
+        analysis.skills = None
+        assert analysis.skill_ids is None
+
+    def test_required_skill_ids_follow_required_skills(self):
+        """Test that assigning vacancy skills recomputes required_skill_ids."""
+        vacancy = JobVacancy(title="Backend", description="", required_skills=["Python", "Docker"])
+        assert vacancy.required_skill_ids == serialize_skill_ids(["docker", "python"])
+
+        vacancy.required_skills = []
+        assert vacancy.required_skill_ids == []
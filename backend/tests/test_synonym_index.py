@@ -0,0 +1,89 @@
+"""
+Tests for the inverted synonym index.
+
+Variants are checked against the full scan over the synonyms map that the
+matchers used before the index existed.
+"""
+from analyzers.enhanced_matcher import EnhancedSkillMatcher
+from analyzers.synonym_index import SynonymIndex, get_synonym_index
+
+normalize = EnhancedSkillMatcher.normalize_skill_name
+
+SYNONYMS = {
+    "SQL": ["SQL", "PostgreSQL", "MySQL"],
+    "PostgreSQL": ["PostgreSQL", "Postgres"],
+    "React": ["React", "ReactJS", "React.js"],
+    "Node.js": ["NodeJS", "Node"],
+    "C++": ["C++", "cpp"],
+}
+
+
+def _scan_variants(synonyms_map, normalized_required):
+    """Variants as found by the previous linear scan."""
+    all_variants = {normalized_required}
+    for canonical_name, synonym_list in synonyms_map.items():
+        normalized_canonical = normalize(canonical_name)
+        if normalized_canonical == normalized_required:
+            all_variants.update(normalize(s) for s in synonym_list)
+        else:
+            for synonym in synonym_list:
+                if normalize(synonym) == normalized_required:
+                    all_variants.add(normalized_canonical)
+                    all_variants.update(normalize(s) for s in synonym_list)
+                    break
+    return all_variants
+
+
+class TestSynonymIndex:
+    """Tests for SynonymIndex."""
+
+    def test_variants_match_linear_scan(self):
+        """Test that every skill gets the same variants as the old scan."""
+        index = SynonymIndex(SYNONYMS, normalize)
+        skills = {normalize(s) for name, group in SYNONYMS.items() for s in [name, *group]}
+        for skill in skills | {"kotlin"}:
+            assert index.variants(skill) == _scan_variants(SYNONYMS, skill)
+
+    def test_skill_in_several_entries(self):
+        """Test that a variant shared by two entries merges both groups."""
+        index = SynonymIndex(SYNONYMS, normalize)
+        assert index.variants("postgresql") == {"sql", "postgresql", "mysql", "postgres"}
+        assert len(index.canonical_ids("postgresql")) == 2
+
+    def test_unknown_skill(self):
+        """Test that an unknown skill is only equivalent to itself."""
+        index = SynonymIndex(SYNONYMS, normalize)
+        assert index.variants("kotlin") == {"kotlin"}
+        assert index.canonical_ids("kotlin") == []
+
+    def test_canonical_name_not_in_its_list(self):
+        """Test that the canonical name is indexed even when not listed as a synonym."""
+        index = SynonymIndex(SYNONYMS, normalize)
+        assert "node.js" in index.variants("node")
+
+
+class TestGetSynonymIndex:
+    """Tests for the synonym index cache."""
+
+    def test_index_reused_for_same_map(self):
+        """Test that the index is built once per map and normalizer."""
+        assert get_synonym_index(SYNONYMS, normalize) is get_synonym_index(SYNONYMS, normalize)
+
+    def test_bound_methods_share_index(self):
+        """Test that normalizers from different matcher instances share the index."""
+        first = get_synonym_index(SYNONYMS, EnhancedSkillMatcher().normalize_skill_name)
+        second = get_synonym_index(SYNONYMS, EnhancedSkillMatcher().normalize_skill_name)
+        assert first is second
+
+    def test_new_map_rebuilds_index(self):
+        """Test that a reloaded map object gets its own index."""
+        reloaded = {**SYNONYMS, "Kotlin": ["Kotlin", "KT"]}
+        index = get_synonym_index(reloaded, normalize)
+        assert index is not get_synonym_index(SYNONYMS, normalize)
+        assert index.variants("kt") == {"kotlin", "kt"}
+
+    def test_enhanced_matcher_shares_loaded_map(self):
+        """Test that matcher instances reuse the parsed synonyms file."""
+        first = EnhancedSkillMatcher().load_synonyms()
+        second = EnhancedSkillMatcher().load_synonyms()
+        assert first is second
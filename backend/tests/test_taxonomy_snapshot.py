@@ -0,0 +1,182 @@
+"""
+Tests for versioned taxonomy snapshots.
+"""
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from analyzers.taxonomy_loader import TaxonomyLoader
+from analyzers.taxonomy_snapshot import (
+    TaxonomySnapshot,
+    TaxonomySnapshotStore,
+    publish_taxonomy_snapshot,
+    write_taxonomy_snapshot,
+)
+
+SCOPES = {
+    ("static", ""): {
+        "React": ["React", "ReactJS"],
+        "PostgreSQL": ["PostgreSQL", "Postgres"],
+    },
+    ("industry", "tech"): {
+        "React": ["React", "React.js"],
+        "Kubernetes": ["Kubernetes", "K8s"],
+    },
+    ("organization", "org1"): {
+        "React": ["React", "OurReact"],
+        "Машинное обучение": ["Машинное обучение", "ML"],
+    },
+}
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    """Snapshot of the sample scopes."""
+    path = tmp_path / "taxonomy-1.bin"
+    write_taxonomy_snapshot(path, 1, SCOPES)
+    return TaxonomySnapshot(path)
+
+
+class TestTaxonomySnapshot:
+    """Tests for TaxonomySnapshot."""
+
+    def test_roundtrip(self, snapshot):
+        """Test that every scope reads back as written."""
+        assert snapshot.version == 1
+        assert sorted(snapshot.scopes()) == sorted(SCOPES)
+        for (kind, scope_id), taxonomy in SCOPES.items():
+            assert snapshot.synonyms(kind, scope_id) == taxonomy
+        assert len(snapshot) == 6
+
+    def test_missing_scope(self, snapshot):
+        """Test that unknown scopes are empty."""
+        assert snapshot.synonyms("industry", "healthcare") == {}
+
+    def test_merge_matches_loader(self, snapshot):
+        """Test that merging follows TaxonomyLoader's priority rules."""
+        loader = TaxonomyLoader(use_cache=False)
+        with patch.object(loader, "load_static_synonyms", return_value=SCOPES[("static", "")]), \
+                patch.object(loader, "load_industry_taxonomies", return_value=SCOPES[("industry", "tech")]), \
+                patch.object(loader, "load_custom_synonyms", return_value=SCOPES[("organization", "org1")]), \
+                patch("analyzers.taxonomy_loader.get_taxonomy_snapshot", return_value=None):
+            expected = loader.load_for_organization("org1", "tech")
+
+        merged = snapshot.merged("org1", "tech")
+        assert merged.keys() == expected.keys()
+        for skill, variants in expected.items():
+            assert sorted(merged[skill]) == sorted(variants)
+
+    def test_merged_cached_per_snapshot(self, snapshot):
+        """Test that merged taxonomies are built once per snapshot."""
+        assert snapshot.merged("org1", "tech") is snapshot.merged("org1", "tech")
+
+    def test_empty_snapshot(self, tmp_path):
+        """Test a snapshot without any entries."""
+        path = tmp_path / "taxonomy-1.bin"
+        write_taxonomy_snapshot(path, 1, {})
+        empty = TaxonomySnapshot(path)
+        assert len(empty) == 0
+        assert empty.merged("org1", "tech") == {}
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test that a file without the snapshot header is refused."""
+        path = tmp_path / "taxonomy-1.bin"
+        path.write_bytes(b"not a snapshot at all")
+        with pytest.raises(ValueError):
+            TaxonomySnapshot(path)
+
+
+class TestTaxonomySnapshotStore:
+    """Tests for TaxonomySnapshotStore."""
+
+    def test_nothing_published(self, tmp_path):
+        """Test that readers get None before the first publish."""
+        assert TaxonomySnapshotStore(tmp_path).current() is None
+
+    def test_readers_swap_to_new_version(self, tmp_path):
+        """Test that another store on the same directory sees each new version."""
+        writer = TaxonomySnapshotStore(tmp_path)
+        reader = TaxonomySnapshotStore(tmp_path, check_interval=0)
+
+        assert writer.publish(SCOPES) == 1
+        first = reader.current()
+        assert first.synonyms("organization", "org1")["React"] == ["React", "OurReact"]
+
+        changed = {**SCOPES, ("organization", "org1"): {"React": ["React", "ReactNative"]}}
+        assert writer.publish(changed) == 2
+        second = reader.current()
+
+        assert second.version == 2
+        assert second.synonyms("organization", "org1")["React"] == ["React", "ReactNative"]
+        # The old snapshot stays usable by code still holding it
+        assert first.synonyms("organization", "org1")["React"] == ["React", "OurReact"]
+
+    def test_check_interval_limits_polling(self, tmp_path):
+        """Test that the version is not re-read within the check interval."""
+        writer = TaxonomySnapshotStore(tmp_path)
+        reader = TaxonomySnapshotStore(tmp_path, check_interval=3600)
+        writer.publish(SCOPES)
+        first = reader.current()
+
+        writer.publish(SCOPES)
+        assert reader.current() is first
+
+    def test_old_versions_removed(self, tmp_path):
+        """Test that only the latest versions are kept on disk."""
+        store = TaxonomySnapshotStore(tmp_path)
+        for _ in range(4):
+            store.publish(SCOPES)
+        assert sorted(p.name for p in tmp_path.glob("taxonomy-*.bin")) == ["taxonomy-3.bin", "taxonomy-4.bin"]
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return SimpleNamespace(all=lambda: self._rows)
+
+
+class _FakeSession:
+    """Async session returning taxonomy rows, then custom synonym rows."""
+
+    def __init__(self, taxonomies, synonyms):
+        self._results = [taxonomies, synonyms]
+
+    async def execute(self, query):
+        return _FakeResult(self._results.pop(0))
+
+
+class TestPublishTaxonomySnapshot:
+    """Tests for publishing snapshots from the database."""
+
+    @pytest.mark.asyncio
+    async def test_publish_from_database(self, tmp_path):
+        """Test that database rows end up in the published snapshot."""
+        store = TaxonomySnapshotStore(tmp_path, check_interval=0)
+        db = _FakeSession(
+            [SimpleNamespace(industry="tech", skill_name="Kubernetes", variants=["K8s"])],
+            [SimpleNamespace(organization_id="org1", canonical_skill="React", custom_synonyms=["OurReact"])],
+        )
+
+        with patch("analyzers.taxonomy_snapshot.get_taxonomy_snapshot_store", return_value=store):
+            version = await publish_taxonomy_snapshot(db)
+
+        snapshot = store.current()
+        assert version == 1
+        assert snapshot.synonyms("industry", "tech") == {"Kubernetes": ["Kubernetes", "K8s"]}
+        assert snapshot.merged("org1", "tech")["React"] == ["React", "OurReact"]
+        assert snapshot.synonyms("static")
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_is_logged(self, tmp_path):
+        """Test that a failing database does not raise."""
+        class BrokenSession:
+            async def execute(self, query):
+                raise RuntimeError("database is down")
+
+        store = TaxonomySnapshotStore(tmp_path)
+        with patch("analyzers.taxonomy_snapshot.get_taxonomy_snapshot_store", return_value=store):
+            assert await publish_taxonomy_snapshot(BrokenSession()) is None
+        assert store.current() is None
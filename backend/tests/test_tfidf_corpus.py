@@ -0,0 +1,129 @@
+"""
+Tests for the corpus-level TF-IDF index.
+
+Scores are checked against sklearn's TfidfVectorizer fitted on the live
+documents, after incremental adds, replacements and deletes, and across
+processes sharing the same directory.
+"""
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from analyzers.tfidf_corpus import CorpusTfidfIndex
+from analyzers.tfidf_matcher import TOKEN_PATTERN
+
+RESUMES = {
+    "r1": "Senior Python developer. Django, PostgreSQL, Docker and Kubernetes in production.",
+    "r2": "Java engineer: Spring Boot, Kafka, PostgreSQL. Some Python scripting.",
+    "r3": "Frontend developer with React, TypeScript and Node.js experience.",
+    "r4": "Data scientist: Python, pandas, scikit-learn, machine learning, SQL.",
+}
+VACANCIES = {
+    "v1": "Backend Python Developer Django PostgreSQL Docker",
+    "v2": "Machine learning engineer Python scikit-learn",
+}
+
+
+def _reference_scores(documents, query_text, targets):
+    """Cosine scores from sklearn fitted on all live documents."""
+    vectorizer = TfidfVectorizer(
+        stop_words="english",
+        ngram_range=(1, 2),
+        token_pattern=TOKEN_PATTERN,
+        sublinear_tf=True,
+    )
+    vectorizer.fit(list(documents.values()))
+    matrix = vectorizer.transform([targets[key] for key in sorted(targets)])
+    query = vectorizer.transform([query_text])
+    scores = (matrix @ query.T).toarray().ravel()
+    return dict(zip(sorted(targets), scores))
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Corpus with all sample resumes and vacancies."""
+    index = CorpusTfidfIndex(tmp_path / "corpus")
+    index.add_documents("resume", list(RESUMES.items()))
+    index.add_documents("vacancy", list(VACANCIES.items()))
+    return index
+
+
+class TestCorpusTfidfIndex:
+    """Tests for CorpusTfidfIndex."""
+
+    def test_scores_match_sklearn(self, corpus):
+        """Test that vacancy-to-resume scores equal sklearn TF-IDF cosines."""
+        hits = dict(corpus.score_document("vacancy", "v1", "resume"))
+        expected = _reference_scores({**RESUMES, **VACANCIES}, VACANCIES["v1"], RESUMES)
+
+        assert hits.keys() == expected.keys()
+        for resume_id, score in expected.items():
+            assert hits[resume_id] == pytest.approx(score, abs=1e-6)
+
+    def test_results_sorted_and_limited(self, corpus):
+        """Test that results are best first and cut at k."""
+        hits = corpus.score_document("vacancy", "v1", "resume", k=2)
+        assert len(hits) == 2
+        assert hits[0][0] == "r1"
+        assert hits[0][1] >= hits[1][1]
+
+    def test_resume_against_vacancies(self, corpus):
+        """Test scoring one resume against every vacancy."""
+        hits = corpus.score_document("resume", "r4", "vacancy")
+        assert [vacancy_id for vacancy_id, _ in hits] == ["v2", "v1"]
+
+    def test_score_text(self, corpus):
+        """Test scoring a text that is not stored in the corpus."""
+        hits = corpus.score_text("React TypeScript developer", "resume", k=1)
+        assert hits[0][0] == "r3"
+
+    def test_idf_reflects_corpus(self, corpus):
+        """Test that common terms get a lower IDF than rare ones."""
+        assert corpus.idf("python") < corpus.idf("kafka")
+        assert corpus.idf("never-seen-term") > corpus.idf("kafka")
+
+    def test_replace_and_remove_update_statistics(self, corpus):
+        """Test that replacements and deletes give the same scores as a refit."""
+        replaced = "Rust systems programmer, embedded C and C++"
+        corpus.add_document("resume", "r2", replaced)
+        corpus.remove_document("resume", "r3")
+
+        live_resumes = {"r1": RESUMES["r1"], "r2": replaced, "r4": RESUMES["r4"]}
+        expected = _reference_scores({**live_resumes, **VACANCIES}, VACANCIES["v2"], live_resumes)
+        hits = dict(corpus.score_document("vacancy", "v2", "resume"))
+
+        assert corpus.count("resume") == 3
+        assert hits.keys() == expected.keys()
+        for resume_id, score in expected.items():
+            assert hits[resume_id] == pytest.approx(score, abs=1e-6)
+
+    def test_unknown_document(self, corpus):
+        """Test that a missing query document gives no results."""
+        assert corpus.score_document("vacancy", "missing", "resume") == []
+
+    def test_empty_corpus(self, tmp_path):
+        """Test that an empty corpus scores nothing."""
+        index = CorpusTfidfIndex(tmp_path / "empty")
+        assert index.score_text("python developer", "resume") == []
+        assert len(index) == 0
+
+    def test_shared_between_processes(self, corpus, tmp_path):
+        """Test that another instance on the same directory sees journal updates."""
+        other = CorpusTfidfIndex(tmp_path / "corpus")
+        assert len(other) == len(RESUMES) + len(VACANCIES)
+
+        corpus.add_document("resume", "r5", "Python Django developer")
+        assert other.count("resume") == len(RESUMES) + 1
+
+    def test_snapshot_roundtrip(self, corpus, tmp_path):
+        """Test that compaction keeps scores and drops unused terms."""
+        corpus.remove_document("resume", "r3")
+        before = corpus.score_document("vacancy", "v1", "resume")
+        corpus.compact()
+
+        reloaded = CorpusTfidfIndex(tmp_path / "corpus")
+        after = reloaded.score_document("vacancy", "v1", "resume")
+
+        assert [doc_id for doc_id, _ in after] == [doc_id for doc_id, _ in before]
+        np.testing.assert_allclose([s for _, s in after], [s for _, s in before], atol=1e-6)
+        assert "typescript" not in reloaded._vocabulary
@@ -0,0 +1,106 @@
+"""
+Tests for TF-IDF skill matching with compiled vacancy profiles.
+
+Tests cover profile caching by content hash, invalidation, and that
+matching through a profile gives the same result as fitting per call.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from analyzers import tfidf_matcher
+from analyzers.tfidf_matcher import (
+    TfidfSkillMatcher,
+    invalidate_vacancy_profile,
+    vacancy_content_hash,
+)
+
+JOB_TITLE = "Senior Python Developer"
+JOB_DESCRIPTION = (
+    "We are looking for a Python developer with Django and PostgreSQL experience. "
+    "Knowledge of machine learning and Docker is a plus."
+)
+REQUIRED_SKILLS = ["Python", "Django", "PostgreSQL", "Kubernetes"]
+RESUMES = [
+    "Python developer, 5 years of Django and PostgreSQL, some Docker.",
+    "Java engineer with Spring and Kubernetes.",
+    "Data scientist: Python, machine learning, pandas.",
+]
+
+
+@pytest.fixture(autouse=True)
+def empty_profile_cache():
+    """Start every test with an empty profile cache."""
+    with patch.object(tfidf_matcher, "_profile_cache", type(tfidf_matcher._profile_cache)()):
+        yield
+
+
+def _reference_match(matcher, resume_text):
+    """Score a resume by fitting the job text directly, without a profile."""
+    keywords, scores = matcher._extract_keywords_from_job(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+    matched, missing = matcher._find_keyword_matches(resume_text.lower(), keywords)
+    total = sum(scores.get(kw, 0.1) for kw in keywords)
+    return sum(scores.get(kw, 0.1) for kw in matched) / total, sorted(matched)
+
+
+class TestVacancyProfile:
+    """Tests for compiled vacancy profiles."""
+
+    def test_content_hash_depends_on_skill_boundaries(self):
+        """Test that skills are hashed as a list, not as joined text."""
+        assert vacancy_content_hash("t", "d", ["machine learning"]) != vacancy_content_hash(
+            "t", "d", ["machine", "learning"]
+        )
+
+    def test_profile_fitted_once_per_vacancy(self):
+        """Test that repeated matches reuse the compiled profile."""
+        matcher = TfidfSkillMatcher()
+        with patch.object(matcher, "_extract_keywords_from_job", wraps=matcher._extract_keywords_from_job) as fit:
+            for resume in RESUMES:
+                matcher.match(resume, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+        assert fit.call_count == 1
+
+    def test_profile_shared_between_matchers(self):
+        """Test that matchers with the same settings share cached profiles."""
+        first = TfidfSkillMatcher().compile_profile(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+        second = TfidfSkillMatcher(threshold=0.9).compile_profile(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+        other_cutoff = TfidfSkillMatcher(tfidf_cutoff=0.2).compile_profile(
+            JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS
+        )
+        assert first is second
+        assert other_cutoff is not first
+
+    def test_invalidation_drops_profile(self):
+        """Test that invalidating a vacancy's old content forces a refit."""
+        matcher = TfidfSkillMatcher()
+        profile = matcher.compile_profile(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+
+        assert invalidate_vacancy_profile(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS) == 1
+        assert matcher.compile_profile(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS) is not profile
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used profiles are dropped."""
+        matcher = TfidfSkillMatcher()
+        with patch.object(tfidf_matcher, "PROFILE_CACHE_SIZE", 2):
+            for i in range(3):
+                matcher.compile_profile(f"Developer {i}", JOB_DESCRIPTION, REQUIRED_SKILLS)
+        assert len(tfidf_matcher._profile_cache) == 2
+
+    @pytest.mark.parametrize("resume_text", RESUMES)
+    def test_profile_match_equals_direct_fit(self, resume_text):
+        """Test that profile-based scores equal fitting the job text per call."""
+        matcher = TfidfSkillMatcher()
+        result = matcher.match(resume_text, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+        score, matched = _reference_match(matcher, resume_text)
+
+        assert result.score == pytest.approx(score)
+        assert sorted(result.matched_keywords) == matched
+
+    def test_required_skills_always_keywords(self):
+        """Test that required skills are profile keywords even with a low TF-IDF score."""
+        matcher = TfidfSkillMatcher()
+        profile = matcher.compile_profile(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+        matched, missing = profile.scan(RESUMES[0].lower())
+
+        assert "kubernetes" in missing
+        assert "django" in matched
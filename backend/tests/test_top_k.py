@@ -0,0 +1,58 @@
+"""
+Tests for the bounded top-K heap.
+"""
+import random
+
+import pytest
+
+from analyzers.top_k import TopK
+
+
+class TestTopK:
+    """Tests for TopK."""
+
+    def test_keeps_best_items(self):
+        """Test that only the k best items are kept, best first."""
+        top = TopK(2)
+        for name, score in [("a", 0.4), ("b", 0.9), ("c", 0.7), ("d", 0.1)]:
+            top.push(score, name)
+
+        assert top.items() == [(0.9, "b"), (0.7, "c")]
+        assert top.pushed == 4
+        assert len(top) == 2
+
+    def test_matches_stable_sort(self):
+        """Test that ties keep arrival order, as a stable sort would."""
+        rng = random.Random(7)
+        scores = [round(rng.random(), 1) for _ in range(500)]
+
+        top = TopK(25)
+        for position, score in enumerate(scores):
+            top.push(score, position)
+
+        expected = sorted(enumerate(scores), key=lambda item: item[1], reverse=True)[:25]
+        assert top.items() == [(score, position) for position, score in expected]
+
+    def test_cutoff(self):
+        """Test that the cutoff is the k-th best score once full."""
+        top = TopK(2)
+        top.push(0.5, "a")
+        assert top.cutoff is None
+        assert top.accepts(0.0) is True
+
+        top.push(0.8, "b")
+        assert top.cutoff == 0.5
+        assert top.accepts(0.5) is False
+        assert top.accepts(0.6) is True
+
+    def test_later_tie_not_kept(self):
+        """Test that a later item never displaces an earlier one with the same score."""
+        top = TopK(1)
+        assert top.push(0.5, "first") is True
+        assert top.push(0.5, "second") is False
+        assert top.items() == [(0.5, "first")]
+
+    def test_invalid_k(self):
+        """Test that k must be positive."""
+        with pytest.raises(ValueError):
+            TopK(0)
@@ -0,0 +1,357 @@
+"""
+Tests for the compiled vacancy path of the unified skill matcher.
+
+Tests cover compile_vacancy(), parity of match_compiled() with match(),
+and rank_candidates() using a single compiled vacancy.
+"""
+import pytest
+from unittest.mock import patch
+
+import numpy as np
+
+from analyzers.unified_matcher import CompiledVacancy, UnifiedSkillMatcher
+from analyzers.vector_matcher import VectorMatchResult
+
+
+JOB_TITLE = "Senior Backend Developer"
+JOB_DESCRIPTION = (
+    "We build Python APIs with Django and PostgreSQL, deployed on Kubernetes. "
+    "Experience with Redis and Celery is a plus."
+)
+REQUIRED_SKILLS = ["Python", "Django", "SQL", "Kubernetes", "Rust"]
+
+CANDIDATES = [
+    {
+        "id": "1",
+        "resume_text": "Python developer, Django and PostgreSQL, some Kubernetes.",
+        "resume_skills": ["Python", "Django", "PostgreSQL", "Kubernets"],
+    },
+    {
+        "id": "2",
+        "resume_text": "Frontend engineer working with React and TypeScript.",
+        "resume_skills": ["ReactJS", "TypeScript"],
+    },
+    {
+        "id": "3",
+        "resume_text": "Rust and Python systems programmer using Redis.",
+        "resume_skills": ["Rust", "Python", "Redis"],
+    },
+]
+
+
+@pytest.fixture
+def matcher():
+    """Unified matcher without vector matching (deterministic scores)."""
+    matcher = UnifiedSkillMatcher()
+    matcher.vector_matcher = None
+    return matcher
+
+
+class TestCompileVacancy:
+    """Tests for compile_vacancy method."""
+
+    def test_compiles_vacancy_side(self, matcher):
+        """Test that the compiled vacancy holds skills and the TF-IDF profile."""
+        compiled = matcher.compile_vacancy(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+
+        assert isinstance(compiled, CompiledVacancy)
+        assert compiled.required_skills == tuple(REQUIRED_SKILLS)
+        assert [c.skill for c in compiled.skills] == REQUIRED_SKILLS
+        assert compiled.tfidf_profile.keywords
+        assert compiled.job_embedding is None
+
+    def test_compiled_vacancy_is_immutable(self, matcher):
+        """Test that a compiled vacancy cannot be modified."""
+        compiled = matcher.compile_vacancy(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+
+        with pytest.raises(AttributeError):
+            compiled.job_title = "Other"
+
+    def test_job_embedding_encoded_once(self, matcher):
+        """Test that the job text is encoded at compile time and kept read-only."""
+        with patch.object(matcher, "vector_matcher", create=True) as vector_matcher:
+            vector_matcher.compose_job_text.return_value = "job text"
+            vector_matcher._encode_text.return_value = np.ones(4)
+
+            compiled = matcher.compile_vacancy(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+
+        vector_matcher._encode_text.assert_called_once_with("job text")
+        assert not compiled.job_embedding.flags.writeable
+
+
+class TestMatchCompiled:
+    """Tests for match_compiled method."""
+
+    @pytest.mark.parametrize("candidate", CANDIDATES, ids=lambda c: c["id"])
+    def test_identical_to_match(self, matcher, candidate):
+        """Test that matching a compiled vacancy gives the match() result."""
+        compiled = matcher.compile_vacancy(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+
+        result = matcher.match_compiled(
+            candidate["resume_text"], candidate["resume_skills"], compiled
+        )
+        expected = matcher.match(
+            resume_text=candidate["resume_text"],
+            resume_skills=candidate["resume_skills"],
+            job_title=JOB_TITLE,
+            job_description=JOB_DESCRIPTION,
+            required_skills=REQUIRED_SKILLS,
+        )
+
+        assert result == expected
+
+    def test_no_vacancy_side_work(self, matcher):
+        """Test that matching a compiled vacancy does not recompile it."""
+        compiled = matcher.compile_vacancy(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+
+        with patch.object(matcher.tfidf_matcher, "compile_profile") as compile_profile, \
+                patch.object(matcher.keyword_matcher, "compile_required_skills") as compile_skills:
+            matcher.match_compiled("Python developer", ["Python"], compiled)
+
+        compile_profile.assert_not_called()
+        compile_skills.assert_not_called()
+
+
+class TestRankCandidates:
+    """Tests for rank_candidates method."""
+
+    def test_compiles_vacancy_once(self, matcher):
+        """Test that ranking compiles the vacancy once for all candidates."""
+        with patch.object(matcher, "compile_vacancy", wraps=matcher.compile_vacancy) as compile_vacancy:
+            ranked = matcher.rank_candidates(
+                CANDIDATES, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS
+            )
+
+        compile_vacancy.assert_called_once()
+        assert len(ranked) == len(CANDIDATES)
+        assert ranked[0]["id"] == "1"
+        scores = [c["overall_score"] for c in ranked]
+        assert scores == sorted(scores, reverse=True)
+
+
+class FakeVectorMatcher:
+    """Vector matcher scoring resumes by a fixed similarity per text."""
+
+    batch_size = 2
+
+    def __init__(self, similarities):
+        self.similarities = similarities
+        self.encoded = []
+
+    def compose_job_text(self, job_title, job_description, required_skills):
+        return "job"
+
+    def _encode_text(self, text):
+        return self._encode_texts([text])[0]
+
+    def _encode_texts(self, texts):
+        self.encoded.extend(texts)
+        return [np.array([self.similarities.get(text, 1.0)]) for text in texts]
+
+    def cosine_similarities(self, texts, job_embedding):
+        return [float(embedding[0]) for embedding in self._encode_texts(texts)]
+
+    def match(self, resume_text, job_title, job_description, required_skills, embeddings=None, similarity=None):
+        if similarity is None:
+            similarity = float(embeddings[0][0])
+        else:
+            # A precomputed similarity must be the resume's own, not a placeholder
+            assert similarity == self.similarities.get(resume_text, 1.0)
+        return VectorMatchResult(similarity=similarity, score=similarity, passed=similarity >= 0.5, method="cosine")
+
+
+@pytest.fixture
+def pool():
+    """Candidate pool with spread keyword, TF-IDF and vector scores."""
+    texts = [
+        "Python Django PostgreSQL Kubernetes Rust developer",
+        "Python Django developer",
+        "Python developer",
+        "Frontend React developer",
+        "Java Spring developer",
+        "Rust Kubernetes engineer",
+    ]
+    skills = [
+        ["Python", "Django", "PostgreSQL", "Kubernetes", "Rust"],
+        ["Python", "Django"],
+        ["Python"],
+        ["React"],
+        ["Java"],
+        ["Rust", "Kubernetes"],
+    ]
+    similarities = dict(zip(texts, [0.9, 0.3, 0.95, 0.99, 0.1, 0.6]))
+    candidates = [
+        {"id": str(i), "resume_text": text, "resume_skills": skill_list}
+        for i, (text, skill_list) in enumerate(zip(texts, skills))
+    ]
+    return candidates, similarities
+
+
+def make_matcher(similarities, **kwargs):
+    matcher = UnifiedSkillMatcher(**kwargs)
+    matcher.vector_matcher = FakeVectorMatcher(similarities)
+    return matcher
+
+
+class TestVectorScores:
+    """Tests for passing vector similarities through to results."""
+
+    def test_rank_candidates_keeps_per_candidate_scores(self, pool):
+        """Test that each ranked candidate gets its own vector score."""
+        candidates, similarities = pool
+        matcher = make_matcher(similarities)
+
+        ranked = matcher.rank_candidates(candidates, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+
+        scores = {c["resume_text"]: c["match_result"]["vector_score"] for c in ranked}
+        assert scores == {text: round(value, 3) for text, value in similarities.items()}
+
+    def test_match_compiled_uses_embeddings(self, pool):
+        """Test that a single compiled match scores the resume embedding."""
+        candidates, similarities = pool
+        matcher = make_matcher(similarities)
+        compiled = matcher.compile_vacancy(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+
+        result = matcher.match_compiled(candidates[0]["resume_text"], candidates[0]["resume_skills"], compiled)
+
+        assert result.vector_similarity == 0.9
+
+
+class TestCascade:
+    """Tests for cascade scoring with early exit."""
+
+    def test_ruled_out_resume_is_bounded(self, pool):
+        """Test that a resume that cannot pass skips vector matching."""
+        candidates, similarities = pool
+        matcher = make_matcher(similarities, overall_threshold=0.7)
+        compiled = matcher.compile_vacancy(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+        matcher.vector_matcher.encoded.clear()
+
+        result = matcher.match_compiled(
+            candidates[4]["resume_text"], candidates[4]["resume_skills"], compiled, cascade=True
+        )
+
+        assert result.bounded is True
+        assert result.passed is False
+        assert result.vector_score == 0.0
+        assert matcher.vector_matcher.encoded == []
+
+    def test_reachable_resume_is_scored(self, pool):
+        """Test that a resume that can still pass gets the full result."""
+        candidates, similarities = pool
+        matcher = make_matcher(similarities, overall_threshold=0.5)
+        compiled = matcher.compile_vacancy(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+        candidate = candidates[0]
+
+        result = matcher.match_compiled(
+            candidate["resume_text"], candidate["resume_skills"], compiled, cascade=True
+        )
+        expected = matcher.match_compiled(
+            candidate["resume_text"], candidate["resume_skills"], compiled, cascade=False
+        )
+
+        assert result.bounded is False
+        assert result == expected
+
+    def test_min_score_bounds_result(self, pool):
+        """Test that a resume below the given cutoff is bounded."""
+        candidates, similarities = pool
+        matcher = make_matcher(similarities, overall_threshold=0.0)
+        compiled = matcher.compile_vacancy(JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+        candidate = candidates[2]
+
+        result = matcher.match_compiled(
+            candidate["resume_text"], candidate["resume_skills"], compiled, cascade=True, min_score=0.99
+        )
+
+        assert result.bounded is True
+
+    @pytest.mark.parametrize("top_k", [1, 2, 3])
+    @pytest.mark.parametrize("threshold", [0.0, 0.4, 0.6])
+    def test_top_k_is_exact(self, pool, top_k, threshold):
+        """Test that cascade ranking keeps the exact top-K of passing candidates."""
+        candidates, similarities = pool
+        exact = make_matcher(similarities, overall_threshold=threshold).rank_candidates(
+            candidates, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS
+        )
+        matcher = make_matcher(similarities, overall_threshold=threshold, cascade=True)
+        ranked = matcher.rank_candidates(
+            candidates, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS, top_k=top_k
+        )
+
+        expected = [c for c in exact if c["match_result"]["passed"]][:top_k]
+        assert ranked[:len(expected)] == expected
+        assert not any(c["match_result"]["bounded"] for c in ranked[:len(expected)])
+
+    def test_cascade_skips_forward_passes(self, pool):
+        """Test that cascade ranking encodes fewer resumes."""
+        candidates, similarities = pool
+        matcher = make_matcher(similarities, overall_threshold=0.0)
+        matcher.rank_candidates(candidates, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+        full = len(matcher.vector_matcher.encoded)
+
+        matcher = make_matcher(similarities, overall_threshold=0.0, cascade=True)
+        ranked = matcher.rank_candidates(
+            candidates, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS, top_k=1
+        )
+
+        assert len(matcher.vector_matcher.encoded) < full
+        assert any(c["match_result"]["bounded"] for c in ranked)
+
+
+class TestStreamTopCandidates:
+    """Tests for streaming top-K ranking."""
+
+    @pytest.mark.parametrize("k", [1, 3, 10])
+    def test_same_as_rank_candidates(self, pool, k):
+        """Test that streaming top-K gives the head of the full ranking."""
+        candidates, similarities = pool
+        matcher = make_matcher(similarities)
+
+        expected = matcher.rank_candidates(candidates, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS)
+        ranked = matcher.rank_top_candidates(
+            iter(candidates), JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS, k=k
+        )
+
+        assert ranked == expected[:k]
+
+    def test_snapshots(self, pool):
+        """Test that intermediate snapshots are lightweight and the last is final."""
+        candidates, similarities = pool
+        matcher = make_matcher(similarities)
+
+        snapshots = list(matcher.stream_top_candidates(
+            candidates, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS, k=2, snapshot_every=2
+        ))
+
+        assert [s.processed for s in snapshots] == [2, 4, 6, 6]
+        assert [s.final for s in snapshots] == [False, False, False, True]
+        assert set(snapshots[0].candidates[0]) == {"id", "overall_score"}
+        assert "match_result" in snapshots[-1].candidates[0]
+        assert [c["id"] for c in snapshots[-2].candidates] == [c["id"] for c in snapshots[-1].candidates]
+
+    def test_cascade_keeps_exact_top_k(self, pool):
+        """Test that cascade streaming returns the exact top-K of passing candidates."""
+        candidates, similarities = pool
+        exact = make_matcher(similarities, overall_threshold=0.3).rank_candidates(
+            candidates, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS
+        )
+        matcher = make_matcher(similarities, overall_threshold=0.3, cascade=True)
+
+        ranked = matcher.rank_top_candidates(
+            candidates, JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS, k=2
+        )
+
+        expected = [c for c in exact if c["match_result"]["passed"]][:2]
+        assert ranked == expected
+
+    def test_consumes_generator(self, pool):
+        """Test that candidates can come from a one-shot generator."""
+        candidates, similarities = pool
+        matcher = make_matcher(similarities)
+
+        ranked = matcher.rank_top_candidates(
+            (dict(c) for c in candidates), JOB_TITLE, JOB_DESCRIPTION, REQUIRED_SKILLS, k=3
+        )
+
+        assert len(ranked) == 3
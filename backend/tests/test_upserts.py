@@ -0,0 +1,95 @@
+"""
+Tests for bulk UPSERT of CandidateRank and MatchResult rows.
+
+Tests cover the generated ON CONFLICT statement, batching and
+de-duplication of pairs within a call.
+"""
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from models import upserts
+from models.upserts import upsert_candidate_ranks, upsert_match_results
+
+
+def rank_row(resume_id=None, vacancy_id=None, score=0.5):
+    return {
+        "resume_id": resume_id or uuid4(),
+        "vacancy_id": vacancy_id or uuid4(),
+        "rank_score": score,
+        "recommendation": "maybe",
+    }
+
+
+@pytest.fixture
+def db():
+    db = MagicMock()
+    db.execute = AsyncMock()
+    return db
+
+
+def compiled_sql(db):
+    """SQL of the first executed statement, as sent to PostgreSQL."""
+    statement = db.execute.await_args_list[0].args[0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestUpsert:
+    """Tests for upsert_candidate_ranks and upsert_match_results."""
+
+    @pytest.mark.asyncio
+    async def test_on_conflict_updates_given_columns(self, db):
+        """Test that conflicts on the pair update the given columns and updated_at."""
+        await upsert_candidate_ranks(db, [rank_row()])
+
+        sql = compiled_sql(db)
+        assert "ON CONFLICT ON CONSTRAINT uq_candidate_ranks_resume_vacancy DO UPDATE" in sql
+        assert "rank_score = excluded.rank_score" in sql
+        assert "recommendation = excluded.recommendation" in sql
+        assert "updated_at = now()" in sql
+        # Key columns and unrelated columns are left alone
+        assert "resume_id = excluded" not in sql
+        assert "id = excluded.id" not in sql
+        assert "rank_position" not in sql.split("DO UPDATE")[1]
+
+    @pytest.mark.asyncio
+    async def test_match_results_constraint(self, db):
+        """Test that match results upsert on their own constraint."""
+        await upsert_match_results(db, [{"resume_id": uuid4(), "vacancy_id": uuid4(), "overall_score": 0.7}])
+
+        assert "ON CONFLICT ON CONSTRAINT uq_match_results_resume_vacancy" in compiled_sql(db)
+
+    @pytest.mark.asyncio
+    async def test_batched_executemany(self, db):
+        """Test that rows are sent in batches of UPSERT_BATCH_SIZE."""
+        with patch.object(upserts, "UPSERT_BATCH_SIZE", 2):
+            written = await upsert_candidate_ranks(db, [rank_row() for _ in range(5)])
+
+        assert written == 5
+        assert [len(call.args[1]) for call in db.execute.await_args_list] == [2, 2, 1]
+        # Every row gets a new primary key for the insert case
+        ids = [row["id"] for call in db.execute.await_args_list for row in call.args[1]]
+        assert len(set(ids)) == 5
+
+    @pytest.mark.asyncio
+    async def test_duplicate_pairs_last_wins(self, db):
+        """Test that a pair appears once per statement, with its last values."""
+        resume_id, vacancy_id = uuid4(), uuid4()
+
+        written = await upsert_candidate_ranks(db, [
+            rank_row(resume_id, vacancy_id, score=0.1),
+            rank_row(),
+            rank_row(resume_id, vacancy_id, score=0.9),
+        ])
+
+        rows = db.execute.await_args.args[1]
+        assert written == 2
+        assert [row["rank_score"] for row in rows if row["resume_id"] == resume_id] == [0.9]
+
+    @pytest.mark.asyncio
+    async def test_no_rows(self, db):
+        """Test that nothing is executed for an empty list."""
+        assert await upsert_candidate_ranks(db, []) == 0
+        db.execute.assert_not_awaited()
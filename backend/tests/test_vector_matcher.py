@@ -0,0 +1,227 @@
+"""
+Tests for the vector similarity matcher.
+
+The sentence-transformers model is replaced with a deterministic fake
+encoder so the tests cover batching, chunked encoding, the embedding store
+integration and scoring without downloading a model.
+"""
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from analyzers import vector_matcher
+from analyzers.embedding_store import EmbeddingStore
+from analyzers.quantization import dequantize
+from analyzers.vector_matcher import VectorSimilarityMatcher, pool_embeddings
+
+
+class FakeModel:
+    """Deterministic stand-in for SentenceTransformer.encode."""
+
+    def __init__(self, dim: int = 8, max_seq_length=None):
+        self.dim = dim
+        self.max_seq_length = max_seq_length
+        self.calls = []
+
+    def _vector(self, text: str) -> np.ndarray:
+        rng = np.random.default_rng(sum(map(ord, text)) + len(text))
+        return rng.standard_normal(self.dim).astype(np.float32)
+
+    def encode(self, sentences, batch_size=32, convert_to_numpy=True, show_progress_bar=False):
+        if isinstance(sentences, str):
+            self.calls.append([sentences])
+            return self._vector(sentences)
+        self.calls.append(list(sentences))
+        return np.vstack([self._vector(s) for s in sentences])
+
+
+@pytest.fixture
+def fake_model():
+    """Patch the matcher to use the fake model."""
+    model = FakeModel()
+    with patch.object(vector_matcher, "_HAS_SENTENCE_TRANSFORMERS", True), \
+            patch.object(VectorSimilarityMatcher, "_get_model", return_value=model):
+        yield model
+
+
+class TestEncodeWithStore:
+    """Tests for embedding store integration."""
+
+    def test_second_encode_hits_store(self, fake_model, tmp_path):
+        """Test that a stored text is not re-encoded."""
+        matcher = VectorSimilarityMatcher(embedding_store=EmbeddingStore(tmp_path))
+
+        first = matcher._encode_text("Python developer")
+        second = matcher._encode_text("Python developer")
+
+        assert len(fake_model.calls) == 1
+        np.testing.assert_allclose(first, second)
+
+    def test_store_disabled(self, fake_model):
+        """Test that encoding works without a store."""
+        matcher = VectorSimilarityMatcher(use_embedding_store=False)
+
+        matcher._encode_text("Python developer")
+        matcher._encode_text("Python developer")
+
+        assert matcher.embedding_store is None
+        assert len(fake_model.calls) == 2
+
+
+class TestBatchMatch:
+    """Tests for batched encoding and scoring."""
+
+    def test_matches_single_path(self, fake_model):
+        """Test that batched scores equal per-resume match scores."""
+        matcher = VectorSimilarityMatcher(use_embedding_store=False, batch_size=2)
+        resumes = ["React and TypeScript", "Java Spring", "Go", "Kubernetes and Docker"]
+        job_text = "Frontend developer React"
+
+        scores = matcher.batch_match(resumes, job_text)
+
+        job_vec = matcher._encode_text(job_text)
+        expected = [
+            matcher._normalize_score(
+                matcher._cosine_similarity(matcher._encode_text(r), job_vec)
+            )
+            for r in resumes
+        ]
+        np.testing.assert_allclose(scores, expected, rtol=1e-6)
+
+    def test_mini_batches_are_length_sorted(self, fake_model):
+        """Test that texts are grouped by length into bounded batches."""
+        matcher = VectorSimilarityMatcher(use_embedding_store=False, batch_size=2)
+
+        matcher.batch_match(["ccc", "a", "dddd", "bb"], "job")
+
+        # The job posting is encoded first, then the resumes
+        assert [len(call) for call in fake_model.calls] == [1, 2, 2]
+        lengths = [len(t) for call in fake_model.calls[1:] for t in call]
+        assert lengths == sorted(lengths)
+
+    def test_stored_texts_skip_encoding(self, fake_model, tmp_path):
+        """Test that a re-rank of an unchanged pool does no forward passes."""
+        matcher = VectorSimilarityMatcher(embedding_store=EmbeddingStore(tmp_path))
+        resumes = ["React", "Vue", "Angular"]
+
+        first = matcher.batch_match(resumes, "Frontend developer")
+        n_calls = len(fake_model.calls)
+        second = matcher.batch_match(resumes, "Frontend developer")
+
+        assert len(fake_model.calls) == n_calls
+        np.testing.assert_allclose(first, second)
+
+    @pytest.mark.parametrize("dtype", ["float16", "int8"])
+    def test_stored_resumes_scored_on_codes(self, fake_model, tmp_path, dtype):
+        """Test that stored resumes are scored on the quantized codes without dequantizing."""
+        resumes = ["React and TypeScript", "Java Spring", "Go", "Kubernetes and Docker"]
+        job_text = "Frontend developer React"
+        expected = VectorSimilarityMatcher(use_embedding_store=False).batch_match(resumes, job_text)
+
+        matcher = VectorSimilarityMatcher(embedding_store=EmbeddingStore(tmp_path, dtype=dtype))
+        first = matcher.batch_match(resumes[:2], job_text)
+        with patch("analyzers.embedding_store.dequantize", wraps=dequantize) as dequantize_rows:
+            scores = matcher.batch_match(resumes, job_text)
+
+        # Only the job posting is read back as a vector
+        assert dequantize_rows.call_count == 1
+        np.testing.assert_allclose(scores, expected, atol=1e-2)
+        np.testing.assert_allclose(scores[:2], first, atol=1e-2)
+
+    def test_empty_input(self, fake_model):
+        """Test batch match with no resumes."""
+        matcher = VectorSimilarityMatcher(use_embedding_store=False)
+        assert matcher.batch_match([], "job") == []
+
+
+class TestPoolEmbeddings:
+    """Tests for chunk pooling."""
+
+    def test_mean_is_weighted(self):
+        """Test that mean pooling weights chunks by token count."""
+        vectors = np.array([[1.0, 0.0], [0.0, 1.0]])
+        np.testing.assert_allclose(pool_embeddings(vectors, "mean", [3, 1]), [0.75, 0.25])
+
+    def test_max(self):
+        """Test element-wise max pooling."""
+        vectors = np.array([[1.0, -2.0], [0.5, 3.0]])
+        np.testing.assert_allclose(pool_embeddings(vectors, "max"), [1.0, 3.0])
+
+    def test_attention_downweights_outlier(self):
+        """Test that attention pooling favours chunks that agree with the document."""
+        vectors = np.array([[1.0, 0.0], [1.0, 0.1], [0.0, 1.0]])
+        pooled = pool_embeddings(vectors, "attention")
+        mean = pool_embeddings(vectors, "mean")
+        assert pooled[1] < mean[1]
+
+    def test_single_chunk_is_unchanged(self):
+        """Test that a single chunk is returned as is."""
+        np.testing.assert_allclose(pool_embeddings(np.array([[0.2, 0.4]]), "attention"), [0.2, 0.4])
+
+
+class TestChunkedEncoding:
+    """Tests for long-document encoding."""
+
+    @pytest.fixture
+    def short_model(self):
+        """Fake model whose input holds only a few words."""
+        model = FakeModel(max_seq_length=10)
+        with patch.object(vector_matcher, "_HAS_SENTENCE_TRANSFORMERS", True), \
+                patch.object(VectorSimilarityMatcher, "_get_model", return_value=model):
+            yield model
+
+    def test_one_forward_pass_per_document(self, short_model):
+        """Test that all windows of a document are encoded in a single call."""
+        matcher = VectorSimilarityMatcher(use_embedding_store=False, pooling="mean", chunk_overlap=0)
+        text = " ".join(f"word{i}" for i in range(30))
+
+        embedding = matcher._encode_text(text)
+
+        assert embedding is not None
+        assert len(short_model.calls) == 1
+        assert len(short_model.calls[0]) == 5
+        assert short_model.calls[0][-1].endswith("word29")
+
+    def test_tail_affects_embedding(self, short_model):
+        """Test that text beyond the first window changes the embedding."""
+        matcher = VectorSimilarityMatcher(use_embedding_store=False, pooling="mean")
+        head = " ".join(f"word{i}" for i in range(20))
+
+        first = matcher._encode_text(head + " python")
+        second = matcher._encode_text(head + " kubernetes")
+
+        assert not np.allclose(first, second)
+
+    def test_chunks_are_stored(self, short_model, tmp_path):
+        """Test that window embeddings are persisted for reuse."""
+        store = EmbeddingStore(tmp_path)
+        matcher = VectorSimilarityMatcher(embedding_store=store, pooling="max")
+        text = " ".join(f"word{i}" for i in range(30))
+
+        matcher._encode_text(text)
+        n_calls = len(short_model.calls)
+        chunks = matcher.encode_chunks(text)
+
+        assert len(short_model.calls) == n_calls
+        assert len(chunks) > 1
+        assert store.count(matcher.model_name) == len(chunks)
+        assert store.count(matcher.embedding_key) == 1
+
+    def test_max_chunks_bounds_cost(self, short_model):
+        """Test that very long documents are capped at max_chunks windows."""
+        matcher = VectorSimilarityMatcher(use_embedding_store=False, pooling="mean", max_chunks=3)
+
+        matcher._encode_text(" ".join(f"word{i}" for i in range(500)))
+
+        assert len(short_model.calls[0]) == 3
+
+    def test_pooling_none_truncates(self, short_model):
+        """Test that disabling pooling encodes the text once."""
+        matcher = VectorSimilarityMatcher(use_embedding_store=False, pooling="none")
+
+        matcher._encode_text(" ".join(f"word{i}" for i in range(30)))
+
+        assert len(short_model.calls) == 1
+        assert len(short_model.calls[0]) == 1
+        assert matcher.embedding_key == matcher.model_name